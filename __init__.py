@@ -1,10 +1,55 @@
 # Python library import
 import asyncio
 from netscud.device_selector import ConnectDevice
+from netscud.fleet import Fleet, FleetResult
+from netscud.connection_pool import ConnectionPool
+from netscud.devices.mikrotik.routeros_api import RouterOSAPI
+from netscud.table import Table
+from netscud.instrumentation import TimingAggregator
+from netscud.capabilities import CapabilityCache
 
 # from netscud.inventory import Inventory
 
-__all__ = ("ConnectDevice",)
+
+def __getattr__(name):
+    """
+    Function used to import set_hot_path_quiet and FleetExporter only when they are used
+
+    The devices (and asyncssh) are imported only when a device is created.
+    pyarrow (optional) is imported only when FleetExporter is used.
+    """
+
+    # set_hot_path_quiet function?
+    if name == "set_hot_path_quiet":
+
+        # Yes
+        from netscud.base_connection import set_hot_path_quiet
+
+        return set_hot_path_quiet
+
+    # FleetExporter class (pyarrow imported only when it is used)?
+    if name == "FleetExporter":
+
+        # Yes
+        from netscud.export import FleetExporter
+
+        return FleetExporter
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = (
+    "ConnectDevice",
+    "set_hot_path_quiet",
+    "Fleet",
+    "FleetResult",
+    "ConnectionPool",
+    "RouterOSAPI",
+    "Table",
+    "FleetExporter",
+    "TimingAggregator",
+    "CapabilityCache",
+)
 
 # Version
 __version__ = "1.1.0"
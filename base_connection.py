@@ -1,14 +1,62 @@
 # Python library import
-import asyncio, asyncssh, logging
+import asyncio, asyncssh, copy, functools, logging, os, time
+from netscud.capabilities import CapabilityCache
+from netscud.channel_pool import ChannelPool
+from netscud.instrumentation import (
+    CommandProbe,
+    emit_event,
+    EVENT_CONNECT,
+    EVENT_AUTH,
+    EVENT_PROMPT_DISCOVERY,
+)
+from netscud.receive_buffer import (
+    ReceiveBuffer,
+    AnsiEscapeFilter,
+    PromptMatcher,
+    OutputLines,
+)
 
 # Module logging logger
 log = logging.getLogger(__package__)
 
-# Debug level
-# logging.basicConfig(level=logging.WARNING)
-# logging.basicConfig(level=logging.INFO)
-logging.basicConfig(level=logging.DEBUG)
-asyncssh.set_debug_level(2)
+# Logger used inside the read loops (data received, hex dumps, etc.)
+# Its level can be changed separately (see set_hot_path_quiet)
+hot_log = logging.getLogger(f"{__package__}.hot_path")
+
+# No message displayed by default: the logging configuration is done by the application
+# For instance:
+# logging.basicConfig(level=logging.DEBUG)
+# asyncssh.set_debug_level(2)
+log.addHandler(logging.NullHandler())
+
+
+def set_hot_path_quiet(quiet=True):
+    """
+    Function used to enable or disable the "hot path quiet" mode
+
+    In "hot path quiet" mode the messages of the read loops (data received,
+    hex dumps, prompt detection, etc.) are not displayed whatever the level
+    of the "netscud" logger is. The other messages are still displayed.
+    Useful when debug messages are needed on many devices.
+
+    :param quiet: optional, True to enable the "hot path quiet" mode, False to disable it. Default value is True
+    :type quiet: bool
+    """
+
+    # "Hot path quiet" mode?
+    if quiet:
+
+        # Yes
+
+        # No message of the read loops
+        hot_log.setLevel(logging.CRITICAL + 1)
+
+    else:
+
+        # No
+
+        # Same level as the "netscud" logger
+        hot_log.setLevel(logging.NOTSET)
 
 
 # Declaration of constant values
@@ -16,6 +64,157 @@ asyncssh.set_debug_level(2)
 # Max data to read in read function
 MAX_BUFFER_DATA = 65535
 
+# Facts given by get_facts (command: cmd_get_<fact>, output read by parse_<fact>)
+FACTS = ("version", "hostname", "model", "serial_number")
+
+# SSH algorithms preferred (post-quantum hybrid key exchanges first, then
+# less CPU used by the key exchange and the encryption)
+SSH_FAST_KEX_ALGS = (
+    "mlkem768x25519-sha256",
+    "mlkem768nistp256-sha256",
+    "mlkem1024nistp384-sha384",
+    "sntrup761x25519-sha512",
+    "sntrup761x25519-sha512@openssh.com",
+    "curve25519-sha256",
+    "curve25519-sha256@libssh.org",
+    "ecdh-sha2-nistp256",
+)
+SSH_FAST_ENCRYPTION_ALGS = (
+    "aes128-gcm@openssh.com",
+    "aes256-gcm@openssh.com",
+    "chacha20-poly1305@openssh.com",
+)
+SSH_FAST_MAC_ALGS = (
+    "umac-64-etm@openssh.com",
+    "hmac-sha2-256-etm@openssh.com",
+)
+
+
+def order_ssh_algorithms(fast_algs, algs):
+    """
+    Function used to get the SSH algorithms with the fastest ones first
+
+    The other algorithms follow in the order of asyncssh.
+
+    :param fast_algs: the fastest algorithms
+    :type fast_algs: list
+
+    :param algs: the algorithms of asyncssh (bytes)
+    :type algs: list
+
+    :return: the algorithms (fastest first)
+    :rtype: list
+    """
+
+    # Names of the algorithms (GSS key exchanges not used: no Kerberos)
+    algs = [alg.decode("utf-8") for alg in algs if not alg.startswith(b"gss-")]
+
+    return [alg for alg in fast_algs if alg in algs] + [
+        alg for alg in algs if alg not in fast_algs
+    ]
+
+
+# SSH algorithms used by the connections (computed once). The key
+# exchanges and the MACs are the default ones of asyncssh; all the
+# encryption algorithms are accepted (even the old ones needed by old devices)
+SSH_KEX_ALGS = order_ssh_algorithms(
+    SSH_FAST_KEX_ALGS, asyncssh.kex.get_default_kex_algs()
+)
+SSH_ENCRYPTION_ALGS = order_ssh_algorithms(
+    SSH_FAST_ENCRYPTION_ALGS, asyncssh.encryption.get_encryption_algs()
+)
+SSH_MAC_ALGS = order_ssh_algorithms(
+    SSH_FAST_MAC_ALGS, asyncssh.mac.get_default_mac_algs()
+)
+
+# Old SSH algorithms disabled by default by asyncssh (eg. diffie-hellman-group1-sha1,
+# hmac-md5), only offered after the others with "legacy_ssh_algorithms"
+SSH_LEGACY_KEX_ALGS = [
+    alg
+    for alg in order_ssh_algorithms((), asyncssh.kex.get_kex_algs())
+    if alg not in SSH_KEX_ALGS
+]
+SSH_LEGACY_MAC_ALGS = [
+    alg
+    for alg in order_ssh_algorithms((), asyncssh.mac.get_mac_algs())
+    if alg not in SSH_MAC_ALGS
+]
+
+# SSH compression algorithms (compression disabled by default: less CPU)
+SSH_COMPRESSION_ALGS = ["zlib@openssh.com", "zlib", "none"]
+SSH_NO_COMPRESSION_ALGS = ["none"]
+
+
+@functools.lru_cache(maxsize=1024)
+def get_ssh_client_options(
+    server_host_key_algs=(),
+    known_hosts=None,
+    keepalive_interval=0,
+    compression=False,
+    legacy_algorithms=False,
+):
+    """
+    Function used to get the options of a SSH connection
+
+    The options are created once for each profile (same parameters) and
+    shared by all the connections with the same profile: the lists of
+    algorithms are not computed again for each device of a fleet. The
+    credentials are not part of these options (no password kept in the
+    cache): they are added for each connection.
+
+    :param server_host_key_algs: optional, the host key algorithms accepted. Default value is () (asyncssh default algorithms)
+    :type server_host_key_algs: tuple
+
+    :param known_hosts: optional, the known_hosts file(s) used to check the host keys (tuple for several files). Default value is None (host keys not checked)
+    :type known_hosts: str or tuple
+
+    :param keepalive_interval: optional, time in seconds between 2 keepalive messages. Default value is 0 (no keepalive)
+    :type keepalive_interval: float
+
+    :param compression: optional, True to allow the compression of the data. Default value is False
+    :type compression: bool
+
+    :param legacy_algorithms: optional, True to also offer the old key exchanges and MACs disabled by default (after the other algorithms). Default value is False
+    :type legacy_algorithms: bool
+
+    :return: the options of the connection
+    :rtype: asyncssh.SSHClientConnectionOptions
+    """
+
+    # Display info message
+    log.info("get_ssh_client_options: new options")
+
+    # Options of the connection
+    options = {
+        "known_hosts": (
+            list(known_hosts) if isinstance(known_hosts, tuple) else known_hosts
+        ),
+        "kex_algs": SSH_KEX_ALGS,
+        "encryption_algs": SSH_ENCRYPTION_ALGS,
+        "mac_algs": SSH_MAC_ALGS,
+        "compression_algs": (
+            SSH_COMPRESSION_ALGS if compression else SSH_NO_COMPRESSION_ALGS
+        ),
+        "keepalive_interval": keepalive_interval,
+    }
+
+    # Old algorithms used as a fallback?
+    if legacy_algorithms:
+
+        # Yes
+
+        # Offered after the default algorithms
+        options["kex_algs"] = SSH_KEX_ALGS + SSH_LEGACY_KEX_ALGS
+        options["mac_algs"] = SSH_MAC_ALGS + SSH_LEGACY_MAC_ALGS
+
+    # Host key algorithms of the device?
+    if server_host_key_algs:
+
+        # Yes
+        options["server_host_key_algs"] = list(server_host_key_algs)
+
+    return asyncssh.SSHClientConnectionOptions(**options)
+
 
 # Dictonary with all netmasks of IPv4
 ipv4_netmask_list = {
@@ -87,6 +286,33 @@ class NetworkDevice:
     :param enable_password: Enable password used for enable mode.
     :type enable_password: str, optional
 
+    :param channels: Number of SSH channels (sessions) opened on the SSH connection. With more than 1 channel, concurrent commands sent to the device run in parallel. Default value is 1
+    :type channels: int, optional
+
+    :param instrumentation: Function receiving the events measured on the device (connection, commands, etc.), like a TimingAggregator. Default value is None (nothing measured)
+    :type instrumentation: function, optional
+
+    :param known_hosts: known_hosts file(s) used to check the SSH host key of the device. Default value is None (host key not checked)
+    :type known_hosts: str or list, optional
+
+    :param keepalive_interval: Time in seconds between 2 SSH keepalive messages. Default value is 0 (no keepalive)
+    :type keepalive_interval: float, optional
+
+    :param compression: Compression of the SSH data allowed. Default value is False
+    :type compression: bool, optional
+
+    :param legacy_ssh_algorithms: Old SSH key exchanges and MACs disabled by default (eg. diffie-hellman-group1-sha1, hmac-md5) also offered, after the other algorithms, for old devices. Default value is False
+    :type legacy_ssh_algorithms: bool, optional
+
+    :param capability_cache: File (or CapabilityCache) where the capabilities discovered on the device (eg. AOS version) are saved for the next runs. Default value is None (capabilities kept in memory only)
+    :type capability_cache: str or CapabilityCache, optional
+
+    :param getter_window: Number of commands of a getter sent without waiting for their prompt (pipelined mode, see send_commands). The device must echo the commands sent in advance after its prompt. Default value is None (one command at a time)
+    :type getter_window: int, optional
+
+    :param output_cache_ttl: Time in seconds an output of a show command read by a method (eg. the VLAN table read before a change) is kept and used again (see send_cached_command). The outputs kept are removed by send_config_set; the methods changing the device remove (or update) the outputs showing what they change. Default value is None (no output kept)
+    :type output_cache_ttl: float, optional
+
     :param conn: Variable used for the management of the SSH connection
     :type conn: SSHClientConnection object
 
@@ -145,6 +371,117 @@ class NetworkDevice:
     :type cmd_save_config: str
     """
 
+    # Attributes of each device. The prompts and the commands below are
+    # shared by all the devices of a class (tuples instead of lists)
+    __slots__ = (
+        "ip",
+        "username",
+        "password",
+        "device_type",
+        "port",
+        "timeout",
+        "_protocol",
+        "enable_mode",
+        "enable_password",
+        "channels",
+        "_channel_pool",
+        "conn",
+        "_writer",
+        "_reader",
+        "stdinx",
+        "stdoutx",
+        "prompt",
+        "possible_prompts",
+        "_prompt_matcher",
+        "instrumentation",
+        "known_hosts",
+        "keepalive_interval",
+        "compression",
+        "legacy_ssh_algorithms",
+        "capability_cache",
+        "_capabilities",
+        "getter_window",
+        "output_cache_ttl",
+        "_output_cache",
+        "_unfinished_stream",
+    )
+
+    # Prompts
+    _connect_first_ending_prompt = ("#", ">")
+    list_of_possible_ending_prompts = (
+        "(config-line)#",
+        "(config-if)#",
+        "(config)#",
+        ">",
+        "#",
+    )
+    _carriage_return_for_send_command = "\n"
+    _send_command_error_in_returned_output = ()
+    _telnet_connect_login = "Username:"
+    _telnet_connect_password = "Password:"
+    _telnet_connect_authentication_fail_prompt = (":", "%")
+
+    # SSH host key algorithms accepted (empty: asyncssh default algorithms)
+    _ssh_server_host_key_algs = ()
+
+    # General commands
+    cmd_enable = "enable"
+    cmd_disable_paging = "terminal length 0"
+    cmd_enter_config_mode = "configure terminal"
+    cmd_exit_config_mode = "exit"
+    cmd_get_version = "show version"
+    cmd_get_hostname = "show version"
+    cmd_get_model = "show inventory"
+    cmd_get_serial_number = "show inventory"
+    cmd_get_config = "show running-config"
+    cmd_save_config = "write memory"
+
+    # Layer 1 commands
+    cmd_get_interfaces = (
+        "interface ethernet print terse without-paging",
+        "foreach i in=([/interface ethernet find]) do={/interface ethernet monitor $i once without-paging}",
+        "interface bridge port print terse without-paging",
+    )
+    cmd_set_interface = (
+        "interface ethernet enable <INTERFACE>",
+        "interface ethernet disable <INTERFACE>",
+        'interface ethernet comment <INTERFACE> "<COMMENT>"',
+        "interface ethernet set l2mtu=<MAXIMUMFRAMESIZE> <INTERFACE>",
+        "interface bridge port set frame-types=<MODE> ingress-filtering=<FILTERINGVLAN> [find interface=<INTERFACE>]",
+    )
+
+    # Layer 2 commands
+    cmd_get_mac_address_table = "interface bridge host print without-paging"
+    cmd_get_arp = "ip arp print terse without-paging"
+    cmd_get_lldp_neighbors = "ip neighbor print terse without-paging"
+    cmd_get_vlans = "interface bridge vlan print terse without-paging"
+    cmd_add_vlan = 'interface bridge vlan add vlan-ids=<VLAN> comment="<VLAN_NAME>" bridge=<BRIDGE>'
+    cmd_remove_vlan = "interface bridge vlan remove [find vlan-ids=<VLAN>]"
+    cmd_show_vlan_tables = (
+        "interface bridge vlan print terse without-paging",
+        "interface bridge vlan print terse",
+    )
+    cmd_add_interface_to_vlan = (
+        "interface bridge vlan print terse",
+        "interface bridge vlan set [find vlan-ids=<VLAN>] untagged=<INTERFACE>",
+        "interface bridge vlan set [find vlan-ids=<VLAN>] tagged=<INTERFACE>",
+        "interface bridge port set [find interface=<INTERFACE>] pvid=<VLAN>",
+    )
+    cmd_remove_interface_from_vlan = (
+        "interface bridge vlan print terse",
+        "interface bridge vlan set [find vlan-ids=<VLAN>] untagged=<INTERFACE>",
+        "interface bridge vlan set [find vlan-ids=<VLAN>] tagged=<INTERFACE>",
+        "interface bridge port set [find interface=<INTERFACE>] pvid=<VLAN>",
+    )
+
+    # Layer 3 commands
+    cmd_get_routing_table = "ip route print without-paging terse"
+    cmd_get_interfaces_ip = "ip address print terse without-paging"
+    cmd_add_static_route = "ip route add dst-address=<NETWORK>/<PREFIXLENGTH> gateway=<DESTINATION> distance=<METRIC>"
+    cmd_remove_static_route = (
+        "ip route remove [find dst-address=<NETWORK>/<PREFIXLENGTH>]"
+    )
+
     def __init__(self, **kwargs):
 
         # Display info message
@@ -159,80 +496,30 @@ class NetworkDevice:
         self._protocol = "ssh"
         self.enable_mode = False
         self.enable_password = ""
+        self.channels = 1
+        self._channel_pool = None
         self.conn = None
         self._writer = None
         self._reader = None
+        self.stdinx = None
+        self.stdoutx = None
+        self.prompt = ""
         self.possible_prompts = []
-        self._connect_first_ending_prompt = ["#", ">"]
-        self.list_of_possible_ending_prompts = [
-            "(config-line)#",
-            "(config-if)#",
-            "(config)#",
-            ">",
-            "#",
-        ]
-        self._carriage_return_for_send_command = "\n"
-        self._send_command_error_in_returned_output = []
-        self._telnet_connect_login = "Username:"
-        self._telnet_connect_password = "Password:"
-        self._telnet_connect_authentication_fail_prompt = [":", "%"]
-
-        # General commands
-        self.cmd_enable = "enable"
-        self.cmd_disable_paging = "terminal length 0"
-        self.cmd_enter_config_mode = "configure terminal"
-        self.cmd_exit_config_mode = "exit"
-        self.cmd_get_version = "show version"
-        self.cmd_get_hostname = "show version | include uptime"
-        self.cmd_get_model = "show inventory"
-        self.cmd_get_serial_number = "show inventory | i SN"
-        self.cmd_get_config = "show running-config"
-        self.cmd_save_config = "write memory"
-
-        # Layer 1 commands
-        self.cmd_get_interfaces = [
-            "interface ethernet print terse without-paging",
-            "foreach i in=([/interface ethernet find]) do={/interface ethernet monitor $i once without-paging}",
-            "interface bridge port print terse without-paging",
-        ]
-        self.cmd_set_interface = [
-            "interface ethernet enable <INTERFACE>",
-            "interface ethernet disable <INTERFACE>",
-            'interface ethernet comment <INTERFACE> "<COMMENT>"',
-            "interface ethernet set l2mtu=<MAXIMUMFRAMESIZE> <INTERFACE>",
-            "interface bridge port set frame-types=<MODE> ingress-filtering=<FILTERINGVLAN> [find interface=<INTERFACE>]",
-        ]
-
-        # Layer 2 commands
-        self.cmd_get_mac_address_table = "interface bridge host print without-paging"
-        self.cmd_get_arp = "ip arp print terse without-paging"
-        self.cmd_get_lldp_neighbors = "ip neighbor print terse without-paging"
-        self.cmd_get_vlans = "interface bridge vlan print terse without-paging"
-        self.cmd_add_vlan = 'interface bridge vlan add vlan-ids=<VLAN> comment="<VLAN_NAME>" bridge=<BRIDGE>'
-        self.cmd_remove_vlan = "interface bridge vlan remove [find vlan-ids=<VLAN>]"
-        self.cmd_add_interface_to_vlan = [
-            "interface bridge vlan print terse",
-            "interface bridge vlan set [find vlan-ids=<VLAN>] untagged=<INTERFACE>",
-            "interface bridge vlan set [find vlan-ids=<VLAN>] tagged=<INTERFACE>",
-            "interface bridge port set [find interface=<INTERFACE>] pvid=<VLAN>",
-        ]
-        self.cmd_remove_interface_from_vlan = [
-            "interface bridge vlan print terse",
-            "interface bridge vlan set [find vlan-ids=<VLAN>] untagged=<INTERFACE>",
-            "interface bridge vlan set [find vlan-ids=<VLAN>] tagged=<INTERFACE>",
-            "interface bridge port set [find interface=<INTERFACE>] pvid=<VLAN>",
-        ]
-
-        # Layer 3 commands
-        self.cmd_get_routing_table = "ip route print without-paging terse"
-        self.cmd_get_interfaces_ip = "ip address print terse without-paging"
-        self.cmd_add_static_route = "ip route add dst-address=<NETWORK>/<PREFIXLENGTH> gateway=<DESTINATION> distance=<METRIC>"
-        self.cmd_remove_static_route = (
-            "ip route remove [find dst-address=<NETWORK>/<PREFIXLENGTH>]"
-        )
+        self._prompt_matcher = PromptMatcher([])
+        self.instrumentation = None
+        self.known_hosts = None
+        self.keepalive_interval = 0
+        self.compression = False
+        self.legacy_ssh_algorithms = False
+        self.capability_cache = None
+        self._capabilities = {}
+        self.getter_window = None
+        self.output_cache_ttl = None
+        self._output_cache = {}
+        self._unfinished_stream = None
 
         # Display info message
-        log.debug("__init__: kwargs: " + str(kwargs))
+        log.debug("__init__: kwargs: %s", kwargs)
 
         # Get information from dictionary
 
@@ -243,42 +530,42 @@ class NetworkDevice:
             self.ip = kwargs["ip"]
 
             # Display info message
-            log.info("__init__: ip found: " + str(self.ip))
+            log.info("__init__: ip found: %s", self.ip)
 
         # "username" found?
         if "username" in kwargs:
             self.username = kwargs["username"]
 
             # Display info message
-            log.info("__init__: username found: " + str(self.username))
+            log.info("__init__: username found: %s", self.username)
 
         # "password" found?
         if "password" in kwargs:
             self.password = kwargs["password"]
 
             # Display info message
-            log.debug("__init__: password found: " + str(self.password))
+            log.debug("__init__: password found: %s", self.password)
 
         # "device_type" found?
         if "device_type" in kwargs:
             self.device_type = kwargs["device_type"]
 
             # Display info message
-            log.info("__init__: device_type found: " + str(self.device_type))
+            log.info("__init__: device_type found: %s", self.device_type)
 
         # "timeout" found?
         if "timeout" in kwargs:
             self.timeout = kwargs["timeout"]
 
             # Display info message
-            log.info("__init__: timeout found: " + str(self.timeout))
+            log.info("__init__: timeout found: %s", self.timeout)
 
         # "protocol" found?
         if "protocol" in kwargs:
             self._protocol = kwargs["protocol"].lower()
 
             # Display info message
-            log.info("__init__: protocol found: " + str(self._protocol))
+            log.info("__init__: protocol found: %s", self._protocol)
 
             # By default telnet port is 23
             if self._protocol.lower() == "telnet":
@@ -289,21 +576,92 @@ class NetworkDevice:
             self.port = kwargs["port"]
 
             # Display info message
-            log.info("__init__: port found: " + str(self.port))
+            log.info("__init__: port found: %s", self.port)
 
         # "enable_mode" found?
         if "enable_mode" in kwargs:
             self.enable_mode = kwargs["enable_mode"]
 
             # Display info message
-            log.info("__init__: enable_mode found: " + str(self.enable_mode))
+            log.info("__init__: enable_mode found: %s", self.enable_mode)
 
         # "enable_password" found?
         if "enable_password" in kwargs:
             self.enable_password = kwargs["enable_password"]
 
             # Display info message
-            log.info("__init__: enable_password found: " + str(self.enable_password))
+            log.info("__init__: enable_password found: %s", self.enable_password)
+
+        # "channels" found?
+        if "channels" in kwargs:
+            self.channels = kwargs["channels"]
+
+            # Display info message
+            log.info("__init__: channels found: %s", self.channels)
+
+        # "instrumentation" found?
+        if "instrumentation" in kwargs:
+            self.instrumentation = kwargs["instrumentation"]
+
+            # Display info message
+            log.info("__init__: instrumentation found: %s", self.instrumentation)
+
+        # "known_hosts" found?
+        if "known_hosts" in kwargs:
+            self.known_hosts = kwargs["known_hosts"]
+
+            # Display info message
+            log.info("__init__: known_hosts found: %s", self.known_hosts)
+
+        # "keepalive_interval" found?
+        if "keepalive_interval" in kwargs:
+            self.keepalive_interval = kwargs["keepalive_interval"]
+
+            # Display info message
+            log.info("__init__: keepalive_interval found: %s", self.keepalive_interval)
+
+        # "compression" found?
+        if "compression" in kwargs:
+            self.compression = kwargs["compression"]
+
+            # Display info message
+            log.info("__init__: compression found: %s", self.compression)
+
+        # "legacy_ssh_algorithms" found?
+        if "legacy_ssh_algorithms" in kwargs:
+            self.legacy_ssh_algorithms = kwargs["legacy_ssh_algorithms"]
+
+            # Display info message
+            log.info(
+                "__init__: legacy_ssh_algorithms found: %s", self.legacy_ssh_algorithms
+            )
+
+        # "capability_cache" found?
+        if "capability_cache" in kwargs:
+            self.capability_cache = kwargs["capability_cache"]
+
+            # Path of a file?
+            if isinstance(self.capability_cache, (str, os.PathLike)):
+
+                # Yes, the cache of the file is used (shared by the devices)
+                self.capability_cache = CapabilityCache.open(self.capability_cache)
+
+            # Display info message
+            log.info("__init__: capability_cache found: %s", self.capability_cache)
+
+        # "getter_window" found?
+        if "getter_window" in kwargs:
+            self.getter_window = kwargs["getter_window"]
+
+            # Display info message
+            log.info("__init__: getter_window found: %s", self.getter_window)
+
+        # "output_cache_ttl" found?
+        if "output_cache_ttl" in kwargs:
+            self.output_cache_ttl = kwargs["output_cache_ttl"]
+
+            # Display info message
+            log.info("__init__: output_cache_ttl found: %s", self.output_cache_ttl)
 
     async def __aenter__(self):
         """
@@ -334,6 +692,73 @@ class NetworkDevice:
         # Close the connection
         await self.disconnect()
 
+    def get_capability(self, name, default=None):
+        """
+        Method used to get a capability already discovered on the device (eg. "aos_version")
+
+        The capability is searched in the memory of the device then in the
+        capability cache (file of the previous runs).
+
+        :param name: the name of the capability
+        :type name: str
+
+        :param default: optional, the value returned if the capability is unknown. Default value is None
+        :type default: any
+
+        :return: the value of the capability
+        :rtype: any
+        """
+
+        # Capability already known by the device?
+        if name in self._capabilities:
+
+            # Yes
+            return self._capabilities[name]
+
+        # Capability cache used?
+        if self.capability_cache is not None:
+
+            # Yes
+
+            # Get the capability saved by a previous run
+            value = self.capability_cache.get(self, name)
+
+            # Capability found?
+            if value is not None:
+
+                # Yes, kept by the device
+                self._capabilities[name] = value
+
+                # Display info message
+                log.info("get_capability: %s found in cache: %r", name, value)
+
+                return value
+
+        return default
+
+    def set_capability(self, name, value):
+        """
+        Method used to save a capability discovered on the device (eg. "aos_version")
+
+        :param name: the name of the capability
+        :type name: str
+
+        :param value: the value of the capability (JSON value)
+        :type value: any
+        """
+
+        # Display info message
+        log.info("set_capability: %s: %r", name, value)
+
+        # Kept by the device
+        self._capabilities[name] = value
+
+        # Capability cache used?
+        if self.capability_cache is not None:
+
+            # Yes, saved for the next runs
+            self.capability_cache.set(self, name, value)
+
     def find_prompt(self, text):
         """
         Method used to find a prompt inside an output string
@@ -358,7 +783,7 @@ class NetworkDevice:
         prompt = text.split("\r")[-1]
 
         # Display info message
-        log.info(f"find_prompt: prompt: '{prompt}'")
+        log.info("find_prompt: prompt: '%s'", prompt)
 
         # Get the possible prompts for future recognition
         self.possible_prompts = self.get_possible_prompts(prompt)
@@ -404,10 +829,10 @@ class NetworkDevice:
         # Prompt should be from "switch#" to "switch"
 
         # Display info message
-        log.info(f"get_possible_prompts: prompt found: '{my_prompt}'")
+        log.info("get_possible_prompts: prompt found: '%s'", my_prompt)
 
         # Display info message
-        log.info(f"get_possible_prompts: prompt found size: '{len(my_prompt)}'")
+        log.info("get_possible_prompts: prompt found size: '%s'", len(my_prompt))
 
         # Now create all the possible prompts for that device
         for ending in list_of_possible_ending_prompts:
@@ -416,14 +841,17 @@ class NetworkDevice:
             list_of_prompts.append(my_prompt + ending)
 
         # Display info message
-        log.info(f"get_possible_prompts: list of possible prompts: {list_of_prompts}")
+        log.info("get_possible_prompts: list of possible prompts: %s", list_of_prompts)
+
+        # Compile all the prompts into one matcher (prompt at the end of a string)
+        self._prompt_matcher = PromptMatcher(list_of_prompts)
 
         # Return the list of prompts
         return list_of_prompts
 
     def check_if_prompt_is_found(self, text):
         """
-        Method used to check if a prompt is detected inside a string
+        Method used to check if a prompt is detected at the end of a string
 
         :param text: a string with prompt
         :type text: str
@@ -432,29 +860,22 @@ class NetworkDevice:
         :rtype: str
         """
 
-        # By default the prompt is not found
-        prompt_found = False
-
-        # Check all possible prompts
-        for prompt in self.possible_prompts:
-
-            # Display info message
-            log.info(f"check_if_prompt_is_found: prompt: '{prompt}'")
+        # Search one of the possible prompts at the end of the text
+        match = self._prompt_matcher.search(text)
 
-            # Is this prompt present in the text?
-            if prompt in text:
+        # Prompt found?
+        if match:
 
-                # Yes
-                prompt_found = True
+            # Yes
 
-                # Display info message
-                log.info(f"check_if_prompt_is_found: prompt found: '{prompt}'")
+            # Display info message
+            hot_log.info("check_if_prompt_is_found: prompt found: '%s'", match.group())
 
-                # Leave the for loop
-                break
+            # The prompt is found
+            return True
 
-        # Return the prompt found
-        return prompt_found
+        # The prompt is not found
+        return False
 
     def remove_command_in_output(self, text, cmd):
         """
@@ -474,17 +895,20 @@ class NetworkDevice:
         """
 
         # Display info message
-        log.info(f"remove_command_in_output: cmd = '{cmd}'")
+        hot_log.info("remove_command_in_output: cmd = '%s'", cmd)
 
         # Display info message
-        log.info(f"remove_command_in_output: cmd (hex) = '{cmd.encode().hex()}'")
+        if hot_log.isEnabledFor(logging.INFO):
+            hot_log.info(
+                "remove_command_in_output: cmd (hex) = '%s'", cmd.encode().hex()
+            )
 
         # Remove the command from the beginning of the output
         # output = text.lstrip(cmd + "\n")
         output = text.split(cmd + "\n")[-1]
 
         # Display info message
-        log.info(f"remove_command_in_output: output = '{output}'")
+        hot_log.info("remove_command_in_output: output = '%s'", output)
 
         # Return the string without the command
         return output
@@ -508,7 +932,7 @@ class NetworkDevice:
         output = text.lstrip("\r\n\r")
 
         # Display info message
-        log.info(f"remove_starting_carriage_return_in_output: output = '{output}'")
+        hot_log.info("remove_starting_carriage_return_in_output: output = '%s'", output)
 
         # Return the string without the starting carriage return
         return output
@@ -528,31 +952,25 @@ class NetworkDevice:
         # Display info message
         log.info("remove_ending_prompt_in_output")
 
-        # Check all possible prompts
-        for prompt in self.possible_prompts:
-
-            # Display info message
-            log.info(f"remove_ending_prompt_in_output: prompt: '{prompt}'")
-
-            # Prompt found in the text?
-            if prompt in text:
+        # Search one of the possible prompts at the end of the text
+        match = self._prompt_matcher.search(text)
 
-                # Yes
+        # Prompt found at the end of the text?
+        if match:
 
-                # Then it is removed from the text
-                # text = text.rstrip(prompt)
-                text = text[: -len(prompt)]
+            # Yes
 
-                # Remove also carriage return
-                text = text.rstrip("\r\n")
+            # Display info message
+            hot_log.info("remove_ending_prompt_in_output: prompt: '%s'", match.group())
 
-                # Leave the loop
-                break
+            # Then it is removed from the text
+            text = text[: match.start()]
 
-        # output = text.rstrip("\r\n" + self.prompt)
+            # Remove also carriage return
+            text = text.rstrip("\r\n")
 
         # Display info message
-        log.info(f"remove_ending_prompt_in_output: text without prompt:\n'{text}'")
+        hot_log.info("remove_ending_prompt_in_output: text without prompt:\n'%s'", text)
 
         # Return the text without prompt at the end
         return text
@@ -579,10 +997,10 @@ class NetworkDevice:
             for element in self._send_command_error_in_returned_output:
 
                 # Display info message
-                log.info(f"check_error_output: element: {element}")
+                hot_log.info("check_error_output: element: %s", element)
 
                 # Display info message
-                log.info(f"check_error_output: output[0]: {output[0]}")
+                hot_log.info("check_error_output: output[0]: %s", output[0])
 
                 # Check if the output starts with a string with an error message (like "% Invalid input detected at '^' marker.")
 
@@ -600,6 +1018,10 @@ class NetworkDevice:
         Method removing ANSI escape sequence from a string
         Just CSI sequences are removed
 
+        For data received chunk by chunk, an AnsiEscapeFilter object
+        should be used instead since it keeps the escape sequences split
+        over 2 chunks.
+
         :param text: the text with a prompt at the beginning
         :type text: str
 
@@ -607,78 +1029,8 @@ class NetworkDevice:
         :rtype: str
         """
 
-        # By default no string returned
-        output = ""
-
-        # By default no escape sequence found
-        esc_found = 0
-
-        # Read char by char a string
-        for i in text:
-
-            # Display char
-            # log.info(f"{str(i).encode('ascii')}")
-
-            # No escape previously found?
-            if esc_found == 0:
-
-                # No escape sequence currently found
-
-                # Escape?
-                if i == "\x1b":
-
-                    # Yes
-                    log.info("Esc!")
-
-                    # Escape found
-                    esc_found = 1
-
-                else:
-
-                    # No
-
-                    # Then the current char can be saved
-                    output += i
-
-            # Escape previously found?
-            elif esc_found == 1:
-
-                # Yes
-
-                # Then check if this is a CSI sequence
-                if i == "[":
-
-                    # Beginning of CSI sequence
-                    log.info("CSI sequence")
-
-                    # CSI sequence
-                    esc_found = 2
-
-                else:
-
-                    # Another Escape sequence
-
-                    # Keep the escape sequence in the string
-                    output += "\x1b" + i
-
-                    # No escape sequence next
-                    esc_found = 0
-
-            else:
-
-                # Char between 'a' and 'z' or 'A' and 'Z'?
-                if (i >= "a" and i <= "z") or (i >= "A" and i <= "Z"):
-
-                    # Yes
-
-                    # Then it is the end of CSI escape sequence
-                    log.info("End of escape sequence")
-
-                    # No escape sequence next
-                    esc_found = 0
-
         # Return a string without ANSI escape sequence
-        return output
+        return AnsiEscapeFilter().feed(text)
 
     async def disable_paging(self):
         """
@@ -703,6 +1055,9 @@ class NetworkDevice:
         # Display info message
         log.info("connect")
 
+        # Beginning of the connection (only measured with an instrumentation)
+        start = self.instrumentation and time.perf_counter()
+
         try:
 
             # SSH?
@@ -713,6 +1068,14 @@ class NetworkDevice:
                 # Then Connect using SSH
                 await self.connectSSH()
 
+                # More than one channel requested?
+                if self.channels > 1:
+
+                    # Yes
+
+                    # Then open the other channels on the same SSH connection
+                    await self.open_channel_pool()
+
             # Telnet?
             elif self._protocol == "telnet":
 
@@ -737,6 +1100,45 @@ class NetworkDevice:
 
             raise
 
+        # Instrumentation used?
+        if start:
+
+            # Yes
+
+            # Duration of the whole connection
+            emit_event(self, EVENT_CONNECT, duration=time.perf_counter() - start)
+
+    def get_ssh_options(self):
+        """
+        Method used to get the options of the SSH connection of the device
+
+        The options without the credentials are shared by the devices with
+        the same profile (class, known_hosts, keepalive_interval,
+        compression and legacy_ssh_algorithms); the username and the password of the device are added.
+
+        :return: the options of the SSH connection
+        :rtype: asyncssh.SSHClientConnectionOptions
+        """
+
+        # Several known_hosts files given in a list (a tuple is used for the cache)?
+        known_hosts = self.known_hosts
+        if isinstance(known_hosts, list):
+            known_hosts = tuple(known_hosts)
+
+        # Get the options of the profile
+        options = get_ssh_client_options(
+            self._ssh_server_host_key_algs,
+            known_hosts,
+            self.keepalive_interval,
+            self.compression,
+            self.legacy_ssh_algorithms,
+        )
+
+        # Options of the device (options of the profile with the credentials)
+        return asyncssh.SSHClientConnectionOptions(
+            options, username=self.username, password=self.password
+        )
+
     async def connectSSH(self):
         """
         Async method used for connecting a device using SSH protocol
@@ -745,18 +1147,14 @@ class NetworkDevice:
         # Display info message
         log.info("connectSSH")
 
-        # Parameters of the connection
+        # Parameters of the connection (options shared by the devices with the same profile)
         generator = asyncssh.connect(
-            self.ip,
-            username=self.username,
-            password=self.password,
-            known_hosts=None,
-            # encryption_algs="*",  # Parameter that includes all encryption algorithms (even the old ones disabled by default)
-            encryption_algs=[
-                algs.decode("utf-8") for algs in asyncssh.encryption._enc_algs
-            ],  # Parameter that includes all encryption algorithms (even the old ones disabled by default)
+            self.ip, port=self.port, options=self.get_ssh_options()
         )
 
+        # Beginning of the authentication (only measured with an instrumentation)
+        start = self.instrumentation and time.perf_counter()
+
         # Trying to connect to the device
         try:
 
@@ -767,7 +1165,7 @@ class NetworkDevice:
             # Timeout
 
             # Display error message
-            log.error(f"connectSSH: connection failed: {self.ip} timeout: '{error}'")
+            log.error("connectSSH: connection failed: %s timeout: '%s'", self.ip, error)
 
             # Exception propagation
             raise asyncio.exceptions.TimeoutError(
@@ -779,7 +1177,7 @@ class NetworkDevice:
             # Connection failed
 
             # Display error message
-            log.error(f"connectSSH: connection failed: {self.ip} '{error}'")
+            log.error("connectSSH: connection failed: %s '%s'", self.ip, error)
 
             # Exception propagation
             raise
@@ -787,14 +1185,38 @@ class NetworkDevice:
         # Display info message
         log.info("connectSSH: connection success")
 
+        # Instrumentation used?
+        if start:
+
+            # Yes
+
+            # Duration of the SSH connection (key exchange and authentication)
+            emit_event(self, EVENT_AUTH, duration=time.perf_counter() - start)
+
+        # Open a session, discover the prompt and disable paging
+        await self.open_sessionSSH()
+
+    async def open_sessionSSH(self):
+        """
+        Async method used to open an interactive session on the SSH connection
+
+        The prompt is discovered and paging is disabled on that session.
+        """
+
+        # Display info message
+        log.info("open_sessionSSH")
+
+        # Beginning of the prompt discovery (only measured with an instrumentation)
+        start = self.instrumentation and time.perf_counter()
+
         # Create a session
         self.stdinx, self.stdoutx, _ = await self.conn.open_session(term_type="netscud")
 
         # Display info message
-        log.info("connectSSH: open_session success")
+        log.info("open_sessionSSH: open_session success")
 
         # By default no data has been read
-        data = ""
+        data = ReceiveBuffer(self._connect_first_ending_prompt)
 
         # By default no prompt found
         prompt_not_found = True
@@ -805,18 +1227,24 @@ class NetworkDevice:
             while prompt_not_found:
 
                 # Display info message
-                log.info("connectSSH: beginning of the loop")
+                log.info("open_sessionSSH: beginning of the loop")
 
                 # Read the prompt
-                data += await asyncio.wait_for(
-                    self.stdoutx.read(MAX_BUFFER_DATA), timeout=self.timeout
+                new_data = data.feed(
+                    await asyncio.wait_for(
+                        self.stdoutx.read(MAX_BUFFER_DATA), timeout=self.timeout
+                    )
                 )
 
                 # Display info message
-                log.info(f"connectSSH: data: '{str(data)}'")
+                hot_log.info("open_sessionSSH: data: '%s'", str(new_data))
 
                 # Display info message
-                log.info(f"connectSSH: data: hex:'{data.encode('utf-8').hex()}'")
+                if hot_log.isEnabledFor(logging.INFO):
+                    hot_log.info(
+                        "open_sessionSSH: data: hex:'%s'",
+                        new_data.encode("utf-8").hex(),
+                    )
 
                 # Check if an initial prompt is found
                 for prompt in self._connect_first_ending_prompt:
@@ -827,7 +1255,9 @@ class NetworkDevice:
                         # Yes
 
                         # Display info message
-                        log.info(f"connectSSH: first ending prompt found: '{prompt}'")
+                        hot_log.info(
+                            "open_sessionSSH: first ending prompt found: '%s'", prompt
+                        )
 
                         # A ending prompt has been found
                         prompt_not_found = False
@@ -836,7 +1266,7 @@ class NetworkDevice:
                         break
 
                 # Display info message
-                log.info("connectSSH: end of loop")
+                log.info("open_sessionSSH: end of loop")
 
         except Exception as error:
 
@@ -844,26 +1274,38 @@ class NetworkDevice:
 
             # Display error message
             log.error(
-                f"connectSSH: timeout while reading the prompt: {self.ip} '{error}'"
+                "open_sessionSSH: timeout while reading the prompt: %s '%s'",
+                self.ip,
+                error,
             )
 
             # Exception propagation
             raise
 
         # Display info message
-        log.info(f"connectSSH: end of prompt loop")
+        log.info("open_sessionSSH: end of prompt loop")
 
         # Remove possible escape sequence
-        data = self.remove_ansi_escape_sequence(data)
+        data = self.remove_ansi_escape_sequence(data.getvalue())
 
         # Find prompt
         self.prompt = self.find_prompt(str(data))
 
         # Display info message
-        log.info(f"connectSSH: prompt found: '{self.prompt}'")
+        hot_log.info("open_sessionSSH: prompt found: '%s'", self.prompt)
 
         # Display info message
-        log.info(f"connectSSH: prompt found size: '{len(self.prompt)}'")
+        hot_log.info("open_sessionSSH: prompt found size: '%s'", len(self.prompt))
+
+        # Instrumentation used?
+        if start:
+
+            # Yes
+
+            # Duration of the opening of the session and of the prompt discovery
+            emit_event(
+                self, EVENT_PROMPT_DISCOVERY, duration=time.perf_counter() - start
+            )
 
         # Disable paging command available?
         if self.cmd_disable_paging:
@@ -872,6 +1314,62 @@ class NetworkDevice:
             # Disable paging
             await self.disable_paging()
 
+    async def open_channel_pool(self):
+        """
+        Async method used to open several SSH channels on the SSH connection
+
+        "channels" sessions are used: the session already open plus new
+        sessions, each one with its own prompt discovery. Then the commands
+        sent with send_command and send_config_set use a free channel. So
+        concurrent commands on the device run in parallel.
+        """
+
+        # Display info message
+        log.info("open_channel_pool: channels: %s", self.channels)
+
+        # List of the channels
+        list_of_channels = []
+
+        # First channel: the session already open
+        channel = copy.copy(self)
+        channel._channel_pool = None
+        list_of_channels.append(channel)
+
+        try:
+
+            # Open the other channels
+            for _ in range(self.channels - 1):
+
+                # Copy of the device using the same SSH connection
+                channel = copy.copy(self)
+                channel._channel_pool = None
+
+                # Open a new session (with prompt discovery)
+                await channel.open_sessionSSH()
+
+                # Save the channel
+                list_of_channels.append(channel)
+
+        except Exception as error:
+
+            # A channel cannot be opened (limited number of sessions on the device?)
+
+            # Display error message
+            log.error(
+                "open_channel_pool: channel %s cannot be opened: '%s'",
+                len(list_of_channels) + 1,
+                error,
+            )
+
+            # No more channels are opened, the channels already open are used
+            # (at least the first session)
+
+        # Display info message
+        log.info("open_channel_pool: channels open: %s", len(list_of_channels))
+
+        # Create the pool of channels
+        self._channel_pool = ChannelPool(list_of_channels)
+
     async def connectTelnet(self):
         """
         Async method used for connecting a device using Telnet protocol
@@ -880,6 +1378,9 @@ class NetworkDevice:
         # Display info message
         log.info("connectTelnet")
 
+        # Beginning of the authentication (only measured with an instrumentation)
+        start = self.instrumentation and time.perf_counter()
+
         try:
 
             # Prepare connection with Telnet
@@ -890,7 +1391,9 @@ class NetworkDevice:
             # Preparation to the connection failed
 
             # Display error message
-            log.error(f"connectTelnet: preparation to the connection failed: '{error}'")
+            log.error(
+                "connectTelnet: preparation to the connection failed: '%s'", error
+            )
 
             # Exception propagation
             raise
@@ -930,31 +1433,27 @@ class NetworkDevice:
         # Temporary string variable
         output = ""
 
-        # Temporary bytes variable
-        byte_data = b""
+        # Buffer of the data received (bytes converted into string)
+        byte_data = ReceiveBuffer([prompt, prompt_password], decode=True)
 
         # Read the telnet information and first prompt (for login but a password prompt can be found for IOS for instance)
         while True:
 
             # Display info message
-            log.info(f"connectTelnet: read data for prompt")
+            log.info("connectTelnet: read data for prompt")
 
             # Read returned prompt
-            byte_data += await asyncio.wait_for(
-                self._reader.read(MAX_BUFFER_DATA), timeout=self.timeout
+            output = byte_data.feed(
+                await asyncio.wait_for(
+                    self._reader.read(MAX_BUFFER_DATA), timeout=self.timeout
+                )
             )
 
             # Display info message
-            log.info(f"connectTelnet: byte_data: {byte_data}")
-
-            # Temporary convertion in string. This string has the following form: "b'....'"
-            output = str(byte_data)
-
-            # Display info message
-            log.info(f"connectTelnet: output: {output}")
+            hot_log.info("connectTelnet: output: %s", output)
 
             # Prompt for the username found?
-            if prompt in output:
+            if byte_data.contains(prompt):
 
                 # Yes
 
@@ -962,7 +1461,7 @@ class NetworkDevice:
                 break
 
             # Prompt for the password found?
-            elif prompt_password in output:
+            elif byte_data.contains(prompt_password):
 
                 # Yes
 
@@ -973,7 +1472,7 @@ class NetworkDevice:
                 break
 
         # Display info message
-        log.info(f"connectTelnet: login prompt: '{output}'")
+        hot_log.info("connectTelnet: login prompt: '%s'", byte_data.getvalue())
 
         # Login to use?
         if use_login:
@@ -983,6 +1482,9 @@ class NetworkDevice:
             # Display info message
             log.info("connectTelnet: sending login")
 
+            # The login is not measured as a command (instrumentation suspended)
+            instrumentation, self.instrumentation = self.instrumentation, None
+
             try:
 
                 # Send login
@@ -998,6 +1500,11 @@ class NetworkDevice:
                 # Propagate the exception
                 raise
 
+            finally:
+
+                # Instrumentation restored
+                self.instrumentation = instrumentation
+
         # Display info message
         log.info("connectTelnet: sending password")
 
@@ -1019,11 +1526,19 @@ class NetworkDevice:
         # Display info message
         log.info("connectTelnet: password sent")
 
+        # Instrumentation used?
+        if start:
+
+            # Yes
+
+            # Duration of the Telnet connection and of the authentication (till the first prompt)
+            emit_event(self, EVENT_AUTH, duration=time.perf_counter() - start)
+
         # Find prompt
         self.prompt = self.find_prompt(str(output))
 
         # Display info message
-        log.info(f"connectTelnet: prompt found: '{self.prompt}'")
+        hot_log.info("connectTelnet: prompt found: '%s'", self.prompt)
 
         # Password enable?
         if self.enable_mode:
@@ -1083,6 +1598,12 @@ class NetworkDevice:
         # Debug info message
         log.info("disconnect")
 
+        # Capability cache used?
+        if self.capability_cache is not None:
+
+            # Yes, the capabilities found are written in its file before leaving
+            await self.capability_cache.flush()
+
         # SSH?
         if self._protocol == "ssh":
 
@@ -1117,6 +1638,17 @@ class NetworkDevice:
         # Debug info message
         log.info("disconnectSSH")
 
+        # Pool of channels used?
+        if self._channel_pool:
+
+            # Yes
+
+            # Close all the channels
+            self._channel_pool.close()
+
+            # No more pool of channels
+            self._channel_pool = None
+
         # Connection previously open in SSH?
         if self.conn:
 
@@ -1150,17 +1682,143 @@ class NetworkDevice:
             # No more connection to disconnect
             self._writer = None
 
-    async def send_command(self, cmd, pattern=None, timeout=None):
+    async def check_connection(self, timeout=None):
         """
-        Async method used to send data to a device
-
-        :param cmd: command to send
-        :type cmd: str
+        Async method used to check if the connection to a device is still working
 
-        :param pattern: optional, a pattern replacing the prompt when the prompt is not expected
-        :type pattern: str
+        A carriage return is sent and a prompt is expected. The whole answer
+        is read (same end of output as send_command) so nothing is left for
+        the next command. No exception is raised: False is returned if the
+        device does not answer.
 
-        :param timeout: optional, a timeout for the command sent. Default value is self.timeout
+        :param timeout: optional, a timeout for the answer of the device. Default value is self.timeout
+        :type timeout: str
+
+        :return: True if the device answers with a prompt
+        :rtype: bool
+        """
+
+        # Debug info message
+        log.info("check_connection")
+
+        # Output of a previous stream_command not read till the end?
+        await self.finish_stream_command()
+
+        # Default value of timeout variable
+        if timeout is None:
+            timeout = self.timeout
+
+        # Prompts expected (only the endings if the prompts of the device are unknown)
+        prompts = self.possible_prompts or self.list_of_possible_ending_prompts
+
+        # Filter of ANSI escape sequences
+        ansi_filter = AnsiEscapeFilter()
+
+        # Buffer of the data received
+        buffer = ReceiveBuffer(
+            prompts,
+            sanitize=lambda data: ansi_filter.feed(data).replace("\r", ""),
+            decode=(self._protocol == "telnet"),
+        )
+
+        try:
+
+            # SSH?
+            if self._protocol == "ssh":
+
+                # Yes
+
+                # No session open?
+                if getattr(self, "stdinx", None) is None:
+
+                    # Yes
+
+                    # Then the connection is not working
+                    return False
+
+                # Send a carriage return
+                self.stdinx.write(self._carriage_return_for_send_command)
+
+                # Stream used to read the data
+                reader = self.stdoutx
+
+            # Telnet?
+            elif self._protocol == "telnet":
+
+                # Yes
+
+                # No connection?
+                if self._writer is None:
+
+                    # Yes
+
+                    # Then the connection is not working
+                    return False
+
+                # Send a carriage return
+                self._writer.write(self._carriage_return_for_send_command.encode())
+
+                # Stream used to read the data
+                reader = self._reader
+
+            else:
+
+                # Unsupported protocol
+                return False
+
+            # Function telling if the whole answer is received (same check as
+            # send_command: eg. Mikrotik sends the prompt twice)
+            end_of_output_found = self.get_end_of_output_detector(buffer)
+
+            # Read the answer
+            while True:
+
+                # Read the data received
+                data = await asyncio.wait_for(
+                    reader.read(MAX_BUFFER_DATA), timeout=timeout
+                )
+
+                # Connection closed by the device?
+                if not data:
+
+                    # Yes
+                    return False
+
+                # Save the data
+                buffer.feed(data)
+
+                # Whole answer received (nothing left for the next command)?
+                if end_of_output_found():
+
+                    # Yes
+
+                    # Display info message
+                    log.info("check_connection: connection working: %s", self.ip)
+
+                    # The connection is working
+                    return True
+
+        except Exception as error:
+
+            # Timeout, connection closed, etc.
+
+            # Display info message
+            log.info("check_connection: connection not working: %s: %r", self.ip, error)
+
+            # The connection is not working
+            return False
+
+    async def send_command(self, cmd, pattern=None, timeout=None):
+        """
+        Async method used to send data to a device
+
+        :param cmd: command to send
+        :type cmd: str
+
+        :param pattern: optional, a pattern replacing the prompt when the prompt is not expected
+        :type pattern: str
+
+        :param timeout: optional, a timeout for the command sent. Default value is self.timeout
         :type timeout: str
 
         :return: the output of command
@@ -1170,6 +1828,18 @@ class NetworkDevice:
         # Debug info message
         log.info("send_command")
 
+        # Pool of channels used?
+        if self._channel_pool:
+
+            # Yes
+
+            # The command is sent using a free channel
+            async with self._channel_pool.channel() as channel:
+                return await channel.send_command(cmd, pattern=pattern, timeout=timeout)
+
+        # Output of a previous stream_command not read till the end?
+        await self.finish_stream_command()
+
         # Default value of timeout variable
         if timeout is None:
             timeout = self.timeout
@@ -1202,6 +1872,253 @@ class NetworkDevice:
         # Return the result of the command
         return output
 
+    async def send_commands(self, cmds, timeout=None, cached=False):
+        """
+        Async method used to send independent commands (eg. the commands of a getter) and get their outputs
+
+        The commands do not depend on each other, so they are not always sent
+        one after the other:
+        - with several SSH channels ("channels" parameter) they run in parallel, one per channel
+        - with "getter_window" they are sent without waiting for the prompt (pipelined mode)
+        - otherwise they are sent one after the other
+
+        :param cmds: the commands to send
+        :type cmds: list
+
+        :param timeout: optional, a timeout for the commands sent. Default value is self.timeout
+        :type timeout: str
+
+        :param cached: optional, if True the outputs kept by the output cache are used and the new outputs are kept (see send_cached_command). Default value is False
+        :type cached: bool
+
+        :return: the output of each command (same order as the commands)
+        :rtype: list of str
+        """
+
+        # Display info message
+        log.info("send_commands: %s commands", len(cmds))
+
+        # Output cache used?
+        if cached and self.output_cache_ttl:
+
+            # Yes
+
+            # Outputs still valid in the cache
+            dict_outputs = {}
+            for cmd in cmds:
+                output = self.get_cached_output(cmd)
+                if output is not None:
+                    dict_outputs[cmd] = output
+
+            # Commands not in the cache (each command sent once)
+            list_of_commands = [
+                cmd for cmd in dict.fromkeys(cmds) if cmd not in dict_outputs
+            ]
+
+            # Display info message
+            log.info(
+                "send_commands: output cache: %s outputs found, %s commands sent",
+                len(cmds) - len(list_of_commands),
+                len(list_of_commands),
+            )
+
+            # Some commands to send?
+            if list_of_commands:
+
+                # Yes
+
+                # Send the commands
+                list_of_outputs = await self.send_commands(list_of_commands, timeout)
+
+                # Keep the new outputs
+                for cmd, output in zip(list_of_commands, list_of_outputs):
+                    self._output_cache[cmd] = (time.monotonic(), output)
+                    dict_outputs[cmd] = output
+
+            # Return the outputs (same order as the commands)
+            return [dict_outputs[cmd] for cmd in cmds]
+
+        # Pool of channels used?
+        if self._channel_pool:
+
+            # Yes
+
+            # All the commands at the same time (each one on a free channel)
+            tasks = [
+                asyncio.ensure_future(self.send_command(cmd, timeout=timeout))
+                for cmd in cmds
+            ]
+
+            try:
+
+                # Wait for the outputs
+                return list(await asyncio.gather(*tasks))
+
+            except BaseException:
+
+                # A command failed (error in the output, timeout...)
+
+                # Then stop the other commands like the commands sent one after the other
+                # (a channel must not be left waiting for an answer)
+                for task in tasks:
+                    task.cancel()
+
+                # Wait for the end of the commands
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+                # Raise the same exception
+                raise
+
+        # Pipelined mode?
+        if self.getter_window and self.getter_window > 1 and len(cmds) > 1:
+
+            # Yes
+
+            # The commands are sent by groups of "getter_window" commands
+            _, list_of_outputs = await self.send_commands_pipelined(
+                cmds, self.getter_window, timeout, "send_commands"
+            )
+
+            # Check if there is an error in the outputs (like "% Unrecognized command")
+            # and generate the same exception as send_command if needed
+            for output in list_of_outputs:
+                self.check_error_output(output)
+
+            return list_of_outputs
+
+        # One command after the other
+        return [await self.send_command(cmd, timeout=timeout) for cmd in cmds]
+
+    async def send_cached_command(self, cmd, timeout=None):
+        """
+        Async method used to send a show command, its output is kept and used again during "output_cache_ttl" seconds
+
+        Used by the methods reading the device before a change (eg. the
+        VLAN table). The outputs kept are removed by send_config_set. The
+        methods changing the device only remove the outputs showing what
+        they change (see clear_output_cache), or update them when the change
+        is known (see update_cached_output). Without "output_cache_ttl" the
+        command is always sent.
+
+        :param cmd: command to send (a command not changing the device)
+        :type cmd: str
+
+        :param timeout: optional, a timeout for the command sent. Default value is self.timeout
+        :type timeout: str
+
+        :return: the output of command
+        :rtype: str
+        """
+
+        # Send the command (or get its output from the cache)
+        list_of_outputs = await self.send_commands([cmd], timeout, cached=True)
+
+        # Return the output of the command
+        return list_of_outputs[0]
+
+    def get_cached_output(self, cmd):
+        """
+        Method used to get the output of a command kept by the output cache
+
+        :param cmd: the command
+        :type cmd: str
+
+        :return: the output of the command, None if not found or too old
+        :rtype: str
+        """
+
+        # Output of the command kept?
+        if cmd not in self._output_cache:
+
+            # No
+            return None
+
+        # Time when the output was received and output
+        received, output = self._output_cache[cmd]
+
+        # Output too old?
+        if time.monotonic() - received > self.output_cache_ttl:
+
+            # Yes, removed from the cache
+            del self._output_cache[cmd]
+
+            return None
+
+        # Display info message
+        log.info("get_cached_output: output found: '%s'", cmd)
+
+        return output
+
+    def clear_output_cache(self, cmds=None):
+        """
+        Method used to remove the outputs kept by the output cache
+
+        Called when the device is changed (send_config_set, add_vlan,
+        set_interface, etc.) so the next reading gets the new values. Only
+        the outputs of the commands showing what is changed are removed (eg.
+        the VLAN tables when a VLAN is added).
+
+        :param cmds: optional, the commands whose outputs are removed. Default value is None (all the outputs)
+        :type cmds: list
+        """
+
+        # Some outputs kept?
+        if not self._output_cache:
+
+            # No
+            return
+
+        # All the outputs removed?
+        if cmds is None:
+
+            # Yes
+
+            # Display info message
+            log.info("clear_output_cache: %s outputs removed", len(self._output_cache))
+
+            # Remove the outputs
+            self._output_cache.clear()
+
+            return
+
+        # Remove the outputs of the commands
+        for cmd in cmds:
+
+            # Output kept?
+            if self._output_cache.pop(cmd, None) is not None:
+
+                # Yes
+
+                # Display info message
+                log.info("clear_output_cache: output removed: '%s'", cmd)
+
+    def update_cached_output(self, cmd, output):
+        """
+        Method used to replace the output of a command kept by the output cache
+
+        Called after a change of the device whose effect on the output is
+        known (eg. an interface added to the untagged interfaces of a VLAN),
+        so the next change does not read the output again. The output keeps
+        the time it was received (same "output_cache_ttl").
+
+        :param cmd: the command
+        :type cmd: str
+
+        :param output: the new output of the command
+        :type output: str
+        """
+
+        # Output of the command kept?
+        if cmd in self._output_cache:
+
+            # Yes
+
+            # Display info message
+            log.info("update_cached_output: output updated: '%s'", cmd)
+
+            # Replace the output (same time)
+            self._output_cache[cmd] = (self._output_cache[cmd][0], output)
+
     async def send_commandSSH(self, cmd, pattern=None, timeout=None):
         """
         Async method used to send data to a device
@@ -1231,7 +2148,10 @@ class NetworkDevice:
         # cmd = cmd + "\r\n"
 
         # Debug info message
-        log.info(f"send_commandSSH: cmd = '{cmd}'")
+        hot_log.info("send_commandSSH: cmd = '%s'", cmd)
+
+        # Measure of the command (only with an instrumentation)
+        probe = self.instrumentation and CommandProbe(self, cmd)
 
         # Sending command
         self.stdinx.write(cmd + self._carriage_return_for_send_command)
@@ -1239,8 +2159,15 @@ class NetworkDevice:
         # Display message
         log.info("send_commandSSH: command sent")
 
+        # Filter of ANSI escape sequences (keeps escape sequences split over 2 chunks)
+        ansi_filter = AnsiEscapeFilter()
+
         # Variable used to gather data
-        output = ""
+        # Only the new data is sanitized: ANSI escape sequences and possible "\r" are removed
+        buffer = ReceiveBuffer(
+            self.possible_prompts + [pattern] if pattern else self.possible_prompts,
+            sanitize=lambda data: ansi_filter.feed(data).replace("\r", ""),
+        )
 
         # Reading data
         while True:
@@ -1248,33 +2175,27 @@ class NetworkDevice:
             # await asyncio.sleep(1)
 
             # Read the data received
-            output += await asyncio.wait_for(
+            data = await asyncio.wait_for(
                 self.stdoutx.read(MAX_BUFFER_DATA), timeout=timeout
             )
 
-            # Debug info message
-            # log.info(f"send_commandSSH: output hex: '{str(output).encode("utf-8").hex()}'")
-
-            # Remove ANSI escape sequence
-            output = self.remove_ansi_escape_sequence(output)
-
-            # Remove possible "\r"
-            output = output.replace("\r", "")
+            # Instrumentation used?
+            if probe:
 
-            # data = ""
-            # for i in output:
-            #     data += i.encode("utf-8").hex()
+                # Yes
+                probe.data_received(len(data))
 
-            # print(data)
+            # Remove ANSI escape sequences and "\r" of the new data
+            output = buffer.feed(data)
 
             # Debug info message
-            log.info(f"send_commandSSH: output: '{output}'")
+            hot_log.info("send_commandSSH: output: '%s'", output)
 
             # Is a patten used?
             if pattern:
 
                 # Use pattern instead of prompt
-                if pattern in output:
+                if buffer.contains(pattern):
 
                     # Yes
 
@@ -1283,18 +2204,30 @@ class NetworkDevice:
 
             else:
 
-                # Check if prompt is found
-                if self.check_if_prompt_is_found(output):
+                # Check if prompt is found (only the end of the data is checked)
+                if self.check_if_prompt_is_found(buffer.recent):
 
                     # Yes
 
                     # Leave the loop
                     break
 
+        # Instrumentation used?
+        if probe:
+
+            # Yes
+            probe.output_received()
+
+        # Get all the data received
+        output = buffer.getvalue()
+
         # Debug info message
-        log.debug(
-            f"send_commandSSH: raw output: '{output}'\nsend_commandSSH: raw output (hex): '{output.encode().hex()}'"
-        )
+        if hot_log.isEnabledFor(logging.DEBUG):
+            hot_log.debug(
+                "send_commandSSH: raw output: '%s'\nsend_commandSSH: raw output (hex): '%s'",
+                output,
+                output.encode().hex(),
+            )
 
         # Remove the command sent from the result of the command
         output = self.remove_command_in_output(output, str(cmd))
@@ -1304,9 +2237,18 @@ class NetworkDevice:
         output = self.remove_ending_prompt_in_output(output)
 
         # Debug info message
-        log.debug(
-            f"send_commandSSH: cleaned output: '{output}'\nsend_commandSSH: cleaned output (hex): '{output.encode().hex()}'"
-        )
+        if hot_log.isEnabledFor(logging.DEBUG):
+            hot_log.debug(
+                "send_commandSSH: cleaned output: '%s'\nsend_commandSSH: cleaned output (hex): '%s'",
+                output,
+                output.encode().hex(),
+            )
+
+        # Instrumentation used?
+        if probe:
+
+            # Yes
+            probe.output_cleaned()
 
         # Check if there is an error in the output string (like "% Unrecognized command")
         # and generate an exception if needed
@@ -1339,6 +2281,9 @@ class NetworkDevice:
         if timeout is None:
             timeout = self.timeout
 
+        # Measure of the command (only with an instrumentation)
+        probe = self.instrumentation and CommandProbe(self, cmd)
+
         # Add carriage return at the end of the command (mandatory to send the command)
         cmd = cmd + "\n"
 
@@ -1348,8 +2293,11 @@ class NetworkDevice:
         # Temporary string variable
         output = ""
 
-        # Temporary bytes variable
-        byte_data = b""
+        # Buffer of the data received (bytes converted into string)
+        byte_data = ReceiveBuffer(
+            self.possible_prompts + [pattern] if pattern else self.possible_prompts,
+            decode=True,
+        )
 
         try:
 
@@ -1357,24 +2305,27 @@ class NetworkDevice:
             while True:
 
                 # Read returned prompt
-                byte_data += await asyncio.wait_for(
+                data = await asyncio.wait_for(
                     self._reader.read(MAX_BUFFER_DATA), timeout=timeout
                 )
 
-                # Display info message
-                log.info(f"send_commandTelnet: byte_data: '{byte_data}'")
+                # Instrumentation used?
+                if probe:
+
+                    # Yes
+                    probe.data_received(len(data))
 
-                # Temporary convertion in string. This string has the following form: "b'....'"
-                output = str(byte_data)
+                # Convert the data into string
+                output = byte_data.feed(data)
 
                 # Display info message
-                log.info(f"send_commandTelnet: output: '{output}'")
+                hot_log.info("send_commandTelnet: output: '%s'", output)
 
                 # Is a patten used?
                 if pattern:
 
                     # Use pattern instead of prompt
-                    if pattern in output:
+                    if byte_data.contains(pattern):
 
                         # Yes
 
@@ -1383,8 +2334,8 @@ class NetworkDevice:
 
                 else:
 
-                    # Check if prompt is found
-                    if self.check_if_prompt_is_found(output):
+                    # Check if prompt is found (only the end of the data is checked)
+                    if self.check_if_prompt_is_found(byte_data.recent):
 
                         # Yes
 
@@ -1406,18 +2357,27 @@ class NetworkDevice:
             # Error during when reading prompt
 
             # Display error message
-            log.error(f"send_commandTelnet: error: {error}")
+            log.error("send_commandTelnet: error: %s", error)
 
             # Exception propagation
             raise
 
-        # Convert data (bytes) into string
-        output = byte_data.decode("utf-8", "ignore")
+        # Instrumentation used?
+        if probe:
+
+            # Yes
+            probe.output_received()
+
+        # Get all the data received (already converted into string)
+        output = byte_data.getvalue()
 
         # Debug info message
-        log.debug(
-            f"send_commandTelnet: raw output: '{output}'\nsend_commandTelnet: raw output (hex): '{output.encode().hex()}'"
-        )
+        if hot_log.isEnabledFor(logging.DEBUG):
+            hot_log.debug(
+                "send_commandTelnet: raw output: '%s'\nsend_commandTelnet: raw output (hex): '%s'",
+                output,
+                output.encode().hex(),
+            )
 
         # Remove the command sent from the result of the command
         output = self.remove_command_in_output(output, str(cmd))
@@ -1427,9 +2387,18 @@ class NetworkDevice:
         output = self.remove_ending_prompt_in_output(output)
 
         # Debug info message
-        log.debug(
-            f"send_commandTelnet: cleaned output: '{output}'\nsend_commandTelnet: cleaned output (hex): '{output.encode().hex()}'"
-        )
+        if hot_log.isEnabledFor(logging.DEBUG):
+            hot_log.debug(
+                "send_commandTelnet: cleaned output: '%s'\nsend_commandTelnet: cleaned output (hex): '%s'",
+                output,
+                output.encode().hex(),
+            )
+
+        # Instrumentation used?
+        if probe:
+
+            # Yes
+            probe.output_cleaned()
 
         # Check if there is an error in the output string (like "% Unrecognized command")
         # and generate an exception if needed
@@ -1438,6 +2407,355 @@ class NetworkDevice:
         # Return the result of the command
         return output
 
+    async def stream_command(self, cmd, timeout=None, chunks=False):
+        """
+        Asyn generator used to send a command and to get its output while it is received
+
+        The output is given line by line (or block by block) as soon as it
+        is received, without the echo of the command at the beginning and
+        without the prompt at the end (the same output as send_command). The
+        output is not kept: huge outputs (configuration, MAC address table,
+        etc.) can be parsed or written to a file with a constant memory.
+
+        If the generator is closed before the end of the output, the rest
+        of the output is read (and ignored) so the next command can be sent.
+        If it is only left (eg. "break" in "async for"), the rest of the
+        output is read before the next command sent to the device.
+
+        :param cmd: command to send
+        :type cmd: str
+
+        :param timeout: optional, a timeout for each read of the data. Default value is self.timeout
+        :type timeout: str
+
+        :param chunks: optional, if True blocks of lines are given instead of lines (joining the blocks gives the whole output). Default value is False
+        :type chunks: bool
+
+        :return: the lines of the output (without "\\n") or the blocks of lines
+        :rtype: str
+        """
+
+        # Debug info message
+        log.info("stream_command")
+
+        # Pool of channels used?
+        if self._channel_pool:
+
+            # Yes
+
+            # The command is sent using a free channel
+            async with self._channel_pool.channel() as channel:
+
+                # Output of the command on the channel
+                stream = channel.stream_command(cmd, timeout=timeout, chunks=chunks)
+
+                try:
+
+                    # Give the output
+                    async for data in stream:
+                        yield data
+
+                finally:
+
+                    # End of the output read before the channel is released
+                    # (even if the generator is closed before)
+                    await stream.aclose()
+
+            return
+
+        # Output of a previous stream_command not read till the end?
+        await self.finish_stream_command()
+
+        # Default value of timeout variable
+        if timeout is None:
+            timeout = self.timeout
+
+        # SSH?
+        if self._protocol == "ssh":
+
+            # Yes
+
+            # Sending command (SSH)
+            self.stdinx.write(cmd + self._carriage_return_for_send_command)
+            read = self.stdoutx.read
+
+        # Telnet?
+        elif self._protocol == "telnet":
+
+            # Yes
+
+            # Sending command (Telnet)
+            self._writer.write((cmd + self._carriage_return_for_send_command).encode())
+            read = self._reader.read
+
+        else:
+
+            # Unsupported protocol
+
+            # Raise an exception
+            raise Exception(f"stream_command: unsupported protocol: {self._protocol}")
+
+        # Measure of the command (only with an instrumentation; the parsing is done by the caller)
+        probe = self.instrumentation and CommandProbe(self, cmd)
+
+        # Display message
+        log.info("stream_command: command sent: '%s'", cmd)
+
+        # Filter of ANSI escape sequences (keeps escape sequences split over 2 chunks)
+        ansi_filter = AnsiEscapeFilter()
+
+        # Only the search window of the prompt is kept (not the whole output)
+        buffer = ReceiveBuffer(
+            self.possible_prompts or self.list_of_possible_ending_prompts,
+            sanitize=lambda data: ansi_filter.feed(data).replace("\r", ""),
+            decode=self._protocol == "telnet",
+            keep_data=False,
+        )
+
+        # Function telling if the end of the output is received
+        end_of_output_found = self.get_end_of_output_detector(buffer)
+
+        # Lines of the output (without the echo of the command)
+        output_lines = OutputLines(self.get_command_echo(cmd))
+
+        # Lines of an error message (like "% Invalid input detected"), read till the prompt
+        error_lines = None
+
+        # Nothing given yet
+        first_lines = True
+
+        # End of the output not yet received
+        done = False
+
+        # Generator not closed
+        closed = False
+
+        # Task reading the rest of the output if the generator is not read till the end
+        end_of_output_task = None
+
+        # Read the rest of the output (ignored) so the next command can be sent
+        async def read_end_of_output():
+
+            nonlocal done
+
+            # Display info message
+            log.info("stream_command: reading the end of the output")
+
+            try:
+
+                # Read the rest of the output
+                while not end_of_output_found():
+
+                    # Read the data received
+                    data = await asyncio.wait_for(
+                        read(MAX_BUFFER_DATA), timeout=timeout
+                    )
+
+                    # Connection closed?
+                    if not data:
+                        break
+
+                    buffer.feed(data)
+
+            except Exception as error:
+
+                # The end of the output cannot be read
+
+                # Display error message
+                log.error("stream_command: end of the output: error: %r", error)
+
+            # Nothing more to read
+            done = True
+
+        # Get the task reading the rest of the output (started only once)
+        def finish():
+
+            nonlocal end_of_output_task
+
+            # Reading of the rest of the output not yet started?
+            if end_of_output_task is None:
+
+                # Yes
+                end_of_output_task = asyncio.ensure_future(read_end_of_output())
+
+            return end_of_output_task
+
+        # The rest of the output is read before the next command if the
+        # generator is left without being closed (eg. "break" in "async for")
+        self._unfinished_stream = finish
+
+        try:
+
+            # Read the data till the prompt
+            while not done:
+
+                # Read the data received
+                data = await asyncio.wait_for(read(MAX_BUFFER_DATA), timeout=timeout)
+
+                # Connection closed?
+                if not data:
+
+                    # Yes
+                    raise Exception("stream_command: connection closed")
+
+                # Instrumentation used?
+                if probe:
+
+                    # Yes
+                    probe.data_received(len(data))
+
+                # Remove ANSI escape sequences and "\r" of the new data
+                data = buffer.feed(data)
+
+                # Debug info message
+                hot_log.info("stream_command: output: '%s'", data)
+
+                # End of the output?
+                done = end_of_output_found()
+
+                # End of the output measured (instrumentation used)?
+                if done and probe:
+
+                    # Yes
+                    probe.output_received()
+
+                # Get the lines completed
+                lines = output_lines.feed(data)
+
+                # Last lines of the output (without the prompt)
+                if done:
+                    lines += output_lines.end(self.remove_ending_prompt_in_output)
+
+                # Nothing to give?
+                if not lines:
+
+                    # Yes
+                    continue
+
+                # First line of the output with an error message (like "% Unrecognized command")?
+                if first_lines and lines[0].startswith(
+                    tuple(self._send_command_error_in_returned_output)
+                ):
+
+                    # Yes
+
+                    # The error message is read till the prompt
+                    error_lines = []
+
+                # Error message?
+                if error_lines is not None:
+
+                    # Yes
+
+                    # The lines are kept for the exception
+                    error_lines += lines
+
+                # Blocks of lines?
+                elif chunks:
+
+                    # Yes
+
+                    # Give the lines at once (with the "\n" after the previous block)
+                    yield ("" if first_lines else "\n") + "\n".join(lines)
+
+                else:
+
+                    # No
+
+                    # Give the lines one by one
+                    for line in lines:
+                        yield line
+
+                first_lines = False
+
+        except GeneratorExit:
+
+            # Generator closed before the end of the output
+            closed = True
+
+            raise
+
+        finally:
+
+            # Generator closed before the end of the output?
+            if closed and not done:
+
+                # Yes
+
+                # Read the rest of the output
+                await asyncio.shield(finish())
+
+            # Output of this command read
+            if self._unfinished_stream is finish:
+                self._unfinished_stream = None
+
+        # Error message received?
+        if error_lines is not None:
+
+            # Yes
+
+            # Raise an exception with the error message
+            self.check_error_output("\n".join(error_lines))
+
+    async def finish_stream_command(self):
+        """
+        Asyn method used to read the end of the output of stream_command if the output was not read till the end
+
+        It happens when the generator of stream_command is left without
+        being closed (eg. "break" in "async for"): the rest of the output is
+        read (and ignored) so the next command gets its own output.
+        """
+
+        # Output of stream_command not read till the end?
+        if self._unfinished_stream is None:
+
+            # No
+            return
+
+        # Display info message
+        log.info("finish_stream_command")
+
+        # Task reading the rest of the output
+        task = self._unfinished_stream()
+
+        # No more output to read
+        self._unfinished_stream = None
+
+        # Wait for the end of the output
+        await asyncio.shield(task)
+
+    def get_command_echo(self, cmd):
+        """
+        Method used to get the echo of a command at the beginning of its output
+
+        The output is given after the first occurrence of the echo.
+
+        :param cmd: the command sent
+        :type cmd: str
+
+        :return: the echo of the command
+        :rtype: str
+        """
+
+        # Command with the end of the line
+        return cmd + "\n"
+
+    def get_end_of_output_detector(self, buffer):
+        """
+        Method used to get the function telling if the end of the output of a command is received
+
+        By default the end of the output is the prompt at the end of the data.
+
+        :param buffer: the buffer receiving the data
+        :type buffer: ReceiveBuffer
+
+        :return: a function returning True if the end of the output is received (called after each chunk)
+        :rtype: function
+        """
+
+        # Prompt at the end of the data (only the end of the data is checked)
+        return lambda: self.check_if_prompt_is_found(buffer.recent)
+
     async def telnet_send_command_with_unexpected_pattern(
         self, cmd, pattern, error_pattern=None, timeout=None
     ):
@@ -1481,8 +2799,10 @@ class NetworkDevice:
         # Temporary string variable
         output = ""
 
-        # Temporary bytes variable
-        byte_data = b""
+        # Buffer of the data received (bytes converted into string)
+        byte_data = ReceiveBuffer(
+            list(pattern or []) + list(error_pattern or []), decode=True
+        )
 
         # By default pattern is not found
         pattern_not_found = True
@@ -1493,27 +2813,23 @@ class NetworkDevice:
             while pattern_not_found:
 
                 # Read returned prompt
-                byte_data += await asyncio.wait_for(
-                    self._reader.read(MAX_BUFFER_DATA), timeout=timeout
+                output = byte_data.feed(
+                    await asyncio.wait_for(
+                        self._reader.read(MAX_BUFFER_DATA), timeout=timeout
+                    )
                 )
 
                 # Display info message
-                log.info(
-                    f"telnet_send_command_with_unexpected_pattern: byte_data: '{byte_data}'"
+                hot_log.info(
+                    "telnet_send_command_with_unexpected_pattern: output: '%s'", output
                 )
 
                 # Display debug message
-                log.debug(
-                    f"telnet_send_command_with_unexpected_pattern: byte_data: hex: '{byte_data.hex()}'"
-                )
-
-                # Temporary convertion in string. This string has the following form: "b'....'"
-                output = str(byte_data)
-
-                # Display info message
-                log.info(
-                    f"telnet_send_command_with_unexpected_pattern: output: '{output}'"
-                )
+                if hot_log.isEnabledFor(logging.DEBUG):
+                    hot_log.debug(
+                        "telnet_send_command_with_unexpected_pattern: output: hex: '%s'",
+                        output.encode().hex(),
+                    )
 
                 # Is a pattern used?
                 if pattern:
@@ -1522,12 +2838,13 @@ class NetworkDevice:
                     for prompt in pattern:
 
                         # Display info message
-                        log.info(
-                            f"telnet_send_command_with_unexpected_pattern: checking prompt: '{prompt}'"
+                        hot_log.info(
+                            "telnet_send_command_with_unexpected_pattern: checking prompt: '%s'",
+                            prompt,
                         )
 
                         # A pattern found?
-                        if prompt in output:
+                        if byte_data.contains(prompt):
 
                             # Yes
 
@@ -1535,8 +2852,9 @@ class NetworkDevice:
                             pattern_not_found = False
 
                             # Display info message
-                            log.info(
-                                f"telnet_send_command_with_unexpected_pattern: prompt found: '{prompt}'"
+                            hot_log.info(
+                                "telnet_send_command_with_unexpected_pattern: prompt found: '%s'",
+                                prompt,
                             )
 
                             # Leave the loop
@@ -1549,12 +2867,13 @@ class NetworkDevice:
                     for bad_prompt in error_pattern:
 
                         # Display info message
-                        log.info(
-                            f"telnet_send_command_with_unexpected_pattern: checking unexpected prompt: '{bad_prompt}'"
+                        hot_log.info(
+                            "telnet_send_command_with_unexpected_pattern: checking unexpected prompt: '%s'",
+                            bad_prompt,
                         )
 
                         # An error_pattern pattern found?
-                        if bad_prompt in output:
+                        if byte_data.contains(bad_prompt):
 
                             # Yes
 
@@ -1595,19 +2914,23 @@ class NetworkDevice:
 
             # Display error message
             log.error(
-                f"telnet_send_command_with_unexpected_pattern: reading prompt: error: {error}"
+                "telnet_send_command_with_unexpected_pattern: reading prompt: error: %s",
+                error,
             )
 
             # Exception propagation
             raise
 
-        # Convert data (bytes) into string
-        output = byte_data.decode("utf-8", "ignore")
+        # Get all the data received (already converted into string)
+        output = byte_data.getvalue()
 
         # Debug info message
-        log.debug(
-            f"telnet_send_command_with_unexpected_pattern: raw output: '{output}'\ntelnet_send_command_with_unexpected_pattern: raw output (hex): '{output.encode().hex()}'"
-        )
+        if hot_log.isEnabledFor(logging.DEBUG):
+            hot_log.debug(
+                "telnet_send_command_with_unexpected_pattern: raw output: '%s'\ntelnet_send_command_with_unexpected_pattern: raw output (hex): '%s'",
+                output,
+                output.encode().hex(),
+            )
 
         # Remove the command sent from the result of the command
         output = self.remove_command_in_output(output, str(cmd))
@@ -1617,14 +2940,17 @@ class NetworkDevice:
         output = self.remove_ending_prompt_in_output(output)
 
         # Debug info message
-        log.debug(
-            f"telnet_send_command_with_unexpected_pattern: cleaned output: '{output}'\ntelnet_send_command_with_unexpected_pattern: cleaned output (hex): '{output.encode().hex()}'"
-        )
+        if hot_log.isEnabledFor(logging.DEBUG):
+            hot_log.debug(
+                "telnet_send_command_with_unexpected_pattern: cleaned output: '%s'\ntelnet_send_command_with_unexpected_pattern: cleaned output (hex): '%s'",
+                output,
+                output.encode().hex(),
+            )
 
         # Return the result of the command
         return output
 
-    async def send_config_set(self, cmds=None, timeout=None):
+    async def send_config_set(self, cmds=None, timeout=None, window=None):
         """
         Async method used to send command in config mode
 
@@ -1640,6 +2966,9 @@ class NetworkDevice:
         :param timeout: optional, a timeout for the command sent. Default value is self.timeout
         :type timeout: str
 
+        :param window: optional, number of commands sent without waiting for their prompt (pipelined mode). Default value is None (one command at a time)
+        :type window: int
+
         :return: the results of the commands sent
         :rtype: list of str
         """
@@ -1647,6 +2976,23 @@ class NetworkDevice:
         # Display info message
         log.info("send_config_set")
 
+        # The device is changed: the outputs kept are no more valid
+        self.clear_output_cache()
+
+        # Pool of channels used?
+        if self._channel_pool:
+
+            # Yes
+
+            # All the commands are sent using the same free channel
+            async with self._channel_pool.channel() as channel:
+                return await channel.send_config_set(
+                    cmds, timeout=timeout, window=window
+                )
+
+        # Output of a previous stream_command not read till the end?
+        await self.finish_stream_command()
+
         # Default value of timeout variable
         if timeout is None:
             timeout = self.timeout
@@ -1660,7 +3006,7 @@ class NetworkDevice:
             # Yes
 
             # Then disconnect using SSH
-            output = await self.send_config_setSSH(cmds, timeout)
+            output = await self.send_config_setSSH(cmds, timeout, window)
 
         # Telnet?
         elif self._protocol == "telnet":
@@ -1668,7 +3014,7 @@ class NetworkDevice:
             # Yes
 
             # Then disconnect using Telnet
-            output = await self.send_config_setTelnet(cmds, timeout)
+            output = await self.send_config_setTelnet(cmds, timeout, window)
 
         else:
 
@@ -1680,7 +3026,7 @@ class NetworkDevice:
         # Return the result of the commands
         return output
 
-    async def send_config_setSSH(self, cmds=None, timeout=None):
+    async def send_config_setSSH(self, cmds=None, timeout=None, window=None):
         """
         Async method used to send command in config mode
 
@@ -1696,6 +3042,9 @@ class NetworkDevice:
         :param timeout: optional, a timeout for the command sent. Default value is self.timeout
         :type timeout: str
 
+        :param window: optional, number of commands sent without waiting for their prompt (pipelined mode). Default value is None (one command at a time)
+        :type window: int
+
         :return: the results of the commands sent
         :rtype: list of str
         """
@@ -1719,7 +3068,7 @@ class NetworkDevice:
             cmds = [cmds]
 
             # A list?
-        elif not isinstance(cmds, list):
+        elif not isinstance(cmds, (list, tuple)):
 
             # Not a list (and not a string)
 
@@ -1748,7 +3097,7 @@ class NetworkDevice:
         cmd = cmd + self._carriage_return_for_send_command
 
         # Display info message
-        log.info(f"send_config_setSSH: cmd = '{cmd}'")
+        hot_log.info("send_config_setSSH: cmd = '%s'", cmd)
 
         # Sending command
         self.stdinx.write(cmd)
@@ -1756,28 +3105,39 @@ class NetworkDevice:
         # Display message
         log.info("send_config_setSSH: configuration mode entered")
 
+        # Buffer of the data received
+        buffer = ReceiveBuffer(self.possible_prompts)
+
         while True:
 
             # Read the data received
-            output += await asyncio.wait_for(
-                self.stdoutx.read(MAX_BUFFER_DATA), timeout=timeout
+            output = buffer.feed(
+                await asyncio.wait_for(
+                    self.stdoutx.read(MAX_BUFFER_DATA), timeout=timeout
+                )
             )
 
             # Display info message
-            log.info(f"send_config_setSSH: output: '{output}'")
+            hot_log.info("send_config_setSSH: output: '%s'", output)
 
-            # Check if prompt is found
-            if self.check_if_prompt_is_found(output):
+            # Check if prompt is found (only the end of the data is checked)
+            if self.check_if_prompt_is_found(buffer.recent):
 
                 # Yes
 
                 # Leave the loop
                 break
 
+        # Get all the data received
+        output = buffer.getvalue()
+
         # Debug info message
-        log.debug(
-            f"send_config_setSSH: raw output: '{output}'\nsend_config_setSSH: raw output (hex): '{output.encode().hex()}'"
-        )
+        if hot_log.isEnabledFor(logging.DEBUG):
+            hot_log.debug(
+                "send_config_setSSH: raw output: '%s'\nsend_config_setSSH: raw output (hex): '%s'",
+                output,
+                output.encode().hex(),
+            )
 
         # Add the output to the returned output
         returned_output += output
@@ -1790,9 +3150,12 @@ class NetworkDevice:
         output = self.remove_ending_prompt_in_output(output)
 
         # Display info message
-        log.debug(
-            f"send_config_setSSH: cleaned output: '{output}'\nsend_config_setSSH: cleaned output (hex): '{output.encode().hex()}'"
-        )
+        if hot_log.isEnabledFor(logging.DEBUG):
+            hot_log.debug(
+                "send_config_setSSH: cleaned output: '%s'\nsend_config_setSSH: cleaned output (hex): '%s'",
+                output,
+                output.encode().hex(),
+            )
 
         # Check if there is an error in the output string (like "% Unrecognized command")
         # and generate an exception if needed
@@ -1808,6 +3171,19 @@ class NetworkDevice:
         # Clear output
         output = ""
 
+        # Pipelined mode?
+        if window and window > 1:
+
+            # Yes
+
+            # The commands are sent by groups of "window" commands
+            returned_output += await self.send_config_commands_pipelined(
+                cmds, window, timeout
+            )
+
+            # No more command to send one by one
+            cmds = []
+
         # Each command
         for cmd in cmds:
 
@@ -1815,7 +3191,7 @@ class NetworkDevice:
             cmd = cmd + self._carriage_return_for_send_command
 
             # Display info message
-            log.info(f"send_config_setSSH: cmd = '{cmd}'")
+            hot_log.info("send_config_setSSH: cmd = '%s'", cmd)
 
             # Sending command
             self.stdinx.write(cmd)
@@ -1823,28 +3199,39 @@ class NetworkDevice:
             # Display info message
             log.info("send_config_setSSH: command sent")
 
+            # Buffer of the data received (one buffer per command)
+            buffer = ReceiveBuffer(self.possible_prompts)
+
             while True:
 
                 # Read the data received
-                output += await asyncio.wait_for(
-                    self.stdoutx.read(MAX_BUFFER_DATA), timeout=timeout
+                output = buffer.feed(
+                    await asyncio.wait_for(
+                        self.stdoutx.read(MAX_BUFFER_DATA), timeout=timeout
+                    )
                 )
 
                 # Display info message
-                log.info(f"send_config_setSSH: output: '{output}'")
+                hot_log.info("send_config_setSSH: output: '%s'", output)
 
-                # Check if prompt is found
-                if self.check_if_prompt_is_found(output):
+                # Check if prompt is found (only the end of the data is checked)
+                if self.check_if_prompt_is_found(buffer.recent):
 
                     # Yes
 
                     # Leave the loop
                     break
 
+            # Get all the data received
+            output = buffer.getvalue()
+
             # Debug info message
-            log.debug(
-                f"send_config_setSSH: raw output: '{output}'\nsend_config_setSSH: raw output (hex): '{output.encode().hex()}'"
-            )
+            if hot_log.isEnabledFor(logging.DEBUG):
+                hot_log.debug(
+                    "send_config_setSSH: raw output: '%s'\nsend_config_setSSH: raw output (hex): '%s'",
+                    output,
+                    output.encode().hex(),
+                )
 
             # Add the output to the returned output
             returned_output += output
@@ -1857,9 +3244,12 @@ class NetworkDevice:
             output = self.remove_ending_prompt_in_output(output)
 
             # Display info message
-            log.debug(
-                f"send_config_setSSH: cleaned output: '{output}'\nsend_config_setSSH: cleaned output (hex): '{output.encode().hex()}'"
-            )
+            if hot_log.isEnabledFor(logging.DEBUG):
+                hot_log.debug(
+                    "send_config_setSSH: cleaned output: '%s'\nsend_config_setSSH: cleaned output (hex): '%s'",
+                    output,
+                    output.encode().hex(),
+                )
 
             # Check if there is an error in the output string (like "% Unrecognized command")
             # and generate an exception if needed
@@ -1882,7 +3272,7 @@ class NetworkDevice:
         cmd = cmd + self._carriage_return_for_send_command
 
         # Display info message
-        log.info(f"send_config_setSSH: cmd = '{cmd}'")
+        hot_log.info("send_config_setSSH: cmd = '%s'", cmd)
 
         # Sending command
         self.stdinx.write(cmd)
@@ -1890,28 +3280,39 @@ class NetworkDevice:
         # Display info message
         log.info("send_config_setSSH: command to leave configuration mode sent")
 
+        # Buffer of the data received
+        buffer = ReceiveBuffer(self.possible_prompts)
+
         while True:
 
             # Read the data received
-            output += await asyncio.wait_for(
-                self.stdoutx.read(MAX_BUFFER_DATA), timeout=timeout
+            output = buffer.feed(
+                await asyncio.wait_for(
+                    self.stdoutx.read(MAX_BUFFER_DATA), timeout=timeout
+                )
             )
 
             # Display info message
-            log.info(f"send_config_setSSH: output: '{output}'")
+            hot_log.info("send_config_setSSH: output: '%s'", output)
 
-            # Check if prompt is found
-            if self.check_if_prompt_is_found(output):
+            # Check if prompt is found (only the end of the data is checked)
+            if self.check_if_prompt_is_found(buffer.recent):
 
                 # Yes
 
                 # Leave the loop
                 break
 
+        # Get all the data received
+        output = buffer.getvalue()
+
         # Debug info message
-        log.debug(
-            f"send_config_setSSH: raw output: '{output}'\nsend_config_setSSH: raw output (hex): '{output.encode().hex()}'"
-        )
+        if hot_log.isEnabledFor(logging.DEBUG):
+            hot_log.debug(
+                "send_config_setSSH: raw output: '%s'\nsend_config_setSSH: raw output (hex): '%s'",
+                output,
+                output.encode().hex(),
+            )
 
         # Add the output to the returned output
         returned_output += output
@@ -1924,9 +3325,12 @@ class NetworkDevice:
         output = self.remove_ending_prompt_in_output(output)
 
         # Display info message
-        log.debug(
-            f"send_config_setSSH: cleaned output: '{output}'\nsend_config_setSSH: cleaned output (hex): '{output.encode().hex()}'"
-        )
+        if hot_log.isEnabledFor(logging.DEBUG):
+            hot_log.debug(
+                "send_config_setSSH: cleaned output: '%s'\nsend_config_setSSH: cleaned output (hex): '%s'",
+                output,
+                output.encode().hex(),
+            )
 
         # Check if there is an error in the output string (like "% Unrecognized command")
         # and generate an exception if needed
@@ -1935,7 +3339,7 @@ class NetworkDevice:
         # Return the result of the commands
         return returned_output
 
-    async def send_config_setTelnet(self, cmds=None, timeout=None):
+    async def send_config_setTelnet(self, cmds=None, timeout=None, window=None):
         """
         Async method used to send command in config mode
 
@@ -1951,6 +3355,9 @@ class NetworkDevice:
         :param timeout: optional, a timeout for the command sent. Default value is self.timeout
         :type timeout: str
 
+        :param window: optional, number of commands sent without waiting for their prompt (pipelined mode). Default value is None (one command at a time)
+        :type window: int
+
         :return: the results of the commands sent
         :rtype: list of str
         """
@@ -1974,7 +3381,7 @@ class NetworkDevice:
             cmds = [cmds]
 
             # A list?
-        elif not isinstance(cmds, list):
+        elif not isinstance(cmds, (list, tuple)):
 
             # Not a list (and not a string)
 
@@ -2003,7 +3410,7 @@ class NetworkDevice:
         cmd = cmd + self._carriage_return_for_send_command
 
         # Display info message
-        log.info(f"send_config_setTelnet: cmd = '{cmd}'")
+        hot_log.info("send_config_setTelnet: cmd = '%s'", cmd)
 
         # Sending command
         self._writer.write(cmd.encode())
@@ -2014,8 +3421,8 @@ class NetworkDevice:
         # Temporary string variable
         output = ""
 
-        # Temporary bytes variable
-        byte_data = b""
+        # Buffer of the data received (bytes converted into string)
+        byte_data = ReceiveBuffer(self.possible_prompts, decode=True)
 
         try:
 
@@ -2023,18 +3430,17 @@ class NetworkDevice:
             while True:
 
                 # Read the data received
-                byte_data += await asyncio.wait_for(
-                    self._reader.read(MAX_BUFFER_DATA), timeout=timeout
+                output = byte_data.feed(
+                    await asyncio.wait_for(
+                        self._reader.read(MAX_BUFFER_DATA), timeout=timeout
+                    )
                 )
 
-                # Temporary convertion in string. This string has the following form: "b'....'"
-                output = str(byte_data)
-
                 # Display info message
-                log.info(f"send_config_setTelnet: output: '{output}'")
+                hot_log.info("send_config_setTelnet: output: '%s'", output)
 
-                # Check if prompt is found
-                if self.check_if_prompt_is_found(output):
+                # Check if prompt is found (only the end of the data is checked)
+                if self.check_if_prompt_is_found(byte_data.recent):
 
                     # Yes
 
@@ -2056,18 +3462,21 @@ class NetworkDevice:
             # Error during when reading prompt
 
             # Display error message
-            log.error(f"send_config_setTelnet: error: {error}")
+            log.error("send_config_setTelnet: error: %s", error)
 
             # Exception propagation
             raise
 
-        # Convert data (bytes) into string
-        output = byte_data.decode("utf-8", "ignore")
+        # Get all the data received (already converted into string)
+        output = byte_data.getvalue()
 
         # Debug info message
-        log.debug(
-            f"send_config_setTelnet: raw output: '{output}'\nsend_config_setTelnet: raw output (hex): '{output.encode().hex()}'"
-        )
+        if hot_log.isEnabledFor(logging.DEBUG):
+            hot_log.debug(
+                "send_config_setTelnet: raw output: '%s'\nsend_config_setTelnet: raw output (hex): '%s'",
+                output,
+                output.encode().hex(),
+            )
 
         # Add the output to the returned output
         returned_output += output
@@ -2080,9 +3489,12 @@ class NetworkDevice:
         output = self.remove_ending_prompt_in_output(output)
 
         # Display info message
-        log.debug(
-            f"send_config_setTelnet: cleaned output: '{output}'\nsend_config_setTelnet: cleaned output (hex): '{output.encode().hex()}'"
-        )
+        if hot_log.isEnabledFor(logging.DEBUG):
+            hot_log.debug(
+                "send_config_setTelnet: cleaned output: '%s'\nsend_config_setTelnet: cleaned output (hex): '%s'",
+                output,
+                output.encode().hex(),
+            )
 
         # Check if there is an error in the output string (like "% Unrecognized command")
         # and generate an exception if needed
@@ -2098,6 +3510,19 @@ class NetworkDevice:
         # Clear output
         output = ""
 
+        # Pipelined mode?
+        if window and window > 1:
+
+            # Yes
+
+            # The commands are sent by groups of "window" commands
+            returned_output += await self.send_config_commands_pipelined(
+                cmds, window, timeout
+            )
+
+            # No more command to send one by one
+            cmds = []
+
         # Each command
         for cmd in cmds:
 
@@ -2105,7 +3530,7 @@ class NetworkDevice:
             cmd = cmd + self._carriage_return_for_send_command
 
             # Display info message
-            log.info(f"send_config_setTelnet: cmd = '{cmd}'")
+            hot_log.info("send_config_setTelnet: cmd = '%s'", cmd)
 
             # Sending command
             self._writer.write(cmd.encode())
@@ -2116,8 +3541,8 @@ class NetworkDevice:
             # Temporary string variable
             output = ""
 
-            # Temporary bytes variable
-            byte_data = b""
+            # Buffer of the data received (bytes converted into string)
+            byte_data = ReceiveBuffer(self.possible_prompts, decode=True)
 
             try:
 
@@ -2125,18 +3550,17 @@ class NetworkDevice:
                 while True:
 
                     # Read the data received
-                    byte_data += await asyncio.wait_for(
-                        self._reader.read(MAX_BUFFER_DATA), timeout=timeout
+                    output = byte_data.feed(
+                        await asyncio.wait_for(
+                            self._reader.read(MAX_BUFFER_DATA), timeout=timeout
+                        )
                     )
 
-                    # Temporary convertion in string. This string has the following form: "b'....'"
-                    output = str(byte_data)
-
                     # Display info message
-                    log.info(f"send_config_setTelnet: output: '{output}'")
+                    hot_log.info("send_config_setTelnet: output: '%s'", output)
 
-                    # Check if prompt is found
-                    if self.check_if_prompt_is_found(output):
+                    # Check if prompt is found (only the end of the data is checked)
+                    if self.check_if_prompt_is_found(byte_data.recent):
 
                         # Yes
 
@@ -2158,18 +3582,21 @@ class NetworkDevice:
                 # Error during when reading prompt
 
                 # Display error message
-                log.error(f"send_config_setTelnet: error: {error}")
+                log.error("send_config_setTelnet: error: %s", error)
 
                 # Exception propagation
                 raise
 
-            # Convert data (bytes) into string
-            output = byte_data.decode("utf-8", "ignore")
+            # Get all the data received (already converted into string)
+            output = byte_data.getvalue()
 
             # Debug info message
-            log.debug(
-                f"send_config_setTelnet: raw output: '{output}'\nsend_config_setTelnet: raw output (hex): '{output.encode().hex()}'"
-            )
+            if hot_log.isEnabledFor(logging.DEBUG):
+                hot_log.debug(
+                    "send_config_setTelnet: raw output: '%s'\nsend_config_setTelnet: raw output (hex): '%s'",
+                    output,
+                    output.encode().hex(),
+                )
 
             # Add the output to the returned output
             returned_output += output
@@ -2182,9 +3609,12 @@ class NetworkDevice:
             output = self.remove_ending_prompt_in_output(output)
 
             # Display info message
-            log.debug(
-                f"send_config_setTelnet: cleaned output: '{output}'\nsend_config_setTelnet: cleaned output (hex): '{output.encode().hex()}'"
-            )
+            if hot_log.isEnabledFor(logging.DEBUG):
+                hot_log.debug(
+                    "send_config_setTelnet: cleaned output: '%s'\nsend_config_setTelnet: cleaned output (hex): '%s'",
+                    output,
+                    output.encode().hex(),
+                )
 
             # Check if there is an error in the output string (like "% Unrecognized command")
             # and generate an exception if needed
@@ -2207,7 +3637,7 @@ class NetworkDevice:
         cmd = cmd + self._carriage_return_for_send_command
 
         # Display info message
-        log.info(f"send_config_setTelnet: cmd = '{cmd}'")
+        hot_log.info("send_config_setTelnet: cmd = '%s'", cmd)
 
         # Sending command
         self._writer.write(cmd.encode())
@@ -2218,8 +3648,8 @@ class NetworkDevice:
         # Temporary string variable
         output = ""
 
-        # Temporary bytes variable
-        byte_data = b""
+        # Buffer of the data received (bytes converted into string)
+        byte_data = ReceiveBuffer(self.possible_prompts, decode=True)
 
         # Protection against infinite loop
         loop = 3
@@ -2230,20 +3660,19 @@ class NetworkDevice:
             while loop:
 
                 # Read the data received
-                byte_data += await asyncio.wait_for(
-                    self._reader.read(MAX_BUFFER_DATA), timeout=timeout
+                output = byte_data.feed(
+                    await asyncio.wait_for(
+                        self._reader.read(MAX_BUFFER_DATA), timeout=timeout
+                    )
                 )
 
-                # Temporary convertion in string. This string has the following form: "b'....'"
-                output = str(byte_data)
-
                 # Display info message
-                log.info(f"send_config_setTelnet: output: '{output}'")
+                hot_log.info("send_config_setTelnet: output: '%s'", output)
 
                 await asyncio.sleep(0.5)
 
-                # Check if prompt is found
-                if self.check_if_prompt_is_found(output):
+                # Check if prompt is found (only the end of the data is checked)
+                if self.check_if_prompt_is_found(byte_data.recent):
 
                     # Yes
 
@@ -2268,18 +3697,21 @@ class NetworkDevice:
             # Error during when reading prompt
 
             # Display error message
-            log.error(f"send_config_setTelnet: error: {error}")
+            log.error("send_config_setTelnet: error: %s", error)
 
             # Exception propagation
             raise
 
-        # Convert data (bytes) into string
-        output = byte_data.decode("utf-8", "ignore")
+        # Get all the data received (already converted into string)
+        output = byte_data.getvalue()
 
         # Debug info message
-        log.debug(
-            f"send_config_setTelnet: raw output: '{output}'\nsend_config_setTelnet: raw output (hex): '{output.encode().hex()}'"
-        )
+        if hot_log.isEnabledFor(logging.DEBUG):
+            hot_log.debug(
+                "send_config_setTelnet: raw output: '%s'\nsend_config_setTelnet: raw output (hex): '%s'",
+                output,
+                output.encode().hex(),
+            )
 
         # Add the output to the returned output
         returned_output += output
@@ -2292,9 +3724,12 @@ class NetworkDevice:
         output = self.remove_ending_prompt_in_output(output)
 
         # Display info message
-        log.debug(
-            f"send_config_setTelnet: cleaned output: '{output}'\nsend_config_setTelnet: cleaned output (hex): '{output.encode().hex()}'"
-        )
+        if hot_log.isEnabledFor(logging.DEBUG):
+            hot_log.debug(
+                "send_config_setTelnet: cleaned output: '%s'\nsend_config_setTelnet: cleaned output (hex): '%s'",
+                output,
+                output.encode().hex(),
+            )
 
         # Check if there is an error in the output string (like "% Unrecognized command")
         # and generate an exception if needed
@@ -2303,6 +3738,396 @@ class NetworkDevice:
         # Return the result of the commands
         return returned_output
 
+    async def send_config_commands_pipelined(self, cmds, window, timeout=None):
+        """
+        Async method used to send configuration commands without waiting for the prompt after each command
+
+        See send_commands_pipelined.
+
+        :param cmds: The commands to the device
+        :type cmds: list
+
+        :param window: the maximum number of commands sent without their answer
+        :type window: int
+
+        :param timeout: optional, a timeout for the data read. Default value is self.timeout
+        :type timeout: str
+
+        :return: the results of the commands sent
+        :rtype: str
+        """
+
+        # Send the commands (an error returned by a command stops the commands)
+        list_of_answers, _ = await self.send_commands_pipelined(
+            cmds, window, timeout, "send_config_set", check_error=True, sanitize=False
+        )
+
+        # Return the results of the commands
+        return "".join(list_of_answers)
+
+    async def send_commands_pipelined(
+        self,
+        cmds,
+        window,
+        timeout=None,
+        name="send_commands_pipelined",
+        check_error=False,
+        sanitize=True,
+    ):
+        """
+        Async method used to send commands without waiting for the prompt after each command
+
+        Up to "window" commands are sent before their answers are read. The
+        data received is then split back per command: the answer of a command
+        ends with a prompt at the beginning of a line followed by the echo of
+        the next command. The device must echo the commands sent in advance
+        after its prompt (like Cisco IOS). The outputs are cleaned like with
+        send_command (echo and prompt removed; with "sanitize" and SSH, ANSI
+        escape sequences and "\\r" removed when the data is received).
+
+        With "check_error", if a command returns an error, no more command is
+        sent, the answers of the commands already sent are read and an
+        exception with the line of the command is raised. The commands sent
+        after the wrong one (at most "window - 1" commands) may have been
+        applied by the device.
+
+        :param cmds: The commands to the device
+        :type cmds: list
+
+        :param window: the maximum number of commands sent without their answer
+        :type window: int
+
+        :param timeout: optional, a timeout for the data read. Default value is self.timeout
+        :type timeout: str
+
+        :param name: optional, the name of the method given in the error message. Default value is "send_commands_pipelined"
+        :type name: str
+
+        :param check_error: optional, if True the outputs are checked (check_error_output) and an error stops the commands (configuration commands). Default value is False
+        :type check_error: bool
+
+        :param sanitize: optional, if True the data received with SSH is sanitized like with send_commandSSH, if False the answers are kept raw like with send_config_setSSH. Default value is True
+        :type sanitize: bool
+
+        :return: the answers of the commands (with their echo and prompt) and the outputs of the commands
+        :rtype: tuple of list
+        """
+
+        # Display info message
+        log.info("send_commands_pipelined: window: %s", window)
+
+        # Output of a previous stream_command not read till the end?
+        await self.finish_stream_command()
+
+        # Default value of timeout variable
+        if timeout is None:
+            timeout = self.timeout
+
+        # SSH with the data sanitized?
+        if self._protocol == "ssh" and sanitize:
+
+            # Yes
+
+            # Filter of ANSI escape sequences (keeps escape sequences split over 2 chunks)
+            ansi_filter = AnsiEscapeFilter()
+
+            # Buffer of the data received
+            # Only the new data is sanitized: ANSI escape sequences and possible "\r" are removed (same as send_commandSSH)
+            buffer = ReceiveBuffer(
+                self.possible_prompts,
+                sanitize=lambda data: ansi_filter.feed(data).replace("\r", ""),
+            )
+
+        else:
+
+            # No
+
+            # Buffer of the data received (bytes converted into string with Telnet, same as send_commandTelnet)
+            buffer = ReceiveBuffer(
+                self.possible_prompts, decode=(self._protocol == "telnet")
+            )
+
+        # Data received not yet given to a command
+        pending = ""
+
+        # Position in "pending" of the first line not yet checked by find_end_of_pipelined_output
+        # (only the new data is searched, not all the data again)
+        scan = 0
+
+        # Next command used when the lines before "scan" were checked
+        scanned_next_cmd = None
+
+        # Answers of the commands (with their echo and prompt)
+        list_of_answers = []
+
+        # Outputs of the commands
+        list_of_outputs = []
+
+        # Number of commands sent
+        number_of_commands_sent = 0
+
+        # Error of a command
+        command_error = None
+
+        # Read until all the commands sent have an answer (and all the commands are sent if no error)
+        while len(list_of_answers) < number_of_commands_sent or (
+            command_error is None and len(list_of_answers) < len(cmds)
+        ):
+
+            # Send the next commands (if no error) without more than "window" commands waiting for an answer
+            while (
+                command_error is None
+                and number_of_commands_sent < len(cmds)
+                and number_of_commands_sent - len(list_of_answers) < window
+            ):
+
+                # Add carriage return at the end of the command (mandatory to send the command)
+                cmd = (
+                    cmds[number_of_commands_sent]
+                    + self._carriage_return_for_send_command
+                )
+
+                # Display info message
+                hot_log.info("send_commands_pipelined: cmd = '%s'", cmd)
+
+                # SSH?
+                if self._protocol == "ssh":
+
+                    # Yes
+
+                    # Sending command
+                    self.stdinx.write(cmd)
+
+                else:
+
+                    # No, Telnet
+
+                    # Sending command
+                    self._writer.write(cmd.encode())
+
+                # One more command sent
+                number_of_commands_sent += 1
+
+            # Read the data received
+            if self._protocol == "ssh":
+                data = buffer.feed(
+                    await asyncio.wait_for(
+                        self.stdoutx.read(MAX_BUFFER_DATA), timeout=timeout
+                    )
+                )
+            else:
+                data = buffer.feed(
+                    await asyncio.wait_for(
+                        self._reader.read(MAX_BUFFER_DATA), timeout=timeout
+                    )
+                )
+
+            # Display info message
+            hot_log.info("send_commands_pipelined: output: '%s'", data)
+
+            # Add the new data to the data not yet given to a command
+            pending += data
+
+            # Give the data to the commands waiting for an answer
+            while len(list_of_answers) < number_of_commands_sent:
+
+                # Index of the command waiting for its answer
+                index = len(list_of_answers)
+
+                # Next command sent (None if the next command is not sent yet)
+                next_cmd = (
+                    cmds[index + 1] if index + 1 < number_of_commands_sent else None
+                )
+
+                # Next command sent since the lines were checked?
+                if next_cmd != scanned_next_cmd:
+
+                    # Yes, all the lines are checked again
+                    scan = 0
+                    scanned_next_cmd = next_cmd
+
+                # Search the end of the answer of the command (in the lines not yet checked)
+                end = self.find_end_of_pipelined_output(pending, next_cmd, scan)
+
+                # Answer not complete?
+                if end == -1:
+
+                    # Yes
+
+                    # The last line (maybe not complete) is checked again with the next data
+                    last_line = pending.rfind("\n", scan)
+                    if last_line != -1:
+                        scan = last_line + 1
+
+                    # More data is needed
+                    break
+
+                # Get the answer of the command
+                output = pending[:end]
+                pending = pending[end:]
+
+                # The data of the next command is not yet checked
+                scan = 0
+                scanned_next_cmd = None
+
+                # Save the answer
+                list_of_answers.append(output)
+
+                # Get the command (with its carriage return with Telnet, same as send_commandSSH and send_commandTelnet)
+                cmd = cmds[index]
+                if self._protocol == "telnet":
+                    cmd += self._carriage_return_for_send_command
+
+                # Remove the command sent from the result of the command
+                output = self.remove_command_in_output(output, str(cmd))
+                # Remove the carriage return of the output
+                output = self.remove_starting_carriage_return_in_output(output)
+                # Remove the ending prompt of the output
+                output = self.remove_ending_prompt_in_output(output)
+
+                # Save the output
+                list_of_outputs.append(output)
+
+                # Outputs not checked?
+                if not check_error:
+
+                    # Yes
+                    continue
+
+                try:
+
+                    # Check if there is an error in the output string (like "% Unrecognized command")
+                    # and generate an exception if needed
+                    self.check_error_output(output)
+
+                except Exception as error:
+
+                    # Error returned by the command
+
+                    # First error?
+                    if command_error is None:
+
+                        # Yes
+
+                        # Display error message
+                        log.error(
+                            "%s: error at line %s: '%s'",
+                            name,
+                            index + 1,
+                            cmds[index],
+                        )
+
+                        # Save the error with the line of the command (no more command is sent)
+                        command_error = Exception(
+                            f"{name}: line {index + 1}: '{cmds[index]}': {error}"
+                        )
+
+        # Error returned by a command?
+        if command_error:
+
+            # Yes
+
+            # Exception propagation
+            raise command_error
+
+        # Return the answers and the outputs of the commands
+        return list_of_answers, list_of_outputs
+
+    def find_end_of_pipelined_output(self, text, next_cmd, start=0):
+        """
+        Method used to find the end of the answer of a command when several commands are sent
+
+        The answer starts with the echo of the command and ends with a prompt
+        at the beginning of a line. If the next command is already sent, its
+        echo must follow the prompt (so a prompt inside the output is not
+        used).
+
+        :param text: the data received starting with the answer of the command
+        :type text: str
+
+        :param next_cmd: the next command sent (None if the next command is not yet sent)
+        :type next_cmd: str
+
+        :param start: optional, beginning of the first line to check (the lines before were already checked). Default value is 0 (all the lines after the echo of the command)
+        :type start: int
+
+        :return: the position of the end of the answer or -1 if the answer is not complete
+        :rtype: int
+        """
+
+        # First search?
+        if start == 0:
+
+            # Yes
+
+            # The prompt is searched after the echo of the command (first line)
+            start = text.find("\n") + 1
+
+            # Echo of the command not yet received?
+            if start == 0:
+
+                # Yes
+                return -1
+
+        # Check all the prompts at the beginning of a line
+        while True:
+
+            # Search the next prompt
+            match = self._prompt_matcher.search_line(text, start)
+
+            # No prompt?
+            if not match:
+
+                # Yes
+                return -1
+
+            # End of the prompt
+            end = match.end()
+
+            # Is the next command already sent?
+            if next_cmd is None:
+
+                # No
+
+                # Then the prompt must be at the end of the data
+                if end == len(text):
+
+                    # End of the answer
+                    return end
+
+            else:
+
+                # Yes
+
+                # Part of the echo which can be compared (the echo of a long command can be modified by the device)
+                size = min(len(next_cmd), 20)
+                echo = text[end : end + size]
+
+                # Echo of the next command after the prompt?
+                if echo == next_cmd[:size]:
+
+                    # Yes
+
+                    # End of the answer
+                    return end
+
+                # Beginning of the echo only (the rest of the echo is not yet received)?
+                if len(echo) < size and next_cmd.startswith(echo):
+
+                    # Yes
+
+                    # More data is needed (a line of the output can look like a prompt)
+                    return -1
+
+            # Not the prompt ending the answer; search in the next lines
+            start = text.find("\n", end) + 1
+
+            # No more line?
+            if start == 0:
+
+                # Yes
+                return -1
+
     #########################################################
     #
     # List of API
@@ -2320,17 +4145,31 @@ class NetworkDevice:
         # Display info message
         log.info("get_version")
 
-        # By default empty string
-        version = ""
-
         # Run get version on the device
         output = await self.send_command(self.cmd_get_version)
 
+        # Get the version of the software of the device from the output
+        return self.parse_version(output)
+
+    def parse_version(self, output):
+        """
+        Method used to get the version of the software of the device from the output of cmd_get_version
+
+        :param output: the output of cmd_get_version
+        :type output: str
+
+        :return: Version of the software of the device
+        :rtype: str
+        """
+
+        # By default empty string
+        version = ""
+
         # Seek "Version " and "," to get the version in the returned output
         version = output.split("Version ")[1].split(",")[0]
 
         # Display info message
-        log.info(f"get_version: version: {version}")
+        log.info("get_version: version: %s", version)
 
         # Return the version of the software of the device
         return version
@@ -2349,14 +4188,40 @@ class NetworkDevice:
         # Get hostname
         output = await self.send_command(self.cmd_get_hostname)
 
+        # Get the name of the device from the output
+        return self.parse_hostname(output)
+
+    def parse_hostname(self, output):
+        """
+        Method used to get the name of the device from the output of cmd_get_hostname
+
+        :param output: the output of cmd_get_hostname
+        :type output: str
+
+        :return: Name of the device
+        :rtype: str
+        """
+
         # Display info message
-        log.info(f"get_hostname: output: '{output}'")
+        log.info("get_hostname: output: '%s'", output)
+
+        # Line with the uptime ("switch uptime is 1 week, 2 days, ..."; same command as get_version)
+        for line in output.splitlines():
+
+            # Is "uptime is" part of the line?
+            if " uptime is " in line:
+
+                # Yes, the line is kept
+                output = line
+
+                # Leave the loop
+                break
 
         # Remove the useless information in the returned string
         output = output.split()[0]
 
         # Display info message
-        log.info(f"get_hostname: hostname found: '{output}'")
+        log.info("get_hostname: hostname found: '%s'", output)
 
         # Return the name of the device
         return output
@@ -2375,14 +4240,28 @@ class NetworkDevice:
         # Get model
         output = await self.send_command(self.cmd_get_model)
 
+        # Get the model of the device from the output
+        return self.parse_model(output)
+
+    def parse_model(self, output):
+        """
+        Method used to get the model of the device from the output of cmd_get_model
+
+        :param output: the output of cmd_get_model
+        :type output: str
+
+        :return: Model of the device
+        :rtype: str
+        """
+
         # Display info message
-        log.info(f"get_model: output: '{output}'")
+        log.info("get_model: output: '%s'", output)
 
         # Remove the useless information in the returned string
         output = output.split('"')[3]
 
         # Display info message
-        log.info(f"get_model: model found: '{output}'")
+        log.info("get_model: model found: '%s'", output)
 
         # Return the model of the device
         return output
@@ -2401,17 +4280,83 @@ class NetworkDevice:
         # Get serial number
         output = await self.send_command(self.cmd_get_serial_number)
 
+        # Get the serial number of the device (first switch of a stack) from the output
+        return self.parse_serial_number(output)
+
+    def parse_serial_number(self, output):
+        """
+        Method used to get the serial number of the device (first switch of a stack) from the output of cmd_get_serial_number
+
+        :param output: the output of cmd_get_serial_number
+        :type output: str
+
+        :return: Serial number of the device
+        :rtype: str
+        """
+
         # Display info message
-        log.info(f"get_serial_number: output: '{output}'")
+        log.info("get_serial_number: output: '%s'", output)
 
-        # Remove the useless information in the returned string
-        output = output.splitlines()[0].split()[-1]
+        # By default empty string (no serial number found)
+        serial_number = ""
+
+        # Line with the serial number of the first item ("PID: WS-C2960-24TT-L  , VID: V02  , SN: FOC1234X5YZ")
+        for line in output.splitlines():
+
+            # Is "SN:" part of the line?
+            if "SN:" in line:
+
+                # Yes
+
+                # Get the serial number (after "SN:")
+                serial_number = line.split("SN:")[1].strip()
+
+                # Leave the loop
+                break
 
         # Display info message
-        log.info(f"get_hostname: hostname found: '{output}'")
+        log.info("get_serial_number: serial number found: '%s'", serial_number)
 
         # Return the serial number of the device
-        return output
+        return serial_number
+
+    async def get_facts(self):
+        """
+        Asyn method used to get the version, the name, the model and the serial number of the device at once
+
+        Each fact has a command (cmd_get_version, cmd_get_hostname, etc.) and
+        a method reading its output (parse_version, parse_hostname, etc.). A
+        command used by several facts (eg. "show chassis" for the model and
+        the serial number of Alcatel AOS devices) is sent only once. The
+        commands are sent with send_commands (at the same time with several
+        channels or with "getter_window").
+
+        :return: the facts of the device ("version", "hostname", "model", "serial_number")
+        :rtype: dict
+        """
+
+        # Display info message
+        log.info("get_facts")
+
+        # Command of each fact
+        dict_commands = {fact: getattr(self, "cmd_get_" + fact) for fact in FACTS}
+
+        # Commands to send (each command once)
+        list_of_commands = list(dict.fromkeys(dict_commands.values()))
+
+        # Display info message
+        log.info("get_facts: commands: %s", list_of_commands)
+
+        # Output of each command
+        dict_outputs = dict(
+            zip(list_of_commands, await self.send_commands(list_of_commands))
+        )
+
+        # Get each fact from the output of its command
+        return {
+            fact: getattr(self, "parse_" + fact)(dict_outputs[cmd])
+            for fact, cmd in dict_commands.items()
+        }
 
     async def get_config(self, timeout=None):
         """
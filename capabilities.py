@@ -0,0 +1,305 @@
+# Python library import
+import asyncio, json, logging, os, threading
+
+# Logger of netscud (same logger as the one of the devices)
+log = logging.getLogger(__package__)
+
+
+class CapabilityCache:
+    """
+    Class used to keep the capabilities discovered on the devices (eg. the AOS version of an Alcatel switch) in a file
+
+    A capability is found once on a device (one command sent) and saved
+    into the file, so the next runs of a script do not send the command
+    again. The file has one JSON line per capability saved: a new line is
+    added at the end of the file when a capability is found or changed (the
+    file is never rewritten while the devices are connected). The last line
+    of a capability is the one used.
+
+    Inside the event loop the lines are written by a thread (the event loop
+    is not blocked by the file). The lines waiting to be written are written
+    together, in order. See flush().
+
+    The capabilities are saved by ip address, port and device type.
+
+    Example:
+
+    async with netscud.ConnectDevice(**my_device, capability_cache="/data/netscud/capabilities.jsonl") as sw1:
+        print(await sw1.get_interfaces())
+
+
+    :param path: optional, the path of the file. Default value is None (capabilities kept in memory only)
+    :type path: str
+    """
+
+    # Caches already opened (key: path of the file)
+    _opened = {}
+
+    def __init__(self, path=None):
+
+        self.path = path
+
+        # Capabilities of each device (key: ip address, port, device type)
+        self._capabilities = {}
+
+        # Lines waiting to be written in the file
+        self._pending_lines = []
+
+        # Writing of the lines already planned?
+        self._writing = False
+
+        # Last writing planned (future of the thread)
+        self._write_future = None
+
+        # Lock used by the threads writing in the file (one at a time, lines kept in order)
+        self._lock = threading.Lock()
+
+        # Capabilities saved in the file?
+        if path and os.path.exists(path):
+
+            # Yes
+            self.load()
+
+    @classmethod
+    def open(cls, path):
+        """
+        Method used to get the cache of a file (the same cache for all the devices using the file)
+
+        :param path: the path of the file
+        :type path: str or os.PathLike
+
+        :return: the cache of the file
+        :rtype: CapabilityCache
+        """
+
+        # Absolute path (same file, same cache)
+        path = os.path.abspath(os.fspath(path))
+
+        # Cache not opened yet?
+        if path not in cls._opened:
+
+            # Yes
+            cls._opened[path] = cls(path)
+
+        return cls._opened[path]
+
+    def load(self):
+        """
+        Method used to read the capabilities saved in the file
+
+        A line which cannot be read (eg. script stopped while the line was
+        written) is ignored. If the file has a lot of old values it is
+        rewritten with the last values only.
+        """
+
+        # Display info message
+        log.info("CapabilityCache: load: %s", self.path)
+
+        # Number of lines read
+        number_of_lines = 0
+
+        # Read the file
+        with open(self.path, encoding="utf-8") as file:
+
+            # Read each line
+            for line in file:
+
+                number_of_lines += 1
+
+                try:
+
+                    # Get the capability
+                    record = json.loads(line)
+                    key = (record["ip"], record["port"], record["device_type"])
+                    self._capabilities.setdefault(key, {})[record["name"]] = record[
+                        "value"
+                    ]
+
+                except (ValueError, KeyError, TypeError):
+
+                    # Line not valid
+
+                    # Display info message
+                    log.warning("CapabilityCache: load: line ignored: %r", line)
+
+        # Number of capabilities
+        number_of_capabilities = sum(
+            len(capabilities) for capabilities in self._capabilities.values()
+        )
+
+        # A lot of old values in the file?
+        if number_of_lines > 2 * number_of_capabilities:
+
+            # Yes, the file is rewritten
+            self.compact()
+
+    def compact(self):
+        """
+        Method used to rewrite the file with the last value of each capability only
+
+        The file is written with a temporary name and renamed once complete.
+        """
+
+        # Display info message
+        log.info("CapabilityCache: compact: %s", self.path)
+
+        # Temporary name of the file while it is written
+        temporary_path = self.path + ".tmp"
+
+        # Write all the capabilities
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            for (ip, port, device_type), capabilities in self._capabilities.items():
+                for name, value in capabilities.items():
+                    file.write(self._line(ip, port, device_type, name, value))
+
+        # The file gets its final name
+        os.replace(temporary_path, self.path)
+
+    def get(self, device, name, default=None):
+        """
+        Method used to get a capability of a device
+
+        :param device: the device
+        :type device: NetworkDevice
+
+        :param name: the name of the capability (eg. "aos_version")
+        :type name: str
+
+        :param default: optional, the value returned if the capability is unknown. Default value is None
+        :type default: any
+
+        :return: the value of the capability
+        :rtype: any
+        """
+
+        return self._capabilities.get(
+            (device.ip, device.port, device.device_type), {}
+        ).get(name, default)
+
+    def set(self, device, name, value):
+        """
+        Method used to save a capability of a device (added to the file if the value changed)
+
+        :param device: the device
+        :type device: NetworkDevice
+
+        :param name: the name of the capability (eg. "aos_version")
+        :type name: str
+
+        :param value: the value of the capability (saved as JSON)
+        :type value: any
+        """
+
+        # Capabilities of the device
+        capabilities = self._capabilities.setdefault(
+            (device.ip, device.port, device.device_type), {}
+        )
+
+        # Same value already saved?
+        if name in capabilities and capabilities[name] == value:
+
+            # Yes, nothing to do
+            return
+
+        # Save the value
+        capabilities[name] = value
+
+        # Display info message
+        log.info(
+            "CapabilityCache: set: %s: %s: %s = %r",
+            device.ip,
+            device.device_type,
+            name,
+            value,
+        )
+
+        # File used?
+        if self.path:
+
+            # Yes, a line will be added at the end of the file
+            self._pending_lines.append(
+                self._line(device.ip, device.port, device.device_type, name, value)
+            )
+
+            # Writing already planned?
+            if self._writing:
+
+                # Yes, the line will be written with the other ones
+                return
+
+            self._writing = True
+
+            try:
+
+                # Event loop running?
+                loop = asyncio.get_running_loop()
+
+            except RuntimeError:
+
+                # No, the line is written now
+                self._write_pending_lines()
+
+            else:
+
+                # Yes, the line is written by a thread
+                self._write_future = loop.run_in_executor(
+                    None, self._write_pending_lines
+                )
+
+    async def flush(self):
+        """
+        Asyn method used to wait until the capabilities saved are written in the file
+        """
+
+        # Writing planned by this event loop? (the writings of a previous event loop are done)
+        if (
+            self._write_future is not None
+            and self._write_future.get_loop() is asyncio.get_running_loop()
+        ):
+
+            # Yes, wait for the end of the last writing (the previous ones are done before)
+            await self._write_future
+
+    def _write_pending_lines(self):
+        """
+        Method used to add the lines waiting to be written at the end of the file
+
+        Called by a thread when the event loop is running.
+        """
+
+        # One thread at a time (lines written in order)
+        with self._lock:
+
+            # New lines will need a new writing
+            self._writing = False
+
+            # Get the lines waiting to be written
+            lines, self._pending_lines = self._pending_lines, []
+
+            # Some lines?
+            if lines:
+
+                # Yes, the lines are added at the end of the file
+                with open(self.path, "a", encoding="utf-8") as file:
+                    file.write("".join(lines))
+
+    def _line(self, ip, port, device_type, name, value):
+        """
+        Method used to get the line of the file of a capability
+
+        :return: the capability (JSON, with a carriage return)
+        :rtype: str
+        """
+
+        return (
+            json.dumps(
+                {
+                    "ip": ip,
+                    "port": port,
+                    "device_type": device_type,
+                    "name": name,
+                    "value": value,
+                }
+            )
+            + "\n"
+        )
@@ -0,0 +1,81 @@
+# Python library import
+import asyncio, contextlib
+
+
+class ChannelPool:
+    """
+    Class used to share several SSH channels (sessions) of a single SSH connection
+
+    Each channel is a NetworkDevice object using its own session (stdin/stdout)
+    over the SSH connection of the device. A command waits for a free channel,
+    so concurrent commands sent to the same device run in parallel (one
+    channel per command).
+
+
+    :param channels: the NetworkDevice objects, one per SSH session
+    :type channels: list
+    """
+
+    def __init__(self, channels):
+
+        # All the channels of the pool
+        self.channels = list(channels)
+
+        # Channels not used by a command
+        self._free_channels = asyncio.Queue()
+
+        # At the beginning all channels are free
+        for channel in self.channels:
+            self._free_channels.put_nowait(channel)
+
+    def __len__(self):
+        """
+        Number of channels of the pool
+
+        :return: the number of channels
+        :rtype: int
+        """
+
+        return len(self.channels)
+
+    @contextlib.asynccontextmanager
+    async def channel(self):
+        """
+        Async context manager used to get a free channel
+
+        The channel is given back to the pool when leaving the context manager.
+
+        :return: a channel (NetworkDevice object)
+        :rtype: NetworkDevice
+        """
+
+        # Wait for a free channel
+        channel = await self._free_channels.get()
+
+        try:
+
+            # Give the channel
+            yield channel
+
+        finally:
+
+            # The channel is free again
+            self._free_channels.put_nowait(channel)
+
+    def close(self):
+        """
+        Method used to close all the channels of the pool
+
+        The SSH connection itself is not closed.
+        """
+
+        # Check all the channels
+        for channel in self.channels:
+
+            # Session open?
+            if getattr(channel, "stdinx", None) is not None:
+
+                # Yes
+
+                # Close the session
+                channel.stdinx.channel.close()
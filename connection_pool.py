@@ -0,0 +1,361 @@
+# Python library import
+import contextlib, logging, time
+from netscud.device_selector import ConnectDevice
+
+# Logger of netscud (same logger as the one of the devices)
+log = logging.getLogger(__package__)
+
+# Declaration of constant values
+
+# Default time in seconds a connection can stay unused in the pool
+DEFAULT_MAX_IDLE_TIME = 300
+
+# Default time in seconds a connection can be used since its creation
+DEFAULT_MAX_LIFETIME = 3600
+
+
+class ConnectionPool:
+    """
+    Class used to keep the connections to the devices open between 2 jobs
+
+    A connection is given back to the pool after a job instead of being
+    closed. The next job on the same device (same ip address, port,
+    username and device type) gets the connection already authenticated
+    with the prompt already found and paging disabled. Before giving an
+    old connection, a carriage return is sent to check the prompt is
+    still received (if not, a new connection is opened).
+
+    The connections not used during "max_idle_time" and the connections
+    older than "max_lifetime" are closed.
+
+
+    :param max_idle_time: optional, maximum time in seconds a connection stays unused in the pool. Default value is 300 seconds
+    :type max_idle_time: float
+
+    :param max_lifetime: optional, maximum time in seconds a connection is used since its creation. Default value is 3600 seconds
+    :type max_lifetime: float
+
+    :param check_connection: optional, if True the prompt of an old connection is checked before using it. Default value is True
+    :type check_connection: bool
+
+    :param check_timeout: optional, timeout in seconds of the check of the prompt. Default value is None (the timeout of the device)
+    :type check_timeout: float
+    """
+
+    def __init__(
+        self,
+        max_idle_time=DEFAULT_MAX_IDLE_TIME,
+        max_lifetime=DEFAULT_MAX_LIFETIME,
+        check_connection=True,
+        check_timeout=None,
+    ):
+
+        self.max_idle_time = max_idle_time
+        self.max_lifetime = max_lifetime
+        self.check_connection = check_connection
+        self.check_timeout = check_timeout
+
+        # Unused connections (key: ip, port, username, device_type; value: list of [device, last time used])
+        self._idle_connections = {}
+
+        # All the connections of the pool, used or not (key: device; value: key of the device, creation time)
+        self._connections = {}
+
+        # Pool closed?
+        self._closed = False
+
+    async def __aenter__(self):
+        """
+        Context manager opening the pool
+        """
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+        Context manager closing the pool (and all the unused connections)
+        """
+
+        await self.close()
+
+    def get_key(self, **kwargs):
+        """
+        Method used to get the key of the connections of a device
+
+        :param kwargs: dictionary with the device connection parameters
+        :type kwargs: dict
+
+        :return: the key (ip address, port, username, device_type)
+        :rtype: tuple
+        """
+
+        return (
+            kwargs.get("ip", ""),
+            kwargs.get("port"),
+            kwargs.get("username", ""),
+            kwargs.get("device_type", ""),
+        )
+
+    def __len__(self):
+        """
+        Number of unused connections in the pool
+
+        :return: the number of unused connections
+        :rtype: int
+        """
+
+        return sum(len(connections) for connections in self._idle_connections.values())
+
+    @contextlib.asynccontextmanager
+    async def connection(self, **kwargs):
+        """
+        Async context manager used to get a device connected
+
+        The connection is given back to the pool when leaving the context
+        manager. If an exception is raised inside the context manager, the
+        connection is closed (the device may still be sending data).
+
+        :param kwargs: dictionary with the device connection parameters
+        :type kwargs: dict
+
+        :return: the device connected
+        :rtype: NetworkDevice
+        """
+
+        # Get a connection
+        device = await self.acquire(**kwargs)
+
+        try:
+
+            # Give the device
+            yield device
+
+        except BaseException:
+
+            # Something wrong
+
+            # The connection is not kept
+            await self.release(device, discard=True)
+
+            # Exception propagation
+            raise
+
+        # Give the connection back to the pool
+        await self.release(device)
+
+    async def acquire(self, **kwargs):
+        """
+        Asyn method used to get a device connected (an unused connection or a new one)
+
+        :param kwargs: dictionary with the device connection parameters
+        :type kwargs: dict
+
+        :return: the device connected
+        :rtype: NetworkDevice
+        """
+
+        # Pool closed?
+        if self._closed:
+
+            # Yes
+            raise Exception("ConnectionPool: pool closed")
+
+        # Close the connections too old
+        await self.evict()
+
+        # Get the key of the device
+        key = self.get_key(**kwargs)
+
+        # Get the unused connections of the device
+        connections = self._idle_connections.get(key, [])
+
+        # Check the unused connections (last used first)
+        while connections:
+
+            # Get a connection
+            device, _ = connections.pop()
+
+            # Check the prompt of the connection (if needed)
+            if not self.check_connection or await device.check_connection(
+                timeout=self.check_timeout
+            ):
+
+                # Connection working
+
+                # Display info message
+                log.info("acquire: connection reused: %s", key)
+
+                # Return the device
+                return device
+
+            # Connection not working
+
+            # Display info message
+            log.info("acquire: connection not working: %s", key)
+
+            # Close the connection
+            await self._disconnect(device)
+
+        # No more unused connections for the device
+        self._idle_connections.pop(key, None)
+
+        # Display info message
+        log.info("acquire: new connection: %s", key)
+
+        # Create the device
+        device = ConnectDevice(**kwargs)
+
+        try:
+
+            # Connection to the device
+            await device.connect()
+
+        except Exception:
+
+            # Disconnection (if needed) in case the connection is done but something failed
+            await device.disconnect()
+
+            # Exception propagation
+            raise
+
+        # Save the key and the creation time of the connection
+        self._connections[device] = (key, time.monotonic())
+
+        # Return the device
+        return device
+
+    async def release(self, device, discard=False):
+        """
+        Asyn method used to give back a device to the pool
+
+        :param device: the device given by acquire()
+        :type device: NetworkDevice
+
+        :param discard: optional, if True the connection is closed instead of being kept. Default value is False
+        :type discard: bool
+        """
+
+        # Connection to close (connection not wanted, too old or pool closed)?
+        if (
+            discard
+            or self._closed
+            or self._is_too_old(device, time.monotonic())
+            or device not in self._connections
+        ):
+
+            # Yes
+
+            # Close the connection
+            await self._disconnect(device)
+
+            return
+
+        # Get the key of the device
+        key = self._connections[device][0]
+
+        # Save the connection with the time it was used
+        self._idle_connections.setdefault(key, []).append([device, time.monotonic()])
+
+    async def evict(self):
+        """
+        Asyn method used to close the unused connections not used for too long or too old
+        """
+
+        # Current time
+        now = time.monotonic()
+
+        # Check the unused connections of all the devices
+        for key in list(self._idle_connections):
+
+            # Connections to close
+            to_close = [
+                device
+                for device, last_used in self._idle_connections[key]
+                if now - last_used > self.max_idle_time or self._is_too_old(device, now)
+            ]
+
+            # Some connections to close?
+            if to_close:
+
+                # Yes
+
+                # Display info message
+                log.info("evict: %s connection(s) closed: %s", len(to_close), key)
+
+                # Keep only the other connections
+                self._idle_connections[key] = [
+                    connection
+                    for connection in self._idle_connections[key]
+                    if connection[0] not in to_close
+                ]
+
+                # No more connection for the device?
+                if not self._idle_connections[key]:
+
+                    # Yes
+                    del self._idle_connections[key]
+
+                # Close the connections
+                for device in to_close:
+                    await self._disconnect(device)
+
+    async def close(self):
+        """
+        Asyn method used to close all the unused connections of the pool
+
+        The connections still used are closed when they are given back.
+        """
+
+        # Display info message
+        log.info("close")
+
+        # No more connection can be given
+        self._closed = True
+
+        # Get all the unused connections
+        all_connections = self._idle_connections
+        self._idle_connections = {}
+
+        # Close them
+        for connections in all_connections.values():
+            for device, _ in connections:
+                await self._disconnect(device)
+
+    def _is_too_old(self, device, now):
+        """
+        Method used to check if a connection has reached its maximum lifetime
+
+        :param device: the device connected
+        :type device: NetworkDevice
+
+        :param now: current time (time.monotonic())
+        :type now: float
+
+        :return: True if the connection is too old
+        :rtype: bool
+        """
+
+        return now - self._connections.get(device, (None, now))[1] > self.max_lifetime
+
+    async def _disconnect(self, device):
+        """
+        Asyn method used to close a connection of the pool
+
+        :param device: the device connected
+        :type device: NetworkDevice
+        """
+
+        # The connection is no more in the pool
+        self._connections.pop(device, None)
+
+        try:
+
+            # Disconnection
+            await device.disconnect()
+
+        except Exception as error:
+
+            # The connection is already closed
+
+            # Display info message
+            log.info("_disconnect: error: %r", error)
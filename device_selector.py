@@ -1,16 +1,147 @@
 # Python library import
-from netscud.devices.alcatel.alcatel_aos import AlcatelAOS
-from netscud.devices.cisco.cisco_ios import CiscoIOS
-from netscud.devices.cisco.cisco_s300 import CiscoS300
-from netscud.devices.mikrotik.mikrotik_routeros import MikrotikRouterOS
+import collections.abc, importlib, importlib.metadata
+
+# Declaration of constant values
+
+# Group of the entry points used by other packages to add device types
+# (eg. in pyproject.toml: [tool.poetry.plugins."netscud.drivers"] my_device = "my_package.my_module:MyDevice")
+ENTRY_POINT_GROUP = "netscud.drivers"
+
+
+class DriverRegistry(collections.abc.Mapping):
+    """
+    Class used to get the class of a device type
+
+    The module of a device class is imported only the first time its device
+    type is used. Device types from other packages are added with the
+    "netscud.drivers" entry points (read the first time a device type is
+    not found) or with the register() method.
+
+
+    :param drivers: the device types with their classes ("module:class" strings)
+    :type drivers: dict
+    """
+
+    def __init__(self, drivers):
+
+        # Classes of the device types ("module:class" string, entry point or class once imported)
+        self._drivers = dict(drivers)
+
+        # By default the entry points are not read
+        self._entry_points_loaded = False
+
+    def register(self, device_type, driver):
+        """
+        Method used to add a device type
+
+        :param device_type: the name of the device type (eg. "cisco_ios")
+        :type device_type: str
+
+        :param driver: the class of the device or a "module:class" string
+        :type driver: class or str
+        """
+
+        self._drivers[device_type] = driver
+
+    def load_entry_points(self):
+        """
+        Method used to add the device types of the "netscud.drivers" entry points
+
+        The device types already known are not replaced. The modules are not
+        imported.
+        """
+
+        # Entry points already read?
+        if self._entry_points_loaded:
+
+            # Yes
+            return
+
+        self._entry_points_loaded = True
+
+        # Get all the entry points
+        all_entry_points = importlib.metadata.entry_points()
+
+        # Entry points of netscud (Python 3.10+ or older versions)
+        if hasattr(all_entry_points, "select"):
+            entry_points = all_entry_points.select(group=ENTRY_POINT_GROUP)
+        else:
+            entry_points = all_entry_points.get(ENTRY_POINT_GROUP, [])
+
+        # Add the new device types
+        for entry_point in entry_points:
+            self._drivers.setdefault(entry_point.name, entry_point)
+
+    def __contains__(self, device_type):
+
+        # Device type unknown?
+        if device_type not in self._drivers:
+
+            # Yes
+
+            # Maybe a device type from another package
+            self.load_entry_points()
+
+        return device_type in self._drivers
+
+    def __getitem__(self, device_type):
+
+        # Device type unknown?
+        if device_type not in self:
+
+            # Yes
+            raise KeyError(device_type)
+
+        # Get the class of the device type
+        driver = self._drivers[device_type]
+
+        # Module not yet imported ("module:class" string)?
+        if isinstance(driver, str):
+
+            # Yes
+
+            # Import the module then get the class
+            module_name, _, class_name = driver.partition(":")
+            driver = getattr(importlib.import_module(module_name), class_name)
+
+        # Entry point?
+        elif isinstance(driver, importlib.metadata.EntryPoint):
+
+            # Yes
+
+            # Import the class
+            driver = driver.load()
+
+        # Save the class (the module is imported only once)
+        self._drivers[device_type] = driver
+
+        # Return the class
+        return driver
+
+    def __iter__(self):
+
+        # All the device types (including the ones of other packages)
+        self.load_entry_points()
+
+        return iter(self._drivers)
+
+    def __len__(self):
+
+        # All the device types (including the ones of other packages)
+        self.load_entry_points()
+
+        return len(self._drivers)
+
 
 #  The supported device_types are the keys of this dictionary
-ALL_DEVICE_TYPE_CLASS = {
-    "alcatel_aos": AlcatelAOS,
-    "cisco_ios": CiscoIOS,
-    "cisco_s300": CiscoS300,
-    "mikrotik_routeros": MikrotikRouterOS,
-}
+ALL_DEVICE_TYPE_CLASS = DriverRegistry(
+    {
+        "alcatel_aos": "netscud.devices.alcatel.alcatel_aos:AlcatelAOS",
+        "cisco_ios": "netscud.devices.cisco.cisco_ios:CiscoIOS",
+        "cisco_s300": "netscud.devices.cisco.cisco_s300:CiscoS300",
+        "mikrotik_routeros": "netscud.devices.mikrotik.mikrotik_routeros:MikrotikRouterOS",
+    }
+)
 
 
 def ConnectDevice(**kwargs):
@@ -53,4 +184,4 @@ def ConnectDevice(**kwargs):
     my_class = ALL_DEVICE_TYPE_CLASS[device_type](**kwargs)
 
     # Return the class
-    return my_class
\ No newline at end of file
+    return my_class
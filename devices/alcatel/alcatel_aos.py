@@ -1,114 +1,131 @@
 # Python library import
 from netscud.base_connection import NetworkDevice, log, ipv4_netmask_list
-import asyncio, asyncssh
+from netscud.instrumentation import emit_event, EVENT_AUTH
+from netscud.table import (
+    Table,
+    MAC_ADDRESS_TABLE_FIELDS,
+    MAC_ADDRESS_TABLE_CATEGORIES,
+    ARP_TABLE_FIELDS,
+    ARP_TABLE_CATEGORIES,
+)
+import asyncio, asyncssh, re, time
 
 # Declaration of constant values
 
 # Max data to read in read function
 MAX_BUFFER_DATA = 65535
 
+# Release of a package in the output of "show microcode" (eg. "Kfbase.img  6.7.2.191.R04  18892862 ...")
+AOS_RELEASE_PATTERN = re.compile(r"^\s*\S+\s+(\d+)\.\d+\.\d+", re.MULTILINE)
+
 
 class AlcatelAOS(NetworkDevice):
     """
     Class for Alcatel AOS devices
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        self._connect_first_ending_prompt = ["-> ", "> "]
-        self.list_of_possible_ending_prompts = ["> "]
-        self._telnet_connect_login = "login :"
-        self._telnet_connect_password = "password :"
-        self._telnet_connect_authentication_fail_prompt = [
-            "login :",
-            "Authentication failure",
-        ]
-
-        # General commands
-        self.cmd_disable_paging = ""
-        self.cmd_enter_config_mode = ""
-        self.cmd_exit_config_mode = ""
-        self.cmd_get_version = "show microcode"
-        self.cmd_get_hostname = "show system"
-        self.cmd_get_model = "show chassis"
-        self.cmd_get_serial_number = "show chassis"
-        self.cmd_get_config = "show configuration snapshot"
-        self.cmd_save_config = [
-            "write memory",  # Save data into working configuration
-            "copy running certified",  # AOS 7, AOS 8, save working configuration into certified configuration
-            "copy working certified",  # AOS 6 and lower, save working configuration into certified configuration
-        ]
-
-        # Layer 1 commands
-        self.cmd_get_interfaces = [
-            "show interfaces",
-            "show interfaces alias",  # AOS 7, AOS 8
-            "show interfaces port",  # AOS 6 and lower
-            "show vlan members",  # AOS 7, AOS 8
-            "show vlan port",  # AOS 6 and lower
-        ]
-        self.cmd_set_interface = [
-            "interfaces <INTERFACE> admin-state enable",
-            "interfaces <INTERFACE> admin-state disable",
-            "interfaces <INTERFACE> admin up",
-            "interfaces <INTERFACE> admin down",
-            'interfaces <INTERFACE> alias "<DESCRIPTION>"',
-            "interfaces <INTERFACE> max-frame-size <MAXIMUMFRAMESIZE>",
-            "interfaces <INTERFACE> max frame <MAXIMUMFRAMESIZE>",
-            "show vlan members",
-            "show vlan port",
-            "no vlan <VLAN> members port <INTERFACE>",
-            "vlan <VLANLIST> no 802.1q <INTERFACE>",
-            "show vlan",
-            "vlan <VLAN>",
-            "vlan <VLANLIST> 802.1q <INTERFACE>",
-            "vlan <VLAN> members port <INTERFACE> tagged",
-        ]
-
-        # Layer 2 commands
-        self.cmd_get_mac_address_table = [
-            "show mac-learning",  # AOS7+
-            "show mac-address-table",  # AOS 6
-        ]
-        self.cmd_get_arp = "show arp"
-        self.cmd_get_lldp_neighbors = "show lldp remote-system"
-        self.cmd_get_vlans = "show vlan"
-        self.cmd_add_vlan = 'vlan <VLAN> name "<VLAN_NAME>"'
-        self.cmd_remove_vlan = "no vlan <VLAN>"
-        self.cmd_add_interface_to_vlan = [
-            "vlan <VLAN> members port <INTERFACE> untagged",
-            "vlan <VLAN> port default <INTERFACE>",
-            "vlan <VLAN> members port <INTERFACE> tagged",
-            "vlan <VLAN> 802.1q <INTERFACE>",
-        ]
-        self.cmd_remove_interface_from_vlan = [
-            "no vlan <VLAN> members port <INTERFACE>",
-            "vlan <VLAN> no port default <INTERFACE>",
-            "no vlan <VLAN> members port <INTERFACE>",
-            "vlan <VLAN> no 802.1q <INTERFACE>",
-        ]
-        self.cmd_get_links_aggregation = "show linkagg"  # Specific to Alcatel AOS
-        self.cmd_add_link_aggregation_to_vlan = [
-            "vlan <VLAN> members linkagg <LINK_AGGREGATION> untagged",
-            "vlan <VLAN> port default <LINK_AGGREGATION>",
-            "vlan <VLAN> members linkagg <LINK_AGGREGATION> tagged",
-            "vlan <VLAN> 802.1q <LINK_AGGREGATION>",
-        ]  # Specific to Alcatel AOS
-        self.cmd_remove_link_aggregation_to_vlan = [
-            "no vlan <VLAN> members linkagg <LINK_AGGREGATION>",
-            "vlan <VLAN> no port default <LINK_AGGREGATION>",
-            "no vlan <VLAN> members linkagg <LINK_AGGREGATION>",
-            "vlan <VLAN> no 802.1q <LINK_AGGREGATION>",
-        ]  # Specific to Alcatel AOS
-
-        # Layer 3 commands
-        self.cmd_get_routing_table = "show ip router database"
-        self.cmd_get_interfaces_ip = "show ip interface"
-        self.cmd_add_static_route = "ip static-route <NETWORK>/<PREFIXLENGTH> gateway <DESTINATION> metric <METRIC>"
-        self.cmd_remove_static_route = (
-            "no ip static-route <NETWORK>/<PREFIXLENGTH> gateway <DESTINATION>"
-        )
+    __slots__ = ()
+
+    # Prompts
+    _connect_first_ending_prompt = ("-> ", "> ")
+    list_of_possible_ending_prompts = ("> ",)
+    _telnet_connect_login = "login :"
+    _telnet_connect_password = "password :"
+    _telnet_connect_authentication_fail_prompt = (
+        "login :",
+        "Authentication failure",
+    )
+
+    # SSH host key algorithms accepted (DSA host keys of the AOS devices)
+    _ssh_server_host_key_algs = ("ssh-dss",)
+
+    # General commands
+    cmd_disable_paging = ""
+    cmd_enter_config_mode = ""
+    cmd_exit_config_mode = ""
+    cmd_get_version = "show microcode"
+    cmd_get_hostname = "show system"
+    cmd_get_model = "show chassis"
+    cmd_get_serial_number = "show chassis"
+    cmd_get_config = "show configuration snapshot"
+    cmd_save_config = (
+        "write memory",  # Save data into working configuration
+        "copy running certified",  # AOS 7, AOS 8, save working configuration into certified configuration
+        "copy working certified",  # AOS 6 and lower, save working configuration into certified configuration
+    )
+
+    # Layer 1 commands
+    cmd_get_interfaces = (
+        "show interfaces",
+        "show interfaces alias",  # AOS 7, AOS 8
+        "show interfaces port",  # AOS 6 and lower
+        "show vlan members",  # AOS 7, AOS 8
+        "show vlan port",  # AOS 6 and lower
+    )
+    cmd_set_interface = (
+        "interfaces <INTERFACE> admin-state enable",
+        "interfaces <INTERFACE> admin-state disable",
+        "interfaces <INTERFACE> admin up",
+        "interfaces <INTERFACE> admin down",
+        'interfaces <INTERFACE> alias "<DESCRIPTION>"',
+        "interfaces <INTERFACE> max-frame-size <MAXIMUMFRAMESIZE>",
+        "interfaces <INTERFACE> max frame <MAXIMUMFRAMESIZE>",
+        "show vlan members",
+        "show vlan port",
+        "no vlan <VLAN> members port <INTERFACE>",
+        "vlan <VLANLIST> no 802.1q <INTERFACE>",
+        "show vlan",
+        "vlan <VLAN>",
+        "vlan <VLANLIST> 802.1q <INTERFACE>",
+        "vlan <VLAN> members port <INTERFACE> tagged",
+    )
+
+    # Layer 2 commands
+    cmd_get_mac_address_table = (
+        "show mac-learning",  # AOS7+
+        "show mac-address-table",  # AOS 6
+    )
+    cmd_get_arp = "show arp"
+    cmd_get_lldp_neighbors = "show lldp remote-system"
+    cmd_get_vlans = "show vlan"
+    cmd_add_vlan = 'vlan <VLAN> name "<VLAN_NAME>"'
+    cmd_remove_vlan = "no vlan <VLAN>"
+    cmd_show_vlan_tables = ("show vlan", "show vlan members", "show vlan port")
+    cmd_add_interface_to_vlan = (
+        "vlan <VLAN> members port <INTERFACE> untagged",
+        "vlan <VLAN> port default <INTERFACE>",
+        "vlan <VLAN> members port <INTERFACE> tagged",
+        "vlan <VLAN> 802.1q <INTERFACE>",
+    )
+    cmd_remove_interface_from_vlan = (
+        "no vlan <VLAN> members port <INTERFACE>",
+        "vlan <VLAN> no port default <INTERFACE>",
+        "no vlan <VLAN> members port <INTERFACE>",
+        "vlan <VLAN> no 802.1q <INTERFACE>",
+    )
+    cmd_get_links_aggregation = "show linkagg"  # Specific to Alcatel AOS
+    cmd_add_link_aggregation_to_vlan = (
+        "vlan <VLAN> members linkagg <LINK_AGGREGATION> untagged",
+        "vlan <VLAN> port default <LINK_AGGREGATION>",
+        "vlan <VLAN> members linkagg <LINK_AGGREGATION> tagged",
+        "vlan <VLAN> 802.1q <LINK_AGGREGATION>",
+    )  # Specific to Alcatel AOS
+    cmd_remove_link_aggregation_to_vlan = (
+        "no vlan <VLAN> members linkagg <LINK_AGGREGATION>",
+        "vlan <VLAN> no port default <LINK_AGGREGATION>",
+        "no vlan <VLAN> members linkagg <LINK_AGGREGATION>",
+        "vlan <VLAN> no 802.1q <LINK_AGGREGATION>",
+    )  # Specific to Alcatel AOS
+
+    # Layer 3 commands
+    cmd_get_routing_table = "show ip router database"
+    cmd_get_interfaces_ip = "show ip interface"
+    cmd_add_static_route = (
+        "ip static-route <NETWORK>/<PREFIXLENGTH> gateway <DESTINATION> metric <METRIC>"
+    )
+    cmd_remove_static_route = (
+        "no ip static-route <NETWORK>/<PREFIXLENGTH> gateway <DESTINATION>"
+    )
 
     def monkey_patch_dsa_512(self):
 
@@ -141,20 +158,14 @@ class AlcatelAOS(NetworkDevice):
         # Monkey patch DSA 512 bits connections
         self.monkey_patch_dsa_512()
 
-        # Parameters of the connection
+        # Parameters of the connection (options shared by the devices with the same profile)
         generator = asyncssh.connect(
-            self.ip,
-            username=self.username,
-            password=self.password,
-            known_hosts=None,
-            # encryption_algs="*",  # Parameter that includes all encryption algorithms (even the old ones disabled by default)
-            encryption_algs=[
-                algs.decode("utf-8") for algs in asyncssh.encryption._enc_algs
-            ],  # Parameter that includes all encryption algorithms (even the old ones disabled by default)
-            # server_host_key_algs=["ssh-rsa", "ssh-dss"],
-            server_host_key_algs=["ssh-dss"],
+            self.ip, port=self.port, options=self.get_ssh_options()
         )
 
+        # Beginning of the authentication (only measured with an instrumentation)
+        start = self.instrumentation and time.perf_counter()
+
         # Trying to connect to the device
         try:
 
@@ -165,7 +176,7 @@ class AlcatelAOS(NetworkDevice):
             # Timeout
 
             # Display error message
-            log.error(f"connectSSH: connection failed: {self.ip} timeout: '{error}'")
+            log.error("connectSSH: connection failed: %s timeout: '%s'", self.ip, error)
 
             # Exception propagation
             raise asyncio.exceptions.TimeoutError(
@@ -177,7 +188,7 @@ class AlcatelAOS(NetworkDevice):
             # Connection failed
 
             # Display error message
-            log.error(f"connectSSH: connection failed: {self.ip} '{error}'")
+            log.error("connectSSH: connection failed: %s '%s'", self.ip, error)
 
             # Exception propagation
             raise
@@ -185,90 +196,16 @@ class AlcatelAOS(NetworkDevice):
         # Display info message
         log.info("connectSSH: connection success")
 
-        # Create a session
-        self.stdinx, self.stdoutx, _ = await self.conn.open_session(term_type="netscud")
-
-        # Display info message
-        log.info("connectSSH: open_session success")
-
-        # By default no data has been read
-        data = ""
-
-        # By default no prompt found
-        prompt_not_found = True
-
-        try:
-
-            # Read data
-            while prompt_not_found:
-
-                # Display info message
-                log.info("connectSSH: beginning of the loop")
-
-                # Read the prompt
-                data += await asyncio.wait_for(
-                    self.stdoutx.read(MAX_BUFFER_DATA), timeout=self.timeout
-                )
-
-                # Display info message
-                log.info(f"connectSSH: data: '{str(data)}'")
-
-                # Display info message
-                log.info(f"connectSSH: data: hex:'{data.encode('utf-8').hex()}'")
-
-                # Check if an initial prompt is found
-                for prompt in self._connect_first_ending_prompt:
-
-                    # Ending prompt found?
-                    if data.endswith(prompt):
-
-                        # Yes
-
-                        # Display info message
-                        log.info(f"connectSSH: first ending prompt found: '{prompt}'")
+        # Instrumentation used?
+        if start:
 
-                        # A ending prompt has been found
-                        prompt_not_found = False
-
-                        # Leave the loop
-                        break
-
-                # Display info message
-                log.info("connectSSH: end of loop")
-
-        except Exception as error:
-
-            # Fail while reading the prompt
-
-            # Display error message
-            log.error(
-                f"connectSSH: timeout while reading the prompt: {self.ip} '{error}'"
-            )
-
-            # Exception propagation
-            raise
-
-        # Display info message
-        log.info(f"connectSSH: end of prompt loop")
-
-        # Remove possible escape sequence
-        data = self.remove_ansi_escape_sequence(data)
-
-        # Find prompt
-        self.prompt = self.find_prompt(str(data))
-
-        # Display info message
-        log.info(f"connectSSH: prompt found: '{self.prompt}'")
-
-        # Display info message
-        log.info(f"connectSSH: prompt found size: '{len(self.prompt)}'")
-
-        # Disable paging command available?
-        if self.cmd_disable_paging:
             # Yes
 
-            # Disable paging
-            await self.disable_paging()
+            # Duration of the SSH connection (key exchange and authentication)
+            emit_event(self, EVENT_AUTH, duration=time.perf_counter() - start)
+
+        # Open a session, discover the prompt and disable paging
+        await self.open_sessionSSH()
 
     async def get_hostname(self):
         """
@@ -284,8 +221,22 @@ class AlcatelAOS(NetworkDevice):
         # Get hostname
         output = await self.send_command(self.cmd_get_hostname)
 
+        # Get the name of the device from the output
+        return self.parse_hostname(output)
+
+    def parse_hostname(self, output):
+        """
+        Method used to get the name of the device from the output of cmd_get_hostname
+
+        :param output: the output of cmd_get_hostname
+        :type output: str
+
+        :return: Name of the device
+        :rtype: str
+        """
+
         # Display info message
-        log.info(f"get_hostname: output: '{output}'")
+        log.info("get_hostname: output: '%s'", output)
 
         # By default no hostname
         hostname = ""
@@ -305,7 +256,7 @@ class AlcatelAOS(NetworkDevice):
                 break
 
         # Display info message
-        log.info(f"get_hostname: hostname found: '{hostname}'")
+        log.info("get_hostname: hostname found: '%s'", hostname)
 
         # Return the name of the device
         return hostname
@@ -324,8 +275,22 @@ class AlcatelAOS(NetworkDevice):
         # Get model
         output = await self.send_command(self.cmd_get_model)
 
+        # Get the model of the device from the output
+        return self.parse_model(output)
+
+    def parse_model(self, output):
+        """
+        Method used to get the model of the device from the output of cmd_get_model
+
+        :param output: the output of cmd_get_model
+        :type output: str
+
+        :return: Model of the device
+        :rtype: str
+        """
+
         # Display info message
-        log.info(f"get_model: output: '{output}'")
+        log.info("get_model: output: '%s'", output)
 
         # By default no model
         model = ""
@@ -345,7 +310,7 @@ class AlcatelAOS(NetworkDevice):
                 break
 
         # Display info message
-        log.info(f"get_model: model found: '{model}'")
+        log.info("get_model: model found: '%s'", model)
 
         # Return the model of the device
         return model
@@ -364,8 +329,22 @@ class AlcatelAOS(NetworkDevice):
         # Get serial number
         output = await self.send_command(self.cmd_get_serial_number)
 
+        # Get the serial number of the device (first switch of a stack) from the output
+        return self.parse_serial_number(output)
+
+    def parse_serial_number(self, output):
+        """
+        Method used to get the serial number of the device (first switch of a stack) from the output of cmd_get_serial_number
+
+        :param output: the output of cmd_get_serial_number
+        :type output: str
+
+        :return: Serial number of the device
+        :rtype: str
+        """
+
         # Display info message
-        log.info(f"get_serial_number: output: '{output}'")
+        log.info("get_serial_number: output: '%s'", output)
 
         # By default no serial number
         serial_number = ""
@@ -385,10 +364,10 @@ class AlcatelAOS(NetworkDevice):
                 break
 
         # Display info message
-        log.info(f"get_serial_number: serial number found: '{serial_number}'")
+        log.info("get_serial_number: serial number found: '%s'", serial_number)
 
         # Return the serial number of the device
-        return output
+        return serial_number
 
     async def get_version(self):
         """
@@ -401,21 +380,219 @@ class AlcatelAOS(NetworkDevice):
         # Display info message
         log.info("get_version")
 
-        # By default empty string
-        version = ""
-
         # Run get version on the device
         output = await self.send_command(self.cmd_get_version)
 
+        # Get the version of the software of the device from the output
+        return self.parse_version(output)
+
+    def parse_version(self, output):
+        """
+        Method used to get the version of the software of the device from the output of cmd_get_version
+
+        :param output: the output of cmd_get_version
+        :type output: str
+
+        :return: Version of the software of the device
+        :rtype: str
+        """
+
+        # By default empty string
+        version = ""
+
         # Get the version from the output returned
         version = output.splitlines()[3].split()[1]
 
         # Display info message
-        log.info(f"get_version: version: {version}")
+        log.info("get_version: version: %s", version)
 
         # Return the version of the software of the device
         return version
 
+    async def get_aos_version(self):
+        """
+        Asyn method used to get the dialect of the commands of the device (AOS 6 or AOS 7+)
+
+        The commands of AOS 6 and AOS 7/AOS 8 are different. The version is
+        found once ("show microcode") then kept by the device and by its
+        capability cache, if any ("aos_version" capability).
+
+        :return: 6 (AOS 6 and lower) or 7 (AOS 7, AOS 8)
+        :rtype: int
+        """
+
+        # Version already known?
+        aos_version = self.get_capability("aos_version")
+        if aos_version is not None:
+
+            # Yes
+            return aos_version
+
+        # Display info message
+        log.info("get_aos_version")
+
+        # Run get version on the device
+        output = await self.send_command(self.cmd_get_version)
+
+        # Get the major release (first package)
+        match = AOS_RELEASE_PATTERN.search(output)
+
+        # AOS 6 and lower?
+        if match and int(match.group(1)) <= 6:
+
+            # Yes
+            aos_version = 6
+
+        else:
+
+            # No (or unknown), AOS 7+ commands by default
+            aos_version = 7
+
+        # Display info message
+        log.info("get_aos_version: aos version: %s", aos_version)
+
+        # Version kept for the next commands
+        self.set_capability("aos_version", aos_version)
+
+        return aos_version
+
+    def get_aos_commands(self, aos_version, aos7_cmd, aos6_cmd):
+        """
+        Method used to get the AOS 7+ and AOS 6 forms of a command, the one of the device first
+
+        :param aos_version: the dialect of the device (6 or 7)
+        :type aos_version: int
+
+        :param aos7_cmd: the command for AOS 7, AOS 8
+        :type aos7_cmd: str
+
+        :param aos6_cmd: the command for AOS 6 and lower
+        :type aos6_cmd: str
+
+        :return: the dialects and their commands
+        :rtype: tuple of tuple
+        """
+
+        # AOS 6?
+        if aos_version == 6:
+
+            # Yes
+            return ((6, aos6_cmd), (7, aos7_cmd))
+
+        # AOS 7+
+        return ((7, aos7_cmd), (6, aos6_cmd))
+
+    async def send_aos_command(self, aos7_cmd, aos6_cmd, timeout=None, cached=False):
+        """
+        Asyn method used to send a command with different forms for AOS 6 and AOS 7+
+
+        Only the form of the dialect of the device is sent. If the device
+        refuses it ("ERROR: Invalid entry", eg. device upgraded since the
+        dialect was saved), the other form is sent and the dialect of the
+        device is changed.
+
+        :param aos7_cmd: the command for AOS 7, AOS 8
+        :type aos7_cmd: str
+
+        :param aos6_cmd: the command for AOS 6 and lower
+        :type aos6_cmd: str
+
+        :param timeout: optional, a timeout for the command sent. Default value is self.timeout
+        :type timeout: str
+
+        :param cached: optional, if True the output is kept by the output cache (see send_cached_command). Default value is False
+        :type cached: bool
+
+        :return: the output of the command
+        :rtype: str
+        """
+
+        # Send the command
+        list_of_outputs = await self.send_aos_commands(
+            [(aos7_cmd, aos6_cmd)], timeout, cached
+        )
+
+        # Return the output of the command
+        return list_of_outputs[0]
+
+    async def send_aos_commands(self, cmds, timeout=None, cached=False):
+        """
+        Asyn method used to send independent commands, some of them with different forms for AOS 6 and AOS 7+
+
+        The forms of the dialect of the device are sent together (see
+        send_commands: several channels or pipelined mode). If the device
+        refuses a command ("ERROR: Invalid entry", eg. device upgraded since
+        the dialect was saved), the other form of this command is sent and
+        the dialect of the device is changed.
+
+        :param cmds: the commands, each one is a string or a tuple (command for AOS 7+, command for AOS 6)
+        :type cmds: list
+
+        :param timeout: optional, a timeout for the commands sent. Default value is self.timeout
+        :type timeout: str
+
+        :param cached: optional, if True the outputs are kept by the output cache (see send_cached_command). Default value is False
+        :type cached: bool
+
+        :return: the output of each command (same order as the commands)
+        :rtype: list of str
+        """
+
+        # Dialect of the device
+        aos_version = await self.get_aos_version()
+
+        # Commands of the dialect of the device
+        list_of_commands = [
+            (
+                cmd
+                if isinstance(cmd, str)
+                else self.get_aos_commands(aos_version, *cmd)[0][1]
+            )
+            for cmd in cmds
+        ]
+
+        # Send the commands
+        list_of_outputs = await self.send_commands(list_of_commands, timeout, cached)
+
+        # Check the output of each command
+        for index, cmd in enumerate(cmds):
+
+            # Command refused? (only the commands with 2 forms)
+            # Example:
+            #                                                ^
+            # ERROR: Invalid entry: "alias"
+            if (
+                not isinstance(cmd, str)
+                and "invalid entry" in list_of_outputs[index].lower()
+            ):
+
+                # Yes
+
+                # Display info message
+                log.info(
+                    "send_aos_commands: aos %s: command refused: '%s'",
+                    aos_version,
+                    list_of_commands[index],
+                )
+
+                # Form of the other dialect
+                version, other_cmd = self.get_aos_commands(aos_version, *cmd)[1]
+
+                # Send the command
+                output = (await self.send_commands([other_cmd], timeout, cached))[0]
+
+                # Command accepted?
+                if "invalid entry" not in output.lower():
+
+                    # Yes, the dialect of the device is changed
+                    self.set_capability("aos_version", version)
+
+                # Save the output
+                list_of_outputs[index] = output
+
+        # Return the outputs of the commands
+        return list_of_outputs
+
     async def save_config(self):
         """
         Asyn method used to save the current configuration on the device
@@ -449,39 +626,12 @@ class AlcatelAOS(NetworkDevice):
         # Add carriage return to the output
         output += "\n"
 
-        # Command to send
-        cmd = self.cmd_save_config[1]
-
-        # AOS 7, AOS8, save working configuration into certified configuration
-        data = await self.send_command(cmd)
-
-        # An error with the previous command happened (i.e the command is not supported by the switch)?
-        if ('ERROR: Invalid entry: "running"') in data:
-
-            # Yes
-
-            # Then try to save ce configuration with another command
-
-            # Display info message
-            log.warning(
-                f"save_config: '{self.cmd_save_config[1]}' command not supported. Trying another 'copy' command: '{self.cmd_save_config[2]}'"
-            )
-
-            # Add carriage return to the output
-            output += "\n"
-
-            # Command to send
-            cmd = self.cmd_save_config[2]
-
-            # AOS 6 and lower, save working configuration into certified configuration
-            output += await self.send_command(cmd)
-
-        else:
-
-            # No
-
-            # So result can be saved into the output
-            output += data
+        # Save working configuration into certified configuration
+        # AOS 7, AOS8: "copy running certified"
+        # AOS 6 and lower: "copy working certified"
+        output += await self.send_aos_command(
+            self.cmd_save_config[1], self.cmd_save_config[2]
+        )
 
         # Time out restored
         self.timeout -= 60
@@ -509,6 +659,9 @@ class AlcatelAOS(NetworkDevice):
         # Display info message
         log.info("send_config_set")
 
+        # The device is changed: the outputs kept are no more valid
+        self.clear_output_cache()
+
         # Default value of timeout variable
         if timeout is None:
             timeout = self.timeout
@@ -528,7 +681,7 @@ class AlcatelAOS(NetworkDevice):
             cmds = [cmds]
 
             # A list?
-        elif not isinstance(cmds, list):
+        elif not isinstance(cmds, (list, tuple)):
 
             # Not a list (and not a string)
 
@@ -547,7 +700,7 @@ class AlcatelAOS(NetworkDevice):
             output += carriage_return
 
             # Send a command
-            output += await self.send_command(cmd, timeout)
+            output += await self.send_command(cmd, timeout=timeout)
 
             # Set carriage return for next commands
             carriage_return = "\n"
@@ -594,64 +747,20 @@ class AlcatelAOS(NetworkDevice):
         #     "show vlan port",        # AOS 6 and lower
         # ]
 
-        # Command for the status of the interfaces
-
-        # Send a command
-        output_status = await self.send_command(self.cmd_get_interfaces[0])
-
-        # Display info message
-        log.info(f"get_interfaces: status command\n'{output_status}'")
-
-        # Command for the description of the interfaces
-
-        # Send a command
-        output_description = await self.send_command(self.cmd_get_interfaces[1])
-
-        # Check if the returned value is not having an error (AOS 6 does has another command)
-        # Error message should be:
-        #                                                ^
-        # ERROR: Invalid entry: "alias"
-        if "error" in output_description.lower():
-
-            # Yes, the command returns an error
-
-            # Display info message
-            log.info(
-                f"get_interfaces: description command: error:\n'{output_description}'"
-            )
-
-            # So let's try to send an AOS 6 equivalent command
-
-            # Send a command
-            output_description = await self.send_command(self.cmd_get_interfaces[2])
-
-        # Display info message
-        log.info(f"get_interfaces: description command\n'{output_description}'")
-
-        # Command for the mode of the interfaces (access or trunk)
-
-        # Send a command
-        output_mode = await self.send_command(self.cmd_get_interfaces[3])
-
-        # Check if there is an error message like this one:
-        #                                         ^
-        # ERROR: Invalid entry: "members"
-        #
-        if "error" in output_mode.lower():
-            # Yes
-
-            # Display info message
-            log.info(f"get_interfaces: mode command: error:\n'{output_mode}'")
-
-            # Then an older command will be used
-
-            # Command for the mode of the interfaces (access or trunk)
-
-            # Send a command
-            output_mode = await self.send_command(self.cmd_get_interfaces[4])
+        # Commands for the status, the description and the mode (access or trunk)
+        # of the interfaces (independent commands, sent together)
+        output_status, output_description, output_mode = await self.send_aos_commands(
+            [
+                self.cmd_get_interfaces[0],
+                (self.cmd_get_interfaces[1], self.cmd_get_interfaces[2]),
+                (self.cmd_get_interfaces[3], self.cmd_get_interfaces[4]),
+            ]
+        )
 
         # Display info message
-        log.info(f"get_interfaces: mode command\n'{output_mode}'")
+        log.info("get_interfaces: status command\n'%s'", output_status)
+        log.info("get_interfaces: description command\n'%s'", output_description)
+        log.info("get_interfaces: mode command\n'%s'", output_mode)
 
         ############################################
         # Research of trunk
@@ -718,7 +827,7 @@ class AlcatelAOS(NetworkDevice):
                             }
 
         # Display info message
-        log.info(f"get_interfaces: dict_mode:\n'{dict_mode}'")
+        log.info("get_interfaces: dict_mode:\n'%s'", dict_mode)
 
         # return dict_mode
 
@@ -797,7 +906,7 @@ class AlcatelAOS(NetworkDevice):
                         }
 
         # Display info message
-        log.info(f"get_interfaces: dict_description:\n'{dict_description}'")
+        log.info("get_interfaces: dict_description:\n'%s'", dict_description)
 
         # return dict_description
 
@@ -991,12 +1100,12 @@ class AlcatelAOS(NetworkDevice):
             default_trunk_vlans = kwargs["default_trunk_vlans"]
 
         # Display info message
-        log.info(f"set_interface: input: interface: {interface}")
-        log.info(f"set_interface: input: admin_state: {admin_state}")
-        log.info(f"set_interface: input: description: {description}")
-        log.info(f"set_interface: input: maximum_frame_size: {maximum_frame_size}")
-        log.info(f"set_interface: input: mode: {mode}")
-        log.info(f"set_interface: input: default_trunk_vlans: {default_trunk_vlans}")
+        log.info("set_interface: input: interface: %s", interface)
+        log.info("set_interface: input: admin_state: %s", admin_state)
+        log.info("set_interface: input: description: %s", description)
+        log.info("set_interface: input: maximum_frame_size: %s", maximum_frame_size)
+        log.info("set_interface: input: mode: %s", mode)
+        log.info("set_interface: input: default_trunk_vlans: %s", default_trunk_vlans)
 
         """
         "interfaces <INTERFACE> admin-state enable",
@@ -1055,6 +1164,9 @@ class AlcatelAOS(NetworkDevice):
             # Return status
             return return_status
 
+        # The interface is changed: the outputs showing the interfaces are no more valid
+        self.clear_output_cache(self.cmd_get_interfaces)
+
         # "admin_state" found?
         if admin_state != None:
 
@@ -1071,69 +1183,31 @@ class AlcatelAOS(NetworkDevice):
                 # "up"
 
                 # [ "interfaces <INTERFACE> admin-state enable", "interfaces <INTERFACE> admin-state disable",]
+                # ["interfaces <INTERFACE> admin up","interfaces <INTERFACE> admin down",]
 
-                # AOS 7+
-
-                # Get the command
-                cmd = self.cmd_set_interface[0]
+                # Get the commands (AOS 7+ and AOS 6)
+                cmd_aos7 = self.cmd_set_interface[0]
+                cmd_aos6 = self.cmd_set_interface[2]
 
             else:
 
                 # "down"
 
-                # Get the command
-                cmd = self.cmd_set_interface[1]
+                # Get the commands (AOS 7+ and AOS 6)
+                cmd_aos7 = self.cmd_set_interface[1]
+                cmd_aos6 = self.cmd_set_interface[3]
 
-            # Adapt the command line
+            # Adapt the command lines
 
             # Replace <INTERFACE> with the interface name
-            cmd = cmd.replace("<INTERFACE>", interface)
+            cmd_aos7 = cmd_aos7.replace("<INTERFACE>", interface)
+            cmd_aos6 = cmd_aos6.replace("<INTERFACE>", interface)
 
             # Display info message
-            log.info(f"set_interface: admin_state: cmd: {cmd}")
-
-            # Change the state of the interface
-            output = await self.send_command(cmd)
-
-            # Check if there is an error (like whith AOS6)
-            #                                               ^
-            # ERROR: Invalid entry: "admin-state"
-            if "admin-state" in output:
-
-                # AOS 7+ command not supported
-
-                # Display info message
-                log.info(f"set_interface: admin_state command: error: {output}")
-
-                # "up" or "down"? (True of False)
-                if admin_state:
-
-                    # "up"
-
-                    # ["interfaces <INTERFACE> admin up","interfaces <INTERFACE> admin down",]
-
-                    # AOS 6
-
-                    # Get the command
-                    cmd = self.cmd_set_interface[2]
-
-                else:
+            log.info("set_interface: admin_state: cmd: %s / %s", cmd_aos7, cmd_aos6)
 
-                    # "down"
-
-                    # Get the command
-                    cmd = self.cmd_set_interface[3]
-
-                # Adapt the command line
-
-                # Replace <INTERFACE> with the interface name
-                cmd = cmd.replace("<INTERFACE>", interface)
-
-                # Display info message
-                log.info(f"set_interface: admin_state: cmd: {cmd}")
-
-                # Change the state of the interface
-                output = await self.send_command(cmd)
+            # Change the state of the interface (AOS 7+ or AOS 6 command)
+            output = await self.send_aos_command(cmd_aos7, cmd_aos6)
 
             # An error (maybe a second time)?
             if "error" in output.lower():
@@ -1141,7 +1215,7 @@ class AlcatelAOS(NetworkDevice):
                 # Yes an error after a command in AOS6 and in AOS7+
 
                 # Display info message
-                log.error(f"set_interface: admin-state: error: {output}")
+                log.error("set_interface: admin-state: error: %s", output)
 
                 # Return an error
                 return return_status
@@ -1167,7 +1241,7 @@ class AlcatelAOS(NetworkDevice):
             cmd = cmd.replace("<DESCRIPTION>", description)
 
             # Display info message
-            log.info(f"set_interface: description: cmd: {cmd}")
+            log.info("set_interface: description: cmd: %s", cmd)
 
             # Change the description of the interface
             await self.send_command(cmd)
@@ -1187,37 +1261,23 @@ class AlcatelAOS(NetworkDevice):
             #  ["interfaces <INTERFACE> max-frame-size <MAXIMUMFRAMESIZE>",
             # "interfaces <INTERFACE> max frame <MAXIMUMFRAMESIZE>",]
 
-            # Replace <INTERFACE> with the interface name
-            cmd = self.cmd_set_interface[5].replace("<INTERFACE>", interface)
+            # Replace <INTERFACE> with the interface name (AOS 7+ and AOS 6 commands)
+            cmd_aos7 = self.cmd_set_interface[5].replace("<INTERFACE>", interface)
+            cmd_aos6 = self.cmd_set_interface[6].replace("<INTERFACE>", interface)
 
             # Maximum Frame Size is between 1518-9216
 
             # Replace <MAXIMUMFRAMESIZE> with the size of the frame
-            cmd = cmd.replace("<MAXIMUMFRAMESIZE>", str(maximum_frame_size))
+            cmd_aos7 = cmd_aos7.replace("<MAXIMUMFRAMESIZE>", str(maximum_frame_size))
+            cmd_aos6 = cmd_aos6.replace("<MAXIMUMFRAMESIZE>", str(maximum_frame_size))
 
             # Display info message
-            log.info(f"set_interface: maximum_frame_size: cmd: {cmd}")
-
-            # Change the Maximum Frame Size of the interface
-            output = await self.send_command(cmd)
-
-            # Check if there is an error
-            # "                                               ^
-            # ERROR: Invalid entry: "max-frame-size""
-            if "max-frame-size" in output:
-
-                # The AOS7+ command is not accepted
-
-                # Attempt with AOS6 command
-
-                # Replace <INTERFACE> with the interface name
-                cmd = self.cmd_set_interface[6].replace("<INTERFACE>", interface)
-
-                # Replace <MAXIMUMFRAMESIZE> with the size of the frame
-                cmd = cmd.replace("<MAXIMUMFRAMESIZE>", str(maximum_frame_size))
+            log.info(
+                "set_interface: maximum_frame_size: cmd: %s / %s", cmd_aos7, cmd_aos6
+            )
 
-                # Change the Maximum Frame Size of the interface
-                output = await self.send_command(cmd)
+            # Change the Maximum Frame Size of the interface (AOS 7+ or AOS 6 command)
+            output = await self.send_aos_command(cmd_aos7, cmd_aos6)
 
             # Check if there is an error
             # Example:
@@ -1229,7 +1289,7 @@ class AlcatelAOS(NetworkDevice):
                 # Yes, there is an error
 
                 # Display info message
-                log.error(f"set_interface: max-frame-size: error: {output}")
+                log.error("set_interface: max-frame-size: error: %s", output)
 
                 # Return an error
                 return return_status
@@ -1244,39 +1304,18 @@ class AlcatelAOS(NetworkDevice):
             # Display info message
             log.info("set_interface: mode")
 
-            # By default, this is Alcatel AOS 7+
-            alcatel_version = 7
-
-            # "show vlan members",
-
-            # Get command
-            cmd = self.cmd_set_interface[7]
-
-            # Change the mode of the interface
-            output = await self.send_command(cmd)
-
-            # Check if an error occured
-            #                                          ^
-            # ERROR: Invalid entry: "members"
-            if "members" in output:
-
-                # Not Alcatel AOS 7+
-
-                # Probably Alcatel AOS 6
-                alcatel_version = 6
-
-                # The send a command for Alcatel AOS 6
-
-                # "show vlan port",
+            # "show vlan members" (AOS 7+) or "show vlan port" (AOS 6)
 
-                # Get command
-                cmd = self.cmd_set_interface[8]
+            # Get the mode of the interfaces (output kept if "output_cache_ttl" is used)
+            output = await self.send_aos_command(
+                self.cmd_set_interface[7], self.cmd_set_interface[8], cached=True
+            )
 
-                # Change the mode of the interface
-                output = await self.send_command(cmd)
+            # Dialect of the device (6 or 7)
+            alcatel_version = await self.get_aos_version()
 
             # Display info message
-            log.info(f"set_interface: mode: aos discovered version: {alcatel_version}")
+            log.info("set_interface: mode: aos discovered version: %s", alcatel_version)
 
             # Check if there is an error
             if "error" in output.lower():
@@ -1284,7 +1323,7 @@ class AlcatelAOS(NetworkDevice):
                 # Yes, there is an error
 
                 # Display info message
-                log.error(f"set_interface: mode: vlan members: error: {output}")
+                log.error("set_interface: mode: vlan members: error: %s", output)
 
                 # Return an error
                 return return_status
@@ -1292,7 +1331,7 @@ class AlcatelAOS(NetworkDevice):
             # Let's check if the port is already an access port or a trunk
 
             # Display info message
-            log.info(f"set_interface: mode: checking trunk_type")
+            log.info("set_interface: mode: checking trunk_type")
 
             # Convert output into a list of lines
             list_output = output.splitlines()
@@ -1370,12 +1409,14 @@ class AlcatelAOS(NetworkDevice):
 
             # Display info message
             log.info(
-                f"set_interface: mode: trunk_type (False=access, True=trunk): {trunk_type}"
+                "set_interface: mode: trunk_type (False=access, True=trunk): %s",
+                trunk_type,
             )
 
             # Display info message
             log.info(
-                f"set_interface: mode: list of VLANs found for a trunk: {list_vlan_trunk}"
+                "set_interface: mode: list of VLANs found for a trunk: %s",
+                list_vlan_trunk,
             )
 
             # Check if access port is requested
@@ -1385,7 +1426,8 @@ class AlcatelAOS(NetworkDevice):
 
                 # Display info message
                 log.info(
-                    f"set_interface: mode: interface {interface} wants to be in access mode"
+                    "set_interface: mode: interface %s wants to be in access mode",
+                    interface,
                 )
 
                 # If the interface is already in access mode there is so no need extra configuration
@@ -1395,6 +1437,9 @@ class AlcatelAOS(NetworkDevice):
 
                     # Yes. The interface is in trunk mode and needs to be changed into access mode
 
+                    # The VLANs of the interface are changed: the VLAN tables kept are no more valid
+                    self.clear_output_cache(self.cmd_show_vlan_tables)
+
                     # "no vlan <VLAN> members port <INTERFACE>",
                     # "vlan <VLANLIST> no 802.1q <INTERFACE>",
 
@@ -1418,7 +1463,8 @@ class AlcatelAOS(NetworkDevice):
 
                             # Display info message
                             log.info(
-                                f"set_interface: mode: remove tagged vlan: aos 7+: cmd: '{cmd}'"
+                                "set_interface: mode: remove tagged vlan: aos 7+: cmd: '%s'",
+                                cmd,
                             )
 
                             # Remove all the tagged VLANs on the interface
@@ -1434,7 +1480,8 @@ class AlcatelAOS(NetworkDevice):
 
                                 # Display info message
                                 log.error(
-                                    f"set_interface: mode: remove tagged vlan: aos 7+: error: {output}"
+                                    "set_interface: mode: remove tagged vlan: aos 7+: error: %s",
+                                    output,
                                 )
 
                                 # Return an error
@@ -1457,7 +1504,8 @@ class AlcatelAOS(NetworkDevice):
 
                         # Display info message
                         log.info(
-                            f"set_interface: mode: remove tagged vlan: aos 6: cmd: '{cmd}'"
+                            "set_interface: mode: remove tagged vlan: aos 6: cmd: '%s'",
+                            cmd,
                         )
 
                         # Remove all the tagged VLANs on the interface
@@ -1473,7 +1521,8 @@ class AlcatelAOS(NetworkDevice):
 
                             # Display info message
                             log.error(
-                                f"set_interface: mode: remove tagged vlan: aos 6: error: {output}"
+                                "set_interface: mode: remove tagged vlan: aos 6: error: %s",
+                                output,
                             )
 
                             # Return an error
@@ -1485,7 +1534,8 @@ class AlcatelAOS(NetworkDevice):
 
                 # Display info message
                 log.info(
-                    f"set_interface: mode: interface {interface} wants to be in trunk mode"
+                    "set_interface: mode: interface %s wants to be in trunk mode",
+                    interface,
                 )
 
                 # If the interface is already in trunk mode there is so no need extra configuration
@@ -1495,6 +1545,9 @@ class AlcatelAOS(NetworkDevice):
 
                     # Yes. The interface is in access mode and needs to be changed into trunk mode
 
+                    # The VLANs of the interface are changed: the VLAN tables kept are no more valid
+                    self.clear_output_cache(self.cmd_show_vlan_tables)
+
                     # Check if list of VLANs to tag is empty
                     if not default_trunk_vlans:
 
@@ -1504,7 +1557,8 @@ class AlcatelAOS(NetworkDevice):
 
                         # Display info message
                         log.error(
-                            f"set_interface: mode: adding trunk is impossible on access port: error: default_trunk_vlans is empty: {default_trunk_vlans}"
+                            "set_interface: mode: adding trunk is impossible on access port: error: default_trunk_vlans is empty: %s",
+                            default_trunk_vlans,
                         )
 
                         # Return an error
@@ -1519,7 +1573,8 @@ class AlcatelAOS(NetworkDevice):
 
                     # Display info message
                     log.info(
-                        f"set_interface: mode: add tagged vlan: get list of VLANs: cmd: '{cmd}'"
+                        "set_interface: mode: add tagged vlan: get list of VLANs: cmd: '%s'",
+                        cmd,
                     )
 
                     # Get the list of VLANs
@@ -1573,7 +1628,8 @@ class AlcatelAOS(NetworkDevice):
 
                     # Display info message
                     log.info(
-                        f"set_interface: mode: add tagged vlan: get list of VLANs: list_vlans: {list_vlans}"
+                        "set_interface: mode: add tagged vlan: get list of VLANs: list_vlans: %s",
+                        list_vlans,
                     )
 
                     # By default the VLAN list of VLAN to add is empty
@@ -1595,7 +1651,8 @@ class AlcatelAOS(NetworkDevice):
 
                     # Display info message
                     log.info(
-                        f"set_interface: mode: add tagged vlan: VLANs to add: vlan_to_add: {vlan_to_add}"
+                        "set_interface: mode: add tagged vlan: VLANs to add: vlan_to_add: %s",
+                        vlan_to_add,
                     )
 
                     # Creation of the needed VLANs
@@ -1610,7 +1667,8 @@ class AlcatelAOS(NetworkDevice):
 
                         # Display info message
                         log.info(
-                            f"set_interface: mode: add tagged vlan: VLANs to add: cmd: '{cmd}'"
+                            "set_interface: mode: add tagged vlan: VLANs to add: cmd: '%s'",
+                            cmd,
                         )
 
                         # Remove all the tagged VLANs on the interface
@@ -1626,7 +1684,9 @@ class AlcatelAOS(NetworkDevice):
 
                             # Display info message
                             log.error(
-                                f"set_interface: mode: add tagged vlan: VLANs to add: VLAN {vlan_id}: error: {output}"
+                                "set_interface: mode: add tagged vlan: VLANs to add: VLAN %s: error: %s",
+                                vlan_id,
+                                output,
                             )
 
                             # Return an error
@@ -1657,7 +1717,8 @@ class AlcatelAOS(NetworkDevice):
 
                             # Display info message
                             log.info(
-                                f"set_interface: mode: add tagged vlans to trunk: aos 7+: cmd: '{cmd}'"
+                                "set_interface: mode: add tagged vlans to trunk: aos 7+: cmd: '%s'",
+                                cmd,
                             )
 
                             # Add tagged VLANs to the interface to make it a trunk port
@@ -1673,7 +1734,8 @@ class AlcatelAOS(NetworkDevice):
 
                                 # Display info message
                                 log.error(
-                                    f"set_interface: mode: add tagged vlans to trunk: aos 7+: error: {output}"
+                                    "set_interface: mode: add tagged vlans to trunk: aos 7+: error: %s",
+                                    output,
                                 )
 
                                 # Return an error
@@ -1703,7 +1765,8 @@ class AlcatelAOS(NetworkDevice):
 
                         # Display info message
                         log.info(
-                            f"set_interface: mode: add tagged vlans to trunk: aos 6: cmd: '{cmd}'"
+                            "set_interface: mode: add tagged vlans to trunk: aos 6: cmd: '%s'",
+                            cmd,
                         )
 
                         # Add tagged VLANs to the interface to make it a trunk port
@@ -1719,7 +1782,8 @@ class AlcatelAOS(NetworkDevice):
 
                             # Display info message
                             log.error(
-                                f"set_interface: mode: add tagged vlans to trunk: aos 6: error: {output}"
+                                "set_interface: mode: add tagged vlans to trunk: aos 6: error: %s",
+                                output,
                             )
 
                             # Return an error
@@ -1731,12 +1795,44 @@ class AlcatelAOS(NetworkDevice):
         # Return status
         return return_status
 
-    async def get_mac_address_table(self):
+    async def get_mac_address_table(self, compact=False):
         """
         Asyn method used to get the mac address table of the device
 
+        :param compact: optional, if True a Table (values saved by columns, less memory) is returned instead of a list of dictionaries. Default value is False
+        :type compact: bool
+
         :return: MAC address table of the device
-        :rtype: list of dict
+        :rtype: list of dict (Table if compact is True)
+        """
+
+        # Display info message
+        log.info("get_mac_address_table")
+
+        # Table saved by columns?
+        if compact:
+
+            # Yes
+            return await Table.collect(
+                self.iter_mac_address_table(),
+                MAC_ADDRESS_TABLE_FIELDS,
+                MAC_ADDRESS_TABLE_CATEGORIES,
+            )
+
+        # Get all the MAC addresses
+        return [mac_dict async for mac_dict in self.iter_mac_address_table()]
+
+    async def iter_mac_address_table(self):
+        """
+        Asyn generator used to get the mac address table of the device while it is received
+
+        The entries are given while the device is still sending the table, so
+        the memory used does not depend on the size of the table. The loop
+        can be left before the end of the table (eg. "break"): the rest of
+        the output is read before the next command.
+
+        :return: the MAC addresses of the device (one dictionary per MAC address)
+        :rtype: dict
         """
 
         # self.cmd_get_mac_address_table = [
@@ -1745,241 +1841,267 @@ class AlcatelAOS(NetworkDevice):
         # ]
 
         # Display info message
-        log.info("get_mac_address_table")
+        log.info("iter_mac_address_table")
 
-        # By default nothing is returned
-        returned_output = []
+        # Dialect of the device (6 or 7)
+        aos_version = await self.get_aos_version()
 
-        # By default, this is Alcatel AOS 7+
-        alcatel_version = 7
+        # Command of the dialect of the device first, then the other command if refused
+        for alcatel_version, cmd in self.get_aos_commands(
+            aos_version,
+            self.cmd_get_mac_address_table[0],
+            self.cmd_get_mac_address_table[1],
+        ):
 
-        # Get command
-        cmd = self.cmd_get_mac_address_table[0]
+            # Display info message
+            log.info("iter_mac_address_table: aos %s: cmd: '%s'", alcatel_version, cmd)
 
-        # Display info message
-        log.info(f"get_mac_address_table: aos 7+: cmd: '{cmd}'")
+            # By default the first lines read are the header
+            header_data = True
 
-        # Send a command
-        output = await self.send_command(cmd)
+            # By default the command is not refused
+            command_refused = False
 
-        # Check if there is an error
-        # Example:
-        #                                     ^
-        # ERROR: Invalid entry: "mac-learning"
-        if "mac-learning" in output.lower():
+            # Lines of the output while they are received
+            lines = self.stream_command(cmd)
 
-            # Yes, there is an error
+            try:
 
-            # Second try in AOS 6
+                # Read each line
+                async for line in lines:
 
-            # Maybe Alcatel AOS 6
-            alcatel_version = 6
+                    # Is it the header data without usefull information?
+                    if header_data:
 
-            # Get command
-            cmd = self.cmd_get_mac_address_table[1]
+                        # Yes
 
-            # Display info message
-            log.info(f"get_mac_address_table: aos 6: cmd: '{cmd}'")
+                        # Check if there is an error
+                        # Example:
+                        #                                     ^
+                        # ERROR: Invalid entry: "mac-learning"
+                        if (
+                            alcatel_version == aos_version
+                            and "invalid entry" in line.lower()
+                        ):
 
-            # Send a command
-            output = await self.send_command(cmd)
+                            # Yes, there is an error
 
-        # Check if there is an error
-        if "error" in output.lower():
+                            # Maybe the other dialect: second try with the other command
+                            command_refused = True
+                            break
 
-            # Yes, there is an error
+                        # Check if there is an error
+                        if "error" in line.lower():
 
-            # Display info message
-            log.error(f"get_mac_address_table: error: {output}")
+                            # Yes, there is an error
 
-            # Return an error
-            return returned_output
+                            # Display info message
+                            log.error("iter_mac_address_table: error: %s", line)
 
-        # Now we can gather the information
+                            # Nothing is given
+                            return
 
-        # Convert output into a list of lines
-        lines = output.splitlines()
+                        # Let's check if it is still the header
+                        if line.startswith("---"):
 
-        # By default the first lines read are the header
-        header_data = True
+                            # Next time will be after header
+                            header_data = False
 
-        # Read each line
-        for line in lines:
+                            # Command of the other dialect accepted?
+                            if alcatel_version != aos_version:
 
-            # Is it the header data without usefull information?
-            if header_data:
+                                # Yes, the dialect of the device is changed
+                                self.set_capability("aos_version", alcatel_version)
 
-                # Yes
+                    else:
 
-                # Let's check if it is still the case
-                if line.startswith("---"):
+                        # Data after header = usefull information
 
-                    # Next time will be after header
-                    header_data = False
+                        # Set default values for variables
+                        mac_type = None
+                        mac_address = None
+                        vlan = None
+                        interface = None
 
-            else:
+                        # Split the line
+                        linesplitted = line.split()
 
-                # Data after header = usefull information
+                        # Check if it is AOS7+
+                        if alcatel_version == 7:
 
-                # Set default values for variables
-                mac_type = None
-                mac_address = None
-                vlan = None
-                interface = None
+                            # Yes, Alcatel AOS 7+
 
-                # Split the line
-                linesplitted = line.split()
+                            # Display info message
+                            log.info(
+                                "iter_mac_address_table: aos 7: linesplitted: '%s'",
+                                linesplitted,
+                            )
 
-                # Check if it is AOS7+
-                if alcatel_version == 7:
+                            # Check if there are at least 6 values
+                            # (i.e.  "Domain", "Vlan/SrvcId[ISId/vnId]", "Mac Address", "Type", "Operation", "Interface")
+                            if len(linesplitted) >= 6:
 
-                    # Yes, Alcatel AOS 7+
+                                # Yes, there are at least 6 values
 
-                    # Display info message
-                    log.info(
-                        f"get_mac_address_table: aos 7: linesplitted: '{linesplitted}'"
-                    )
+                                # "linesplitted" example:
+                                # ['VLAN', '1234', '02:60:74:1f:f5:cd', 'dynamic', 'bridging', '1/1/8']
 
-                    # Check if there are at least 6 values
-                    # (i.e.  "Domain", "Vlan/SrvcId[ISId/vnId]", "Mac Address", "Type", "Operation", "Interface")
-                    if len(linesplitted) >= 6:
+                                # Get the type of MAC address (dynamic or static)
+                                # MAC address type is either "dynamic"/"bmac"/"multicast" (dynamic) or "static" (static)
+                                # Check if "learned" is found
+                                if "static" in linesplitted[3]:
 
-                        # Yes, there are at least 6 values
+                                    # Static MAC address
+                                    mac_type = "static"
 
-                        # "linesplitted" example:
-                        # ['VLAN', '1234', '02:60:74:1f:f5:cd', 'dynamic', 'bridging', '1/1/8']
+                                else:
 
-                        # Get the type of MAC address (dynamic or static)
-                        # MAC address type is either "dynamic"/"bmac"/"multicast" (dynamic) or "static" (static)
-                        # Check if "learned" is found
-                        if "static" in linesplitted[3]:
+                                    # Dynamic MAC address
+                                    mac_type = "dynamic"
 
-                            # Static MAC address
-                            mac_type = "static"
+                                # Get MAC address
+                                mac_address_possible = linesplitted[2].lower()
 
-                        else:
+                                # Check if ':' is in the MAC address
+                                if ":" in mac_address_possible:
 
-                            # Dynamic MAC address
-                            mac_type = "dynamic"
+                                    # Yes, so it should be a MAC address
+                                    mac_address = mac_address_possible
 
-                        # Get MAC address
-                        mac_address_possible = linesplitted[2].lower()
+                                # Check if the firt value is "VLAN"
+                                if linesplitted[0].lower() == "vlan":
 
-                        # Check if ':' is in the MAC address
-                        if ":" in mac_address_possible:
+                                    # Yes, so the next value is a VLAN information
 
-                            # Yes, so it should be a MAC address
-                            mac_address = mac_address_possible
+                                    # Get VLAN
+                                    vlan = int(linesplitted[1])
 
-                        # Check if the firt value is "VLAN"
-                        if linesplitted[0].lower() == "vlan":
+                                # Get interface
+                                interface = linesplitted[5]
 
-                            # Yes, so the next value is a VLAN information
+                                # Create a dictionary
+                                mac_dict = {
+                                    "mac_type": mac_type,
+                                    "mac_address": mac_address,
+                                    "vlan": vlan,
+                                    "interface": interface,
+                                }
 
-                            # Get VLAN
-                            vlan = int(linesplitted[1])
+                                # Give the MAC information
+                                if mac_address:
+                                    yield mac_dict
 
-                        # Get interface
-                        interface = linesplitted[5]
+                        else:
 
-                        # Create a dictionary
-                        mac_dict = {
-                            "mac_type": mac_type,
-                            "mac_address": mac_address,
-                            "vlan": vlan,
-                            "interface": interface,
-                        }
+                            # Alcatel AOS 6
 
-                        # Add the MAC information to the list
-                        if mac_address:
-                            returned_output.append(mac_dict)
+                            # Display info message
+                            log.info(
+                                "iter_mac_address_table: aos 6: linesplitted: '%s'",
+                                linesplitted,
+                            )
 
-                else:
+                            # Check if there are at least 7 values
+                            # (i.e.  "Domain", "Vlan/SrvcId", "Mac Address", "Type", "Protocol",
+                            # "Operation", "Interface")
+                            if len(linesplitted) >= 7:
 
-                    # Alcatel AOS 6
+                                # Yes, there are at least 7 values
 
-                    # Display info message
-                    log.info(
-                        f"get_mac_address_table: aos 6: linesplitted: '{linesplitted}'"
-                    )
+                                # "linesplitted" example:
+                                # ['VLAN', '1234', '02:60:74:1f:f5:cd', 'learned', '---', 'bridging', '1/8']
 
-                    # Check if there are at least 7 values
-                    # (i.e.  "Domain", "Vlan/SrvcId", "Mac Address", "Type", "Protocol",
-                    # "Operation", "Interface")
-                    if len(linesplitted) >= 7:
+                                # Get the type of MAC address (dynamic or static)
+                                # MAC address type is either "learned" (dynamic) or "permanent" (static)
+                                # Check if "learned" is found
+                                if "learned" in linesplitted[3]:
 
-                        # Yes, there are at least 7 values
+                                    # Dynamic MAC address
+                                    mac_type = "dynamic"
 
-                        # "linesplitted" example:
-                        # ['VLAN', '1234', '02:60:74:1f:f5:cd', 'learned', '---', 'bridging', '1/8']
+                                else:
 
-                        # Get the type of MAC address (dynamic or static)
-                        # MAC address type is either "learned" (dynamic) or "permanent" (static)
-                        # Check if "learned" is found
-                        if "learned" in linesplitted[3]:
+                                    # Static MAC address
+                                    mac_type = "static"
 
-                            # Dynamic MAC address
-                            mac_type = "dynamic"
+                                # Get MAC address
+                                mac_address_possible = linesplitted[2].lower()
 
-                        else:
+                                # Check if ':' is in the MAC address
+                                if ":" in mac_address_possible:
 
-                            # Static MAC address
-                            mac_type = "static"
+                                    # Yes, so it should be a MAC address
+                                    mac_address = mac_address_possible
 
-                        # Get MAC address
-                        mac_address_possible = linesplitted[2].lower()
+                                # Check if the firt value is "VLAN"
+                                if linesplitted[0].lower() == "vlan":
 
-                        # Check if ':' is in the MAC address
-                        if ":" in mac_address_possible:
+                                    # Yes, so the next value is a VLAN information
 
-                            # Yes, so it should be a MAC address
-                            mac_address = mac_address_possible
+                                    # Get VLAN
+                                    vlan = int(linesplitted[1])
 
-                        # Check if the firt value is "VLAN"
-                        if linesplitted[0].lower() == "vlan":
+                                # Get interface
+                                interface = linesplitted[6]
 
-                            # Yes, so the next value is a VLAN information
+                                # Create a dictionary
+                                mac_dict = {
+                                    "mac_type": mac_type,
+                                    "mac_address": mac_address,
+                                    "vlan": vlan,
+                                    "interface": interface,
+                                }
 
-                            # Get VLAN
-                            vlan = int(linesplitted[1])
+                                # Give the MAC information
+                                if mac_address:
+                                    yield mac_dict
 
-                        # Get interface
-                        interface = linesplitted[6]
+            finally:
 
-                        # Create a dictionary
-                        mac_dict = {
-                            "mac_type": mac_type,
-                            "mac_address": mac_address,
-                            "vlan": vlan,
-                            "interface": interface,
-                        }
+                # End of the output read even if the generator is closed before
+                await lines.aclose()
 
-                        # Add the MAC information to the list
-                        if mac_address:
-                            returned_output.append(mac_dict)
+            # Command refused?
+            if not command_refused:
 
-        # Return data
-        return returned_output
+                # No, all the MAC addresses are given
+                return
 
-    async def get_arp_table(self):
+    async def get_arp_table(self, compact=False):
         """
         Asyn method used to get the ARP table of the device
 
+        :param compact: optional, if True a Table (values saved by columns, less memory) is returned instead of a list of dictionaries. Default value is False
+        :type compact: bool
+
         :return: ARP table of the device
-        :rtype: list of dict
+        :rtype: list of dict (Table if compact is True)
         """
 
         # Display info message
         log.info("get_arp_table")
 
-        # By default nothing is returned
-        returned_output = []
+        # Table saved by columns?
+        if compact:
 
-        # Send a command
-        output = await self.send_command(self.cmd_get_arp)
+            # Yes
+            return await Table.collect(
+                self.iter_arp_table(), ARP_TABLE_FIELDS, ARP_TABLE_CATEGORIES
+            )
+
+        # Get all the ARP entries
+        return [returned_dict async for returned_dict in self.iter_arp_table()]
+
+    async def iter_arp_table(self):
+        """
+        Asyn generator used to get the ARP table of the device while it is received
+
+        :return: the ARP entries of the device (one dictionary per entry)
+        :rtype: dict
+        """
 
         # Display info message
-        log.info(f"get_arp:\n'{output}'")
+        log.info("iter_arp_table")
 
         # Example of returned output:
         #
@@ -1994,94 +2116,100 @@ class AlcatelAOS(NetworkDevice):
         #
         #
 
-        # Convert a string into a list of strings
-        lines = output.splitlines()
-
         # By default, the beginning of the first character of the interface is not defined
         interface_starting_position = None
 
         # By default the first lines read are the header
         header_data = True
 
-        # Read each line
-        for line in lines:
+        # Lines of the output while they are received
+        lines = self.stream_command(self.cmd_get_arp)
 
-            # Is it the header data without usefull information?
-            if header_data:
+        try:
 
-                # Yes
+            # Read each line
+            async for line in lines:
 
-                # Let's check if it is still the case
-                if line.startswith("---"):
+                # Is it the header data without usefull information?
+                if header_data:
 
-                    # Get the position of the first charater of the interface
-                    list_of_plus = [i for i, letter in enumerate(line) if letter == "+"]
+                    # Yes
+
+                    # Let's check if it is still the case
+                    if line.startswith("---"):
+
+                        # Get the position of the first charater of the interface
+                        list_of_plus = [
+                            i for i, letter in enumerate(line) if letter == "+"
+                        ]
+
+                        # At least than 5 characters "+"?
+                        if len(list_of_plus) >= 5:
+                            # Yes
 
-                    # At least than 5 characters "+"?
-                    if len(list_of_plus) >= 5:
-                        # Yes
+                            # Saving the position of the first character of the interface
+                            interface_starting_position = list_of_plus[4]
 
-                        # Saving the position of the first character of the interface
-                        interface_starting_position = list_of_plus[4]
+                        # Next time will be after header
+                        header_data = False
 
-                    # Next time will be after header
-                    header_data = False
+                else:
 
-            else:
+                    # Data after header = usefull information
 
-                # Data after header = usefull information
+                    # Set default values for variables
+                    address = None
+                    mac_address = None
+                    interface = None
 
-                # Set default values for variables
-                address = None
-                mac_address = None
-                interface = None
+                    # Split the line
+                    splitted_line = line.split()
 
-                # Split the line
-                splitted_line = line.split()
+                    # Does the line has at least 3 elements?
+                    if len(splitted_line) >= 3:
 
-                # Does the line has at least 3 elements?
-                if len(splitted_line) >= 3:
+                        # Yes
 
-                    # Yes
+                        # Get MAC address
+                        mac_address_possible = splitted_line[1]
 
-                    # Get MAC address
-                    mac_address_possible = splitted_line[1]
+                        # Check if this is a MAC address
+                        if ":" in mac_address_possible:
 
-                    # Check if this is a MAC address
-                    if ":" in mac_address_possible:
+                            # Yes
 
-                        # Yes
+                            # Save the MAC Address
+                            mac_address = mac_address_possible
 
-                        # Save the MAC Address
-                        mac_address = mac_address_possible
+                            # Get IP address
+                            address = splitted_line[0]
 
-                        # Get IP address
-                        address = splitted_line[0]
+                            # Position of the interface found?
+                            if interface_starting_position:
 
-                        # Position of the interface found?
-                        if interface_starting_position:
+                                # Yes
 
-                            # Yes
+                                # Get interface
+                                interface = line[interface_starting_position:]
 
-                            # Get interface
-                            interface = line[interface_starting_position:]
+                                # Remove left and right space
+                                interface = interface.strip()
 
-                            # Remove left and right space
-                            interface = interface.strip()
+                    # Create a dictionary
+                    returned_dict = {
+                        "address": address,
+                        "mac_address": mac_address,
+                        "interface": interface,
+                    }
 
-                # Create a dictionary
-                returned_dict = {
-                    "address": address,
-                    "mac_address": mac_address,
-                    "interface": interface,
-                }
+                    # Give the information
+                    if address:
+                        yield returned_dict
 
-                # Add the information to the list
-                if address:
-                    returned_output.append(returned_dict)
+        finally:
 
-        # Return data
-        return returned_output
+            # End of the output read even if the generator is closed before
+            await lines.aclose()
 
     async def get_lldp_neighbors(self):
         """
@@ -2101,7 +2229,7 @@ class AlcatelAOS(NetworkDevice):
         output = await self.send_command(self.cmd_get_lldp_neighbors)
 
         # Display info message
-        log.info(f"get_lldp_neighbors:\n'{output}'")
+        log.info("get_lldp_neighbors:\n'%s'", output)
 
         # Example of LLDP data on Alcatel AOS switch:
         # Remote LLDP Agents on Local Slot/Port 1/21:
@@ -2124,7 +2252,7 @@ class AlcatelAOS(NetworkDevice):
         for block in blocks:
 
             # Display info message
-            log.debug(f"get_lldp_neighbors: block: '{block}'")
+            log.debug("get_lldp_neighbors: block: '%s'", block)
 
             # Check if the block is just having empty string
             if block:
@@ -2149,7 +2277,7 @@ class AlcatelAOS(NetworkDevice):
                 local_interface = lines[0].split()[-1][:-1]
 
                 # Display info message
-                log.info(f"get_lldp_neighbors: local_interface: {local_interface}")
+                log.info("get_lldp_neighbors: local_interface: %s", local_interface)
 
                 # Read each line
                 for line in lines:
@@ -2173,13 +2301,13 @@ class AlcatelAOS(NetworkDevice):
                             chassis_id = splitted_line[1][:-1]
 
                             # Display info message
-                            log.info(f"get_lldp_neighbors: chassis_id: {chassis_id}")
+                            log.info("get_lldp_neighbors: chassis_id: %s", chassis_id)
 
                             # Get Port ID - TLV type 2
                             port_id = splitted_line[3][:-1]
 
                             # Display info message
-                            log.info(f"get_lldp_neighbors: port_id: {port_id}")
+                            log.info("get_lldp_neighbors: port_id: %s", port_id)
 
                     # Get Time To Live - TLV type 3
                     # Not available on Alcatel AOS.
@@ -2190,7 +2318,7 @@ class AlcatelAOS(NetworkDevice):
 
                         # Display info message
                         log.info(
-                            f"get_lldp_neighbors: port_description: {port_description}"
+                            "get_lldp_neighbors: port_description: %s", port_description
                         )
 
                     # Get System name - TLV type 5
@@ -2198,7 +2326,7 @@ class AlcatelAOS(NetworkDevice):
                         system_name = line.split("= ", 1)[1][:-1]
 
                         # Display info message
-                        log.info(f"get_lldp_neighbors: system_name: {system_name}")
+                        log.info("get_lldp_neighbors: system_name: %s", system_name)
 
                     # Get System description - TLV type 6
                     if "system description" in lower_case_line:
@@ -2206,7 +2334,8 @@ class AlcatelAOS(NetworkDevice):
 
                         # Display info message
                         log.info(
-                            f"get_lldp_neighbors: system_description: {system_description}"
+                            "get_lldp_neighbors: system_description: %s",
+                            system_description,
                         )
 
                     # Get System capabilities - TLV type 7
@@ -2227,7 +2356,8 @@ class AlcatelAOS(NetworkDevice):
 
                         # Display info message
                         log.info(
-                            f"get_lldp_neighbors: system_capabilities: all_capabilities: {all_capabilities}"
+                            "get_lldp_neighbors: system_capabilities: all_capabilities: %s",
+                            all_capabilities,
                         )
 
                         # Read each capability
@@ -2246,7 +2376,8 @@ class AlcatelAOS(NetworkDevice):
 
                         # Display info message
                         log.info(
-                            f"get_lldp_neighbors: management_address: {management_address}"
+                            "get_lldp_neighbors: management_address: %s",
+                            management_address,
                         )
 
                 # Create a dictionary
@@ -2288,7 +2419,7 @@ class AlcatelAOS(NetworkDevice):
         output = await self.send_command(self.cmd_get_vlans)
 
         # Display info message
-        log.info(f"get_vlans:\n'{output}'")
+        log.info("get_vlans:\n'%s'", output)
 
         # By default, the beginning of the first character of the VLAN name is not defined
         vlan_name_starting_position = None
@@ -2337,13 +2468,13 @@ class AlcatelAOS(NetworkDevice):
                 name = line[vlan_name_starting_position:].strip()
 
                 # Display info message
-                log.info(f"get_vlans: name: {name}")
+                log.info("get_vlans: name: %s", name)
 
                 # Get VLAN ID
                 vlan_id = int(line.split()[0])
 
                 # Display info message
-                log.info(f"get_vlans: vlan_id: {vlan_id}")
+                log.info("get_vlans: vlan_id: %s", vlan_id)
 
                 # Create a dictionary
                 returned_dict = {
@@ -2397,13 +2528,16 @@ class AlcatelAOS(NetworkDevice):
         cmd_add_vlan = cmd_add_vlan.replace("<VLAN_NAME>", vlan_name)
 
         # Display info message
-        log.info(f"add_vlan: cmd_add_vlan: '{cmd_add_vlan}'")
+        log.info("add_vlan: cmd_add_vlan: '%s'", cmd_add_vlan)
+
+        # The VLANs are changed: the VLAN tables kept are no more valid
+        self.clear_output_cache(self.cmd_show_vlan_tables)
 
         # Add VLAN
         output = await self.send_command(cmd_add_vlan)
 
         # Display info message
-        log.info(f"add_vlan: output: '{output}'")
+        log.info("add_vlan: output: '%s'", output)
 
         # Check if an error happened
         # Example:
@@ -2442,13 +2576,16 @@ class AlcatelAOS(NetworkDevice):
         cmd_remove_vlan = self.cmd_remove_vlan.replace("<VLAN>", str(vland_id))
 
         # Display info message
-        log.info(f"remove_vlan: cmd_remove_vlan: '{cmd_remove_vlan}'")
+        log.info("remove_vlan: cmd_remove_vlan: '%s'", cmd_remove_vlan)
+
+        # The VLANs are changed: the VLAN tables kept are no more valid
+        self.clear_output_cache(self.cmd_show_vlan_tables)
 
         # Add VLAN
         output = await self.send_command(cmd_remove_vlan)
 
         # Display info message
-        log.info(f"remove_vlan: output: '{output}'")
+        log.info("remove_vlan: output: '%s'", output)
 
         # No error?
         # Example:
@@ -2503,9 +2640,9 @@ class AlcatelAOS(NetworkDevice):
         return_status = False
 
         # Display info message
-        log.info(f"add_interface_to_vlan: input: interface: {interface}")
-        log.info(f"add_interface_to_vlan: input: mode: {mode}")
-        log.info(f"add_interface_to_vlan: input: vlan: {vlan}")
+        log.info("add_interface_to_vlan: input: interface: %s", interface)
+        log.info("add_interface_to_vlan: input: mode: %s", mode)
+        log.info("add_interface_to_vlan: input: vlan: %s", vlan)
 
         # Get parameters
 
@@ -2551,6 +2688,9 @@ class AlcatelAOS(NetworkDevice):
         # Convert VLAN (integer) to string
         vlan_string = str(vlan)
 
+        # The VLANs are changed: the VLAN tables kept are no more valid
+        self.clear_output_cache(self.cmd_show_vlan_tables)
+
         # Check if mode is "access"
         if mode == "access":
 
@@ -2567,7 +2707,7 @@ class AlcatelAOS(NetworkDevice):
             cmd = cmd.replace("<VLAN>", vlan_string)
 
             # Display info message
-            log.info(f"add_interface_to_vlan: set VLAN: access: aos 7+: cmd: {cmd}")
+            log.info("add_interface_to_vlan: set VLAN: access: aos 7+: cmd: %s", cmd)
 
             # Change the VLAN of the interface (in VLAN config of an access port)
             output = await self.send_command(cmd)
@@ -2591,7 +2731,7 @@ class AlcatelAOS(NetworkDevice):
                 cmd = cmd.replace("<VLAN>", vlan_string)
 
                 # Display info message
-                log.info(f"add_interface_to_vlan: set VLAN: access: aos 6: cmd: {cmd}")
+                log.info("add_interface_to_vlan: set VLAN: access: aos 6: cmd: %s", cmd)
 
                 # Change the VLAN of the interface (in VLAN config of an access port)
                 output = await self.send_command(cmd)
@@ -2605,7 +2745,9 @@ class AlcatelAOS(NetworkDevice):
                 # Yes, there is an error
 
                 # Display info message
-                log.error(f"add_interface_to_vlan: add vlan to access: error: {output}")
+                log.error(
+                    "add_interface_to_vlan: add vlan to access: error: %s", output
+                )
 
                 # Return an error
                 return return_status
@@ -2625,7 +2767,7 @@ class AlcatelAOS(NetworkDevice):
             cmd = cmd.replace("<VLAN>", vlan_string)
 
             # Display info message
-            log.info(f"add_interface_to_vlan: set VLAN: trunk: aos 7+: cmd: {cmd}")
+            log.info("add_interface_to_vlan: set VLAN: trunk: aos 7+: cmd: %s", cmd)
 
             # Change the VLAN of the interface
             output = await self.send_command(cmd)
@@ -2649,7 +2791,7 @@ class AlcatelAOS(NetworkDevice):
                 cmd = cmd.replace("<VLAN>", vlan_string)
 
                 # Display info message
-                log.info(f"add_interface_to_vlan: set VLAN: aos 6: cmd: {cmd}")
+                log.info("add_interface_to_vlan: set VLAN: aos 6: cmd: %s", cmd)
 
                 # Change the VLAN of the interface (in VLAN config of an access port)
                 output = await self.send_command(cmd)
@@ -2663,7 +2805,7 @@ class AlcatelAOS(NetworkDevice):
                 # Yes, there is an error
 
                 # Display info message
-                log.error(f"add_interface_to_vlan: add vlan to trunk: error: {output}")
+                log.error("add_interface_to_vlan: add vlan to trunk: error: %s", output)
 
                 # Return an error
                 return return_status
@@ -2715,9 +2857,9 @@ class AlcatelAOS(NetworkDevice):
         return_status = False
 
         # Display info message
-        log.info(f"remove_interface_from_vlan: input: interface: {interface}")
-        log.info(f"remove_interface_from_vlan: input: mode: {mode}")
-        log.info(f"remove_interface_from_vlan: input: vlan: {vlan}")
+        log.info("remove_interface_from_vlan: input: interface: %s", interface)
+        log.info("remove_interface_from_vlan: input: mode: %s", mode)
+        log.info("remove_interface_from_vlan: input: vlan: %s", vlan)
 
         # Get parameters
 
@@ -2763,6 +2905,9 @@ class AlcatelAOS(NetworkDevice):
         # Convert VLAN (integer) to string
         vlan_string = str(vlan)
 
+        # The VLANs are changed: the VLAN tables kept are no more valid
+        self.clear_output_cache(self.cmd_show_vlan_tables)
+
         # Check if mode is "access"
         if mode == "access":
 
@@ -2779,7 +2924,7 @@ class AlcatelAOS(NetworkDevice):
             cmd = cmd.replace("<VLAN>", vlan_string)
 
             # Display info message
-            log.info(f"remove_interface_from_vlan: access: aos 7+: cmd: {cmd}")
+            log.info("remove_interface_from_vlan: access: aos 7+: cmd: %s", cmd)
 
             # Change the VLAN of the interface
             output = await self.send_command(cmd)
@@ -2804,7 +2949,7 @@ class AlcatelAOS(NetworkDevice):
 
                 # Display info message
                 log.info(
-                    f"remove_interface_from_vlan: set VLAN: access: aos 6: cmd: {cmd}"
+                    "remove_interface_from_vlan: set VLAN: access: aos 6: cmd: %s", cmd
                 )
 
                 # Change the VLAN of the interface (in VLAN config of an access port)
@@ -2820,7 +2965,7 @@ class AlcatelAOS(NetworkDevice):
 
                 # Display info message
                 log.error(
-                    f"remove_interface_from_vlan: add vlan to access: error: {output}"
+                    "remove_interface_from_vlan: add vlan to access: error: %s", output
                 )
 
                 # Return an error
@@ -2841,7 +2986,7 @@ class AlcatelAOS(NetworkDevice):
             cmd = cmd.replace("<VLAN>", vlan_string)
 
             # Display info message
-            log.info(f"remove_interface_from_vlan: trunk: aos 7+: cmd: {cmd}")
+            log.info("remove_interface_from_vlan: trunk: aos 7+: cmd: %s", cmd)
 
             # Change the VLAN of the interface
             output = await self.send_command(cmd)
@@ -2865,7 +3010,7 @@ class AlcatelAOS(NetworkDevice):
                 cmd = cmd.replace("<VLAN>", vlan_string)
 
                 # Display info message
-                log.info(f"remove_interface_from_vlan: trunk: aos 6: cmd: {cmd}")
+                log.info("remove_interface_from_vlan: trunk: aos 6: cmd: %s", cmd)
 
                 # Change the VLAN of the interface (in VLAN config of an access port)
                 output = await self.send_command(cmd)
@@ -2880,7 +3025,8 @@ class AlcatelAOS(NetworkDevice):
 
                 # Display info message
                 log.error(
-                    f"remove_interface_from_vlan: remove vlan to trunk: error: {output}"
+                    "remove_interface_from_vlan: remove vlan to trunk: error: %s",
+                    output,
                 )
 
                 # Return an error
@@ -2903,254 +3049,236 @@ class AlcatelAOS(NetworkDevice):
         # Display info message
         log.info("get_routing_table")
 
-        # By default nothing is returned
-        returned_output = {}
+        # Get all the routes
+        return {
+            network: returned_dict
+            async for network, returned_dict in self.iter_routing_table()
+        }
 
-        # Send a command
-        output = await self.send_command(self.cmd_get_routing_table)
+    async def iter_routing_table(self):
+        """
+        Asyn generator used to get the routing table of the device while it is received
+
+        :return: the routes of the device (network and dictionary of the route)
+        :rtype: tuple
+        """
 
         # Display info message
-        log.info(f"get_routing_table:\n'{output}'")
+        log.info("iter_routing_table")
 
-        # First let's divide the returned output in two parts:
+        # The returned output has two parts:
         # - one with the routing table
         # - one witch inactive static routes (specific to Alcatel AOS 6 and 7+)
 
-        routing_information_string, inactive_static_routes = output.split(
-            "Inactive Static Routes"
-        )
-
-        # Display info message
-        log.info(
-            f"get_routing_table: routing_information_string\n'{routing_information_string}'"
-        )
-
-        # Display info message
-        log.info(
-            f"get_routing_table: inactive_static_routes\n'{inactive_static_routes}'"
-        )
-
-        # routing_information_string extracting information
-
-        # Convert a string into a list of strings
-        lines = routing_information_string.splitlines()
-
-        # First search the end of the header of the data returned ("---")
-        for line_number, line in enumerate(lines):
-            if "---" in line:
-                break
+        # By default the lines read are the routing table
+        inactive_static_routes = False
 
-        # line_number has the value of the line with "---"
+        # By default the first lines read are the header (till "---")
+        header_data = True
 
-        # Display info message
-        log.info(
-            f"get_routing_table: routing_information_string: line_number: '{line_number}'"
-        )
+        # Lines of the output while they are received
+        lines = self.stream_command(self.cmd_get_routing_table)
 
-        # Increase line_number to the line number of the next data
-        line_number = line_number + 1
+        try:
 
-        # Check if there are still data (it should be the case)
-        if len(lines) > line_number:
+            # Read each line
+            async for line in lines:
 
-            # Yes there is still data (routing table data)
+                # Beginning of the inactive static routes?
+                if "Inactive Static Routes" in line:
 
-            # Read lines
-            for line in lines[line_number:]:
+                    # Yes
+                    inactive_static_routes = True
 
-                # Initialize data with default values
-                network = ""
-                address = ""
-                prefix = 0
-                protocol = "unknown"
-                administrative_distance = 0
-                gateway = ""
-                active = False
-                protocol_attributes = None
+                    # The header of the inactive static routes is read first
+                    header_data = True
 
-                # Get the 3 first characters
-                three_first_characters = line[:3]
+                # Is it the header data without usefull information?
+                elif header_data:
 
-                # Get the data after the 3 first characters
-                after_the_three_first_characters = line[3:]
+                    # Yes
 
-                # Split the data after the 3 first characters
-                splitted_line = after_the_three_first_characters.split()
+                    # Let's check if it is still the case
+                    if "---" in line:
 
-                log.info(
-                    f"get_routing_table: routing_information_string: splitted_line: '{splitted_line}'"
-                )
+                        # Next time will be after header
+                        header_data = False
 
-                # Check if there are 5 data at least
-                if len(splitted_line) >= 5:
+                # Routing table data?
+                elif not inactive_static_routes:
 
-                    # Yes, enought data
+                    # Initialize data with default values
+                    network = ""
+                    address = ""
+                    prefix = 0
+                    protocol = "unknown"
+                    administrative_distance = 0
+                    gateway = ""
+                    active = False
+                    protocol_attributes = None
 
-                    # Get network, address and prefix
-                    network = splitted_line[0]
-                    address = network.split("/")[0]
-                    prefix = int(network.split("/")[1])
+                    # Get the 3 first characters
+                    three_first_characters = line[:3]
 
-                    # Get protocol and administrative distance
+                    # Get the data after the 3 first characters
+                    after_the_three_first_characters = line[3:]
 
-                    # Save protocol name
-                    protocol_name = splitted_line[3].lower()
+                    # Split the data after the 3 first characters
+                    splitted_line = after_the_three_first_characters.split()
 
-                    if protocol_name == "local":
+                    log.info(
+                        "iter_routing_table: routing table: splitted_line: '%s'",
+                        splitted_line,
+                    )
 
-                        # Connected
-                        protocol = "connected"
+                    # Check if there are 5 data at least
+                    if len(splitted_line) >= 5:
 
-                        # Administratice distance is 0
+                        # Yes, enought data
 
-                    elif protocol_name == "static":
+                        # Get network, address and prefix
+                        network = splitted_line[0]
+                        address = network.split("/")[0]
+                        prefix = int(network.split("/")[1])
 
-                        # Static
-                        protocol = "static"
+                        # Get protocol and administrative distance
 
-                        # Administratice distance
-                        administrative_distance = 1
+                        # Save protocol name
+                        protocol_name = splitted_line[3].lower()
 
-                    elif protocol_name == "rip":
+                        if protocol_name == "local":
 
-                        # RIP
-                        protocol = "rip"
+                            # Connected
+                            protocol = "connected"
 
-                        # Administratice distance
-                        administrative_distance = 120
+                            # Administratice distance is 0
 
-                    elif protocol_name == "bgp":
+                        elif protocol_name == "static":
 
-                        # BGP
-                        protocol = "bgp"
+                            # Static
+                            protocol = "static"
 
-                        # Administratice distance
-                        administrative_distance = 20
+                            # Administratice distance
+                            administrative_distance = 1
 
-                    elif protocol_name == "ospf":
+                        elif protocol_name == "rip":
 
-                        # OSPF
-                        protocol = "ospf"
+                            # RIP
+                            protocol = "rip"
 
-                        # Administratice distance
-                        administrative_distance = 110
+                            # Administratice distance
+                            administrative_distance = 120
 
-                    # Get gateway
-                    gateway = splitted_line[1]
+                        elif protocol_name == "bgp":
 
-                    # Get active status
-                    if len(three_first_characters) > 0:
+                            # BGP
+                            protocol = "bgp"
 
-                        # Check the status ("+" = active)
-                        if "+" in three_first_characters:
+                            # Administratice distance
+                            administrative_distance = 20
 
-                            # Active status
-                            active = True
+                        elif protocol_name == "ospf":
 
-                    # Get protocole attribute
-                    protocol_attributes = {"metric": int(splitted_line[4])}
+                            # OSPF
+                            protocol = "ospf"
 
-                    # Create a dictionary
-                    returned_dict = {
-                        "address": address,
-                        "prefix": prefix,
-                        "protocol": protocol,
-                        "administrative_distance": administrative_distance,
-                        "gateway": gateway,
-                        "active": active,
-                        "protocol_attributes": protocol_attributes,
-                    }
+                            # Administratice distance
+                            administrative_distance = 110
 
-                    # Is a network found?
-                    if network:
+                        # Get gateway
+                        gateway = splitted_line[1]
 
-                        # Yes
+                        # Get active status
+                        if len(three_first_characters) > 0:
 
-                        # Add the information to the dict
-                        returned_output[network] = returned_dict
+                            # Check the status ("+" = active)
+                            if "+" in three_first_characters:
 
-        # inactive_static_routes extracting information
+                                # Active status
+                                active = True
 
-        # Convert a string into a list of strings
-        lines = inactive_static_routes.splitlines()
+                        # Get protocole attribute
+                        protocol_attributes = {"metric": int(splitted_line[4])}
 
-        # First search the end of the header of the data returned ("---")
-        for line_number, line in enumerate(lines):
-            if "---" in line:
-                break
+                        # Create a dictionary
+                        returned_dict = {
+                            "address": address,
+                            "prefix": prefix,
+                            "protocol": protocol,
+                            "administrative_distance": administrative_distance,
+                            "gateway": gateway,
+                            "active": active,
+                            "protocol_attributes": protocol_attributes,
+                        }
 
-        # line_number has the value of the line with "---"
+                        # Is a network found?
+                        if network:
 
-        # Display info message
-        log.info(
-            f"get_routing_table: inactive_static_routes: line_number: '{line_number}'"
-        )
+                            # Yes
 
-        # Increase line_number to the line number of the next data
-        line_number = line_number + 1
+                            # Give the information
+                            yield network, returned_dict
 
-        # Check if there are still data (it should be the case)
-        if len(lines) > line_number:
+                # Inactive static routes data
+                else:
 
-            # Yes there data (routing table data)
+                    # Initialize data with default values
+                    network = ""
+                    address = ""
+                    prefix = 0
+                    protocol = "static"
+                    administrative_distance = 1
+                    gateway = ""
+                    active = False
+                    protocol_attributes = None
 
-            # Read lines
-            for line in lines[line_number:]:
+                    # Split the data
+                    splitted_line = line.split()
 
-                # Initialize data with default values
-                network = ""
-                address = ""
-                prefix = 0
-                protocol = "static"
-                administrative_distance = 1
-                gateway = ""
-                active = False
-                protocol_attributes = None
-
-                # Split the data
-                splitted_line = line.split()
+                    log.info(
+                        "iter_routing_table: inactive static routes: splitted_line: '%s'",
+                        splitted_line,
+                    )
 
-                log.info(
-                    f"get_routing_table: inactive_static_routes: splitted_line: '{splitted_line}'"
-                )
+                    # Check if there are 3 data at least
+                    if len(splitted_line) >= 3:
 
-                # Check if there are 3 data at least
-                if len(splitted_line) >= 3:
+                        # Yes, enought data
 
-                    # Yes, enought data
+                        # Get network, address and prefix
+                        network = splitted_line[0]
+                        address = network.split("/")[0]
+                        prefix = int(network.split("/")[1])
 
-                    # Get network, address and prefix
-                    network = splitted_line[0]
-                    address = network.split("/")[0]
-                    prefix = int(network.split("/")[1])
+                        # Get gateway
+                        gateway = splitted_line[1]
 
-                    # Get gateway
-                    gateway = splitted_line[1]
+                        # Get protocole attribute
+                        protocol_attributes = {"metric": int(splitted_line[2])}
 
-                    # Get protocole attribute
-                    protocol_attributes = {"metric": int(splitted_line[2])}
+                        # Create a dictionary
+                        returned_dict = {
+                            "address": address,
+                            "prefix": prefix,
+                            "protocol": protocol,
+                            "administrative_distance": administrative_distance,
+                            "gateway": gateway,
+                            "active": active,
+                            "protocol_attributes": protocol_attributes,
+                        }
 
-                    # Create a dictionary
-                    returned_dict = {
-                        "address": address,
-                        "prefix": prefix,
-                        "protocol": protocol,
-                        "administrative_distance": administrative_distance,
-                        "gateway": gateway,
-                        "active": active,
-                        "protocol_attributes": protocol_attributes,
-                    }
+                        # Is a network found?
+                        if network:
 
-                    # Is a network found?
-                    if network:
+                            # Yes
 
-                        # Yes
+                            # Give the information
+                            yield network, returned_dict
 
-                        # Add the information to the dict
-                        returned_output[network] = returned_dict
+        finally:
 
-        # Return data
-        return returned_output
+            # End of the output read even if the generator is closed before
+            await lines.aclose()
 
     async def get_interfaces_ip(self):
         """
@@ -3171,7 +3299,7 @@ class AlcatelAOS(NetworkDevice):
         output = await self.send_command(cmd)
 
         # Display info message
-        log.info(f"get_interfaces_ip: output: '{output}'")
+        log.info("get_interfaces_ip: output: '%s'", output)
 
         # By default the dictionary returned is empty
         returned_dict = {}
@@ -3188,7 +3316,7 @@ class AlcatelAOS(NetworkDevice):
 
         # Display info message
         log.info(
-            f"get_interfaces_ip: inactive_static_routes: line_number: '{line_number}'"
+            "get_interfaces_ip: inactive_static_routes: line_number: '%s'", line_number
         )
 
         # Increase line_number to the line number of the next data
@@ -3300,7 +3428,7 @@ class AlcatelAOS(NetworkDevice):
             # No
 
             # Display info message
-            log.error(f"add_static_route: no network specified: {network_ip}")
+            log.error("add_static_route: no network specified: %s", network_ip)
 
             # Return an error
             return return_status
@@ -3311,7 +3439,7 @@ class AlcatelAOS(NetworkDevice):
             # No
 
             # Display info message
-            log.error(f"add_static_route: no prefix_length specified: {prefix_length}")
+            log.error("add_static_route: no prefix_length specified: %s", prefix_length)
 
             # Return an error
             return return_status
@@ -3323,7 +3451,8 @@ class AlcatelAOS(NetworkDevice):
 
             # Display info message
             log.error(
-                f"add_static_route: prefix_length incorrect value (1...32): {prefix_length}"
+                "add_static_route: prefix_length incorrect value (1...32): %s",
+                prefix_length,
             )
 
             # Return an error
@@ -3336,7 +3465,7 @@ class AlcatelAOS(NetworkDevice):
 
             # Display info message
             log.error(
-                f"add_static_route: no destination_ip specified: {destination_ip}"
+                "add_static_route: no destination_ip specified: %s", destination_ip
             )
 
             # Return an error
@@ -3348,7 +3477,7 @@ class AlcatelAOS(NetworkDevice):
             # No
 
             # Display info message
-            log.error(f"add_static_route: no metric specified: {metric}")
+            log.error("add_static_route: no metric specified: %s", metric)
 
             # Return an error
             return return_status
@@ -3368,7 +3497,10 @@ class AlcatelAOS(NetworkDevice):
         cmd = cmd.replace("<METRIC>", str(metric))
 
         # Display info message
-        log.info(f"add_static_route: cmd: {cmd}")
+        log.info("add_static_route: cmd: %s", cmd)
+
+        # The routes are changed: the routing table kept is no more valid
+        self.clear_output_cache((self.cmd_get_routing_table,))
 
         # Sending command
         output = await self.send_command(cmd)
@@ -3382,7 +3514,7 @@ class AlcatelAOS(NetworkDevice):
             # Yes, there is an error
 
             # Display info message
-            log.error(f"add_static_route: error: {output}")
+            log.error("add_static_route: error: %s", output)
 
             # Return an error
             return return_status
@@ -3434,7 +3566,7 @@ class AlcatelAOS(NetworkDevice):
             # No
 
             # Display info message
-            log.error(f"remove_static_route: no network specified: {network_ip}")
+            log.error("remove_static_route: no network specified: %s", network_ip)
 
             # Return an error
             return return_status
@@ -3446,7 +3578,7 @@ class AlcatelAOS(NetworkDevice):
 
             # Display info message
             log.error(
-                f"remove_static_route: no prefix_length specified: {prefix_length}"
+                "remove_static_route: no prefix_length specified: %s", prefix_length
             )
 
             # Return an error
@@ -3459,7 +3591,8 @@ class AlcatelAOS(NetworkDevice):
 
             # Display info message
             log.error(
-                f"remove_static_route: prefix_length incorrect value (1...32): {prefix_length}"
+                "remove_static_route: prefix_length incorrect value (1...32): %s",
+                prefix_length,
             )
 
             # Return an error
@@ -3472,7 +3605,8 @@ class AlcatelAOS(NetworkDevice):
 
             # Display info message
             log.error(
-                f"remove_static_route: no destination IP address specified: {destination_ip}"
+                "remove_static_route: no destination IP address specified: %s",
+                destination_ip,
             )
 
             # Return an error
@@ -3490,7 +3624,10 @@ class AlcatelAOS(NetworkDevice):
         cmd = cmd.replace("<DESTINATION>", destination_ip)
 
         # Display info message
-        log.info(f"remove_static_route: cmd: {cmd}")
+        log.info("remove_static_route: cmd: %s", cmd)
+
+        # The routes are changed: the routing table kept is no more valid
+        self.clear_output_cache((self.cmd_get_routing_table,))
 
         # Sending command
         output = await self.send_command(cmd)
@@ -3504,7 +3641,7 @@ class AlcatelAOS(NetworkDevice):
             # Yes, there is an error
 
             # Display info message
-            log.error(f"remove_static_route: error: {output}")
+            log.error("remove_static_route: error: %s", output)
 
             # Return an error
             return return_status
@@ -3554,14 +3691,14 @@ class AlcatelAOS(NetworkDevice):
 
             # Display info message
             log.error(
-                f"get_links_aggregation: returned output: error:\n'{output_status}'"
+                "get_links_aggregation: returned output: error:\n'%s'", output_status
             )
 
             # Exit
             return returned_output
 
         # Display info message
-        log.info(f"get_links_aggregation: returned output\n'{output_status}'")
+        log.info("get_links_aggregation: returned output\n'%s'", output_status)
 
         # Convert a string into a list of strings
         lines = output_status.splitlines()
@@ -3574,7 +3711,7 @@ class AlcatelAOS(NetworkDevice):
         # line_number has the value of the line with "---"
 
         # Display info message
-        log.info(f"get_links_aggregation: line_number: '{line_number}'")
+        log.info("get_links_aggregation: line_number: '%s'", line_number)
 
         # Increase line_number to the line number of the next data
         line_number = line_number + 1
@@ -3636,7 +3773,9 @@ class AlcatelAOS(NetworkDevice):
 
                         # Display info message
                         log.info(
-                            f"get_links_aggregation: link_aggregation: {link_aggregation} returned_dict: '{returned_dict}'"
+                            "get_links_aggregation: link_aggregation: %s returned_dict: '%s'",
+                            link_aggregation,
+                            returned_dict,
                         )
 
                         # Add the information to the dict
@@ -3687,10 +3826,11 @@ class AlcatelAOS(NetworkDevice):
 
         # Display info message
         log.info(
-            f"add_link_aggregation_to_vlan: input: link_aggregation: {link_aggregation}"
+            "add_link_aggregation_to_vlan: input: link_aggregation: %s",
+            link_aggregation,
         )
-        log.info(f"add_link_aggregation_to_vlan: input: mode: {mode}")
-        log.info(f"add_link_aggregation_to_vlan: input: vlan: {vlan}")
+        log.info("add_link_aggregation_to_vlan: input: mode: %s", mode)
+        log.info("add_link_aggregation_to_vlan: input: vlan: %s", vlan)
 
         # Get parameters
 
@@ -3736,6 +3876,9 @@ class AlcatelAOS(NetworkDevice):
         # Convert VLAN (integer) to string
         vlan_string = str(vlan)
 
+        # The VLANs are changed: the VLAN tables kept are no more valid
+        self.clear_output_cache(self.cmd_show_vlan_tables)
+
         # Remove possible "0/" before link aggregation reference (e.g: "0/1" -> "1")
         # Necessary since those characters are not used in the folowing commands
         link_aggregation = link_aggregation.replace("0/", "")
@@ -3759,7 +3902,7 @@ class AlcatelAOS(NetworkDevice):
 
             # Display info message
             log.info(
-                f"add_link_aggregation_to_vlan: set VLAN: access: aos 7+: cmd: {cmd}"
+                "add_link_aggregation_to_vlan: set VLAN: access: aos 7+: cmd: %s", cmd
             )
 
             # Change the VLAN of the link aggregation
@@ -3785,7 +3928,8 @@ class AlcatelAOS(NetworkDevice):
 
                 # Display info message
                 log.info(
-                    f"add_link_aggregation_to_vlan: set VLAN: access: aos 6: cmd: {cmd}"
+                    "add_link_aggregation_to_vlan: set VLAN: access: aos 6: cmd: %s",
+                    cmd,
                 )
 
                 # Change the VLAN of the link aggregation
@@ -3801,7 +3945,8 @@ class AlcatelAOS(NetworkDevice):
 
                 # Display info message
                 log.error(
-                    f"add_link_aggregation_to_vlan: add vlan to access: error: {output}"
+                    "add_link_aggregation_to_vlan: add vlan to access: error: %s",
+                    output,
                 )
 
                 # Return an error
@@ -3825,7 +3970,7 @@ class AlcatelAOS(NetworkDevice):
 
             # Display info message
             log.info(
-                f"add_link_aggregation_to_vlan: set VLAN: trunk: aos 7+: cmd: {cmd}"
+                "add_link_aggregation_to_vlan: set VLAN: trunk: aos 7+: cmd: %s", cmd
             )
 
             # Change the VLAN of the link aggregation
@@ -3850,7 +3995,7 @@ class AlcatelAOS(NetworkDevice):
                 cmd = cmd.replace("<VLAN>", vlan_string)
 
                 # Display info message
-                log.info(f"add_link_aggregation_to_vlan: set VLAN: aos 6: cmd: {cmd}")
+                log.info("add_link_aggregation_to_vlan: set VLAN: aos 6: cmd: %s", cmd)
 
                 # Change the VLAN of the link_aggregation
                 output = await self.send_command(cmd)
@@ -3865,9 +4010,258 @@ class AlcatelAOS(NetworkDevice):
 
                 # Display info message
                 log.error(
-                    f"add_link_aggregation_to_vlan: add vlan to trunk: error: {output}"
+                    "add_link_aggregation_to_vlan: add vlan to trunk: error: %s", output
+                )
+
+                # Return an error
+                return return_status
+
+        # No error
+        return_status = True
+
+        # Return status
+        return return_status
+
+    async def apply_vlan_membership(
+        self, membership=None, link_aggregation_membership=None
+    ):
+        """
+        Asyn method used to add several interfaces and links aggregation to VLANs of the device (bulk add_interface_to_vlan and add_link_aggregation_to_vlan)
+
+        The VLANs of the interfaces ("show vlan members" or "show vlan port")
+        are read once, the interfaces already in their VLAN (same mode) are
+        ignored and the commands of the AOS version of the device are sent
+        in one send_config_set (an access interface leaves its old default
+        VLAN). Nothing is sent if nothing changes or if a VLAN is not found
+        ("show vlan").
+
+        Example:
+
+        await sw1.apply_vlan_membership({"1/1/2": ("access", 10), "1/1/3": ("trunk", 20)}, {"1": ("trunk", 20)})
+
+
+        :param membership: optional, mode (access, trunk) and VLAN number of each interface
+        :type membership: dict
+
+        :param link_aggregation_membership: optional, mode (access, trunk) and VLAN number of each link aggregation
+        :type link_aggregation_membership: dict
+
+        :return: Status. True = no error, False = error
+        :rtype: bool
+        """
+
+        # Display info message
+        log.info("apply_vlan_membership")
+
+        # By default result status is having an error
+        return_status = False
+
+        # "membership" or "link_aggregation_membership" found?
+        if not membership and not link_aggregation_membership:
+
+            # No
+
+            # So no action can be performed
+
+            # Display info message
+            log.info("apply_vlan_membership: no membership specified")
+
+            # Return status
+            return return_status
+
+        # Dialect of the device (6 or 7)
+        aos_version = await self.get_aos_version()
+
+        # "show vlan members" (AOS 7+) or "show vlan port" (AOS 6)
+
+        # Get the VLANs of the interfaces (output kept if "output_cache_ttl" is used)
+        output = await self.send_aos_command(
+            self.cmd_set_interface[7], self.cmd_set_interface[8], cached=True
+        )
+
+        # Check if there is an error
+        if "error" in output.lower():
+
+            # Yes, there is an error
+
+            # Display info message
+            log.error("apply_vlan_membership: vlan members: error: %s", output)
+
+            # Return an error
+            return return_status
+
+        # VLANs of the interfaces already set: (VLAN, interface, mode)
+        # Example:
+        #  vlan     port     type        status
+        # --------+-------+-----------+-------------
+        #    1     1/1/1   untagged    inactive
+        #   10     0/1     qtagged     forwarding
+        set_of_members = set()
+
+        # By default the lines read are header
+        no_header_data = False
+
+        # Read each line
+        for line in output.splitlines():
+
+            # Is it the header data without information about VLANS and interfaces?
+            if not no_header_data:
+
+                # Yes
+
+                # Let's check if it is still the case
+                if line.startswith("---"):
+
+                    # Next time it will be interface data
+                    no_header_data = True
+
+            else:
+
+                # Get "vlan", "port" and "type"
+                vlan_port_type = line.split()
+
+                # Check if there are 3 values (i.e. "vlan", "port" and "type" in the line)
+                if len(vlan_port_type) >= 3:
+
+                    # Yes, "tagged" (AOS 7+) and "qtagged" (AOS 6) are trunks
+                    set_of_members.add(
+                        (
+                            vlan_port_type[0],
+                            vlan_port_type[1],
+                            (
+                                "trunk"
+                                if vlan_port_type[2] in ("tagged", "qtagged")
+                                else "access"
+                            ),
+                        )
+                    )
+
+        # Commands to send
+        list_of_commands = []
+
+        # Interfaces then links aggregation
+        for dict_membership, list_of_templates, tag, prefix in (
+            (membership, self.cmd_add_interface_to_vlan, "<INTERFACE>", ""),
+            (
+                link_aggregation_membership,
+                self.cmd_add_link_aggregation_to_vlan,
+                "<LINK_AGGREGATION>",
+                "0/",
+            ),
+        ):
+
+            # Check each interface (or link aggregation)
+            for interface, (mode, vlan) in (dict_membership or {}).items():
+
+                # Convert VLAN (integer) to string
+                vlan_string = str(vlan)
+
+                # Remove possible "0/" before link aggregation reference (e.g: "0/1" -> "1")
+                # Necessary since those characters are not used in the folowing commands
+                if prefix:
+                    interface = interface.replace("0/", "")
+
+                # Mode "access" or "trunk"
+                mode = "access" if mode == "access" else "trunk"
+
+                # Interface already in the VLAN with this mode?
+                if (vlan_string, prefix + interface, mode) in set_of_members:
+
+                    # Yes, nothing to change
+
+                    # Display info message
+                    log.info(
+                        "apply_vlan_membership: %s already in VLAN %s (%s)",
+                        interface,
+                        vlan_string,
+                        mode,
+                    )
+
+                    continue
+
+                # "vlan <VLAN> members port <INTERFACE> untagged" (AOS 7+), "vlan <VLAN> port default <INTERFACE>" (AOS 6)
+                # "vlan <VLAN> members port <INTERFACE> tagged" (AOS 7+), "vlan <VLAN> 802.1q <INTERFACE>" (AOS 6)
+                cmd = list_of_templates[
+                    (0 if mode == "access" else 2) + (0 if aos_version == 7 else 1)
+                ]
+
+                # Replace <INTERFACE> (or <LINK_AGGREGATION>) and <VLAN>
+                list_of_commands.append(
+                    cmd.replace(tag, interface).replace("<VLAN>", vlan_string)
                 )
 
+        # Display info message
+        log.info("apply_vlan_membership: commands: %s", list_of_commands)
+
+        # Something to change?
+        if list_of_commands:
+
+            # Yes
+
+            # Get the VLANs of the device (output kept if "output_cache_ttl" is used)
+            output = await self.send_cached_command(self.cmd_get_vlans)
+
+            # VLAN IDs of the device (first column after the header)
+            # Example:
+            #  vlan    type   admin   oper    1x1   flat   auth   ip    tag   name
+            # ------+-------+-------+------+------+------+------+-----+-----+----------
+            #    1      std    on      on     on     on     off   on     off  VLAN 1
+            set_of_vlans = set()
+
+            # By default the lines read are header
+            no_header_data = False
+
+            # Read each line
+            for line in output.splitlines():
+
+                # Is it the header data without information about VLANS?
+                if not no_header_data:
+
+                    # Yes
+
+                    # Next time it will be VLAN data
+                    no_header_data = line.startswith("---")
+
+                elif line.split():
+
+                    # VLAN ID of the line
+                    set_of_vlans.add(line.split()[0])
+
+            # Check each VLAN used
+            for dict_membership in (membership, link_aggregation_membership):
+                for interface, (mode, vlan) in (dict_membership or {}).items():
+
+                    # VLAN found?
+                    if str(vlan) not in set_of_vlans:
+
+                        # No VLAN found
+
+                        # So it is impossible to add interface to a non-existing VLAN
+                        # (nothing is sent to the device)
+
+                        # Display info message
+                        log.error(
+                            "apply_vlan_membership: %s: VLAN %s not found",
+                            interface,
+                            vlan,
+                        )
+
+                        return return_status
+
+            # Send all the commands (the output cache is cleared)
+            output = await self.send_config_set(list_of_commands)
+
+            # Check if there is an error
+            # Example:
+            # ERROR: VLAN 2234 does not exist. First create the VLAN
+            #
+            if "error" in output.lower():
+
+                # Yes, there is an error
+
+                # Display info message
+                log.error("apply_vlan_membership: error: %s", output)
+
                 # Return an error
                 return return_status
 
@@ -3918,10 +4312,11 @@ class AlcatelAOS(NetworkDevice):
 
         # Display info message
         log.info(
-            f"remove_link_aggregation_to_vlan: input: link_aggregation: {link_aggregation}"
+            "remove_link_aggregation_to_vlan: input: link_aggregation: %s",
+            link_aggregation,
         )
-        log.info(f"remove_link_aggregation_to_vlan: input: mode: {mode}")
-        log.info(f"remove_link_aggregation_to_vlan: input: vlan: {vlan}")
+        log.info("remove_link_aggregation_to_vlan: input: mode: %s", mode)
+        log.info("remove_link_aggregation_to_vlan: input: vlan: %s", vlan)
 
         # Get parameters
 
@@ -3967,6 +4362,9 @@ class AlcatelAOS(NetworkDevice):
         # Convert VLAN (integer) to string
         vlan_string = str(vlan)
 
+        # The VLANs are changed: the VLAN tables kept are no more valid
+        self.clear_output_cache(self.cmd_show_vlan_tables)
+
         # Remove possible "0/" before link aggregation reference (e.g: "0/1" -> "1")
         # Necessary since those characters are not used in the folowing commands
         link_aggregation = link_aggregation.replace("0/", "")
@@ -3990,7 +4388,8 @@ class AlcatelAOS(NetworkDevice):
 
             # Display info message
             log.info(
-                f"remove_link_aggregation_to_vlan: set VLAN: access: aos 7+: cmd: {cmd}"
+                "remove_link_aggregation_to_vlan: set VLAN: access: aos 7+: cmd: %s",
+                cmd,
             )
 
             # Change the VLAN of the link aggregation
@@ -4016,7 +4415,8 @@ class AlcatelAOS(NetworkDevice):
 
                 # Display info message
                 log.info(
-                    f"remove_link_aggregation_to_vlan: set VLAN: access: aos 6: cmd: {cmd}"
+                    "remove_link_aggregation_to_vlan: set VLAN: access: aos 6: cmd: %s",
+                    cmd,
                 )
 
                 # Change the VLAN of the link aggregation
@@ -4032,7 +4432,8 @@ class AlcatelAOS(NetworkDevice):
 
                 # Display info message
                 log.error(
-                    f"remove_link_aggregation_to_vlan: remove vlan to access: error: {output}"
+                    "remove_link_aggregation_to_vlan: remove vlan to access: error: %s",
+                    output,
                 )
 
                 # Return an error
@@ -4056,7 +4457,7 @@ class AlcatelAOS(NetworkDevice):
 
             # Display info message
             log.info(
-                f"remove_link_aggregation_to_vlan: set VLAN: trunk: aos 7+: cmd: {cmd}"
+                "remove_link_aggregation_to_vlan: set VLAN: trunk: aos 7+: cmd: %s", cmd
             )
 
             # Change the VLAN of the link aggregation
@@ -4082,7 +4483,7 @@ class AlcatelAOS(NetworkDevice):
 
                 # Display info message
                 log.info(
-                    f"remove_link_aggregation_to_vlan: set VLAN: aos 6: cmd: {cmd}"
+                    "remove_link_aggregation_to_vlan: set VLAN: aos 6: cmd: %s", cmd
                 )
 
                 # Change the VLAN of the link_aggregation
@@ -4098,7 +4499,8 @@ class AlcatelAOS(NetworkDevice):
 
                 # Display info message
                 log.error(
-                    f"remove_link_aggregation_to_vlan: remove vlan to trunk: error: {output}"
+                    "remove_link_aggregation_to_vlan: remove vlan to trunk: error: %s",
+                    output,
                 )
 
                 # Return an error
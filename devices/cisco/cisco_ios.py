@@ -1,5 +1,5 @@
 # Python library import
-from netscud.base_connection import NetworkDevice, log
+from netscud.base_connection import NetworkDevice, log, hot_log
 
 
 class CiscoIOS(NetworkDevice):
@@ -7,10 +7,9 @@ class CiscoIOS(NetworkDevice):
     Class for Cisco IOS devices
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    __slots__ = ()
 
-        self._send_command_error_in_returned_output = ["%"]
+    _send_command_error_in_returned_output = ("%",)
 
     def check_error_output(self, output):
         """
@@ -69,21 +68,22 @@ class CiscoIOS(NetworkDevice):
                     break
 
             # Display info message
-            log.info(
-                f"check_error_output: number of lines in the output: {len(output_lines)}"
+            hot_log.info(
+                "check_error_output: number of lines in the output: %s",
+                len(output_lines),
             )
 
             # Check all elements in the list of output
             for element in self._send_command_error_in_returned_output:
 
                 # Display info message
-                log.info(f"check_error_output: element: '{element}'")
+                hot_log.info("check_error_output: element: '%s'", element)
 
                 # Check if the output starts with a string with an error message (like "% Invalid input detected at '^' marker.")
                 for line in output_lines:
 
                     # Display info message
-                    log.info(f"check_error_output: line: '{line}'")
+                    hot_log.info("check_error_output: line: '%s'", line)
 
                     # Error message?
                     if line.startswith(element):
@@ -91,8 +91,8 @@ class CiscoIOS(NetworkDevice):
                         # Yes
 
                         # Display info message
-                        log.info(
-                            f"check_error_output: error in output found : '{element}'"
+                        hot_log.info(
+                            "check_error_output: error in output found : '%s'", element
                         )
 
                         # Raise an exception
@@ -7,19 +7,18 @@ class CiscoS300(NetworkDevice):
     Class for SG3XX devices
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        self._send_command_error_in_returned_output = ["%"]
-        self._telnet_connect_login = "User Name:"
-        self._telnet_connect_password = "Password:"
-        self._telnet_connect_authentication_fail_prompt = [
-            "User Name:",
-            "authentication failed",
-        ]
-        self.cmd_disable_paging = "terminal datadump"
-        self.cmd_get_hostname = "show system | include System Name:"
-        self.cmd_get_serial_number = "show system id unit 1"
+    __slots__ = ()
+
+    _send_command_error_in_returned_output = ("%",)
+    _telnet_connect_login = "User Name:"
+    _telnet_connect_password = "Password:"
+    _telnet_connect_authentication_fail_prompt = (
+        "User Name:",
+        "authentication failed",
+    )
+    cmd_disable_paging = "terminal datadump"
+    cmd_get_hostname = "show system | include System Name:"
+    cmd_get_serial_number = "show system id unit 1"
 
     async def get_hostname(self):
         """
@@ -35,14 +34,28 @@ class CiscoS300(NetworkDevice):
         # Get hostname
         output = await self.send_command(self.cmd_get_hostname)
 
+        # Get the name of the device from the output
+        return self.parse_hostname(output)
+
+    def parse_hostname(self, output):
+        """
+        Method used to get the name of the device from the output of cmd_get_hostname
+
+        :param output: the output of cmd_get_hostname
+        :type output: str
+
+        :return: Name of the device
+        :rtype: str
+        """
+
         # Display info message
-        log.info(f"get_hostname: output: '{output}'")
+        log.info("get_hostname: output: '%s'", output)
 
         # Remove the useless information in the returned string
         output = output.split("System Name: ")[1].strip()
 
         # Display info message
-        log.info(f"get_hostname: hostname found: '{output}'")
+        log.info("get_hostname: hostname found: '%s'", output)
 
         # Return the name of the device
         return output
@@ -58,16 +71,30 @@ class CiscoS300(NetworkDevice):
         # Display info message
         log.info("get_version")
 
-        # By default empty string
-        version = ""
-
         # Run get version on the device
         output = await self.send_command(self.cmd_get_version)
 
+        # Get the version of the software of the device from the output
+        return self.parse_version(output)
+
+    def parse_version(self, output):
+        """
+        Method used to get the version of the software of the device from the output of cmd_get_version
+
+        :param output: the output of cmd_get_version
+        :type output: str
+
+        :return: Version of the software of the device
+        :rtype: str
+        """
+
+        # By default empty string
+        version = ""
+
         # Seek "Version: " on each line of the returned output
         for line in output.splitlines():
 
-            log.info(f"get_version: line: {line}")
+            log.info("get_version: line: %s", line)
 
             # Is it the line with "Version: "
             if "Version: " in line:
@@ -81,7 +108,7 @@ class CiscoS300(NetworkDevice):
                 break
 
         # Display info message
-        log.info(f"get_version: version: {version}")
+        log.info("get_version: version: %s", version)
 
         # Return the version of the software of the device
         return version
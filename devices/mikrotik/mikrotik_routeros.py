@@ -1,6 +1,27 @@
 # Python library import
-from netscud.base_connection import NetworkDevice, log
-import asyncio, asyncssh
+from netscud.base_connection import NetworkDevice, log, hot_log
+from netscud.receive_buffer import ReceiveBuffer, AnsiEscapeFilter, PromptTracker
+from netscud.devices.mikrotik.routeros_api import RouterOSAPI
+from netscud.instrumentation import (
+    CommandProbe,
+    emit_event,
+    EVENT_AUTH,
+    EVENT_PROMPT_DISCOVERY,
+)
+from netscud.devices.mikrotik.terse import (
+    parse_terse,
+    parse_terse_line,
+    parse_terse_values,
+    replace_terse_value,
+)
+from netscud.table import (
+    Table,
+    MAC_ADDRESS_TABLE_FIELDS,
+    MAC_ADDRESS_TABLE_CATEGORIES,
+    ARP_TABLE_FIELDS,
+    ARP_TABLE_CATEGORIES,
+)
+import asyncio, asyncssh, logging, time, types
 
 # Declaration of constant values
 
@@ -11,100 +32,257 @@ MAX_BUFFER_DATA = 65535
 class MikrotikRouterOS(NetworkDevice):
     """
     Class for Mikrotik RouterOS devices
+
+    The parameters are the ones of NetworkDevice and:
+
+    :param api: If True the getters (get_arp_table, get_mac_address_table, get_vlans, get_interfaces, get_routing_table, get_interfaces_ip, get_facts, etc.) read the records of the RouterOS API (see open_api) instead of the text of the CLI; the methods changing the device still use the CLI. The "api" service (or "api-ssl") must be enabled on the device. Default value is False
+    :type api: bool, optional
+
+    :param api_port: Port of the RouterOS API. Default value is None (8728, 8729 with SSL)
+    :type api_port: int, optional
+
+    :param api_ssl: True or a SSLContext to use the RouterOS API with SSL. Default value is None (no SSL)
+    :type api_ssl: bool or ssl.SSLContext, optional
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    __slots__ = ("api", "api_port", "api_ssl", "_api")
 
-        self.interface_mode = {
+    # Values of "frame-types" for each interface mode
+    interface_mode = types.MappingProxyType(
+        {
             "access": "admit-only-untagged-and-priority-tagged",
             "trunk": "admit-only-vlan-tagged",
             "hybrid": "admit-all",
         }
+    )
+
+    # Protocol of a route for each flag of a route given by the RouterOS API
+    api_route_protocols = types.MappingProxyType(
+        {
+            "connect": "connected",
+            "static": "static",
+            "rip": "rip",
+            "bgp": "bgp",
+            "ospf": "ospf",
+            "mme": "mme",
+        }
+    )
+
+    # Prompts
+    # self._connect_first_ending_prompt = ["> \x1b[K"]
+    _connect_first_ending_prompt = "\x1b\x5b\x4b"
+    _connect_second_ending_prompt = "> "
+    list_of_possible_ending_prompts = ("] > ",)
+    _carriage_return_for_send_command = "\r\n"
+    _telnet_connect_login = "Login: "
+    _telnet_connect_password = "Password: "
+    _telnet_connect_authentication_fail_prompt = (
+        "Login: ",
+        "Login failed, incorrect username or password",
+    )
+
+    _telnet_connect_first_ending_prompt = ("] > ",)
+
+    # General commands
+    # No global disabling for Mikrotik RouterOS so use
+    # "without-paging" at the end of your commands
+    cmd_disable_paging = None
+    cmd_exit_config_mode = "/"
+    cmd_get_version = "system resource print without-paging"
+    cmd_get_hostname = "system identity print without-paging"
+    cmd_get_model = "system resource print without-paging"
+    cmd_get_serial_number = "system routerboard print without-paging"
+    cmd_get_config = "export"
+    # No command to save the config. So it is always saved after "Enter"
+    cmd_save_config = ""
+
+    # Layer 1 commands
+    # Commands for status, duplex/speed, mode
+    # self.cmd_get_interfaces = [
+    #     "interface ethernet print terse without-paging",
+    #     "foreach i in=([/interface ethernet find]) do={/interface ethernet monitor $i once without-paging}",
+    #     "interface bridge vlan print terse",
+    # ]
+    cmd_get_interfaces = (
+        "interface ethernet print terse without-paging",
+        "foreach i in=([/interface ethernet find]) do={/interface ethernet monitor $i once without-paging}",
+        "interface bridge port print terse without-paging",
+    )
+    cmd_set_interface = (
+        "interface ethernet enable <INTERFACE>",
+        "interface ethernet disable <INTERFACE>",
+        'interface ethernet comment <INTERFACE> "<COMMENT>"',
+        "interface ethernet set l2mtu=<MAXIMUMFRAMESIZE> <INTERFACE>",
+        "interface bridge port set frame-types=<MODE> ingress-filtering=<FILTERINGVLAN> [find interface=<INTERFACE>]",
+    )
+
+    # Layer 2 commands
+    cmd_get_mac_address_table = "interface bridge host print without-paging"
+    cmd_get_arp = "ip arp print terse without-paging"
+    cmd_get_lldp_neighbors = "ip neighbor print terse without-paging"
+    cmd_get_vlans = "interface bridge vlan print terse without-paging"
+    cmd_get_bridges = (
+        "interface bridge print terse without-paging"  # Specific to Mikrotik
+    )
+    cmd_add_vlan = 'interface bridge vlan add vlan-ids=<VLAN> comment="<VLAN_NAME>" bridge=<BRIDGE>'
+    cmd_remove_vlan = "interface bridge vlan remove [find vlan-ids=<VLAN>]"
+    cmd_show_vlan_tables = (
+        "interface bridge vlan print terse without-paging",
+        "interface bridge vlan print terse",
+    )
+    cmd_add_interface_to_vlan = (
+        "interface bridge vlan print terse",
+        "interface bridge vlan set [find vlan-ids=<VLAN>] untagged=<INTERFACE>",
+        "interface bridge vlan set [find vlan-ids=<VLAN>] tagged=<INTERFACE>",
+        "interface bridge port set [find interface=<INTERFACE>] pvid=<VLAN>",
+    )
+    cmd_remove_interface_from_vlan = (
+        "interface bridge vlan print terse",
+        "interface bridge vlan set [find vlan-ids=<VLAN>] untagged=<INTERFACE>",
+        "interface bridge vlan set [find vlan-ids=<VLAN>] tagged=<INTERFACE>",
+        "interface bridge port set [find interface=<INTERFACE>] pvid=<VLAN>",
+    )
+
+    # Layer 3 commands
+    cmd_get_routing_table = "ip route print without-paging terse"
+    cmd_get_interfaces_ip = "ip address print terse without-paging"
+    cmd_add_static_route = "ip route add dst-address=<NETWORK>/<PREFIXLENGTH> gateway=<DESTINATION> distance=<METRIC>"
+    cmd_remove_static_route = (
+        "ip route remove [find dst-address=<NETWORK>/<PREFIXLENGTH>]"
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
 
         # Remove useless escape data using the user login
         self.username = self.username + "+cte"
 
-        # self._connect_first_ending_prompt = ["> \x1b[K"]
-        self._connect_first_ending_prompt = "\x1b\x5b\x4b"
-        self._connect_second_ending_prompt = "> "
-        self.list_of_possible_ending_prompts = [
-            "] > ",
-        ]
-        self._carriage_return_for_send_command = "\r\n"
-        self._telnet_connect_login = "Login: "
-        self._telnet_connect_password = "Password: "
-        self._telnet_connect_authentication_fail_prompt = [
-            "Login: ",
-            "Login failed, incorrect username or password",
-        ]
+        # By default the getters use the CLI
+        self.api = False
+        self.api_port = None
+        self.api_ssl = None
 
-        self._telnet_connect_first_ending_prompt = ["] > "]
-
-        # General commands
-        # No global disabling for Mikrotik RouterOS so use
-        # "without-paging" at the end of your commands
-        self.cmd_disable_paging = None
-        self.cmd_exit_config_mode = "/"
-        self.cmd_get_version = "system resource print without-paging"
-        self.cmd_get_hostname = "system identity print without-paging"
-        self.cmd_get_model = "system resource print without-paging"
-        self.cmd_get_serial_number = "system routerboard print without-paging"
-        self.cmd_get_config = "export"
-        # No command to save the config. So it is always saved after "Enter"
-        self.cmd_save_config = ""
-
-        # Layer 1 commands
-        # Commands for status, duplex/speed, mode
-        # self.cmd_get_interfaces = [
-        #     "interface ethernet print terse without-paging",
-        #     "foreach i in=([/interface ethernet find]) do={/interface ethernet monitor $i once without-paging}",
-        #     "interface bridge vlan print terse",
-        # ]
-        self.cmd_get_interfaces = [
-            "interface ethernet print terse without-paging",
-            "foreach i in=([/interface ethernet find]) do={/interface ethernet monitor $i once without-paging}",
-            "interface bridge port print terse without-paging",
-        ]
-        self.cmd_set_interface = [
-            "interface ethernet enable <INTERFACE>",
-            "interface ethernet disable <INTERFACE>",
-            'interface ethernet comment <INTERFACE> "<COMMENT>"',
-            "interface ethernet set l2mtu=<MAXIMUMFRAMESIZE> <INTERFACE>",
-            "interface bridge port set frame-types=<MODE> ingress-filtering=<FILTERINGVLAN> [find interface=<INTERFACE>]",
-        ]
+        # Connection to the RouterOS API (opened by connect if "api" is True)
+        self._api = None
+
+        # "api" found?
+        if "api" in kwargs:
+            self.api = kwargs["api"]
+
+            # Display info message
+            log.info("__init__: api found: %s", self.api)
+
+        # "api_port" found?
+        if "api_port" in kwargs:
+            self.api_port = kwargs["api_port"]
+
+            # Display info message
+            log.info("__init__: api_port found: %s", self.api_port)
+
+        # "api_ssl" found?
+        if "api_ssl" in kwargs:
+            self.api_ssl = kwargs["api_ssl"]
+
+            # Display info message
+            log.info("__init__: api_ssl found: %s", self.api_ssl)
+
+    async def connect(self):
+        """
+        Async method used for connecting a device
+
+        The connection to the RouterOS API is opened after the one of the
+        CLI if "api" is True.
+        """
+
+        # Connection to the CLI
+        await super().connect()
+
+        # Getters served by the RouterOS API?
+        if self.api:
+
+            # Yes
+
+            # Connection to the API
+            self._api = await self.open_api(self.api_port, self.api_ssl)
 
-        # Layer 2 commands
-        self.cmd_get_mac_address_table = "interface bridge host print without-paging"
-        self.cmd_get_arp = "ip arp print terse without-paging"
-        self.cmd_get_lldp_neighbors = "ip neighbor print terse without-paging"
-        self.cmd_get_vlans = "interface bridge vlan print terse without-paging"
-        self.cmd_get_bridges = (
-            "interface bridge print terse without-paging"  # Specific to Mikrotik
+    async def disconnect(self):
+        """
+        Async method used to disconnect a device (and its RouterOS API)
+        """
+
+        # Connection to the RouterOS API open?
+        if self._api is not None:
+
+            # Yes
+
+            # Close the connection to the API
+            await self._api.disconnect()
+            self._api = None
+
+        # Disconnection of the CLI
+        await super().disconnect()
+
+    async def open_api(self, port=None, ssl=None):
+        """
+        Asyn method used to open a connection to the RouterOS API of the device
+
+        The API gives the records of the commands (list of dictionaries)
+        instead of the text of the CLI. The "api" service (or "api-ssl") must
+        be enabled on the device. The same ip address, username, password and
+        timeout as the device are used.
+
+        :param port: optional, the port of the API. Default value is 8728 (8729 with SSL)
+        :type port: int
+
+        :param ssl: optional, True or a SSLContext to use the API with SSL. Default value is None (no SSL)
+        :type ssl: bool or ssl.SSLContext
+
+        :return: the connection to the API (to be closed with disconnect() or used with "async with")
+        :rtype: RouterOSAPI
+        """
+
+        # Display info message
+        log.info("open_api")
+
+        # Username without "+cte" (only used by the CLI)
+        username = (
+            self.username[:-4] if self.username.endswith("+cte") else self.username
         )
-        self.cmd_add_vlan = 'interface bridge vlan add vlan-ids=<VLAN> comment="<VLAN_NAME>" bridge=<BRIDGE>'
-        self.cmd_remove_vlan = "interface bridge vlan remove [find vlan-ids=<VLAN>]"
-        self.cmd_add_interface_to_vlan = [
-            "interface bridge vlan print terse",
-            "interface bridge vlan set [find vlan-ids=<VLAN>] untagged=<INTERFACE>",
-            "interface bridge vlan set [find vlan-ids=<VLAN>] tagged=<INTERFACE>",
-            "interface bridge port set [find interface=<INTERFACE>] pvid=<VLAN>",
-        ]
-        self.cmd_remove_interface_from_vlan = [
-            "interface bridge vlan print terse",
-            "interface bridge vlan set [find vlan-ids=<VLAN>] untagged=<INTERFACE>",
-            "interface bridge vlan set [find vlan-ids=<VLAN>] tagged=<INTERFACE>",
-            "interface bridge port set [find interface=<INTERFACE>] pvid=<VLAN>",
-        ]
 
-        # Layer 3 commands
-        self.cmd_get_routing_table = "ip route print without-paging terse"
-        self.cmd_get_interfaces_ip = "ip address print terse without-paging"
-        self.cmd_add_static_route = "ip route add dst-address=<NETWORK>/<PREFIXLENGTH> gateway=<DESTINATION> distance=<METRIC>"
-        self.cmd_remove_static_route = (
-            "ip route remove [find dst-address=<NETWORK>/<PREFIXLENGTH>]"
+        # Create the connection to the API
+        api = RouterOSAPI(
+            self.ip, username, self.password, port=port, ssl=ssl, timeout=self.timeout
         )
 
+        # Connection
+        await api.connect()
+
+        # Return the connection
+        return api
+
+    async def get_api_value(self, path, key):
+        """
+        Asyn method used to get a value of the first record of a menu of the RouterOS API (eg. "/system/identity")
+
+        :param path: the menu
+        :type path: str
+
+        :param key: the name of the value
+        :type key: str
+
+        :return: the value ("" if not found)
+        :rtype: str
+        """
+
+        # Get the records of the menu
+        records = await self._api.print(path, proplist=[key])
+
+        # Display info message
+        log.info("get_api_value: %s: %s", path, records)
+
+        # Return the value of the first record
+        return records[0].get(key, "") if records else ""
+
     async def connectSSH(self):
         """
         Async method used for connecting a device using SSH protocol
@@ -125,18 +303,14 @@ class MikrotikRouterOS(NetworkDevice):
         # Display info message
         log.info("connectSSH")
 
-        # Parameters of the connection
+        # Parameters of the connection (options shared by the devices with the same profile)
         generator = asyncssh.connect(
-            self.ip,
-            username=self.username,
-            password=self.password,
-            known_hosts=None,
-            # encryption_algs="*",  # Parameter that includes all encryption algorithms (even the old ones disabled by default)
-            encryption_algs=[
-                algs.decode("utf-8") for algs in asyncssh.encryption._enc_algs
-            ],  # Parameter that includes all encryption algorithms (even the old ones disabled by default)
+            self.ip, port=self.port, options=self.get_ssh_options()
         )
 
+        # Beginning of the authentication (only measured with an instrumentation)
+        start = self.instrumentation and time.perf_counter()
+
         # Trying to connect to the device
         try:
 
@@ -147,7 +321,7 @@ class MikrotikRouterOS(NetworkDevice):
             # Timeout
 
             # Display error message
-            log.error(f"connectSSH: connection failed: {self.ip} timeout: '{error}'")
+            log.error("connectSSH: connection failed: %s timeout: '%s'", self.ip, error)
 
             # Exception propagation
             raise asyncio.exceptions.TimeoutError(
@@ -159,7 +333,7 @@ class MikrotikRouterOS(NetworkDevice):
             # Connection failed
 
             # Display error message
-            log.error(f"connectSSH: connection failed: {self.ip} '{error}'")
+            log.error("connectSSH: connection failed: %s '%s'", self.ip, error)
 
             # Exception propagation
             raise
@@ -167,14 +341,43 @@ class MikrotikRouterOS(NetworkDevice):
         # Display info message
         log.info("connectSSH: connection success")
 
+        # Instrumentation used?
+        if start:
+
+            # Yes
+
+            # Duration of the SSH connection (key exchange and authentication)
+            emit_event(self, EVENT_AUTH, duration=time.perf_counter() - start)
+
+        # Open a session and discover the prompt
+        await self.open_sessionSSH()
+
+    async def open_sessionSSH(self):
+        """
+        Async method used to open an interactive session on the SSH connection
+
+        See connectSSH for the special prompt of Mikrotik devices.
+        """
+
+        # Display info message
+        log.info("open_sessionSSH")
+
+        # Beginning of the prompt discovery (only measured with an instrumentation)
+        start = self.instrumentation and time.perf_counter()
+
         # Create a session
         self.stdinx, self.stdoutx, _ = await self.conn.open_session(term_type="netscud")
 
         # Display info message
-        log.info("connectSSH: open_session success")
+        log.info("open_sessionSSH: open_session success")
 
         # By default no data has been read
-        data = ""
+        data = ReceiveBuffer(
+            [self._connect_first_ending_prompt, self._connect_second_ending_prompt]
+        )
+
+        # By default the first part of the expected prompt is not found
+        first_ending_prompt_found = False
 
         # By default no prompt found
         prompt_not_found = True
@@ -185,21 +388,31 @@ class MikrotikRouterOS(NetworkDevice):
             while prompt_not_found:
 
                 # Display info message
-                log.info("connectSSH: beginning of the loop")
+                log.info("open_sessionSSH: beginning of the loop")
 
                 # Read the prompt
-                data += await asyncio.wait_for(
-                    self.stdoutx.read(MAX_BUFFER_DATA), timeout=self.timeout
+                new_data = data.feed(
+                    await asyncio.wait_for(
+                        self.stdoutx.read(MAX_BUFFER_DATA), timeout=self.timeout
+                    )
                 )
 
                 # Display info message
-                log.info(f"connectSSH: data: '{str(data)}'")
+                hot_log.info("open_sessionSSH: data: '%s'", str(new_data))
 
                 # Display info message
-                log.info(f"connectSSH: data: hex:'{data.encode('utf-8').hex()}'")
+                if hot_log.isEnabledFor(logging.INFO):
+                    hot_log.info(
+                        "open_sessionSSH: data: hex:'%s'",
+                        new_data.encode("utf-8").hex(),
+                    )
+
+                # The first part of the expected prompt is searched only in the new data
+                if data.contains(self._connect_first_ending_prompt):
+                    first_ending_prompt_found = True
 
                 # Check if the first part of the expected prompt is found
-                if self._connect_first_ending_prompt in data:
+                if first_ending_prompt_found:
 
                     # Found
 
@@ -209,7 +422,7 @@ class MikrotikRouterOS(NetworkDevice):
                         # Yes
 
                         # Display info message
-                        log.info(f"connectSSH: ending of prompt found")
+                        log.info("open_sessionSSH: ending of prompt found")
 
                         # A ending prompt has been found
                         prompt_not_found = False
@@ -218,7 +431,7 @@ class MikrotikRouterOS(NetworkDevice):
                         break
 
                 # Display info message
-                log.info("connectSSH: end of loop")
+                log.info("open_sessionSSH: end of loop")
 
         except Exception as error:
 
@@ -226,14 +439,26 @@ class MikrotikRouterOS(NetworkDevice):
 
             # Display error message
             log.error(
-                f"connectSSH: timeout while reading the prompt: {self.ip} '{error}'"
+                "open_sessionSSH: timeout while reading the prompt: %s '%s'",
+                self.ip,
+                error,
             )
 
             # Exception propagation
             raise
 
         # Display info message
-        log.info(f"connectSSH: end of prompt loop")
+        log.info("open_sessionSSH: end of prompt loop")
+
+        # Instrumentation used?
+        if start:
+
+            # Yes
+
+            # Duration of the opening of the session and of the prompt discovery
+            emit_event(
+                self, EVENT_PROMPT_DISCOVERY, duration=time.perf_counter() - start
+            )
 
         # # Remove possible escape sequence
         # data = self.remove_ansi_escape_sequence(data)
@@ -242,10 +467,10 @@ class MikrotikRouterOS(NetworkDevice):
         # self.prompt = self.find_prompt(str(data))
 
         # # Display info message
-        # log.info(f"connectSSH: prompt found: '{self.prompt}'")
+        # log.info(f"open_sessionSSH: prompt found: '{self.prompt}'")
 
         # # Display info message
-        # log.info(f"connectSSH: prompt found size: '{len(self.prompt)}'")
+        # log.info(f"open_sessionSSH: prompt found size: '{len(self.prompt)}'")
 
         # # Disable paging command available?
         # if self.cmd_disable_paging:
@@ -269,6 +494,9 @@ class MikrotikRouterOS(NetworkDevice):
         # Display info message
         log.info("connectTelnet")
 
+        # Beginning of the authentication (only measured with an instrumentation)
+        start = self.instrumentation and time.perf_counter()
+
         try:
 
             # Prepare connection with Telnet
@@ -279,7 +507,9 @@ class MikrotikRouterOS(NetworkDevice):
             # Preparation to the connection failed
 
             # Display error message
-            log.error(f"connectTelnet: preparation to the connection failed: '{error}'")
+            log.error(
+                "connectTelnet: preparation to the connection failed: '%s'", error
+            )
 
             # Exception propagation
             raise
@@ -319,33 +549,33 @@ class MikrotikRouterOS(NetworkDevice):
         # Temporary string variable
         output = ""
 
-        # Temporary bytes variable
-        byte_data = b""
+        # Buffer of the data received (bytes converted into string)
+        byte_data = ReceiveBuffer([prompt, prompt_password], decode=True)
 
         # Read the telnet information and first prompt (for login but a password prompt can be found for IOS for instance)
         while True:
 
             # Display info message
-            log.info(f"connectTelnet: read data for prompt")
+            log.info("connectTelnet: read data for prompt")
 
             # await asyncio.sleep(2)
 
             # Read returned prompt
-            byte_data += await asyncio.wait_for(
+            raw_data = await asyncio.wait_for(
                 self._reader.read(MAX_BUFFER_DATA), timeout=self.timeout
             )
 
             # Display info message
-            log.info(f"connectTelnet: byte_data: {byte_data}")
+            hot_log.info("connectTelnet: raw_data: %s", raw_data)
 
-            # Temporary convertion in string. This string has the following form: "b'....'"
-            output = str(byte_data)
+            # Conversion in string of the new data
+            output = byte_data.feed(raw_data)
 
             # Display info message
-            log.info(f"connectTelnet: output: {output}")
+            hot_log.info("connectTelnet: output: %s", output)
 
             # Prompt for the username found?
-            if prompt in output:
+            if byte_data.contains(prompt):
 
                 # Yes
 
@@ -353,7 +583,7 @@ class MikrotikRouterOS(NetworkDevice):
                 break
 
             # Prompt for the password found?
-            elif prompt_password in output:
+            elif byte_data.contains(prompt_password):
 
                 # Yes
 
@@ -364,12 +594,12 @@ class MikrotikRouterOS(NetworkDevice):
                 break
 
             # A special Telnet string send at first connection?
-            elif b"\xff\xfd\x18\xff\xfd \xff\xfd#\xff\xfd" in byte_data:
+            elif b"\xff\xfd\x18\xff\xfd \xff\xfd#\xff\xfd" in raw_data:
 
                 # Yes
 
                 # Display info message
-                log.info(f"connectTelnet: telnet_init_message")
+                log.info("connectTelnet: telnet_init_message")
 
                 # chr(0xFF).chr(0xFB).chr(0x1F).chr(0xFF).chr(0xFB).chr(0x20).chr(0xFF).chr(0xFB).chr(0x18).chr(0xFF).chr(0xFB).chr(0x27).chr(0xFF).chr(0xFD).chr(0x01).chr(0xFF).chr(0xFB).chr(0x03).chr(0xFF).chr(0xFD).chr(0x03).chr(0xFF).chr(0xFC).chr(0x23).chr(0xFF).chr(0xFC).chr(0x24).chr(0xFF).chr(0xFA).chr(0x1F).chr(0x00).chr(0x50).chr(0x00).chr(0x18).chr(0xFF).chr(0xF0).chr(0xFF).chr(0xFA).chr(0x20).chr(0x00).chr(0x33).chr(0x38).chr(0x34).chr(0x30).chr(0x30).chr(0x2C).chr(0x33).chr(0x38).chr(0x34).chr(0x30).chr(0x30).chr(0xFF).chr(0xF0).chr(0xFF).chr(0xFA).chr(0x27).chr(0x00).chr(0xFF).chr(0xF0).chr(0xFF).chr(0xFA).chr(0x18).chr(0x00).chr(0x41).chr(0x4E).chr(0x53).chr(0x49).chr(0xFF).chr(0xF0);
                 # Messages in Telnet format
@@ -378,19 +608,22 @@ class MikrotikRouterOS(NetworkDevice):
                 cmd += b"\xff\xfc\x01\xff\xfc\x22\xff\xfe\x05\xff\xfc\x21"
 
                 # Display info message
-                log.info(f"connectTelnet: telnet_init_message: send: {cmd}")
+                hot_log.info("connectTelnet: telnet_init_message: send: %s", cmd)
 
                 # Display info message
-                log.debug(f"connectTelnet: telnet_init_message: send: '{cmd.hex()}'")
+                if hot_log.isEnabledFor(logging.DEBUG):
+                    hot_log.debug(
+                        "connectTelnet: telnet_init_message: send: '%s'", cmd.hex()
+                    )
 
                 # Sending command
                 self._writer.write(cmd)
 
-                # Temporary bytes variable cleared
-                byte_data = b""
+                # Buffer of the data received cleared
+                byte_data.clear()
 
         # Display info message
-        log.info(f"connectTelnet: login prompt: '{output}'")
+        hot_log.info("connectTelnet: login prompt: '%s'", byte_data.getvalue())
 
         # Login to use?
         if use_login:
@@ -439,6 +672,200 @@ class MikrotikRouterOS(NetworkDevice):
         # Display info message
         log.info("connectTelnet: password sent")
 
+        # Instrumentation used?
+        if start:
+
+            # Yes
+
+            # Duration of the Telnet connection and of the authentication (till the first prompt)
+            emit_event(self, EVENT_AUTH, duration=time.perf_counter() - start)
+
+    def get_command_echo(self, cmd):
+        """
+        Method used to get the echo of a command at the beginning of its output
+
+        For Mikrotik the first line is removed (same as send_command).
+
+        :param cmd: the command sent
+        :type cmd: str
+
+        :return: the end of the first line
+        :rtype: str
+        """
+
+        # For Mikrotik just remove the first line (complicated otherwise)
+        return "\n"
+
+    def get_end_of_output_detector(self, buffer):
+        """
+        Method used to get the function telling if the end of the output of a command is received
+
+        For Mikrotik the prompt is received twice (echo of the command, then
+        end of the output).
+
+        :param buffer: the buffer receiving the data
+        :type buffer: ReceiveBuffer
+
+        :return: a function returning True if the end of the output is received (called after each chunk)
+        :rtype: function
+        """
+
+        # Positions of the prompts received (echo of the command, then end of the output)
+        return PromptTracker(buffer, self.list_of_possible_ending_prompts).update
+
+    def remove_ending_prompt_in_output(self, text):
+        """
+        Method removing the prompt at the end of a string
+
+        :param text: the text with a prompt at the end
+        :type text: str
+
+        :return: the output string without the ending prompt
+        :rtype: str
+        """
+
+        # Display info message
+        log.info("remove_ending_prompt_in_output")
+
+        # For Mikrotik just remove the last line (complicated otherwise)
+        return text[: text.rfind("\n")] if "\n" in text else ""
+
+    def remove_command_in_output(self, text, cmd):
+        """
+        Method removing the command at the beginning of a string
+
+        For Mikrotik the first line is removed (same as send_command).
+
+        :param text: the text with the command at the beginning
+        :type text: str
+
+        :param cmd: the command previously sent
+        :type cmd: str
+
+        :return: the output string without the command
+        :rtype: str
+        """
+
+        # For Mikrotik just remove the first line (complicated otherwise)
+        return text[text.find("\n") + 1 :]
+
+    def find_end_of_pipelined_output(self, text, next_cmd, start=0):
+        """
+        Method used to find the end of the answer of a command when several commands are sent
+
+        Mikrotik draws its prompt again before the echo of each command:
+        the answer of a command ends with a prompt at the beginning of a line
+        ("[admin@MikroTik] > "), then the echo of the next command starts
+        with "\\r" (removed with SSH), the prompt again and the command.
+
+        Only the line being checked is searched (not all the data after it).
+
+        :param text: the data received starting with the answer of the command
+        :type text: str
+
+        :param next_cmd: the next command sent (None if the next command is not yet sent)
+        :type next_cmd: str
+
+        :param start: optional, beginning of the first line to check (the lines before were already checked). Default value is 0 (all the lines after the echo of the command)
+        :type start: int
+
+        :return: the position of the end of the answer or -1 if the answer is not complete
+        :rtype: int
+        """
+
+        # First search?
+        if start == 0:
+
+            # Yes
+
+            # The prompt is searched after the echo of the command (first line)
+            start = text.find("\n") + 1
+
+            # Echo of the command not yet received?
+            if start == 0:
+
+                # Yes
+                return -1
+
+        # Check all the lines after the echo
+        while start < len(text):
+
+            # End of the line (or end of the data received)
+            line_end = text.find("\n", start)
+            if line_end == -1:
+                line_end = len(text)
+
+            # Line starting like a prompt? ("[admin@MikroTik] > ")
+            if text.startswith("[", start):
+
+                # Yes
+
+                # Check all the ending prompts
+                for ending_prompt in self.list_of_possible_ending_prompts:
+
+                    # Ending prompt in the line?
+                    end = text.find(ending_prompt, start, line_end)
+                    if end == -1:
+
+                        # No
+                        continue
+
+                    # End of the prompt
+                    end += len(ending_prompt)
+
+                    # Is the next command already sent?
+                    if next_cmd is None:
+
+                        # No
+
+                        # Then the prompt must be at the end of the data
+                        if end == len(text):
+
+                            # End of the answer
+                            return end
+
+                    else:
+
+                        # Yes
+
+                        # Prompt drawn again before the echo of the next command? ("\r" kept with Telnet)
+                        echo_start = end + 1 if text.startswith("\r", end) else end
+                        prompt_end = text.find(ending_prompt, echo_start, line_end)
+                        if text.startswith("[", echo_start) and prompt_end != -1:
+
+                            # Yes
+
+                            # Part of the echo which can be compared (the echo of a long command can be modified by the device)
+                            echo_start = prompt_end + len(ending_prompt)
+                            size = min(len(next_cmd), 20)
+                            echo = text[echo_start : min(echo_start + size, line_end)]
+
+                            # Beginning of the echo only (the rest of the line is not yet received)?
+                            if (
+                                len(echo) < size
+                                and line_end == len(text)
+                                and next_cmd.startswith(echo)
+                            ):
+
+                                # Yes
+
+                                # More data is needed (a line of the output can look like a prompt)
+                                return -1
+
+                            # Echo of the next command after the prompt?
+                            if (echo or not size) and next_cmd.startswith(echo):
+
+                                # Yes
+
+                                # End of the answer
+                                return end
+
+            # Not the prompt ending the answer; search in the next line
+            start = line_end + 1
+
+        # Answer not complete
+        return -1
+
     async def send_commandSSH(self, cmd, pattern=None, timeout=None):
         """
         Async method used to send data to a device
@@ -464,7 +891,10 @@ class MikrotikRouterOS(NetworkDevice):
             timeout = self.timeout
 
         # Debug info message
-        log.info(f"send_commandSSH: cmd = '{cmd}'")
+        hot_log.info("send_commandSSH: cmd = '%s'", cmd)
+
+        # Measure of the command (only with an instrumentation)
+        probe = self.instrumentation and CommandProbe(self, cmd)
 
         # Sending command
         # Add carriage return at the end of the command (mandatory to send the command)
@@ -473,37 +903,57 @@ class MikrotikRouterOS(NetworkDevice):
         # Display message
         log.info("send_commandSSH: command sent")
 
+        # Filter of ANSI escape sequences (keeps escape sequences split over 2 chunks)
+        ansi_filter = AnsiEscapeFilter()
+
         # Variable used to gather data
-        output = ""
+        # Only the new data is sanitized: ANSI escape sequences and possible "\r" are removed
+        buffer = ReceiveBuffer(
+            (
+                list(self.list_of_possible_ending_prompts) + [pattern]
+                if pattern
+                else self.list_of_possible_ending_prompts
+            ),
+            sanitize=lambda data: ansi_filter.feed(data).replace("\r", ""),
+        )
+
+        # Positions of the prompts received (echo of the command, then end of the output)
+        prompt_tracker = PromptTracker(buffer, self.list_of_possible_ending_prompts)
 
-        # Variable used for leaving loop (necessary since there is a "while" with a "for" and a "break" command)
+        # Variable used for leaving loop
         stay_in_loop = True
 
         # Reading data
         while stay_in_loop:
 
             # Read the data received
-            output += await asyncio.wait_for(
+            output = await asyncio.wait_for(
                 self.stdoutx.read(MAX_BUFFER_DATA), timeout=timeout
             )
 
-            # Debug info message
-            log.debug(f"send_commandSSH: output hex: '{output.encode('utf-8').hex()}'")
+            # Instrumentation used?
+            if probe:
+
+                # Yes
+                probe.data_received(len(output))
 
-            # Remove ANSI escape sequence
-            output = self.remove_ansi_escape_sequence(output)
+            # Debug info message
+            if hot_log.isEnabledFor(logging.DEBUG):
+                hot_log.debug(
+                    "send_commandSSH: output hex: '%s'", output.encode("utf-8").hex()
+                )
 
-            # Remove possible "\r"
-            output = output.replace("\r", "")
+            # Remove ANSI escape sequence and possible "\r" of the new data
+            output = buffer.feed(output)
 
             # Debug info message
-            log.info(f"send_commandSSH: output: '{output}'")
+            hot_log.info("send_commandSSH: output: '%s'", output)
 
             # Is a patten used?
             if pattern:
 
                 # Use pattern instead of prompt
-                if pattern in output:
+                if buffer.contains(pattern):
 
                     # Yes
 
@@ -512,29 +962,33 @@ class MikrotikRouterOS(NetworkDevice):
 
             else:
 
-                # Check if prompt is found
-                for prompt in self.list_of_possible_ending_prompts:
+                # Both prompts found (echo of the command and end of the output)?
+                if prompt_tracker.update():
 
-                    # A pattern found twice (or more)?
-                    if output.count(prompt) >= 2:
+                    # Yes
 
-                        # Yes
+                    # Display info message
+                    hot_log.info("send_commandSSH: prompt found twice or more")
 
-                        # Display info message
-                        log.info(
-                            f"send_commandSSH: prompt found twice or more: '{prompt}'"
-                        )
+                    # Will leave the while loop
+                    stay_in_loop = False
 
-                        # Will leave the while loop
-                        stay_in_loop = False
+        # Instrumentation used?
+        if probe:
 
-                        # Leave the loop
-                        break
+            # Yes
+            probe.output_received()
+
+        # Get all the data received
+        output = buffer.getvalue()
 
         # Debug info message
-        log.debug(
-            f"send_commandSSH: raw output: '{output}'\nsend_commandSSH: raw output (hex): '{output.encode().hex()}'"
-        )
+        if hot_log.isEnabledFor(logging.DEBUG):
+            hot_log.debug(
+                "send_commandSSH: raw output: '%s'\nsend_commandSSH: raw output (hex): '%s'",
+                output,
+                output.encode().hex(),
+            )
 
         # # Remove the command sent from the result of the command
         # output = self.remove_command_in_output(output, str(cmd))
@@ -546,18 +1000,20 @@ class MikrotikRouterOS(NetworkDevice):
         # Remove the command sent from the result of the command
         # output = self.remove_command_in_output(output, str(cmd))
         # For Mikrotik just remove the first line (complicated otherwise)
-        output = output.split("\n", 1)[1]
+        start = output.find("\n") + 1
         # Remove the carriage return of the output
         # output = self.remove_starting_carriage_return_in_output(output)
         # Remove the ending prompt of the output
+        # For Mikrotik just remove the last line (complicated otherwise)
+        end = output.rfind("\n")
 
-        # 2 lines?
-        if "\n" in output:
+        # 2 lines or more (a line after the first one)?
+        if end >= start:
 
             # Yes
 
-            # For Mikrotik just remove the last line (complicated otherwise)
-            output = output[: output.rfind("\n")]
+            # Only one copy of the output is made
+            output = output[start:end]
         else:
 
             # No. There is just the prompt
@@ -566,9 +1022,18 @@ class MikrotikRouterOS(NetworkDevice):
             output = ""
 
         # Debug info message
-        log.debug(
-            f"send_commandSSH: cleaned output: '{output}'\nsend_commandSSH: cleaned output (hex): '{output.encode().hex()}'"
-        )
+        if hot_log.isEnabledFor(logging.DEBUG):
+            hot_log.debug(
+                "send_commandSSH: cleaned output: '%s'\nsend_commandSSH: cleaned output (hex): '%s'",
+                output,
+                output.encode().hex(),
+            )
+
+        # Instrumentation used?
+        if probe:
+
+            # Yes
+            probe.output_cleaned()
 
         # Return the result of the command
         return output
@@ -597,6 +1062,9 @@ class MikrotikRouterOS(NetworkDevice):
         if timeout is None:
             timeout = self.timeout
 
+        # Measure of the command (only with an instrumentation)
+        probe = self.instrumentation and CommandProbe(self, cmd)
+
         # Add carriage return at the end of the command (mandatory to send the command)
         cmd = cmd + self._carriage_return_for_send_command
 
@@ -606,10 +1074,20 @@ class MikrotikRouterOS(NetworkDevice):
         # Temporary string variable
         output = ""
 
-        # Temporary bytes variable
-        byte_data = b""
+        # Buffer of the data received (bytes converted into string)
+        byte_data = ReceiveBuffer(
+            (
+                list(self.list_of_possible_ending_prompts) + [pattern]
+                if pattern
+                else self.list_of_possible_ending_prompts
+            ),
+            decode=True,
+        )
+
+        # Positions of the prompts received (echo of the command, then end of the output)
+        prompt_tracker = PromptTracker(byte_data, self.list_of_possible_ending_prompts)
 
-        # Variable used for leaving loop (necessary since there is a "while" with a "for" and a "break" command)
+        # Variable used for leaving loop
         stay_in_loop = True
 
         try:
@@ -618,24 +1096,27 @@ class MikrotikRouterOS(NetworkDevice):
             while stay_in_loop:
 
                 # Read returned prompt
-                byte_data += await asyncio.wait_for(
+                data = await asyncio.wait_for(
                     self._reader.read(MAX_BUFFER_DATA), timeout=timeout
                 )
 
-                # Display info message
-                log.info(f"send_commandTelnet: byte_data: '{byte_data}'")
+                # Instrumentation used?
+                if probe:
+
+                    # Yes
+                    probe.data_received(len(data))
 
-                # Temporary convertion in string. This string has the following form: "b'....'"
-                output = str(byte_data)
+                # Convert the data into string
+                output = byte_data.feed(data)
 
                 # Display info message
-                log.info(f"send_commandTelnet: output: '{output}'")
+                hot_log.info("send_commandTelnet: output: '%s'", output)
 
                 # Is a patten used?
                 if pattern:
 
                     # Use pattern instead of prompt
-                    if pattern in output:
+                    if byte_data.contains(pattern):
 
                         # Yes
 
@@ -644,24 +1125,16 @@ class MikrotikRouterOS(NetworkDevice):
 
                 else:
 
-                    # Check if prompt is found
-                    for prompt in self.list_of_possible_ending_prompts:
-
-                        # A pattern found twice (or more)?
-                        if output.count(prompt) >= 2:
-
-                            # Yes
+                    # Both prompts found (echo of the command and end of the output)?
+                    if prompt_tracker.update():
 
-                            # Display info message
-                            log.info(
-                                f"send_commandTelnet: prompt found twice or more: '{prompt}'"
-                            )
+                        # Yes
 
-                            # Will leave the while loop
-                            stay_in_loop = False
+                        # Display info message
+                        hot_log.info("send_commandTelnet: prompt found twice or more")
 
-                            # Leave the loop
-                            break
+                        # Will leave the while loop
+                        stay_in_loop = False
 
         except asyncio.TimeoutError:
 
@@ -678,33 +1151,54 @@ class MikrotikRouterOS(NetworkDevice):
             # Error during when reading prompt
 
             # Display error message
-            log.error(f"send_commandTelnet: error: {error}")
+            log.error("send_commandTelnet: error: %s", error)
 
             # Exception propagation
             raise
 
-        # Convert data (bytes) into string
-        output = byte_data.decode("utf-8", "ignore")
+        # Instrumentation used?
+        if probe:
+
+            # Yes
+            probe.output_received()
+
+        # Get all the data received (already converted into string)
+        output = byte_data.getvalue()
 
         # Debug info message
-        log.debug(
-            f"send_commandTelnet: raw output: '{output}'\nsend_commandTelnet: raw output (hex): '{output.encode().hex()}'"
-        )
+        if hot_log.isEnabledFor(logging.DEBUG):
+            hot_log.debug(
+                "send_commandTelnet: raw output: '%s'\nsend_commandTelnet: raw output (hex): '%s'",
+                output,
+                output.encode().hex(),
+            )
 
         # Remove the command sent from the result of the command
         # output = self.remove_command_in_output(output, str(cmd))
         # For Mikrotik just remove the first line (complicated otherwise)
-        output = output.split("\n\r", 1)[1]
+        start = output.index("\n\r") + 2
         # Remove the carriage return of the output
         # output = self.remove_starting_carriage_return_in_output(output)
         # Remove the ending prompt of the output
         # For Mikrotik just remove the last line (complicated otherwise)
-        output = output[: output.rfind("\n")]
+        end = output.rfind("\n")
+
+        # Only one copy of the output is made (last character removed if there is no other line)
+        output = output[start : end if end >= start else -1]
 
         # Debug info message
-        log.debug(
-            f"send_commandTelnet: cleaned output: '{output}'\nsend_commandTelnet: cleaned output (hex): '{output.encode().hex()}'"
-        )
+        if hot_log.isEnabledFor(logging.DEBUG):
+            hot_log.debug(
+                "send_commandTelnet: cleaned output: '%s'\nsend_commandTelnet: cleaned output (hex): '%s'",
+                output,
+                output.encode().hex(),
+            )
+
+        # Instrumentation used?
+        if probe:
+
+            # Yes
+            probe.output_cleaned()
 
         # Return the result of the command
         return output
@@ -752,8 +1246,13 @@ class MikrotikRouterOS(NetworkDevice):
         # Temporary string variable
         output = ""
 
-        # Temporary bytes variable
-        byte_data = b""
+        # Buffer of the data received (bytes converted into string)
+        byte_data = ReceiveBuffer(
+            list(pattern or []) + list(error_pattern or []), decode=True
+        )
+
+        # Number of times each prompt has been found
+        prompt_count = dict.fromkeys(pattern or [], 0)
 
         # By default pattern is not found
         pattern_not_found = True
@@ -764,27 +1263,23 @@ class MikrotikRouterOS(NetworkDevice):
             while pattern_not_found:
 
                 # Read returned prompt
-                byte_data += await asyncio.wait_for(
-                    self._reader.read(MAX_BUFFER_DATA), timeout=timeout
+                output = byte_data.feed(
+                    await asyncio.wait_for(
+                        self._reader.read(MAX_BUFFER_DATA), timeout=timeout
+                    )
                 )
 
                 # Display info message
-                log.info(
-                    f"telnet_send_command_with_unexpected_pattern: byte_data: '{byte_data}'"
+                hot_log.info(
+                    "telnet_send_command_with_unexpected_pattern: output: '%s'", output
                 )
 
                 # Display debug message
-                log.debug(
-                    f"telnet_send_command_with_unexpected_pattern: byte_data: hex: '{byte_data.hex()}'"
-                )
-
-                # Temporary convertion in string. This string has the following form: "b'....'"
-                output = str(byte_data)
-
-                # Display info message
-                log.info(
-                    f"telnet_send_command_with_unexpected_pattern: output: '{output}'"
-                )
+                if hot_log.isEnabledFor(logging.DEBUG):
+                    hot_log.debug(
+                        "telnet_send_command_with_unexpected_pattern: output: hex: '%s'",
+                        output.encode().hex(),
+                    )
 
                 # Is a pattern used?
                 if pattern:
@@ -793,12 +1288,16 @@ class MikrotikRouterOS(NetworkDevice):
                     for prompt in pattern:
 
                         # Display info message
-                        log.info(
-                            f"telnet_send_command_with_unexpected_pattern: checking prompt: '{prompt}'"
+                        hot_log.info(
+                            "telnet_send_command_with_unexpected_pattern: checking prompt: '%s'",
+                            prompt,
                         )
 
+                        # Count the prompts brought by the new data
+                        prompt_count[prompt] += byte_data.count_new(prompt)
+
                         # A pattern found twice (or more)?
-                        if output.count(prompt) >= 2:
+                        if prompt_count[prompt] >= 2:
                             # if prompt in output:
 
                             # Yes
@@ -807,8 +1306,9 @@ class MikrotikRouterOS(NetworkDevice):
                             pattern_not_found = False
 
                             # Display info message
-                            log.info(
-                                f"telnet_send_command_with_unexpected_pattern: prompt found: '{prompt}'"
+                            hot_log.info(
+                                "telnet_send_command_with_unexpected_pattern: prompt found: '%s'",
+                                prompt,
                             )
 
                             # Leave the loop
@@ -821,12 +1321,13 @@ class MikrotikRouterOS(NetworkDevice):
                     for bad_prompt in error_pattern:
 
                         # Display info message
-                        log.info(
-                            f"telnet_send_command_with_unexpected_pattern: checking unexpected prompt: '{bad_prompt}'"
+                        hot_log.info(
+                            "telnet_send_command_with_unexpected_pattern: checking unexpected prompt: '%s'",
+                            bad_prompt,
                         )
 
                         # An error_pattern pattern found?
-                        if bad_prompt in output:
+                        if byte_data.contains(bad_prompt):
 
                             # Yes
 
@@ -867,19 +1368,23 @@ class MikrotikRouterOS(NetworkDevice):
 
             # Display error message
             log.error(
-                f"telnet_send_command_with_unexpected_pattern: reading prompt: error: {error}"
+                "telnet_send_command_with_unexpected_pattern: reading prompt: error: %s",
+                error,
             )
 
             # Exception propagation
             raise
 
-        # Convert data (bytes) into string
-        output = byte_data.decode("utf-8", "ignore")
+        # Get all the data received (already converted into string)
+        output = byte_data.getvalue()
 
         # Debug info message
-        log.debug(
-            f"telnet_send_command_with_unexpected_pattern: raw output: '{output}'\ntelnet_send_command_with_unexpected_pattern: raw output (hex): '{output.encode().hex()}'"
-        )
+        if hot_log.isEnabledFor(logging.DEBUG):
+            hot_log.debug(
+                "telnet_send_command_with_unexpected_pattern: raw output: '%s'\ntelnet_send_command_with_unexpected_pattern: raw output (hex): '%s'",
+                output,
+                output.encode().hex(),
+            )
 
         # Remove the command sent from the result of the command
         # output = self.remove_command_in_output(output, str(cmd))
@@ -891,9 +1396,12 @@ class MikrotikRouterOS(NetworkDevice):
         output = output[: output.rfind("\n")]
 
         # Debug info message
-        log.debug(
-            f"telnet_send_command_with_unexpected_pattern: cleaned output: '{output}'\ntelnet_send_command_with_unexpected_pattern: cleaned output (hex): '{output.encode().hex()}'"
-        )
+        if hot_log.isEnabledFor(logging.DEBUG):
+            hot_log.debug(
+                "telnet_send_command_with_unexpected_pattern: cleaned output: '%s'\ntelnet_send_command_with_unexpected_pattern: cleaned output (hex): '%s'",
+                output,
+                output.encode().hex(),
+            )
 
         # Return the result of the command
         return output
@@ -918,6 +1426,9 @@ class MikrotikRouterOS(NetworkDevice):
         # Display info message
         log.info("send_config_set")
 
+        # The device is changed: the outputs kept are no more valid
+        self.clear_output_cache()
+
         # Default value of timeout variable
         if timeout is None:
             timeout = self.timeout
@@ -937,7 +1448,7 @@ class MikrotikRouterOS(NetworkDevice):
             cmds = [cmds]
 
             # A list?
-        elif not isinstance(cmds, list):
+        elif not isinstance(cmds, (list, tuple)):
 
             # Not a list (and not a string)
 
@@ -981,17 +1492,40 @@ class MikrotikRouterOS(NetworkDevice):
         # Display info message
         log.info("get_version")
 
-        # By default empty string
-        version = ""
+        # Getter served by the RouterOS API?
+        if self._api is not None:
+
+            # Yes
+            version = await self.get_api_value("/system/resource", "version")
+
+            # Version without the release channel ("6.48.6 (long-term)" gives "6.48.6")
+            return version.partition(" ")[0]
 
         # Run get version on the device
         output = await self.send_command(self.cmd_get_version)
 
+        # Get the version of the software of the device from the output
+        return self.parse_version(output)
+
+    def parse_version(self, output):
+        """
+        Method used to get the version of the software of the device from the output of cmd_get_version
+
+        :param output: the output of cmd_get_version
+        :type output: str
+
+        :return: Version of the software of the device
+        :rtype: str
+        """
+
+        # By default empty string
+        version = ""
+
         # Seek data to get the version in the returned output
         version = output.split("version: ")[1].split()[0]
 
         # Display info message
-        log.info(f"get_version: version: {version}")
+        log.info("get_version: version: %s", version)
 
         # Return the version of the software of the device
         return version
@@ -1007,17 +1541,37 @@ class MikrotikRouterOS(NetworkDevice):
         # Display info message
         log.info("get_hostname")
 
+        # Getter served by the RouterOS API?
+        if self._api is not None:
+
+            # Yes, the name of the device
+            return await self.get_api_value("/system/identity", "name")
+
         # Get hostname
         output = await self.send_command(self.cmd_get_hostname)
 
+        # Get the name of the device from the output
+        return self.parse_hostname(output)
+
+    def parse_hostname(self, output):
+        """
+        Method used to get the name of the device from the output of cmd_get_hostname
+
+        :param output: the output of cmd_get_hostname
+        :type output: str
+
+        :return: Name of the device
+        :rtype: str
+        """
+
         # Display info message
-        log.info(f"get_hostname: output: '{output}'")
+        log.info("get_hostname: output: '%s'", output)
 
         # Remove the useless information in the returned string
         output = output.split()[1]
 
         # Display info message
-        log.info(f"get_hostname: hostname found: '{output}'")
+        log.info("get_hostname: hostname found: '%s'", output)
 
         # Return the name of the device
         return output
@@ -1033,17 +1587,37 @@ class MikrotikRouterOS(NetworkDevice):
         # Display info message
         log.info("get_model")
 
+        # Getter served by the RouterOS API?
+        if self._api is not None:
+
+            # Yes, the model of the device
+            return await self.get_api_value("/system/resource", "board-name")
+
         # Get model
         output = await self.send_command(self.cmd_get_model)
 
+        # Get the model of the device from the output
+        return self.parse_model(output)
+
+    def parse_model(self, output):
+        """
+        Method used to get the model of the device from the output of cmd_get_model
+
+        :param output: the output of cmd_get_model
+        :type output: str
+
+        :return: Model of the device
+        :rtype: str
+        """
+
         # Display info message
-        log.info(f"get_model: output: '{output}'")
+        log.info("get_model: output: '%s'", output)
 
         # Remove the useless information in the returned string
         output = output.split("board-name: ")[1].split()[0]
 
         # Display info message
-        log.info(f"get_model: model found: '{output}'")
+        log.info("get_model: model found: '%s'", output)
 
         # Return the model of the device
         return output
@@ -1059,21 +1633,81 @@ class MikrotikRouterOS(NetworkDevice):
         # Display info message
         log.info("get_serial_number")
 
+        # Getter served by the RouterOS API?
+        if self._api is not None:
+
+            # Yes, the serial number of the device
+            return await self.get_api_value("/system/routerboard", "serial-number")
+
         # Get model
         output = await self.send_command(self.cmd_get_serial_number)
 
+        # Get the serial number of the device (first switch of a stack) from the output
+        return self.parse_serial_number(output)
+
+    def parse_serial_number(self, output):
+        """
+        Method used to get the serial number of the device (first switch of a stack) from the output of cmd_get_serial_number
+
+        :param output: the output of cmd_get_serial_number
+        :type output: str
+
+        :return: Serial number of the device
+        :rtype: str
+        """
+
         # Display info message
-        log.info(f"get_serial_number: output: '{output}'")
+        log.info("get_serial_number: output: '%s'", output)
 
         # Remove the useless information in the returned string
         output = output.split("serial-number: ")[1].split()[0]
 
         # Display info message
-        log.info(f"get_hostname: hostname found: '{output}'")
+        log.info("get_serial_number: serial number found: '%s'", output)
 
         # Return the serial number of the device
         return output
 
+    async def get_facts(self):
+        """
+        Asyn method used to get the version, the name, the model and the serial number of the device at once
+
+        With the RouterOS API the facts are read with 3 commands sent at the
+        same time.
+
+        :return: the facts of the device ("version", "hostname", "model", "serial_number")
+        :rtype: dict
+        """
+
+        # Getter served by the RouterOS API?
+        if self._api is None:
+
+            # No, the CLI is used
+            return await super().get_facts()
+
+        # Display info message
+        log.info("get_facts")
+
+        # Records of the resources, of the identity and of the routerboard
+        resources, identities, routerboards = await asyncio.gather(
+            self._api.print("/system/resource", proplist=["version", "board-name"]),
+            self._api.print("/system/identity", proplist=["name"]),
+            self._api.print("/system/routerboard", proplist=["serial-number"]),
+        )
+
+        # First record of each menu
+        resource = resources[0] if resources else {}
+        identity = identities[0] if identities else {}
+        routerboard = routerboards[0] if routerboards else {}
+
+        # Return the facts (version without the release channel)
+        return {
+            "version": resource.get("version", "").partition(" ")[0],
+            "hostname": identity.get("name", ""),
+            "model": resource.get("board-name", ""),
+            "serial_number": routerboard.get("serial-number", ""),
+        }
+
     async def get_config(self, timeout=None):
         """
         Asyn method used to get the configuration of the device
@@ -1115,142 +1749,318 @@ class MikrotikRouterOS(NetworkDevice):
         # Return the commands of the configuration saving process
         return output
 
-    async def get_mac_address_table(self):
+    async def get_mac_address_table(self, compact=False):
         """
         Asyn method used to get the mac address table of the device
 
+        :param compact: optional, if True a Table (values saved by columns, less memory) is returned instead of a list of dictionaries. Default value is False
+        :type compact: bool
+
         :return: MAC address table of the device
-        :rtype: list of dict
+        :rtype: list of dict (Table if compact is True)
         """
 
         # Display info message
         log.info("get_mac_address_table")
 
-        # By default nothing is returned
-        returned_output = []
+        # Table saved by columns?
+        if compact:
 
-        # Send a command
-        output = await self.send_command(self.cmd_get_mac_address_table)
+            # Yes
+            return await Table.collect(
+                self.iter_mac_address_table(),
+                MAC_ADDRESS_TABLE_FIELDS,
+                MAC_ADDRESS_TABLE_CATEGORIES,
+            )
 
-        # Convert string to list of string and remove the 2 first lines
-        lines = output.splitlines()[2:]
+        # Get all the MAC addresses
+        return [mac_dict async for mac_dict in self.iter_mac_address_table()]
 
-        # Read each line
-        for line in lines:
+    async def iter_mac_address_table(self):
+        """
+        Asyn generator used to get the mac address table of the device while it is received
 
-            # Set default values for variables
-            mac_type = None
-            mac_address = None
-            vlan = None
-            interface = None
+        The entries are given while the device is still sending the table, so
+        the memory used does not depend on the size of the table. The loop
+        can be left before the end of the table (eg. "break"): the rest of
+        the output is read before the next command.
 
-            # If the MAC address is dynamic AND local then it is self (its own MAC address)
+        :return: the MAC addresses of the device (one dictionary per MAC address)
+        :rtype: dict
+        """
 
-            # Get the type of MAC address (dynamic, static or self)
-            if len(line) > 6:
+        # Display info message
+        log.info("iter_mac_address_table")
+
+        # Getter served by the RouterOS API?
+        if self._api is not None:
+
+            # Yes, the MAC addresses of the bridges
+            for mac_dict in self.parse_api_mac_address_table(
+                await self._api.print("/interface/bridge/host")
+            ):
+                yield mac_dict
+
+            return
+
+        # Number of lines read
+        line_number = 0
+
+        # Lines of the output while they are received
+        lines = self.stream_command(self.cmd_get_mac_address_table)
+
+        try:
+
+            # Read each line
+            async for line in lines:
+
+                # The 2 first lines are removed
+                line_number += 1
+                if line_number <= 2:
+                    continue
 
-                if line[6].lower() == "l":
+                # Set default values for variables
+                mac_type = None
+                mac_address = None
+                vlan = None
+                interface = None
 
-                    # Self MAC address
-                    mac_type = "self"
+                # If the MAC address is dynamic AND local then it is self (its own MAC address)
 
                 # Get the type of MAC address (dynamic, static or self)
-                elif line[5].lower() == "d":
+                if len(line) > 6:
 
-                    # Dynamic MAC address
-                    mac_type = "dynamic"
-                else:
+                    if line[6].lower() == "l":
 
-                    # Static MAC address
-                    mac_type = "static"
+                        # Self MAC address
+                        mac_type = "self"
 
-            # Get MAC address
-            if len(line) > 26:
-                mac_address = line[9:26]
+                    # Get the type of MAC address (dynamic, static or self)
+                    elif line[5].lower() == "d":
 
-                # Convert MAC address into lower case
-                mac_address = mac_address.lower()
+                        # Dynamic MAC address
+                        mac_type = "dynamic"
+                    else:
 
-            # Get VLAN
-            if len(line) > 31:
-                vlan = int(line[27:31].strip())
+                        # Static MAC address
+                        mac_type = "static"
 
-            # Get interface
-            if len(line) > 32:
-                interface = line[32:].split()[0]
+                # Get MAC address
+                if len(line) > 26:
+                    mac_address = line[9:26]
 
-            # Create a dictionary
-            mac_dict = {
-                "mac_type": mac_type,
-                "mac_address": mac_address,
-                "vlan": vlan,
-                "interface": interface,
-            }
+                    # Convert MAC address into lower case
+                    mac_address = mac_address.lower()
+
+                # Get VLAN
+                if len(line) > 31:
+                    vlan = int(line[27:31].strip())
+
+                # Get interface
+                if len(line) > 32:
+                    interface = line[32:].split()[0]
+
+                # Create a dictionary
+                mac_dict = {
+                    "mac_type": mac_type,
+                    "mac_address": mac_address,
+                    "vlan": vlan,
+                    "interface": interface,
+                }
+
+                # Give the MAC information
+                if mac_address:
+                    yield mac_dict
+
+        finally:
+
+            # End of the output read even if the generator is closed before
+            await lines.aclose()
+
+    def parse_api_mac_address_table(self, records):
+        """
+        Method used to get the MAC addresses from the records of "/interface/bridge/host" (RouterOS API)
+
+        :param records: the records of the RouterOS API
+        :type records: list of dict
+
+        :return: the MAC addresses (one dictionary per MAC address, same values as with the CLI)
+        :rtype: list of dict
+        """
+
+        # By default nothing is returned
+        returned_output = []
+
+        # Read each record
+        for record in records:
+
+            # Get the type of MAC address (dynamic, static or self)
+            if record.get("local") == "true":
+
+                # Self MAC address
+                mac_type = "self"
 
-            # Add the MAC information to the list
+            elif record.get("dynamic") == "true":
+
+                # Dynamic MAC address
+                mac_type = "dynamic"
+
+            else:
+
+                # Static MAC address
+                mac_type = "static"
+
+            # Get MAC address (lower case)
+            mac_address = record.get("mac-address", "").lower()
+
+            # Get VLAN
+            vlan = int(record["vid"]) if record.get("vid") else None
+
+            # Get interface ("on-interface" with RouterOS 6, "interface" with RouterOS 7)
+            interface = record.get("on-interface") or record.get("interface")
+
+            # Add the information to the list
             if mac_address:
-                returned_output.append(mac_dict)
+                returned_output.append(
+                    {
+                        "mac_type": mac_type,
+                        "mac_address": mac_address,
+                        "vlan": vlan,
+                        "interface": interface,
+                    }
+                )
 
         # Return data
         return returned_output
 
-    async def get_arp_table(self):
+    async def get_arp_table(self, compact=False):
         """
         Asyn method used to get the ARP table of the device
 
+        :param compact: optional, if True a Table (values saved by columns, less memory) is returned instead of a list of dictionaries. Default value is False
+        :type compact: bool
+
         :return: ARP table of the device
-        :rtype: list of dict
+        :rtype: list of dict (Table if compact is True)
         """
 
         # Display info message
         log.info("get_arp_table")
 
-        # By default nothing is returned
-        returned_output = []
+        # Table saved by columns?
+        if compact:
+
+            # Yes
+            return await Table.collect(
+                self.iter_arp_table(), ARP_TABLE_FIELDS, ARP_TABLE_CATEGORIES
+            )
+
+        # Getter served by the RouterOS API?
+        if self._api is not None:
+
+            # Yes
+            return self.parse_api_arp_table(await self._api.print("/ip/arp"))
 
         # Send a command
         output = await self.send_command(self.cmd_get_arp)
 
+        # Get all the ARP entries (no async generator for each entry)
+        return self.parse_arp_table(output.splitlines())
+
+    async def iter_arp_table(self):
+        """
+        Asyn generator used to get the ARP table of the device while it is received
+
+        :return: the ARP entries of the device (one dictionary per entry)
+        :rtype: dict
+        """
+
         # Display info message
-        log.info(f"get_arp:\n'{output}'")
+        log.info("iter_arp_table")
 
-        # Convert a string into a list of strings
-        lines = output.splitlines()
+        # Getter served by the RouterOS API?
+        if self._api is not None:
 
-        # Read each line
-        for line in lines:
+            # Yes
+            for returned_dict in self.parse_api_arp_table(
+                await self._api.print("/ip/arp")
+            ):
+                yield returned_dict
 
-            # Set default values for variables
-            address = None
-            mac_address = None
-            interface = None
+            return
+
+        # Blocks of lines of the output while they are received
+        # (the lines of a block are parsed without going back to the event loop)
+        blocks = self.stream_command(self.cmd_get_arp, chunks=True)
 
-            # Get IP address
-            if " address=" in line:
-                address = line.split(" address=")[-1].split()[0]
+        try:
 
-            # Get MAC address
-            if " mac-address=" in line:
-                mac_address = line.split(" mac-address=")[-1].split()[0]
+            # Read each block
+            async for block in blocks:
 
-            # Get interface
-            if " interface=" in line:
-                interface = line.split(" interface=")[-1].split()[0]
+                # Give the ARP entries of the block
+                for returned_dict in self.parse_arp_table(block.splitlines()):
+                    yield returned_dict
 
-            # Create a dictionary
-            returned_dict = {
-                "address": address,
-                "mac_address": mac_address,
-                "interface": interface,
-            }
+        finally:
+
+            # End of the output read even if the generator is closed before
+            await blocks.aclose()
+
+    def parse_arp_table(self, lines):
+        """
+        Method used to get the ARP entries from the lines of the output of cmd_get_arp
+
+        :param lines: the lines of the output of cmd_get_arp
+        :type lines: list of str
+
+        :return: the ARP entries (one dictionary per entry)
+        :rtype: list of dict
+        """
+
+        # By default nothing is returned
+        returned_output = []
+
+        # Read the IP address, MAC address and interface of each line (None if not found)
+        for address, mac_address, interface in parse_terse_values(
+            lines, ("address", "mac-address", "interface")
+        ):
 
             # Add the information to the list
             if address:
-                returned_output.append(returned_dict)
+                returned_output.append(
+                    {
+                        "address": address,
+                        "mac_address": mac_address,
+                        "interface": interface,
+                    }
+                )
 
         # Return data
         return returned_output
 
+    def parse_api_arp_table(self, records):
+        """
+        Method used to get the ARP entries from the records of "/ip/arp" (RouterOS API)
+
+        :param records: the records of the RouterOS API
+        :type records: list of dict
+
+        :return: the ARP entries (one dictionary per entry, same values as with the CLI)
+        :rtype: list of dict
+        """
+
+        # Return the entries with an IP address
+        return [
+            {
+                "address": record["address"],
+                "mac_address": record.get("mac-address"),
+                "interface": record.get("interface"),
+            }
+            for record in records
+            if record.get("address")
+        ]
+
     async def get_lldp_neighbors(self):
         """
         Asyn method used to get the LLDP information from the device
@@ -1276,13 +2086,10 @@ class MikrotikRouterOS(NetworkDevice):
         output = await self.send_command(self.cmd_get_lldp_neighbors)
 
         # Display info message
-        log.info(f"get_lldp_neighbors:\n'{output}'")
-
-        # Convert a string into a list of strings
-        lines = output.splitlines()
+        log.info("get_lldp_neighbors:\n'%s'", output)
 
         # Read each line
-        for line in lines:
+        for record in parse_terse(output):
 
             # Default value for local interface (no interface)
             local_interface = None
@@ -1298,30 +2105,28 @@ class MikrotikRouterOS(NetworkDevice):
             management_address = ""
 
             # Get local interface
-            if " interface=" in line:
-                local_interface = line.split(" interface=")[-1].split()[0].split(",")[0]
+            if "interface" in record:
+                local_interface = record["interface"].split(",")[0]
 
                 # Display info message
-                log.info(f"get_lldp_neighbors: local_interface: {local_interface}")
+                log.info("get_lldp_neighbors: local_interface: %s", local_interface)
 
             # Get Chassis ID - TLV type 1
-            if " mac-address=" in line:
-                chassis_id = line.split(" mac-address=")[-1].split()[0]
+            if "mac-address" in record:
+                chassis_id = record["mac-address"]
 
                 # Convert the MAC address of the Chassis ID into a lower case string
                 chassis_id = chassis_id.lower()
 
                 # Display info message
-                log.info(f"get_lldp_neighbors: chassis_id: {chassis_id}")
+                log.info("get_lldp_neighbors: chassis_id: %s", chassis_id)
 
             # Get Port ID - TLV type 2
-            if " interface-name=" in line:
-                port_id = (
-                    line.split(" interface-name=")[-1].split("=")[0].rsplit(" ", 1)[0]
-                )
+            if "interface-name" in record:
+                port_id = record["interface-name"]
 
                 # Display info message
-                log.info(f"get_lldp_neighbors: port_id: {port_id}")
+                log.info("get_lldp_neighbors: port_id: %s", port_id)
 
             # Get Time To Live - TLV type 3
             # Not available on RouterOS. "age" parameter is a decreasing counter
@@ -1330,37 +2135,28 @@ class MikrotikRouterOS(NetworkDevice):
             # Not available on RouterOS.
 
             # Get System name - TLV type 5
-            if " identity=" in line:
-                system_name = line.split(" identity=")[-1].split()[0]
-
-                # Check if return value is a string "" (just double quotes which means empty data)
-                if system_name == '""':
-
-                    # Yes, empty string
-                    system_name = ""
+            # (quotes removed: "" gives an empty string)
+            if "identity" in record:
+                system_name = record["identity"]
 
                 # Display info message
-                log.info(f"get_lldp_neighbors: system_name: {system_name}")
+                log.info("get_lldp_neighbors: system_name: %s", system_name)
 
             # Get System description - TLV type 6
-            if " system-description=" in line:
-                system_description = (
-                    line.split(" system-description=")[-1]
-                    .split("=")[0]
-                    .rsplit(" ", 1)[0]
-                )
+            if "system-description" in record:
+                system_description = record["system-description"]
 
                 # Display info message
                 log.info(
-                    f"get_lldp_neighbors: system_description: {system_description}"
+                    "get_lldp_neighbors: system_description: %s", system_description
                 )
 
             # Get System capabilities - TLV type 7
-            if " system-caps=" in line:
+            if "system-caps" in record:
 
                 # First get the capablities as a string separated by commas
                 # e.g.: 'bridge,wlan-ap,router,station-only'
-                string_capability = line.split(" system-caps=")[-1].split()[0]
+                string_capability = record["system-caps"]
 
                 # Then convert them into a list of characters
                 # Code	Capability
@@ -1385,12 +2181,12 @@ class MikrotikRouterOS(NetworkDevice):
 
                 # Display info message
                 log.info(
-                    f"get_lldp_neighbors: system_capabilities: {system_capabilities}"
+                    "get_lldp_neighbors: system_capabilities: %s", system_capabilities
                 )
 
             # Get Management address - TLV type 8
-            if " address=" in line:
-                management_address = line.split(" address=")[-1].split()[0]
+            if "address" in record:
+                management_address = record["address"]
 
             # LLDP TLV Type 9 to 127 are currently not supported by this method
 
@@ -1415,9 +2211,8 @@ class MikrotikRouterOS(NetworkDevice):
 
                 # Add the information to the dict
                 # Each interface can get several returned_dict in a list
-                returned_output[local_interface] = returned_output.get(
-                    local_interface, []
-                ) + [returned_dict]
+                # (the list is not copied for each neighbour)
+                returned_output.setdefault(local_interface, []).append(returned_dict)
 
         # Return data
         return returned_output
@@ -1438,56 +2233,62 @@ class MikrotikRouterOS(NetworkDevice):
         # Display info message
         log.info("get_interfaces")
 
+        # Getter served by the RouterOS API?
+        if self._api is not None:
+
+            # Yes
+            return await self.get_interfaces_api()
+
         # By default nothing is returned
         returned_output = {}
 
-        # Command for the status of the interfaces
-
-        # Send a command
-        output_status = await self.send_command(self.cmd_get_interfaces[0])
+        # Commands for the status, the speed and the duplex mode and the mode
+        # (access or trunk) of the interfaces (independent commands, sent together)
+        output_status, output_bitrate, output_mode = await self.send_commands(
+            self.cmd_get_interfaces
+        )
 
         # Display info message
-        log.info(f"get_interfaces: status command\n'{output_status}'")
-
-        # Command for the speed and the duplex mode of the interfaces
-
-        # Send a command
-        output_bitrate = await self.send_command(self.cmd_get_interfaces[1])
+        log.info("get_interfaces: status command\n'%s'", output_status)
+        log.info("get_interfaces: speed duplex command\n'%s'", output_bitrate)
+        log.info("get_interfaces: mode command\n'%s'", output_mode)
 
-        # Display info message
-        log.info(f"get_interfaces: speed duplex command\n'{output_bitrate}'")
+        # Convert a string into a list of strings (status)
+        lines = output_status.splitlines()
 
-        # Command for the mode of the interfaces (access or trunk)
+        # By default there is no speed and duplex information
+        dict_bitrate = {}
 
-        # Send a command
-        output_mode = await self.send_command(self.cmd_get_interfaces[2])
+        # Read each block of strings (duplex/speed of one interface, blocks separated
+        # by an empty line; "\r\n" with Telnet)
+        for data_block in output_bitrate.replace("\r\n", "\n").split("\n\n"):
 
-        # Display info message
-        log.info(f"get_interfaces: mode command\n'{output_mode}'")
+            # Read each line of the block
+            for line_bitrate in data_block.splitlines():
 
-        # Convert a string into a list of strings (status)
-        lines = output_status.splitlines()
+                # Name of the interface? (eg. "                 name: ether1")
+                field, _, value = line_bitrate.strip().partition(": ")
+                if field == "name":
 
-        # Convert a string into a list of block of strings (duplex/speed)
-        block_of_strings_bitrate = output_bitrate.split("\n\n")
+                    # Yes, the block is saved with the name of the interface
+                    dict_bitrate[value.strip()] = data_block
 
-        # Convert a string into a list of block of strings (mode)
-        block_of_strings_mode = output_mode.splitlines()
+                    # Leave the loop
+                    break
 
         # By default there is no trunk interface
         dict_trunk_interface = {}
 
-        # Read all tagged interfaces line by line
-        for line in block_of_strings_mode:
+        # Read all tagged interfaces line by line (frame types and name of the interface)
+        for frame_types, interface_trunk in parse_terse(
+            output_mode, ("frame-types", "interface")
+        ):
 
-            # Check if a " frame-types=" is inside the string
-            if " frame-types=" in line:
+            # Check if a "frame-types" is inside the line
+            if frame_types:
 
                 # Yes
 
-                # Save the string with the name of the interfaces separated with a comma
-                frame_types = line.split(" frame-types=")[-1].split()[0]
-
                 # Mikrotik devices have 3 modes:
                 # access, trunk or hybrid
                 # (FrameTypes ::= admit-all | admit-only-untagged-and-priority-tagged | admit-only-vlan-tagged)
@@ -1510,15 +2311,13 @@ class MikrotikRouterOS(NetworkDevice):
 
                         # Display info message
                         log.info(
-                            f"get_interfaces: frame-types: mode found: '{frame_types}'"
+                            "get_interfaces: frame-types: mode found: '%s'", frame_types
                         )
 
-                        # Get the name of the interface
-                        interface_trunk = line.split(" interface=")[-1].split()[0]
-
                         # Display info message
                         log.info(
-                            f"get_interfaces: frame-types: interface: '{interface_trunk}'"
+                            "get_interfaces: frame-types: interface: '%s'",
+                            interface_trunk,
                         )
 
                         # So save the interface mode with a conventional name
@@ -1541,6 +2340,9 @@ class MikrotikRouterOS(NetworkDevice):
         # Read each line
         for line in lines:
 
+            # Get the fields of the line
+            record = parse_terse_line(line)
+
             # Initialize data with default values
             interface_name = ""
             operational = False
@@ -1552,11 +2354,11 @@ class MikrotikRouterOS(NetworkDevice):
             description = ""
 
             # Get interface name
-            if " name=" in line:
-                interface_name = line.split(" name=")[-1].split()[0]
+            if "name" in record:
+                interface_name = record["name"]
 
                 # Display info message
-                log.info(f"get_interfaces: interface_name: {interface_name}")
+                log.info("get_interfaces: interface_name: %s", interface_name)
 
                 # Get operational and admin_state status
                 if len(line) > 3:
@@ -1579,92 +2381,61 @@ class MikrotikRouterOS(NetworkDevice):
                     # No need to compare since default values are already fine
 
                 # Display info message
-                log.info(f"get_interfaces: operational: {operational}, admin_state")
+                log.info("get_interfaces: operational: %s, admin_state", operational)
 
                 # Get maximum frame size
-                if " l2mtu=" in line:
-                    maximum_frame_size = int(line.split(" l2mtu=")[-1].split()[0])
+                if "l2mtu" in record:
+                    maximum_frame_size = int(record["l2mtu"])
 
                     # Display info message
                     log.info(
-                        f"get_interfaces: maximum_frame_size : {maximum_frame_size}"
+                        "get_interfaces: maximum_frame_size : %s", maximum_frame_size
                     )
 
                 # Get speed and duplex information
 
-                for index, data_block in enumerate(block_of_strings_bitrate):
-
-                    # Display info message
-                    log.info(
-                        f"get_interfaces: get_speed: index: {index} [{len(block_of_strings_bitrate)}]"
-                    )
-
-                    # Is the name of interface found in the block of strings?
-                    if f"name: {interface_name}" in data_block:
-
-                        # Yes, so this block of strings has information on the interface
-
-                        # Display info message
-                        log.info(f"get_interfaces: get_speed: index found: {index}")
-
-                        # " rate: " field found in the block of strings? (speed)
-                        if " rate: " in data_block:
-
-                            # Yes
-
-                            # Then extract the string data
-                            rate_string = (
-                                data_block.split(" rate: ")[-1].split()[0].lower()
-                            )
-
-                            # Is is mbps?
-                            if "mbps" in rate_string:
-                                # Yes
+                # Block of strings with information on the interface
+                data_block = dict_bitrate.get(interface_name)
 
-                                # Then speed is saved
-                                speed = int(float(rate_string.split("mbps")[0]))
+                # Is the interface found in the blocks of strings?
+                if data_block is not None:
 
-                            # Is is gbps?
-                            elif "gbps" in rate_string:
+                    # Yes
 
-                                # Yes
+                    # Display info message
+                    log.info("get_interfaces: get_speed: %s found", interface_name)
 
-                                # Then speed is saved in mpbs
-                                speed = int(float(rate_string.split("gbps")[0]) * 1000)
+                    # " rate: " field found in the block of strings? (speed)
+                    if " rate: " in data_block:
 
-                            # Is is tbps? (not seen on current Mikrotik product; for future use)
-                            elif "tbps" in rate_string:
-                                # Yes
+                        # Yes
 
-                                # Then speed is saved in mpbs
-                                speed = int(
-                                    float(rate_string.split("tbps")[0]) * 1000000
-                                )
+                        # Then extract the string data
+                        rate_string = data_block.split(" rate: ")[-1].split()[0].lower()
 
-                            # Display info message
-                            log.info(
-                                f"get_interfaces: get_speed: rate found: {rate_string}, rate: {speed} mbps"
-                            )
+                        # Speed in Mbit/s
+                        speed = self.parse_speed(rate_string)
 
-                        # " full-duplex: yes" field found in the block of strings? (full_duplex)
-                        if " full-duplex: yes" in data_block:
-
-                            # Yes
+                        # Display info message
+                        log.info(
+                            "get_interfaces: get_speed: rate found: %s, rate: %s mbps",
+                            rate_string,
+                            speed,
+                        )
 
-                            # Display info message
-                            log.info(
-                                f"get_interfaces: get_duplex: {interface_name} is in full duplex mode"
-                            )
+                    # " full-duplex: yes" field found in the block of strings? (full_duplex)
+                    if " full-duplex: yes" in data_block:
 
-                            # Then the insterface is in full duplex mode
-                            full_duplex = True
+                        # Yes
 
-                        # Remove current interface information from the block of data
-                        # (to speed up the research of data)
-                        del block_of_strings_bitrate[index]
+                        # Display info message
+                        log.info(
+                            "get_interfaces: get_duplex: %s is in full duplex mode",
+                            interface_name,
+                        )
 
-                        # Leave the loop
-                        break
+                        # Then the insterface is in full duplex mode
+                        full_duplex = True
 
                 # Get interface mode (access, trunk or hybrid)
 
@@ -1677,7 +2448,7 @@ class MikrotikRouterOS(NetworkDevice):
                     mode = dict_trunk_interface[interface_name]
 
                     # Display info message
-                    log.info(f"get_interfaces: mode: {mode}")
+                    log.info("get_interfaces: mode: %s", mode)
 
                 # # Check if the interface is one of the trunk interface
                 # if interface_name in dict_trunk_interface:
@@ -1754,13 +2525,11 @@ class MikrotikRouterOS(NetworkDevice):
                 #                 fcs_error = int(fcs_string)
 
                 # Get description
-                if " comment=" in line:
-                    description = (
-                        line.split(" comment=")[-1].split("=")[0].rsplit(" ", 1)[0]
-                    )
+                if "comment" in record:
+                    description = record["comment"]
 
                     # Display info message
-                    log.info(f"get_interfaces: comment: {description}")
+                    log.info("get_interfaces: comment: %s", description)
 
                 # Create a dictionary
                 returned_dict = {
@@ -1780,6 +2549,135 @@ class MikrotikRouterOS(NetworkDevice):
         # Return data
         return returned_output
 
+    async def get_interfaces_api(self):
+        """
+        Asyn method used to get the information of ALL the interfaces of the device with the RouterOS API
+
+        Same values as get_interfaces with the records of the RouterOS API:
+        - "/interface/ethernet" for status, maximum frame size and description
+        - "/interface/ethernet/monitor" for duplex/speed
+        - "/interface/bridge/port" for mode (access / trunk / hybrid)
+
+        :return: Interfaces of the device
+        :rtype: dict of dict
+        """
+
+        # Display info message
+        log.info("get_interfaces_api")
+
+        # By default nothing is returned
+        returned_output = {}
+
+        # Records of the interfaces and of the ports of the bridges (sent together)
+        ethernet_records, port_records = await asyncio.gather(
+            self._api.print("/interface/ethernet"),
+            self._api.print(
+                "/interface/bridge/port", proplist=["interface", "frame-types"]
+            ),
+        )
+
+        # Names of the interfaces
+        list_of_names = [
+            record["name"] for record in ethernet_records if "name" in record
+        ]
+
+        # Speed and duplex mode of the interfaces (monitored once)
+        monitor_records = (
+            await self._api.talk(
+                "/interface/ethernet/monitor",
+                {"numbers": ",".join(list_of_names), "once": ""},
+            )
+            if list_of_names
+            else []
+        )
+
+        # Speed and duplex mode of each interface
+        dict_monitor = {record.get("name"): record for record in monitor_records}
+
+        # Mode of each "frame-types" value
+        dict_modes = {
+            frame_types: mode for mode, frame_types in self.interface_mode.items()
+        }
+
+        # Mode of the interfaces of the bridges
+        dict_trunk_interface = {
+            record.get("interface"): dict_modes[record["frame-types"]]
+            for record in port_records
+            if record.get("frame-types") in dict_modes
+        }
+
+        # Read each interface
+        for record in ethernet_records:
+
+            # Get interface name
+            interface_name = record.get("name")
+
+            # Interface name found?
+            if not interface_name:
+
+                # No
+                continue
+
+            # Get operational and admin_state status
+            admin_state = record.get("disabled") != "true"
+            operational = admin_state and record.get("running") == "true"
+
+            # Speed and duplex mode of the interface
+            monitor = dict_monitor.get(interface_name, {})
+
+            # Add the information to the dict
+            returned_output[interface_name] = {
+                "operational": operational,
+                "admin_state": admin_state,
+                "maximum_frame_size": int(record.get("l2mtu") or 0),
+                "full_duplex": monitor.get("full-duplex") == "true",
+                "speed": self.parse_speed(monitor.get("rate", "")),
+                "mode": dict_trunk_interface.get(interface_name, "access"),
+                "description": record.get("comment", ""),
+            }
+
+        # Return data
+        return returned_output
+
+    def parse_speed(self, rate):
+        """
+        Method used to get the speed of an interface from its rate ("100Mbps", "1Gbps", etc.)
+
+        :param rate: the rate of the interface
+        :type rate: str
+
+        :return: the speed in Mbit/s (0 if unknown)
+        :rtype: int
+        """
+
+        # Rate in lower case
+        rate_string = rate.lower()
+
+        # Is is mbps?
+        if "mbps" in rate_string:
+            # Yes
+
+            # Then speed is saved
+            return int(float(rate_string.split("mbps")[0]))
+
+        # Is is gbps?
+        if "gbps" in rate_string:
+
+            # Yes
+
+            # Then speed is saved in mpbs
+            return int(float(rate_string.split("gbps")[0]) * 1000)
+
+        # Is is tbps? (not seen on current Mikrotik product; for future use)
+        if "tbps" in rate_string:
+            # Yes
+
+            # Then speed is saved in mpbs
+            return int(float(rate_string.split("tbps")[0]) * 1000000)
+
+        # Unknown speed
+        return 0
+
     async def get_vlans(self):
         """
         Asyn method used to get the vlans information from the device
@@ -1791,20 +2689,37 @@ class MikrotikRouterOS(NetworkDevice):
         # Display info message
         log.info("get_vlans")
 
-        # By default nothing is returned
-        returned_output = {}
+        # Getter served by the RouterOS API?
+        if self._api is not None:
+
+            # Yes, the records have the same fields as the lines of the CLI
+            return self.parse_vlans(await self._api.print("/interface/bridge/vlan"))
 
         # Send a command
         output = await self.send_command(self.cmd_get_vlans)
 
         # Display info message
-        log.info(f"get_vlans:\n'{output}'")
+        log.info("get_vlans:\n'%s'", output)
 
-        # Convert a string into a list of strings
-        lines = output.splitlines()
+        # Get the VLANs from the fields of each line
+        return self.parse_vlans(parse_terse(output))
 
-        # Read each line
-        for line in lines:
+    def parse_vlans(self, records):
+        """
+        Method used to get the VLANs from the fields of the lines of cmd_get_vlans (or from the records of the RouterOS API)
+
+        :param records: the fields of each line (or each record)
+        :type records: list of dict
+
+        :return: VLANs of the device
+        :rtype: dict
+        """
+
+        # By default nothing is returned
+        returned_output = {}
+
+        # Read each record
+        for record in records:
 
             # Initialize data with default values
             name = ""
@@ -1815,25 +2730,25 @@ class MikrotikRouterOS(NetworkDevice):
             # }
 
             # Get VLAN name
-            if " comment=" in line:
-                name = line.split(" comment=")[-1].split("=")[0].rsplit(" ", 1)[0]
+            if "comment" in record:
+                name = record["comment"]
 
                 # Display info message
-                log.info(f"get_vlans: name: {name}")
+                log.info("get_vlans: name: %s", name)
 
             # Get VLAN ID
-            if " vlan-ids=" in line:
-                vlan_id = int(line.split(" vlan-ids=")[-1].split()[0])
+            if "vlan-ids" in record:
+                vlan_id = int(record["vlan-ids"])
 
                 # Display info message
-                log.info(f"get_vlans: vlan_id: {vlan_id}")
+                log.info("get_vlans: vlan_id: %s", vlan_id)
 
             # Get bridge (special Mikrotik)
-            if " bridge=" in line:
-                bridge = line.split(" bridge=")[-1].split("=")[0].rsplit(" ", 1)[0]
+            if "bridge" in record:
+                bridge = record["bridge"]
 
                 # Display info message
-                log.info(f"get_vlans: bridge: {bridge}")
+                log.info("get_vlans: bridge: %s", bridge)
 
                 # Save bridge information into
                 extra = {
@@ -1868,106 +2783,185 @@ class MikrotikRouterOS(NetworkDevice):
         # Display info message
         log.info("get_routing_table")
 
-        # By default nothing is returned
-        returned_output = {}
+        # Get all the routes
+        return {
+            network: returned_dict
+            async for network, returned_dict in self.iter_routing_table()
+        }
 
-        # Send a command
-        output = await self.send_command(self.cmd_get_routing_table)
+    async def iter_routing_table(self):
+        """
+        Asyn generator used to get the routing table of the device while it is received
+
+        :return: the routes of the device (network and dictionary of the route)
+        :rtype: tuple
+        """
 
         # Display info message
-        log.info(f"get_routing_table:\n'{output}'")
+        log.info("iter_routing_table")
 
-        # Convert a string into a list of strings
-        lines = output.splitlines()
+        # Getter served by the RouterOS API?
+        if self._api is not None:
 
-        # Read each line
-        for line in lines:
+            # Yes
+            for route in self.parse_api_routing_table(
+                await self._api.print("/ip/route")
+            ):
+                yield route
 
-            # Initialize data with default values
-            network = ""
-            address = ""
-            prefix = 0
-            protocol = "unknown"
-            administrative_distance = 0
-            gateway = ""
-            active = False
-            protocol_attributes = None
+            return
+
+        # Lines of the output while they are received
+        lines = self.stream_command(self.cmd_get_routing_table)
+
+        try:
+
+            # Read each line
+            async for line in lines:
+
+                # Initialize data with default values
+                network = ""
+                address = ""
+                prefix = 0
+                protocol = "unknown"
+                administrative_distance = 0
+                gateway = ""
+                active = False
+                protocol_attributes = None
+
+                # Get the fields of the line
+                record = parse_terse_line(line)
+
+                # Get network, address and prefix
+                if "dst-address" in record:
+                    network = record["dst-address"]
+                    address = network.split("/")[0]
+                    prefix = int(network.split("/")[1])
+
+                # Get protocol
+
+                # Save char with protocol letter
+                if len(line) > 5:
+
+                    protocol_char = line[5]
+
+                    if protocol_char == "C":
+
+                        # Connected
+                        protocol = "connected"
+
+                    elif protocol_char == "S":
+
+                        # Static
+                        protocol = "static"
+
+                    elif protocol_char == "r":
+
+                        # RIP
+                        protocol = "rip"
+
+                    elif protocol_char == "b":
 
-            # Get network, address and prefix
-            if " dst-address=" in line:
-                network = line.split(" dst-address=")[-1].split()[0]
-                address = network.split("/")[0]
-                prefix = int(network.split("/")[1])
+                        # BGP
+                        protocol = "bgp"
 
-            # Get protocol
+                    elif protocol_char == "o":
 
-            # Save char with protocol letter
-            if len(line) > 5:
+                        # OSPF
+                        protocol = "ospf"
 
-                protocol_char = line[5]
+                    elif protocol_char == "m":
 
-                if protocol_char == "C":
+                        # MME
+                        protocol = "mme"
 
-                    # Connected
-                    protocol = "connected"
+                # Get administrative distance
+                if "distance" in record:
+                    administrative_distance = int(record["distance"])
 
-                elif protocol_char == "S":
+                # Get gateway
+                if "gateway" in record:
+                    gateway = record["gateway"]
 
-                    # Static
-                    protocol = "static"
+                # Get active status
+                if len(line) > 3:
+
+                    if line[3] == "A":
+                        active = True
+
+                # Create a dictionary
+                returned_dict = {
+                    "address": address,
+                    "prefix": prefix,
+                    "protocol": protocol,
+                    "administrative_distance": administrative_distance,
+                    "gateway": gateway,
+                    "active": active,
+                    "protocol_attributes": protocol_attributes,
+                }
 
-                elif protocol_char == "r":
+                # Is a network found?
+                if network:
 
-                    # RIP
-                    protocol = "rip"
+                    # Yes
 
-                elif protocol_char == "b":
+                    # Give the information
+                    yield network, returned_dict
 
-                    # BGP
-                    protocol = "bgp"
+        finally:
 
-                elif protocol_char == "o":
+            # End of the output read even if the generator is closed before
+            await lines.aclose()
 
-                    # OSPF
-                    protocol = "ospf"
+    def parse_api_routing_table(self, records):
+        """
+        Method used to get the routes from the records of "/ip/route" (RouterOS API)
 
-                elif protocol_char == "m":
+        :param records: the records of the RouterOS API
+        :type records: list of dict
 
-                    # MME
-                    protocol = "mme"
+        :return: the routes (network and dictionary of the route, same values as with the CLI)
+        :rtype: list of tuple
+        """
 
-            # Get administrative distance
-            if " distance=" in line:
-                administrative_distance = int(line.split(" distance=")[-1].split()[0])
+        # By default nothing is returned
+        returned_output = []
 
-            # Get gateway
-            if " gateway=" in line:
-                gateway = line.split(" gateway=")[-1].split()[0]
+        # Read each record
+        for record in records:
 
-            # Get active status
-            if len(line) > 3:
+            # Get network
+            network = record.get("dst-address", "")
 
-                if line[3] == "A":
-                    active = True
+            # Is a network found?
+            if not network:
+
+                # No
+                continue
+
+            # Get the protocol from the flags of the route ("connect=true", "static=true", etc.)
+            protocol = next(
+                (
+                    protocol
+                    for flag, protocol in self.api_route_protocols.items()
+                    if record.get(flag) == "true"
+                ),
+                "unknown",
+            )
 
             # Create a dictionary
             returned_dict = {
-                "address": address,
-                "prefix": prefix,
+                "address": network.split("/")[0],
+                "prefix": int(network.split("/")[1]),
                 "protocol": protocol,
-                "administrative_distance": administrative_distance,
-                "gateway": gateway,
-                "active": active,
-                "protocol_attributes": protocol_attributes,
+                "administrative_distance": int(record.get("distance") or 0),
+                "gateway": record.get("gateway", ""),
+                "active": record.get("active") == "true",
+                "protocol_attributes": None,
             }
 
-            # Is a network found?
-            if network:
-
-                # Yes
-
-                # Add the information to the dict
-                returned_output[network] = returned_dict
+            # Add the information to the list
+            returned_output.append((network, returned_dict))
 
         # Return data
         return returned_output
@@ -1990,7 +2984,7 @@ class MikrotikRouterOS(NetworkDevice):
         output = await self.send_command(self.cmd_get_bridges)
 
         # Display info message
-        log.info(f"get_bridges:\n'{output}'")
+        log.info("get_bridges:\n'%s'", output)
 
         # Convert a string into a list of strings
         lines = output.splitlines()
@@ -2008,6 +3002,9 @@ class MikrotikRouterOS(NetworkDevice):
             vlan_filtering = False
             multicast_querier = False
 
+            # Get the fields of the line
+            record = parse_terse_line(line)
+
             # Get index
 
             # Line has enough characters?
@@ -2024,7 +3021,7 @@ class MikrotikRouterOS(NetworkDevice):
                     index = int(index_string)
 
                     # Display info message
-                    log.info(f"get_bridges: index: {index}")
+                    log.info("get_bridges: index: %s", index)
 
                 except:
 
@@ -2032,11 +3029,11 @@ class MikrotikRouterOS(NetworkDevice):
                     pass
 
             # Get name
-            if " name=" in line:
-                name = line.split(" name=")[-1].split("=")[0].rsplit(" ", 1)[0]
+            if "name" in record:
+                name = record["name"]
 
                 # Display info message
-                log.info(f"get_bridges: name: {name}")
+                log.info("get_bridges: name: %s", name)
 
             # Get status
             line_words = line.split()
@@ -2053,34 +3050,27 @@ class MikrotikRouterOS(NetworkDevice):
                     status = True
 
                     # Display info message
-                    log.info(f"get_bridges: status: {status}")
+                    log.info("get_bridges: status: %s", status)
 
             # Get MAC ADDRESS
-            if " mac-address=" in line:
-                mac_address = (
-                    line.split(" mac-address=")[-1].split("=")[0].rsplit(" ", 1)[0]
-                )
+            if "mac-address" in record:
+                mac_address = record["mac-address"]
 
                 # Display info message
-                log.info(f"get_bridges: mac_address: {mac_address}")
+                log.info("get_bridges: mac_address: %s", mac_address)
 
             # Get Spanning Tree mode
-            if " protocol-mode=" in line:
-                spanning_tree = (
-                    line.split(" protocol-mode=")[-1].split("=")[0].rsplit(" ", 1)[0]
-                )
+            if "protocol-mode" in record:
+                spanning_tree = record["protocol-mode"]
 
                 # Display info message
-                log.info(f"get_bridges: spanning_tree: {spanning_tree}")
+                log.info("get_bridges: spanning_tree: %s", spanning_tree)
 
             # Get IGMP SNOOPING status
-            if " igmp-snooping=" in line:
+            if "igmp-snooping" in record:
 
                 # Value "yes" for IGMP SNOOPING?
-                if (
-                    line.split(" igmp-snooping=")[-1].split("=")[0].rsplit(" ", 1)[0]
-                    == "yes"
-                ):
+                if record["igmp-snooping"] == "yes":
 
                     # Yes
 
@@ -2088,16 +3078,13 @@ class MikrotikRouterOS(NetworkDevice):
                     igmp_snooping = True
 
                     # Display info message
-                    log.info(f"get_bridges: igmp_snooping: {igmp_snooping}")
+                    log.info("get_bridges: igmp_snooping: %s", igmp_snooping)
 
             # Get VLAN filtering status
-            if " vlan-filtering=" in line:
+            if "vlan-filtering" in record:
 
                 # Value "yes" for VLAN filtering?
-                if (
-                    line.split(" vlan-filtering=")[-1].split("=")[0].rsplit(" ", 1)[0]
-                    == "yes"
-                ):
+                if record["vlan-filtering"] == "yes":
 
                     # Yes
 
@@ -2105,18 +3092,13 @@ class MikrotikRouterOS(NetworkDevice):
                     vlan_filtering = True
 
                     # Display info message
-                    log.info(f"get_bridges: vlan_filtering: {vlan_filtering}")
+                    log.info("get_bridges: vlan_filtering: %s", vlan_filtering)
 
             # Get multicast querier status
-            if " multicast-querier=" in line:
+            if "multicast-querier" in record:
 
                 # Value "yes"?
-                if (
-                    line.split(" multicast-querier=")[-1]
-                    .split("=")[0]
-                    .rsplit(" ", 1)[0]
-                    == "yes"
-                ):
+                if record["multicast-querier"] == "yes":
 
                     # Yes
 
@@ -2124,7 +3106,7 @@ class MikrotikRouterOS(NetworkDevice):
                     multicast_querier = True
 
                     # Display info message
-                    log.info(f"get_bridges: multicast_querier: {multicast_querier}")
+                    log.info("get_bridges: multicast_querier: %s", multicast_querier)
 
             # Create a dictionary
             returned_dict = {
@@ -2192,7 +3174,7 @@ class MikrotikRouterOS(NetworkDevice):
         bridge_name = kwargs["bridge_name"]
 
         # Display info message
-        log.info(f"add_vlan: bridge_name found: '{bridge_name}'")
+        log.info("add_vlan: bridge_name found: '%s'", bridge_name)
 
         # Adapt the command line
         # self.cmd_add_vlan = "interface bridge vlan add vlan-ids=<VLAN> comment=\"<VLAN_NAME>\" bridge=<BRIDGE>"
@@ -2208,13 +3190,16 @@ class MikrotikRouterOS(NetworkDevice):
         cmd_add_vlan = cmd_add_vlan.replace("<VLAN_NAME>", vlan_name)
 
         # Display info message
-        log.info(f"add_vlan: cmd_add_vlan: '{cmd_add_vlan}'")
+        log.info("add_vlan: cmd_add_vlan: '%s'", cmd_add_vlan)
+
+        # The VLANs are changed: the VLAN tables kept are no more valid
+        self.clear_output_cache(self.cmd_show_vlan_tables)
 
         # Add VLAN
         output = await self.send_command(cmd_add_vlan)
 
         # Display info message
-        log.info(f"add_vlan: output: '{output}'")
+        log.info("add_vlan: output: '%s'", output)
 
         # Check if an error happened
         # "failure: vlan already added"
@@ -2250,13 +3235,16 @@ class MikrotikRouterOS(NetworkDevice):
         cmd_remove_vlan = self.cmd_remove_vlan.replace("<VLAN>", str(vland_id))
 
         # Display info message
-        log.info(f"remove_vlan: cmd_remove_vlan: '{cmd_remove_vlan}'")
+        log.info("remove_vlan: cmd_remove_vlan: '%s'", cmd_remove_vlan)
+
+        # The VLANs are changed: the VLAN tables kept are no more valid
+        self.clear_output_cache(self.cmd_show_vlan_tables)
 
         # Add VLAN
         output = await self.send_command(cmd_remove_vlan)
 
         # Display info message
-        log.info(f"remove_vlan: output: '{output}'")
+        log.info("remove_vlan: output: '%s'", output)
 
         # No error?
         if "no such item" not in output:
@@ -2312,11 +3300,11 @@ class MikrotikRouterOS(NetworkDevice):
         return_status = False
 
         # Display info message
-        log.info(f"set_interface: input: interface: {interface}")
-        log.info(f"set_interface: input: admin_state: {admin_state}")
-        log.info(f"set_interface: input: description: {description}")
-        log.info(f"set_interface: input: maximum_frame_size: {maximum_frame_size}")
-        log.info(f"set_interface: input: mode: {mode}")
+        log.info("set_interface: input: interface: %s", interface)
+        log.info("set_interface: input: admin_state: %s", admin_state)
+        log.info("set_interface: input: description: %s", description)
+        log.info("set_interface: input: maximum_frame_size: %s", maximum_frame_size)
+        log.info("set_interface: input: mode: %s", mode)
 
         # Get parameters
 
@@ -2333,6 +3321,9 @@ class MikrotikRouterOS(NetworkDevice):
             # Return status
             return return_status
 
+        # The interface is changed: the outputs showing the interfaces are no more valid
+        self.clear_output_cache(self.cmd_get_interfaces)
+
         # "admin_state" found?
         if admin_state != None:
 
@@ -2366,7 +3357,7 @@ class MikrotikRouterOS(NetworkDevice):
             cmd = cmd.replace("<INTERFACE>", interface)
 
             # Display info message
-            log.info(f"set_interface: admin_state: cmd: {cmd}")
+            log.info("set_interface: admin_state: cmd: %s", cmd)
 
             # Change the state of the interface
             await self.send_command(cmd)
@@ -2392,7 +3383,7 @@ class MikrotikRouterOS(NetworkDevice):
             cmd = cmd.replace("<COMMENT>", description)
 
             # Display info message
-            log.info(f"set_interface: description: cmd: {cmd}")
+            log.info("set_interface: description: cmd: %s", cmd)
 
             # Change the description of the interface
             await self.send_command(cmd)
@@ -2418,7 +3409,7 @@ class MikrotikRouterOS(NetworkDevice):
             cmd = cmd.replace("<MAXIMUMFRAMESIZE>", str(maximum_frame_size))
 
             # Display info message
-            log.info(f"set_interface: maximum_frame_size: cmd: {cmd}")
+            log.info("set_interface: maximum_frame_size: cmd: %s", cmd)
 
             # Change the Maximum Frame Size of the interface
             output = await self.send_command(cmd)
@@ -2430,7 +3421,7 @@ class MikrotikRouterOS(NetworkDevice):
                 # Error with the Maximum Frame Size value
 
                 # Display info message
-                log.error(f"set_interface: maximum_frame_size: output: {output}")
+                log.error("set_interface: maximum_frame_size: output: %s", output)
 
                 # Return an error
                 return return_status
@@ -2478,7 +3469,7 @@ class MikrotikRouterOS(NetworkDevice):
             cmd = cmd.replace("<MODE>", interface_mode)
 
             # Display info message
-            log.info(f"set_interface: mode: cmd: {cmd}")
+            log.info("set_interface: mode: cmd: %s", cmd)
 
             # Change the mode of the interface
             await self.send_command(cmd)
@@ -2489,6 +3480,58 @@ class MikrotikRouterOS(NetworkDevice):
         # Return status
         return return_status
 
+    def update_cached_vlan_table(self, cmd, output, line, field, value):
+        """
+        Method used to update the VLAN table kept by the output cache after a change of the interfaces of a VLAN
+
+        The line of the VLAN is changed in the output kept, so several
+        changes of interfaces read the VLAN table once (see
+        "output_cache_ttl"). The output is removed if the line cannot be
+        changed. The other VLAN tables kept are removed.
+
+        :param cmd: the command used to read the VLAN table
+        :type cmd: str
+
+        :param output: the output of the command (before the change)
+        :type output: str
+
+        :param line: the line of the VLAN in the output
+        :type line: str
+
+        :param field: the field changed ("tagged" or "untagged")
+        :type field: str
+
+        :param value: the new value of the field (interfaces seperated with comma)
+        :type value: str
+        """
+
+        # The other VLAN tables kept are no more valid
+        self.clear_output_cache(
+            [
+                vlan_table
+                for vlan_table in self.cmd_show_vlan_tables
+                if vlan_table != cmd
+            ]
+        )
+
+        # Change the value in the line of the VLAN
+        new_line = replace_terse_value(line, field, value)
+
+        # Line changed?
+        if new_line is None:
+
+            # No
+
+            # The VLAN table kept is no more valid
+            self.clear_output_cache((cmd,))
+
+        else:
+
+            # Yes
+
+            # Update the VLAN table kept
+            self.update_cached_output(cmd, output.replace(line, new_line, 1))
+
     async def add_interface_to_vlan(
         self,
         interface=None,
@@ -2523,9 +3566,9 @@ class MikrotikRouterOS(NetworkDevice):
         return_status = False
 
         # Display info message
-        log.info(f"add_interface_to_vlan: input: interface: {interface}")
-        log.info(f"add_interface_to_vlan: input: mode: {mode}")
-        log.info(f"add_interface_to_vlan: input: vlan: {vlan}")
+        log.info("add_interface_to_vlan: input: interface: %s", interface)
+        log.info("add_interface_to_vlan: input: mode: %s", mode)
+        log.info("add_interface_to_vlan: input: vlan: %s", vlan)
 
         # Get parameters
 
@@ -2577,32 +3620,30 @@ class MikrotikRouterOS(NetworkDevice):
         cmd = self.cmd_add_interface_to_vlan[0]
 
         # Display info message
-        log.info(f"add_interface_to_vlan: get VLAN IDs: cmd: {cmd}")
+        log.info("add_interface_to_vlan: get VLAN IDs: cmd: %s", cmd)
 
-        # Change the VLAN of the interface (in VLAN config of a bridge)
-        output = await self.send_command(cmd)
+        # Get the VLANs of the bridges (output kept if "output_cache_ttl" is used)
+        output = output_vlans = await self.send_cached_command(cmd)
 
         # Display info message
-        log.info(f"add_interface_to_vlan: get VLAN IDs: output: {output}")
-
-        # Convert a string into a list of strings
-        lines = output.splitlines()
+        log.info("add_interface_to_vlan: get VLAN IDs: output: %s", output)
 
         # By default no VLAN found
         vlan_found = False
 
         # Check each line
-        for line in lines:
+        for line in output.splitlines():
+
+            # Get the fields of the line
+            record = parse_terse_line(line)
 
             # VLAN IDs in the line?
-            if "vlan-ids=" in line:
+            if "vlan-ids" in record:
 
                 # Yes
 
                 # Get VLAN IDs
-                list_of_vlans_in_one_line = (
-                    line.split(" vlan-ids=")[-1].split()[0].split(",")
-                )
+                list_of_vlans_in_one_line = record["vlan-ids"].split(",")
 
                 # Something returned?
                 if list_of_vlans_in_one_line:
@@ -2610,7 +3651,7 @@ class MikrotikRouterOS(NetworkDevice):
                     # Yes
 
                     # Is the first element empty?
-                    if list_of_vlans_in_one_line[0] != '""':
+                    if list_of_vlans_in_one_line[0] != "":
 
                         # No it is not empty
 
@@ -2621,22 +3662,26 @@ class MikrotikRouterOS(NetworkDevice):
 
                             # Display info message
                             log.info(
-                                f"add_interface_to_vlan: get VLAN IDs: VLAN found: {vlan}"
+                                "add_interface_to_vlan: get VLAN IDs: VLAN found: %s",
+                                vlan,
                             )
 
                             # Get tagged list of interfaces
-                            tagged_list_of_interfaces = (
-                                line.split(" tagged=")[-1].split()[0].split(",")
+                            tagged_list_of_interfaces = record.get("tagged", "").split(
+                                ","
                             )
 
                             # Get untagged list of interfaces
-                            untagged_list_of_interfaces = (
-                                line.split(" untagged=")[-1].split()[0].split(",")
-                            )
+                            untagged_list_of_interfaces = record.get(
+                                "untagged", ""
+                            ).split(",")
 
                             # VLAN found
                             vlan_found = True
 
+                            # Line of the VLAN (updated in the output cache after the change)
+                            vlan_line = line
+
                             # Leave the loop
                             break
 
@@ -2654,15 +3699,17 @@ class MikrotikRouterOS(NetworkDevice):
 
         # Display info message
         log.info(
-            f"add_interface_to_vlan: get VLAN IDs: tagged_list_of_interfaces: {tagged_list_of_interfaces}"
+            "add_interface_to_vlan: get VLAN IDs: tagged_list_of_interfaces: %s",
+            tagged_list_of_interfaces,
         )
 
         # Display info message
         log.info(
-            f"add_interface_to_vlan: get VLAN IDs: untagged_list_of_interfaces: {untagged_list_of_interfaces}"
+            "add_interface_to_vlan: get VLAN IDs: untagged_list_of_interfaces: %s",
+            untagged_list_of_interfaces,
         )
 
-        # Check if tagged and untagged list have a value ['""']
+        # Check if tagged and untagged list have a value [''] (no interface)
 
         # Check if tagged_list_of_interfaces has just one element
         if len(tagged_list_of_interfaces) == 1:
@@ -2670,7 +3717,7 @@ class MikrotikRouterOS(NetworkDevice):
             # Yes just one
 
             # Check if that element is ""
-            if tagged_list_of_interfaces[0] == '""':
+            if tagged_list_of_interfaces[0] == "":
 
                 # Yes it is
 
@@ -2683,7 +3730,7 @@ class MikrotikRouterOS(NetworkDevice):
             # Yes just one
 
             # Check if that element is ""
-            if untagged_list_of_interfaces[0] == '""':
+            if untagged_list_of_interfaces[0] == "":
 
                 # Yes it is
 
@@ -2692,12 +3739,14 @@ class MikrotikRouterOS(NetworkDevice):
 
         # Display info message
         log.info(
-            f'add_interface_to_vlan: get VLAN IDs: after removing "": tagged_list_of_interfaces: {tagged_list_of_interfaces}'
+            'add_interface_to_vlan: get VLAN IDs: after removing "": tagged_list_of_interfaces: %s',
+            tagged_list_of_interfaces,
         )
 
         # Display info message
         log.info(
-            f'add_interface_to_vlan: get VLAN IDs: after removing "": untagged_list_of_interfaces: {untagged_list_of_interfaces}'
+            'add_interface_to_vlan: get VLAN IDs: after removing "": untagged_list_of_interfaces: %s',
+            untagged_list_of_interfaces,
         )
 
         # Check if mode is "access"
@@ -2722,7 +3771,7 @@ class MikrotikRouterOS(NetworkDevice):
             cmd = cmd.replace("<VLAN>", vlan_string)
 
             # Display info message
-            log.info(f"add_interface_to_vlan: mode access: vlan: cmd: {cmd}")
+            log.info("add_interface_to_vlan: mode access: vlan: cmd: %s", cmd)
 
             # Change the VLAN of the interface (in VLAN config of a bridge)
             output = await self.send_command(cmd)
@@ -2735,11 +3784,25 @@ class MikrotikRouterOS(NetworkDevice):
                 # Error with the VLAN value
 
                 # Display info message
-                log.error(f"add_interface_to_vlan: mode access: vlan: output: {output}")
+                log.error(
+                    "add_interface_to_vlan: mode access: vlan: output: %s", output
+                )
 
                 # Return an error
                 return return_status
 
+            # The VLAN table kept is updated (no new reading for the next change)
+            self.update_cached_vlan_table(
+                self.cmd_add_interface_to_vlan[0],
+                output_vlans,
+                vlan_line,
+                "untagged",
+                ",".join(untagged_list_of_interfaces),
+            )
+
+            # The ports of the bridge are changed: the outputs showing the interfaces are no more valid
+            self.clear_output_cache(self.cmd_get_interfaces)
+
             # "interface bridge port set [find interface=<INTERFACE>] pvid=<VLAN>",
 
             # Replace <INTERFACE> with the interface name
@@ -2749,7 +3812,7 @@ class MikrotikRouterOS(NetworkDevice):
             cmd = cmd.replace("<VLAN>", vlan_string)
 
             # Display info message
-            log.info(f"add_interface_to_vlan: mode access: port: cmd: {cmd}")
+            log.info("add_interface_to_vlan: mode access: port: cmd: %s", cmd)
 
             # Change the VLAN of the interface (in Port config of a bridge)
             output = await self.send_command(cmd)
@@ -2761,7 +3824,9 @@ class MikrotikRouterOS(NetworkDevice):
                 # Error with the VLAN value
 
                 # Display info message
-                log.error(f"add_interface_to_vlan: mode access: port: output: {output}")
+                log.error(
+                    "add_interface_to_vlan: mode access: port: output: %s", output
+                )
 
                 # Return an error
                 return return_status
@@ -2787,7 +3852,7 @@ class MikrotikRouterOS(NetworkDevice):
             cmd = cmd.replace("<VLAN>", vlan_string)
 
             # Display info message
-            log.info(f"add_interface_to_vlan: mode trunk or hybrid: cmd: {cmd}")
+            log.info("add_interface_to_vlan: mode trunk or hybrid: cmd: %s", cmd)
 
             # Change the description of the interface
             output = await self.send_command(cmd)
@@ -2802,12 +3867,21 @@ class MikrotikRouterOS(NetworkDevice):
 
                 # Display info message
                 log.error(
-                    f"add_interface_to_vlan: mode trunk/hybrid: port: output: {output}"
+                    "add_interface_to_vlan: mode trunk/hybrid: port: output: %s", output
                 )
 
                 # Return an error
                 return return_status
 
+            # The VLAN table kept is updated (no new reading for the next change)
+            self.update_cached_vlan_table(
+                self.cmd_add_interface_to_vlan[0],
+                output_vlans,
+                vlan_line,
+                "tagged",
+                ",".join(tagged_list_of_interfaces),
+            )
+
         # No error
         return_status = True
 
@@ -2848,9 +3922,9 @@ class MikrotikRouterOS(NetworkDevice):
         return_status = False
 
         # Display info message
-        log.info(f"remove_interface_from_vlan: input: interface: {interface}")
-        log.info(f"remove_interface_from_vlan: input: mode: {mode}")
-        log.info(f"remove_interface_from_vlan: input: vlan: {vlan}")
+        log.info("remove_interface_from_vlan: input: interface: %s", interface)
+        log.info("remove_interface_from_vlan: input: mode: %s", mode)
+        log.info("remove_interface_from_vlan: input: vlan: %s", vlan)
 
         # Get parameters
 
@@ -2900,32 +3974,30 @@ class MikrotikRouterOS(NetworkDevice):
         cmd = self.cmd_remove_interface_from_vlan[0]
 
         # Display info message
-        log.info(f"remove_interface_from_vlan: get VLAN IDs: cmd: {cmd}")
+        log.info("remove_interface_from_vlan: get VLAN IDs: cmd: %s", cmd)
 
-        # Change the VLAN of the interface (in VLAN config of a bridge)
-        output = await self.send_command(cmd)
+        # Get the VLANs of the bridges (output kept if "output_cache_ttl" is used)
+        output = output_vlans = await self.send_cached_command(cmd)
 
         # Display info message
-        log.info(f"remove_interface_from_vlan: get VLAN IDs: output: {output}")
-
-        # Convert a string into a list of strings
-        lines = output.splitlines()
+        log.info("remove_interface_from_vlan: get VLAN IDs: output: %s", output)
 
         # By default no VLAN found
         vlan_found = False
 
         # Check each line
-        for line in lines:
+        for line in output.splitlines():
+
+            # Get the fields of the line
+            record = parse_terse_line(line)
 
             # VLAN IDs in the line?
-            if "vlan-ids=" in line:
+            if "vlan-ids" in record:
 
                 # Yes
 
                 # Get VLAN IDs
-                list_of_vlans_in_one_line = (
-                    line.split(" vlan-ids=")[-1].split()[0].split(",")
-                )
+                list_of_vlans_in_one_line = record["vlan-ids"].split(",")
 
                 # Something returned?
                 if list_of_vlans_in_one_line:
@@ -2933,7 +4005,7 @@ class MikrotikRouterOS(NetworkDevice):
                     # Yes
 
                     # Is the first element empty?
-                    if list_of_vlans_in_one_line[0] != '""':
+                    if list_of_vlans_in_one_line[0] != "":
 
                         # No it is not empty
 
@@ -2944,22 +4016,26 @@ class MikrotikRouterOS(NetworkDevice):
 
                             # Display info message
                             log.info(
-                                f"remove_interface_from_vlan: get VLAN IDs: VLAN found: {vlan}"
+                                "remove_interface_from_vlan: get VLAN IDs: VLAN found: %s",
+                                vlan,
                             )
 
                             # Get tagged list of interfaces
-                            tagged_list_of_interfaces = (
-                                line.split(" tagged=")[-1].split()[0].split(",")
+                            tagged_list_of_interfaces = record.get("tagged", "").split(
+                                ","
                             )
 
                             # Get untagged list of interfaces
-                            untagged_list_of_interfaces = (
-                                line.split(" untagged=")[-1].split()[0].split(",")
-                            )
+                            untagged_list_of_interfaces = record.get(
+                                "untagged", ""
+                            ).split(",")
 
                             # VLAN found
                             vlan_found = True
 
+                            # Line of the VLAN (updated in the output cache after the change)
+                            vlan_line = line
+
                             # Leave the loop
                             break
 
@@ -2977,15 +4053,17 @@ class MikrotikRouterOS(NetworkDevice):
 
         # Display info message
         log.info(
-            f"remove_interface_from_vlan: get VLAN IDs: tagged_list_of_interfaces: {tagged_list_of_interfaces}"
+            "remove_interface_from_vlan: get VLAN IDs: tagged_list_of_interfaces: %s",
+            tagged_list_of_interfaces,
         )
 
         # Display info message
         log.info(
-            f"remove_interface_from_vlan: get VLAN IDs: untagged_list_of_interfaces: {untagged_list_of_interfaces}"
+            "remove_interface_from_vlan: get VLAN IDs: untagged_list_of_interfaces: %s",
+            untagged_list_of_interfaces,
         )
 
-        # Check if tagged and untagged list have a value ['""']
+        # Check if tagged and untagged list have a value [''] (no interface)
 
         # Check if tagged_list_of_interfaces has just one element
         if len(tagged_list_of_interfaces) == 1:
@@ -2993,7 +4071,7 @@ class MikrotikRouterOS(NetworkDevice):
             # Yes just one
 
             # Check if that element is ""
-            if tagged_list_of_interfaces[0] == '""':
+            if tagged_list_of_interfaces[0] == "":
 
                 # Yes it is
 
@@ -3006,7 +4084,7 @@ class MikrotikRouterOS(NetworkDevice):
             # Yes just one
 
             # Check if that element is ""
-            if untagged_list_of_interfaces[0] == '""':
+            if untagged_list_of_interfaces[0] == "":
 
                 # Yes it is
 
@@ -3015,12 +4093,14 @@ class MikrotikRouterOS(NetworkDevice):
 
         # Display info message
         log.info(
-            f'remove_interface_from_vlan: get VLAN IDs: after removing "": tagged_list_of_interfaces: {tagged_list_of_interfaces}'
+            'remove_interface_from_vlan: get VLAN IDs: after removing "": tagged_list_of_interfaces: %s',
+            tagged_list_of_interfaces,
         )
 
         # Display info message
         log.info(
-            f'remove_interface_from_vlan: get VLAN IDs: after removing "": untagged_list_of_interfaces: {untagged_list_of_interfaces}'
+            'remove_interface_from_vlan: get VLAN IDs: after removing "": untagged_list_of_interfaces: %s',
+            untagged_list_of_interfaces,
         )
 
         # Check if mode is "access"
@@ -3035,7 +4115,9 @@ class MikrotikRouterOS(NetworkDevice):
 
                 # Display info message
                 log.error(
-                    f"remove_interface_from_vlan: access: interface '{interface}' does not belong to VLAN {vlan_string}"
+                    "remove_interface_from_vlan: access: interface '%s' does not belong to VLAN %s",
+                    interface,
+                    vlan_string,
                 )
 
                 # Return an error
@@ -3066,7 +4148,7 @@ class MikrotikRouterOS(NetworkDevice):
             cmd = cmd.replace("<VLAN>", vlan_string)
 
             # Display info message
-            log.info(f"remove_interface_from_vlan: mode access: vlan: cmd: {cmd}")
+            log.info("remove_interface_from_vlan: mode access: vlan: cmd: %s", cmd)
 
             # Change the VLAN of the interface (in VLAN config of a bridge)
             output = await self.send_command(cmd)
@@ -3080,12 +4162,24 @@ class MikrotikRouterOS(NetworkDevice):
 
                 # Display info message
                 log.error(
-                    f"remove_interface_from_vlan: mode access: vlan: output: {output}"
+                    "remove_interface_from_vlan: mode access: vlan: output: %s", output
                 )
 
                 # Return an error
                 return return_status
 
+            # The VLAN table kept is updated (no new reading for the next change)
+            self.update_cached_vlan_table(
+                self.cmd_remove_interface_from_vlan[0],
+                output_vlans,
+                vlan_line,
+                "untagged",
+                ",".join(untagged_list_of_interfaces),
+            )
+
+            # The ports of the bridge are changed: the outputs showing the interfaces are no more valid
+            self.clear_output_cache(self.cmd_get_interfaces)
+
             # "interface bridge port set [find interface=<INTERFACE>] pvid=<VLAN>",
 
             # Replace <INTERFACE> with the interface name
@@ -3097,7 +4191,7 @@ class MikrotikRouterOS(NetworkDevice):
             cmd = cmd.replace("<VLAN>", "1")
 
             # Display info message
-            log.info(f"remove_interface_from_vlan: mode access: port: cmd: {cmd}")
+            log.info("remove_interface_from_vlan: mode access: port: cmd: %s", cmd)
 
             # Change the VLAN of the interface (in Port config of a bridge)
             output = await self.send_command(cmd)
@@ -3110,7 +4204,8 @@ class MikrotikRouterOS(NetworkDevice):
 
                 # Display info message
                 log.error(
-                    f"cmd_remove_interface_from_vlan: mode access: port: output: {output}"
+                    "cmd_remove_interface_from_vlan: mode access: port: output: %s",
+                    output,
                 )
 
                 # Return an error
@@ -3127,7 +4222,9 @@ class MikrotikRouterOS(NetworkDevice):
 
                 # Display info message
                 log.error(
-                    f"remove_interface_from_vlan: trunk/hybrid: interface '{interface}' does not belong to VLAN {vlan_string}"
+                    "remove_interface_from_vlan: trunk/hybrid: interface '%s' does not belong to VLAN %s",
+                    interface,
+                    vlan_string,
                 )
 
                 # Return an error
@@ -3158,7 +4255,7 @@ class MikrotikRouterOS(NetworkDevice):
             cmd = cmd.replace("<VLAN>", vlan_string)
 
             # Display info message
-            log.info(f"remove_interface_from_vlan: mode trunk or hybrid: cmd: {cmd}")
+            log.info("remove_interface_from_vlan: mode trunk or hybrid: cmd: %s", cmd)
 
             # Change the description of the interface
             output = await self.send_command(cmd)
@@ -3173,12 +4270,304 @@ class MikrotikRouterOS(NetworkDevice):
 
                 # Display info message
                 log.error(
-                    f"remove_interface_from_vlan: mode trunk/hybrid: port: output: {output}"
+                    "remove_interface_from_vlan: mode trunk/hybrid: port: output: %s",
+                    output,
                 )
 
                 # Return an error
                 return return_status
 
+            # The VLAN table kept is updated (no new reading for the next change)
+            self.update_cached_vlan_table(
+                self.cmd_remove_interface_from_vlan[0],
+                output_vlans,
+                vlan_line,
+                "tagged",
+                ",".join(tagged_list_of_interfaces),
+            )
+
+        # No error
+        return_status = True
+
+        # Return status
+        return return_status
+
+    async def apply_vlan_membership(self, membership=None):
+        """
+        Asyn method used to add several interfaces to VLANs of the device (bulk add_interface_to_vlan)
+
+        The VLAN table of the bridges is read once and the new lists of
+        tagged and untagged interfaces of each VLAN are computed. An access
+        interface is removed from the untagged interfaces of the VLAN it is
+        moved from. The interfaces already in their VLAN are ignored; only
+        the VLANs changed are sent with the "pvid" of the access interfaces
+        moved, all in one send_config_set (nothing is sent if nothing
+        changes or if a VLAN is not found).
+
+        Example:
+
+        await sw1.apply_vlan_membership({"ether2": ("access", 10), "ether3": ("trunk", 20)})
+
+
+        :param membership: mode (access, trunk, hybrid) and VLAN number of each interface
+        :type membership: dict
+
+        :return: Status. True = no error, False = error
+        :rtype: bool
+        """
+
+        # Display info message
+        log.info("apply_vlan_membership")
+
+        # By default result status is having an error
+        return_status = False
+
+        # "membership" found?
+        if not membership:
+
+            # No
+
+            # So no action can be performed
+
+            # Display info message
+            log.info("apply_vlan_membership: no membership specified")
+
+            # Return status
+            return return_status
+
+        # Get all VLAN IDs
+
+        # Get command
+        cmd = self.cmd_add_interface_to_vlan[0]
+
+        # Display info message
+        log.info("apply_vlan_membership: get VLAN IDs: cmd: %s", cmd)
+
+        # Get the VLANs of the bridges (output kept if "output_cache_ttl" is used)
+        output = await self.send_cached_command(cmd)
+
+        # Display info message
+        log.info("apply_vlan_membership: get VLAN IDs: output: %s", output)
+
+        # Lines of the VLAN table (key: VLAN ID as a string)
+        dict_vlan_lines = {}
+
+        # VLAN used in the commands, tagged and untagged interfaces of each line of the VLAN table
+        list_of_line_vlans = []
+        list_of_tagged = []
+        list_of_untagged = []
+
+        # Check each line
+        for record in parse_terse(output):
+
+            # VLAN IDs in the line?
+            if "vlan-ids" in record:
+
+                # Yes
+
+                # VLANs of the line (without "")
+                list_of_vlans_in_one_line = [
+                    vlan_id for vlan_id in record["vlan-ids"].split(",") if vlan_id
+                ]
+
+                # Some VLAN found?
+                if not list_of_vlans_in_one_line:
+
+                    # No
+                    continue
+
+                # Save the interfaces of the line (without "")
+                list_of_line_vlans.append(list_of_vlans_in_one_line[0])
+                list_of_tagged.append(
+                    [name for name in record.get("tagged", "").split(",") if name]
+                )
+                list_of_untagged.append(
+                    [name for name in record.get("untagged", "").split(",") if name]
+                )
+
+                # Each VLAN of the line
+                for vlan_id in list_of_vlans_in_one_line:
+                    dict_vlan_lines[vlan_id] = len(list_of_line_vlans) - 1
+
+        # Lines of the VLAN table with untagged or tagged interfaces changed
+        set_of_untagged_changed = set()
+        set_of_tagged_changed = set()
+
+        # Lines of the VLAN table with untagged interfaces removed (VLANs the interfaces are moved from)
+        set_of_untagged_removed = set()
+
+        # Commands setting the "pvid" of the access interfaces
+        list_of_pvid_commands = []
+
+        # Check each interface
+        for interface, (mode, vlan) in membership.items():
+
+            # Convert VLAN (integer) to string
+            vlan_string = str(vlan)
+
+            # VLAN found?
+            if vlan_string not in dict_vlan_lines:
+
+                # No VLAN found
+
+                # So it is impossible to add interface to a non-existing VLAN
+                # (nothing is sent to the device)
+
+                # Display info message
+                log.error(
+                    "apply_vlan_membership: interface %s: VLAN %s not found",
+                    interface,
+                    vlan_string,
+                )
+
+                return return_status
+
+            # Line of the VLAN
+            line = dict_vlan_lines[vlan_string]
+
+            # Check if mode is "access"
+            if mode == "access":
+
+                # Access mode interface
+
+                # By default the interface is already an untagged interface of the VLAN only
+                changed = False
+
+                # Remove the interface from the untagged interfaces of the other VLANs
+                # (the VLAN it is moved from)
+                for other_line, untagged in enumerate(list_of_untagged):
+                    if other_line != line and interface in untagged:
+                        untagged.remove(interface)
+                        set_of_untagged_changed.add(other_line)
+                        set_of_untagged_removed.add(other_line)
+                        changed = True
+
+                # Interface in the tagged interfaces of the VLAN?
+                if interface in list_of_tagged[line]:
+
+                    # Yes, it is removed (not tagged and untagged at the same time)
+                    list_of_tagged[line].remove(interface)
+                    set_of_tagged_changed.add(line)
+
+                # Interface not yet in the untagged interfaces?
+                if interface not in list_of_untagged[line]:
+
+                    # Yes, the interface is added
+                    list_of_untagged[line].append(interface)
+                    set_of_untagged_changed.add(line)
+                    changed = True
+
+                # Interface already in the VLAN?
+                if not changed:
+
+                    # Yes, nothing to change
+
+                    # Display info message
+                    log.info(
+                        "apply_vlan_membership: %s already in VLAN %s (%s)",
+                        interface,
+                        vlan_string,
+                        mode,
+                    )
+
+                    continue
+
+                # "interface bridge port set [find interface=<INTERFACE>] pvid=<VLAN>",
+                list_of_pvid_commands.append(
+                    self.cmd_add_interface_to_vlan[3]
+                    .replace("<INTERFACE>", interface)
+                    .replace("<VLAN>", vlan_string)
+                )
+
+            else:
+
+                # trunk or hybrid mode
+
+                # Interface already in the tagged interfaces?
+                if interface in list_of_tagged[line]:
+
+                    # Yes, nothing to change
+
+                    # Display info message
+                    log.info(
+                        "apply_vlan_membership: %s already in VLAN %s (%s)",
+                        interface,
+                        vlan_string,
+                        mode,
+                    )
+
+                    continue
+
+                # Interface in the untagged interfaces of the VLAN?
+                if interface in list_of_untagged[line]:
+
+                    # Yes, it is removed (not tagged and untagged at the same time)
+                    list_of_untagged[line].remove(interface)
+                    set_of_untagged_changed.add(line)
+
+                # The interface is added
+                list_of_tagged[line].append(interface)
+                set_of_tagged_changed.add(line)
+
+        # Commands to send
+        list_of_commands = []
+
+        # Each line of the VLAN table with untagged interfaces changed
+        # (VLANs the interfaces are moved from first: an interface is never untagged in 2 VLANs)
+        for line in sorted(
+            set_of_untagged_changed,
+            key=lambda line: (line not in set_of_untagged_removed, line),
+        ):
+
+            # "interface bridge vlan set [find vlan-ids=<VLAN>] untagged=<INTERFACE>",
+            # ('""' for no interface: Mikrotik format)
+            list_of_commands.append(
+                self.cmd_add_interface_to_vlan[1]
+                .replace("<INTERFACE>", ",".join(list_of_untagged[line]) or '""')
+                .replace("<VLAN>", list_of_line_vlans[line])
+            )
+
+        # Each line of the VLAN table with tagged interfaces changed
+        for line in sorted(set_of_tagged_changed):
+
+            # "interface bridge vlan set [find vlan-ids=<VLAN>] tagged=<INTERFACE>",
+            list_of_commands.append(
+                self.cmd_add_interface_to_vlan[2]
+                .replace("<INTERFACE>", ",".join(list_of_tagged[line]) or '""')
+                .replace("<VLAN>", list_of_line_vlans[line])
+            )
+
+        # The "pvid" are set once the interfaces are in the VLANs
+        list_of_commands += list_of_pvid_commands
+
+        # Display info message
+        log.info("apply_vlan_membership: commands: %s", list_of_commands)
+
+        # Nothing to change?
+        if not list_of_commands:
+
+            # Yes, nothing is sent
+
+            # No error
+            return True
+
+        # Send all the commands (the output cache is cleared)
+        output = await self.send_config_set(list_of_commands)
+
+        # Check if there is an error
+        # "failure: interface cannot be in tagged and untagged at the same time"
+        # "failure: each interface can appear only once"
+        # "value of pvid out of range (1..4094)"
+        if "failure" in output or "out of range" in output:
+
+            # Error with a VLAN value
+
+            # Display info message
+            log.error("apply_vlan_membership: output: %s", output)
+
+            # Return an error
+            return return_status
+
         # No error
         return_status = True
 
@@ -3197,6 +4586,12 @@ class MikrotikRouterOS(NetworkDevice):
         # Display info message
         log.info("get_interfaces_ip")
 
+        # Getter served by the RouterOS API?
+        if self._api is not None:
+
+            # Yes, the records have the same fields as the lines of the CLI
+            return self.parse_interfaces_ip(await self._api.print("/ip/address"))
+
         # Get command
         cmd = self.cmd_get_interfaces_ip
 
@@ -3204,16 +4599,27 @@ class MikrotikRouterOS(NetworkDevice):
         output = await self.send_command(cmd)
 
         # Display info message
-        log.info(f"get_interfaces_ip: output: '{output}'")
+        log.info("get_interfaces_ip: output: '%s'", output)
+
+        # Get the IP addresses from the fields of each line
+        return self.parse_interfaces_ip(parse_terse(output))
+
+    def parse_interfaces_ip(self, records):
+        """
+        Method used to get the IP addresses of the interfaces from the fields of the lines of cmd_get_interfaces_ip (or from the records of the RouterOS API)
+
+        :param records: the fields of each line (or each record)
+        :type records: list of dict
+
+        :return: the interfaces and their IP addresses
+        :rtype: dict of dict
+        """
 
         # By default the dictionary returned is empty
         returned_dict = {}
 
-        # Convert a string into a list of strings
-        lines = output.splitlines()
-
-        # Read each line
-        for line in lines:
+        # Read each record
+        for record in records:
 
             # Set default values for variables
             interface = None
@@ -3221,12 +4627,12 @@ class MikrotikRouterOS(NetworkDevice):
             prefix = None
 
             # Get interface
-            if " interface=" in line:
-                interface = line.split(" interface=")[-1].split()[0]
+            if "interface" in record:
+                interface = record["interface"]
 
             # Get IP address and prefix
-            if " address=" in line:
-                full_address = line.split(" address=")[-1].split()[0]
+            if "address" in record:
+                full_address = record["address"]
 
                 # Separate IP address from prefix
                 (address, prefix_string) = full_address.split("/")
@@ -3306,7 +4712,7 @@ class MikrotikRouterOS(NetworkDevice):
             # No
 
             # Display info message
-            log.error(f"add_static_route: no network specified: {network_ip}")
+            log.error("add_static_route: no network specified: %s", network_ip)
 
             # Return an error
             return return_status
@@ -3317,7 +4723,7 @@ class MikrotikRouterOS(NetworkDevice):
             # No
 
             # Display info message
-            log.error(f"add_static_route: no prefix_length specified: {prefix_length}")
+            log.error("add_static_route: no prefix_length specified: %s", prefix_length)
 
             # Return an error
             return return_status
@@ -3329,7 +4735,8 @@ class MikrotikRouterOS(NetworkDevice):
 
             # Display info message
             log.error(
-                f"add_static_route: prefix_length incorrect value (1...32): {prefix_length}"
+                "add_static_route: prefix_length incorrect value (1...32): %s",
+                prefix_length,
             )
 
             # Return an error
@@ -3342,7 +4749,7 @@ class MikrotikRouterOS(NetworkDevice):
 
             # Display info message
             log.error(
-                f"add_static_route: no destination_ip specified: {destination_ip}"
+                "add_static_route: no destination_ip specified: %s", destination_ip
             )
 
             # Return an error
@@ -3354,7 +4761,7 @@ class MikrotikRouterOS(NetworkDevice):
             # No
 
             # Display info message
-            log.error(f"add_static_route: no metric specified: {metric}")
+            log.error("add_static_route: no metric specified: %s", metric)
 
             # Return an error
             return return_status
@@ -3374,7 +4781,10 @@ class MikrotikRouterOS(NetworkDevice):
         cmd = cmd.replace("<METRIC>", str(metric))
 
         # Display info message
-        log.info(f"add_static_route: cmd: {cmd}")
+        log.info("add_static_route: cmd: %s", cmd)
+
+        # The routes are changed: the routing table kept is no more valid
+        self.clear_output_cache((self.cmd_get_routing_table,))
 
         # Sending command
         await self.send_command(cmd)
@@ -3426,7 +4836,7 @@ class MikrotikRouterOS(NetworkDevice):
             # No
 
             # Display info message
-            log.error(f"remove_static_route: no network specified: {network_ip}")
+            log.error("remove_static_route: no network specified: %s", network_ip)
 
             # Return an error
             return return_status
@@ -3438,7 +4848,7 @@ class MikrotikRouterOS(NetworkDevice):
 
             # Display info message
             log.error(
-                f"remove_static_route: no prefix_length specified: {prefix_length}"
+                "remove_static_route: no prefix_length specified: %s", prefix_length
             )
 
             # Return an error
@@ -3451,7 +4861,8 @@ class MikrotikRouterOS(NetworkDevice):
 
             # Display info message
             log.error(
-                f"remove_static_route: prefix_length incorrect value (1...32): {prefix_length}"
+                "remove_static_route: prefix_length incorrect value (1...32): %s",
+                prefix_length,
             )
 
             # Return an error
@@ -3466,7 +4877,10 @@ class MikrotikRouterOS(NetworkDevice):
         cmd = cmd.replace("<PREFIXLENGTH>", str(prefix_length))
 
         # Display info message
-        log.info(f"remove_static_route: cmd: {cmd}")
+        log.info("remove_static_route: cmd: %s", cmd)
+
+        # The routes are changed: the routing table kept is no more valid
+        self.clear_output_cache((self.cmd_get_routing_table,))
 
         # Sending command
         await self.send_command(cmd)
@@ -0,0 +1,556 @@
+# Python library import
+import asyncio, hashlib, logging, ssl as ssl_module
+
+# Declaration of constant values
+
+# Max data to read in read function
+MAX_BUFFER_DATA = 65535
+
+# Logger of netscud (same logger as the one of the devices)
+log = logging.getLogger("netscud")
+
+# Default ports of the RouterOS API
+API_PORT = 8728
+API_SSL_PORT = 8729
+
+
+def encode_length(length):
+    """
+    Function used to encode the length of a word of the RouterOS API
+
+    :param length: the length of the word (in bytes)
+    :type length: int
+
+    :return: the length encoded (1 to 5 bytes)
+    :rtype: bytes
+    """
+
+    # 1 byte?
+    if length < 0x80:
+        return bytes((length,))
+
+    # 2 bytes?
+    if length < 0x4000:
+        return (length | 0x8000).to_bytes(2, "big")
+
+    # 3 bytes?
+    if length < 0x200000:
+        return (length | 0xC00000).to_bytes(3, "big")
+
+    # 4 bytes?
+    if length < 0x10000000:
+        return (length | 0xE0000000).to_bytes(4, "big")
+
+    # 5 bytes
+    return b"\xf0" + length.to_bytes(4, "big")
+
+
+def encode_sentence(words):
+    """
+    Function used to encode a sentence of the RouterOS API
+
+    A sentence is a list of words (each word with its length before) ended
+    by an empty word.
+
+    :param words: the words of the sentence (eg. ["/ip/arp/print", "=.proplist=address"])
+    :type words: list
+
+    :return: the sentence encoded
+    :rtype: bytes
+    """
+
+    # Data to send
+    data = bytearray()
+
+    # Add each word with its length
+    for word in words:
+        encoded_word = word.encode("utf-8")
+        data += encode_length(len(encoded_word))
+        data += encoded_word
+
+    # End of the sentence (empty word)
+    data += b"\x00"
+
+    return bytes(data)
+
+
+class SentenceDecoder:
+    """
+    Class used to get the sentences of the RouterOS API from the data received
+
+    The data is read by chunks (not word by word) and the sentences are
+    decoded from the chunks. A sentence split over several chunks is given
+    once all its words are received.
+    """
+
+    def __init__(self):
+
+        # Data received not yet decoded (end of the last chunk)
+        self._data = b""
+
+        # Words of the sentence being decoded
+        self._words = []
+
+    def feed(self, data):
+        """
+        Method used to add data received and to get the sentences completed
+
+        :param data: the data received
+        :type data: bytes
+
+        :return: the sentences completed (each sentence is a list of words)
+        :rtype: list
+        """
+
+        # Sentences completed
+        sentences = []
+
+        # Data to decode
+        data = self._data + data if self._data else data
+        size = len(data)
+        position = 0
+
+        # Words of the current sentence
+        words = self._words
+
+        # Decode all the complete words
+        while position < size:
+
+            # First byte of the length
+            first_byte = data[position]
+
+            # Length on 1, 2, 3, 4 or 5 bytes
+            if first_byte < 0x80:
+                length, start = first_byte, position + 1
+            elif first_byte < 0xC0:
+                length, start = (
+                    int.from_bytes(data[position : position + 2], "big") & 0x3FFF,
+                    position + 2,
+                )
+            elif first_byte < 0xE0:
+                length, start = (
+                    int.from_bytes(data[position : position + 3], "big") & 0x1FFFFF,
+                    position + 3,
+                )
+            elif first_byte < 0xF0:
+                length, start = (
+                    int.from_bytes(data[position : position + 4], "big") & 0xFFFFFFF,
+                    position + 4,
+                )
+            else:
+                length, start = (
+                    int.from_bytes(data[position + 1 : position + 5], "big"),
+                    position + 5,
+                )
+
+            # Word not completely received?
+            if start + length > size:
+
+                # Yes
+
+                # Wait for the next chunk
+                break
+
+            # End of the sentence (empty word)?
+            if length == 0:
+
+                # Yes
+                sentences.append(words)
+                words = []
+
+            else:
+
+                # No, a word
+                words.append(data[start : start + length].decode("utf-8", "replace"))
+
+            # Next word
+            position = start + length
+
+        # Save the data not decoded and the words of the sentence not complete
+        self._data = data[position:]
+        self._words = words
+
+        # Return the sentences completed
+        return sentences
+
+
+class RouterOSAPI:
+    """
+    Class used to send commands to a Mikrotik device with the RouterOS API
+
+    The RouterOS API (port 8728, or 8729 with SSL) gives the records of a
+    command directly (list of dictionaries) instead of the text displayed
+    by the CLI. Each command gets a tag, so several commands can be sent at
+    the same time on the same connection: the answers are given back to
+    the right command whatever their order.
+
+
+    :param ip: the ip address of the device
+    :type ip: str
+
+    :param username: the username used for the connection
+    :type username: str
+
+    :param password: the password used for the connection
+    :type password: str
+
+    :param port: optional, the port of the API. Default value is 8728 (8729 with SSL)
+    :type port: int
+
+    :param ssl: optional, True or a SSLContext to use the API with SSL. Default value is None (no SSL)
+    :type ssl: bool or ssl.SSLContext
+
+    :param timeout: optional, timeout in seconds of the connection and of each command. Default value is 10
+    :type timeout: float
+    """
+
+    def __init__(self, ip, username, password, port=None, ssl=None, timeout=10):
+
+        self.ip = ip
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+
+        # SSL used?
+        if ssl is True:
+
+            # Yes, with the default checks of the certificate
+            ssl = ssl_module.create_default_context()
+
+        self.ssl = ssl or None
+
+        # Port by default (with or without SSL)
+        self.port = port or (API_SSL_PORT if self.ssl else API_PORT)
+
+        # Streams of the connection
+        self._reader = None
+        self._writer = None
+
+        # Task reading the answers of the device
+        self._read_task = None
+
+        # Number of the next tag
+        self._next_tag = 0
+
+        # Commands waiting for their answer (key: tag; value: [future, records, error])
+        self._pending = {}
+
+    async def __aenter__(self):
+        """
+        Context manager opening the connection
+        """
+
+        await self.connect()
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+        Context manager closing the connection
+        """
+
+        await self.disconnect()
+
+    async def connect(self):
+        """
+        Asyn method used to open the connection and to log in
+        """
+
+        # Display info message
+        log.info("RouterOSAPI: connect: %s:%s", self.ip, self.port)
+
+        # Open the connection
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.ip, self.port, ssl=self.ssl),
+            timeout=self.timeout,
+        )
+
+        # Start the reading of the answers
+        self._read_task = asyncio.ensure_future(self._read_answers())
+
+        try:
+
+            # Login (RouterOS 6.43 and later)
+            answer = await self.talk(
+                "/login", {"name": self.username, "password": self.password}
+            )
+
+            # Challenge given (RouterOS older than 6.43)?
+            if answer and "ret" in answer[-1]:
+
+                # Yes
+
+                # The password is sent hashed with the challenge
+                response = hashlib.md5(
+                    b"\x00"
+                    + self.password.encode("utf-8")
+                    + bytes.fromhex(answer[-1]["ret"])
+                ).hexdigest()
+
+                # Login with the hash
+                await self.talk(
+                    "/login", {"name": self.username, "response": "00" + response}
+                )
+
+        except Exception:
+
+            # Login failed
+
+            # Close the connection
+            await self.disconnect()
+
+            # Exception propagation
+            raise
+
+        # Display info message
+        log.info("RouterOSAPI: connect: logged in")
+
+    async def disconnect(self):
+        """
+        Asyn method used to close the connection
+        """
+
+        # Display info message
+        log.info("RouterOSAPI: disconnect")
+
+        # Stop the reading of the answers
+        if self._read_task is not None:
+            self._read_task.cancel()
+            await asyncio.gather(self._read_task, return_exceptions=True)
+            self._read_task = None
+
+        # Close the connection
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+        # The commands still waiting get an error
+        self._fail_pending(Exception("RouterOSAPI: connection closed"))
+
+    async def talk(self, command, attributes=None, queries=None, timeout=None):
+        """
+        Asyn method used to send a command and to get its answer
+
+        Several commands can be sent at the same time (for instance with
+        asyncio.gather): each one gets its own answer.
+
+        :param command: the command (eg. "/ip/arp/print")
+        :type command: str
+
+        :param attributes: optional, the attributes of the command (eg. {"address": "192.168.0.1", "interface": "ether1"})
+        :type attributes: dict
+
+        :param queries: optional, the queries of a "print" command (eg. ["interface=ether1"] or ["#|"])
+        :type queries: list
+
+        :param timeout: optional, a timeout in seconds. Default value is the timeout of the connection
+        :type timeout: float
+
+        :return: the records given by the device (one dictionary per record; the "done" sentence is the last record if it has values)
+        :rtype: list of dict
+        """
+
+        # Connection open?
+        if self._writer is None or self._read_task.done():
+
+            # No
+            raise Exception("RouterOSAPI: not connected")
+
+        # Tag of the command
+        tag = str(self._next_tag)
+        self._next_tag += 1
+
+        # Words of the command
+        words = [command]
+        words += [f"={key}={value}" for key, value in (attributes or {}).items()]
+        words += [f"?{query}" for query in (queries or [])]
+        words.append(f".tag={tag}")
+
+        # Display info message
+        log.info("RouterOSAPI: talk: %s", command)
+
+        # Save the command waiting for its answer
+        future = asyncio.get_running_loop().create_future()
+        self._pending[tag] = [future, [], None]
+
+        try:
+
+            # Send the command (a whole sentence at once)
+            self._writer.write(encode_sentence(words))
+            await self._writer.drain()
+
+            # Wait for the answer
+            return await asyncio.wait_for(
+                future, timeout=self.timeout if timeout is None else timeout
+            )
+
+        finally:
+
+            # The command is no more waiting
+            self._pending.pop(tag, None)
+
+    async def print(self, path, queries=None, proplist=None, timeout=None):
+        """
+        Asyn method used to get the records of a menu
+
+        :param path: the menu (eg. "/ip/arp" or "/interface/bridge/host")
+        :type path: str
+
+        :param queries: optional, the queries used to filter the records (eg. ["dynamic=true"])
+        :type queries: list
+
+        :param proplist: optional, the properties to get (all by default)
+        :type proplist: list
+
+        :param timeout: optional, a timeout in seconds. Default value is the timeout of the connection
+        :type timeout: float
+
+        :return: the records (one dictionary per record)
+        :rtype: list of dict
+        """
+
+        # Properties to get
+        attributes = {".proplist": ",".join(proplist)} if proplist else None
+
+        # Send the command and return the records
+        return await self.talk(
+            path.rstrip("/") + "/print", attributes, queries, timeout=timeout
+        )
+
+    async def _read_answers(self):
+        """
+        Asyn method used to read the answers of the device and to give them to their commands
+        """
+
+        try:
+
+            # Decoder of the sentences
+            decoder = SentenceDecoder()
+
+            # Read all the data
+            while True:
+
+                # Read the data received
+                data = await self._reader.read(MAX_BUFFER_DATA)
+
+                # Connection closed?
+                if not data:
+
+                    # Yes
+                    raise Exception("RouterOSAPI: connection closed by the device")
+
+                # Give the answers to the commands
+                for words in decoder.feed(data):
+                    self._dispatch(words)
+
+        except asyncio.CancelledError:
+
+            # Connection closed
+            raise
+
+        except Exception as error:
+
+            # Connection lost or fatal error
+
+            # Display error message
+            log.error("RouterOSAPI: _read_answers: error: %r", error)
+
+            # The commands waiting get the error
+            self._fail_pending(error)
+
+    def _dispatch(self, words):
+        """
+        Method used to give a sentence received to the command waiting for it
+
+        :param words: the words of the sentence
+        :type words: list
+        """
+
+        # Empty sentence?
+        if not words:
+
+            # Yes
+            return
+
+        # Type of the sentence ("!re", "!done", "!trap", "!fatal") and values
+        reply, record, tag = words[0], {}, None
+        for word in words[1:]:
+
+            # Tag of the command?
+            if word.startswith(".tag="):
+
+                # Yes
+                tag = word[5:]
+
+            # Attribute ("=key=value")?
+            elif word.startswith("="):
+
+                # Yes
+                key, _, value = word[1:].partition("=")
+                record[key] = value
+
+        # Fatal error (the device closes the connection)?
+        if reply == "!fatal":
+
+            # Yes
+            raise Exception(f"RouterOSAPI: fatal error: {' '.join(words[1:])}")
+
+        # Get the command of the answer
+        pending = self._pending.get(tag)
+
+        # Command no more waiting (timeout)?
+        if pending is None:
+
+            # Yes
+            return
+
+        future, records, error = pending
+
+        # Record?
+        if reply == "!re":
+
+            # Yes
+            records.append(record)
+
+        # Error?
+        elif reply == "!trap":
+
+            # Yes
+
+            # The error is given with the end of the answer
+            pending[2] = Exception(
+                f"RouterOSAPI: error: {record.get('message', record)}"
+            )
+
+        # End of the answer?
+        elif reply == "!done" and not future.done():
+
+            # Yes
+
+            # Error?
+            if error:
+
+                # Yes
+                future.set_exception(error)
+
+            else:
+
+                # No
+
+                # Values given with the end of the answer (eg. "ret")?
+                if record:
+                    records.append(record)
+
+                future.set_result(records)
+
+    def _fail_pending(self, error):
+        """
+        Method used to give an error to all the commands waiting for their answer
+
+        :param error: the error
+        :type error: Exception
+        """
+
+        for future, _, _ in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
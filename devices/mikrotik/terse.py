@@ -0,0 +1,316 @@
+# Python library import
+import re
+
+# Declaration of constant values
+
+# Field of a line with escaped characters in a quoted value ('key="value \"quoted\""')
+# An unquoted value goes up to the next "key=" (it can have spaces)
+_ESCAPED_LINE_FIELD = re.compile(
+    r'(?:^|(?<=\s))([^\s="]+)=("(?:[^"\\]|\\.)*"|\S*(?:\s+(?![^\s="]+=)\S+)*)'
+)
+
+# Escaped characters of a quoted value (\" and \\)
+_ESCAPED_CHARACTER = re.compile(r'\\(["\\])')
+
+
+def _add_unquoted_fields(text, fields):
+    """
+    Function used to get the fields of a text without quotes
+
+    The text is split on the "=" characters, each part being the value of
+    a field followed by the name of the next field.
+
+    :param text: the text ("<index> <flags> key1=value1 key2=value2 ...")
+    :type text: str
+
+    :param fields: the dictionary where the fields are added
+    :type fields: dict
+
+    :return: the name of the last field (its value is the quoted value after the text if the text ends with "=")
+    :rtype: str
+    """
+
+    # Split the text on "=": "<index> <flags> key1", "value1 key2", ..., "valueN"
+    parts = text.split("=")
+
+    # Name of the first field (last word before the first "=")
+    key = parts[0].rpartition(" ")[2]
+
+    # Read the values (each one followed by the name of the next field)
+    for part in parts[1:-1]:
+        value, _, next_key = part.rpartition(" ")
+        fields[key] = value.rstrip()
+        key = next_key
+
+    # Last value of the text
+    if len(parts) > 1:
+        fields[key] = parts[-1].strip()
+
+    # Return the name of the last field
+    return key
+
+
+def parse_terse_line(line):
+    """
+    Function used to get the fields of a line of a Mikrotik "print terse" command
+
+    The line is read once. The index and the flags at the beginning of the
+    line are not returned. A value without quotes goes up to the next field
+    (it can have spaces). The quotes of the quoted values are removed (eg.
+    'comment="my vlan"' gives "my vlan" and 'identity=""' gives "").
+
+    Example: ' 0 D address=192.168.0.2 mac-address=00:0C:42:00:00:01 interface=bridge1'
+    gives {'address': '192.168.0.2', 'mac-address': '00:0C:42:00:00:01', 'interface': 'bridge1'}
+
+    :param line: a line of the output
+    :type line: str
+
+    :return: the fields of the line (name: value)
+    :rtype: dict
+    """
+
+    # Fields of the line
+    fields = {}
+
+    # Quoted value in the line?
+    if '"' not in line:
+
+        # No
+        _add_unquoted_fields(line, fields)
+
+    # Escaped character in a quoted value?
+    elif "\\" in line:
+
+        # Yes
+
+        # The quotes are found by a regular expression (slower)
+        for key, value in _ESCAPED_LINE_FIELD.findall(line):
+            fields[key] = (
+                _ESCAPED_CHARACTER.sub(r"\1", value[1:-1])
+                if value[:1] == '"'
+                else value
+            )
+
+    else:
+
+        # Quoted values without escaped character
+
+        # Split the line on the quotes: text, quoted value, text, quoted value, ..., text
+        segments = line.split('"')
+
+        # Position of the text after the last quoted value
+        last = len(segments) - 1
+
+        # Read the text and the quoted value after it
+        for index in range(0, last, 2):
+
+            # Fields of the text; the quoted value is the value of its last field
+            fields[_add_unquoted_fields(segments[index], fields)] = segments[index + 1]
+
+        # Some text after the last quoted value? (nothing if the line ends with a quoted value)
+        if segments[last]:
+
+            # Yes
+            _add_unquoted_fields(segments[last], fields)
+
+    # Return the fields
+    return fields
+
+
+def parse_terse(output, fields=None):
+    """
+    Generator used to get the records of the output of a Mikrotik "print terse" command
+
+    The lines without field are skipped.
+
+    :param output: the output of the command
+    :type output: str
+
+    :param fields: optional, the names of the fields to get. If given, a tuple of the values is given for each line (None for a missing field) instead of a dictionary. Default value is None (dictionary)
+    :type fields: list
+
+    :return: the records, one for each line with fields
+    :rtype: dict or tuple
+    """
+
+    # Read each line
+    for line in output.splitlines():
+
+        # Get the fields of the line
+        record = parse_terse_line(line)
+
+        # Some fields found?
+        if record:
+
+            # Yes
+
+            # Give the record (dictionary or tuple of the values wanted)
+            yield (
+                record
+                if fields is None
+                else tuple(record.get(field) for field in fields)
+            )
+
+
+def parse_terse_values(lines, fields):
+    """
+    Generator used to get the values of a few fields of the lines of a Mikrotik "print terse" command
+
+    Faster than parse_terse for the fields with a single word value (IP
+    address, MAC address, name of an interface, etc.; RouterOS puts the
+    values with spaces between quotes): each value is found with a
+    substring search in the text before the first quote of the line, so
+    a quoted value with " field=" inside is never read as a field. If a
+    field is not found in that text while the line has quoted values (a
+    field after a quoted value or a quoted value), the whole line is read
+    by parse_terse_line.
+
+    Example: parse_terse_values(output.splitlines(), ("address", "interface"))
+
+    :param lines: the lines of the output (each line starts with its index)
+    :type lines: list of str
+
+    :param fields: the names of the fields to get
+    :type fields: list
+
+    :return: a tuple of the values for each line (None for a missing field)
+    :rtype: tuple
+    """
+
+    # Text searched before each value (" address=", etc.)
+    keys = [" " + field + "=" for field in fields]
+
+    # Read each line
+    for line in lines:
+
+        # Text before the first quote (the whole line if there is no quote)
+        text, quote, _ = line.partition('"')
+
+        # Values found
+        values = []
+
+        # Search each field
+        for key in keys:
+
+            # Get the text after the name of the field
+            _, found, value = text.partition(key)
+
+            # Field found?
+            if found:
+
+                # Yes
+
+                # The value goes up to the next space
+                end = value.find(" ")
+
+                # Space found?
+                if end != -1:
+
+                    # Yes
+                    values.append(value[:end])
+                    continue
+
+                # End of the line?
+                if not quote:
+
+                    # Yes
+                    values.append(value.strip())
+                    continue
+
+            # Field not found and no quoted value?
+            elif not quote:
+
+                # Yes, the field is missing
+                values.append(None)
+                continue
+
+            # The field can be after a quoted value or it has a quoted value
+
+            # The whole line is read
+            record = parse_terse_line(line)
+            values = [record.get(field) for field in fields]
+            break
+
+        # Give the values of the line
+        yield tuple(values)
+
+
+def replace_terse_value(line, field, value):
+    """
+    Function used to change the value of a field in a line of a Mikrotik "print terse" command
+
+    Used to update a line kept after a change of the device (eg. the
+    untagged interfaces of a VLAN). Only a value without quotes is
+    changed; the new value must not have spaces or quotes.
+
+    Example: replace_terse_value(' 0 bridge=bridge1 vlan-ids=10 untagged=ether1', 'untagged', 'ether1,ether2')
+    gives ' 0 bridge=bridge1 vlan-ids=10 untagged=ether1,ether2'
+
+    :param line: a line of the output
+    :type line: str
+
+    :param field: the name of the field
+    :type field: str
+
+    :param value: the new value of the field
+    :type value: str
+
+    :return: the new line or None if the value cannot be changed (field not found, quoted value, escaped character)
+    :rtype: str
+    """
+
+    # New value with a space or a quote or escaped character in the line?
+    if " " in value or '"' in value or "\\" in line:
+
+        # Yes, the line is not changed
+        return None
+
+    # Text searched before the value
+    key = " " + field + "="
+
+    # Split the line on the quotes: text, quoted value, text, quoted value, ..., text
+    segments = line.split('"')
+
+    # Position of the text after the last quoted value
+    last = len(segments) - 1
+
+    # Search the field in the texts (not in the quoted values)
+    for index in range(0, last + 1, 2):
+
+        # Position of the field in the text
+        start = segments[index].find(key)
+
+        # Field found?
+        if start == -1:
+
+            # No
+            continue
+
+        # Beginning of the value
+        start += len(key)
+
+        # The value goes up to the next space
+        end = segments[index].find(" ", start)
+
+        # Space found?
+        if end == -1:
+
+            # No
+
+            # Quoted value after the text?
+            if index != last:
+
+                # Yes, the line is not changed
+                return None
+
+            # The value goes up to the end of the line
+            end = len(segments[index])
+
+        # Change the value
+        segments[index] = segments[index][:start] + value + segments[index][end:]
+
+        # Give the new line
+        return '"'.join(segments)
+
+    # Field not found
+    return None
@@ -0,0 +1,103 @@
+# Python library import
+import asyncio, hashlib, logging, sys, time
+from netscud.devices.mikrotik.mikrotik_routeros import MikrotikRouterOS
+
+# No log during the benchmark
+logging.disable(logging.CRITICAL)
+
+# Number of lines of the bridge host table (can be given as parameter)
+NUMBER_OF_LINES = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+
+# Size of the chunks read
+CHUNK_SIZE = 1024
+
+# Command sent
+CMD = "interface bridge host print without-paging"
+
+# Prompt of the device
+PROMPT = "[admin@sw] > "
+
+
+class FakeReader:
+    """
+    Class giving the data of a device chunk by chunk (no network)
+    """
+
+    def __init__(self, data):
+
+        self.chunks = [
+            data[index : index + CHUNK_SIZE]
+            for index in range(0, len(data), CHUNK_SIZE)
+        ]
+
+    async def read(self, n):
+
+        return self.chunks.pop(0)
+
+
+class FakeWriter:
+    """
+    Class ignoring the data sent to a device
+    """
+
+    def write(self, data):
+
+        pass
+
+
+def bridge_host_table():
+    """
+    Function creating a synthetic bridge host table
+    """
+
+    return "".join(
+        f" {i:<5} D  {i % 256:02X}:{(i >> 8) % 256:02X}:AA:BB:CC:DD 1 ether{i % 24 + 1:<10} bridge1 \r\n"
+        for i in range(NUMBER_OF_LINES)
+    )
+
+
+async def task():
+    """
+    Async function
+    """
+
+    # Table returned by the device
+    table = bridge_host_table()
+
+    # SSH: echo of the command with the prompt, output then prompt
+    sw1 = MikrotikRouterOS(ip="192.168.0.1", username="admin", password="")
+    sw1.stdinx = FakeWriter()
+    sw1.stdoutx = FakeReader(
+        f"{CMD}\r\n{PROMPT}{CMD}\r\nFlags: X - disabled, I - invalid, D - dynamic\r\n{table}{PROMPT}"
+    )
+
+    # Sending command
+    start = time.perf_counter()
+    output = await sw1.send_commandSSH(CMD)
+    duration = time.perf_counter() - start
+
+    # Display message
+    print(
+        f"SSH:    {NUMBER_OF_LINES} lines: {duration:.3f} s, {len(output)} characters, md5: {hashlib.md5(output.encode()).hexdigest()}"
+    )
+
+    # Telnet: echo of the command, output then 2 prompts
+    sw1._writer = FakeWriter()
+    sw1._reader = FakeReader(f"{CMD}\n\r{table}{PROMPT}\r\n{PROMPT}".encode())
+
+    # Sending command
+    start = time.perf_counter()
+    output = await sw1.send_commandTelnet(CMD)
+    duration = time.perf_counter() - start
+
+    # Display message
+    print(
+        f"Telnet: {NUMBER_OF_LINES} lines: {duration:.3f} s, {len(output)} characters, md5: {hashlib.md5(output.encode()).hexdigest()}"
+    )
+
+
+# Main function call
+if __name__ == "__main__":
+
+    # Main async loop
+    asyncio.run(task())
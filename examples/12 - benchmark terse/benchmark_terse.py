@@ -0,0 +1,105 @@
+# Python library import
+import asyncio, logging, sys, time
+from netscud.devices.mikrotik.mikrotik_routeros import MikrotikRouterOS
+from netscud.devices.mikrotik.terse import parse_terse, parse_terse_values
+
+# No log during the benchmark
+logging.disable(logging.CRITICAL)
+
+# Number of entries of the ARP table (can be given as parameter)
+NUMBER_OF_ENTRIES = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+
+def arp_table():
+    """
+    Function creating a synthetic ARP table ("ip arp print terse")
+    """
+
+    return "\n".join(
+        f" {i:<5} D address=10.{i >> 16}.{(i >> 8) % 256}.{i % 256} "
+        f"mac-address=00:0C:42:{i >> 16:02X}:{(i >> 8) % 256:02X}:{i % 256:02X} "
+        f'interface=bridge1 published=no comment="host {i}"'
+        for i in range(NUMBER_OF_ENTRIES)
+    )
+
+
+class FakeMikrotik(MikrotikRouterOS):
+    """
+    Class giving the ARP table without device
+    """
+
+    __slots__ = ()
+
+    async def send_command(self, cmd, pattern=None, timeout=None):
+
+        return OUTPUT
+
+    async def stream_command(self, cmd, timeout=None, chunks=False):
+
+        # Lines of the output
+        lines = OUTPUT.splitlines()
+
+        # Blocks of lines?
+        if chunks:
+
+            # Yes (1000 lines per block)
+            for index in range(0, len(lines), 1000):
+                yield ("\n" if index else "") + "\n".join(lines[index : index + 1000])
+
+        else:
+
+            # No
+            for line in lines:
+                yield line
+
+
+# Output of the command
+OUTPUT = arp_table()
+
+
+async def task():
+    """
+    Async function
+    """
+
+    # Device (no connection)
+    sw1 = FakeMikrotik(ip="192.168.0.1", username="admin", password="")
+
+    # ARP table
+    start = time.perf_counter()
+    output = await sw1.get_arp_table()
+    duration = time.perf_counter() - start
+
+    # Display message
+    print(
+        f"get_arp_table: {NUMBER_OF_ENTRIES} entries: {duration:.3f} s, first entry: {output[0]}"
+    )
+
+    # Tokenizer only (tuples of the fields wanted)
+    start = time.perf_counter()
+    output = list(parse_terse(OUTPUT, ("address", "mac-address", "comment")))
+    duration = time.perf_counter() - start
+
+    # Display message
+    print(
+        f"parse_terse:   {NUMBER_OF_ENTRIES} entries: {duration:.3f} s, first entry: {output[0]}"
+    )
+
+    # Substring search of the fields wanted (single word values)
+    start = time.perf_counter()
+    output = list(
+        parse_terse_values(OUTPUT.splitlines(), ("address", "mac-address", "interface"))
+    )
+    duration = time.perf_counter() - start
+
+    # Display message
+    print(
+        f"parse_terse_values: {NUMBER_OF_ENTRIES} entries: {duration:.3f} s, first entry: {output[0]}"
+    )
+
+
+# Main function call
+if __name__ == "__main__":
+
+    # Main async loop
+    asyncio.run(task())
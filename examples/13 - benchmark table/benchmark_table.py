@@ -0,0 +1,110 @@
+# Python library import
+import sys, time, tracemalloc
+from netscud.table import (
+    Table,
+    MAC_ADDRESS_TABLE_FIELDS,
+    MAC_ADDRESS_TABLE_CATEGORIES,
+)
+
+# Number of MAC addresses of the fleet (can be given as parameter)
+NUMBER_OF_ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+
+# Number of MAC addresses of the list of dictionaries (can be given as parameter; less memory needed)
+NUMBER_OF_ROWS_LIST = int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+
+# Number of MAC addresses per device
+ROWS_PER_DEVICE = 5000
+
+
+def mac_address_tables(number_of_rows):
+    """
+    Function giving synthetic MAC address tables (device name, then entries like get_mac_address_table)
+    """
+
+    for first_row in range(0, number_of_rows, ROWS_PER_DEVICE):
+
+        # Name of the device
+        device = f"switch{first_row // ROWS_PER_DEVICE}"
+
+        # MAC addresses of the device
+        yield device, (
+            {
+                "mac_type": "dynamic" if i % 10 else "static",
+                "mac_address": f"00:0c:{i >> 24 & 255:02x}:{i >> 16 & 255:02x}:{i >> 8 & 255:02x}:{i & 255:02x}",
+                "vlan": i % 100 + 1,
+                "interface": f"1/1/{i % 48 + 1}",
+            }
+            for i in range(first_row, min(first_row + ROWS_PER_DEVICE, number_of_rows))
+        )
+
+
+def measure(name, number_of_rows, collect):
+    """
+    Function measuring the memory used by the MAC addresses of the fleet
+    """
+
+    # Start measuring
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    # Gather the MAC addresses
+    result = collect(mac_address_tables(number_of_rows))
+
+    # Memory used by the result
+    duration = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Display message
+    print(
+        f"{name}: {len(result)} rows: {memory / 2**20:.0f} MiB ({memory / len(result):.0f} bytes per row), {duration:.1f} s"
+    )
+
+    return result
+
+
+def collect_list(tables):
+    """
+    Function gathering the MAC addresses into a list of dictionaries
+    """
+
+    rows = []
+
+    for device, entries in tables:
+        rows.extend({**entry, "device": device} for entry in entries)
+
+    return rows
+
+
+def collect_table(tables):
+    """
+    Function gathering the MAC addresses into a Table
+    """
+
+    table = Table(
+        MAC_ADDRESS_TABLE_FIELDS + ("device",),
+        MAC_ADDRESS_TABLE_CATEGORIES + ("device",),
+    )
+
+    for device, entries in tables:
+        table.extend(entries, device=device)
+
+    return table
+
+
+# Main function call
+if __name__ == "__main__":
+
+    # List of dictionaries
+    rows = measure("list of dict", NUMBER_OF_ROWS_LIST, collect_list)
+
+    # Table with the same rows
+    table = measure("Table       ", NUMBER_OF_ROWS_LIST, collect_table)
+
+    # Same values?
+    print(f"same rows: {table == rows}, first row: {table[0]}")
+
+    del rows, table
+
+    # Table of the whole fleet
+    measure("Table       ", NUMBER_OF_ROWS, collect_table)
@@ -0,0 +1,186 @@
+# Python library import
+import asyncio, logging, sys, time, tracemalloc
+import netscud
+
+# No log during the benchmark
+logging.disable(logging.CRITICAL)
+
+# Protocol (can be given as parameter)
+PROTOCOL = sys.argv[1] if len(sys.argv) > 1 else "ssh"
+
+# Numbers of devices connected at the same time (can be given as parameter, eg. "1,10,100,1000,10000")
+NUMBERS_OF_DEVICES = [
+    int(number)
+    for number in (sys.argv[2] if len(sys.argv) > 2 else "1,10,100,1000").split(",")
+]
+
+# Device types simulated (can be given as parameter)
+DEVICE_TYPES = (
+    sys.argv[3].split(",")
+    if len(sys.argv) > 3
+    else ["cisco_ios", "cisco_s300", "alcatel_aos", "mikrotik_routeros"]
+)
+
+# Commands sent by each device
+COMMANDS_PER_DEVICE = 10
+
+# Command sent (generated output of the simulator)
+CMD = "show benchmark"
+
+# Number of lines of the output of the command
+OUTPUT_LINES = 100
+
+
+async def start_simulator(device_type):
+    """
+    Function starting a simulator in another process (the CPU of the simulator is not measured)
+    """
+
+    # Start the simulator
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "netscud.simulator",
+        device_type,
+        "--protocol",
+        PROTOCOL,
+        "--output-lines",
+        str(OUTPUT_LINES),
+        stdout=asyncio.subprocess.PIPE,
+    )
+
+    # Port of the simulator (last word of the first line: "... on 127.0.0.1:port")
+    line = await process.stdout.readline()
+    port = int(line.split(b":")[-1])
+
+    return process, port
+
+
+async def run_devices(device_type, port, number_of_devices, measure_memory):
+    """
+    Function connecting devices to the simulator (all connected at the same time) and sending the commands
+
+    The memory is measured with tracemalloc (slower) so the durations are measured in another run.
+    """
+
+    # Devices (all connected to the simulator)
+    device = {
+        "ip": "127.0.0.1",
+        "port": port,
+        "username": "admin",
+        "password": "",
+        "device_type": device_type,
+        "protocol": PROTOCOL,
+        "timeout": 300,
+    }
+    fleet = netscud.Fleet([device] * number_of_devices, concurrency=number_of_devices)
+
+    # Devices connected
+    connected = 0
+    all_connected = asyncio.Event()
+
+    async def task(sw):
+
+        nonlocal connected
+
+        # One more device connected
+        connected += 1
+        if connected == number_of_devices:
+            all_connected.set()
+
+        # Wait for all the devices (all the connections open at the same time)
+        await all_connected.wait()
+
+        # Send the commands
+        for _ in range(COMMANDS_PER_DEVICE):
+            await sw.send_command(CMD)
+
+    # Memory used before the connections
+    if measure_memory:
+        tracemalloc.start()
+        memory_before = tracemalloc.get_traced_memory()[0]
+
+    # Run the devices
+    start = time.perf_counter()
+    run = asyncio.create_task(fleet.run_all(task))
+
+    # Wait for all the devices connected (or an error)
+    await asyncio.wait(
+        [run, asyncio.create_task(all_connected.wait())],
+        return_when=asyncio.FIRST_COMPLETED,
+    )
+    connection_duration = time.perf_counter() - start
+
+    # Memory used by the devices connected
+    memory = None
+    if measure_memory:
+        memory = tracemalloc.get_traced_memory()[0] - memory_before
+        tracemalloc.stop()
+
+    # Wait for the commands
+    results = await run
+    commands_duration = time.perf_counter() - start - connection_duration
+
+    # Errors
+    errors = [result for result in results if not result.success]
+
+    return connection_duration, commands_duration, memory, errors
+
+
+async def benchmark(device_type, number_of_devices):
+    """
+    Function measuring the connection rate, the commands per second and the memory for some devices
+    """
+
+    # Simulator of the devices
+    process, port = await start_simulator(device_type)
+
+    # Warm up (modules imported by the first connection)
+    await run_devices(device_type, port, 1, False)
+
+    # Durations
+    connection_duration, commands_duration, _, errors = await run_devices(
+        device_type, port, number_of_devices, False
+    )
+
+    # Memory
+    _, _, memory, memory_errors = await run_devices(
+        device_type, port, number_of_devices, True
+    )
+    errors += memory_errors
+
+    # Stop the simulator
+    process.terminate()
+    await process.wait()
+
+    # Display message
+    print(
+        f"{device_type:<18} {number_of_devices:>6} devices: "
+        f"{number_of_devices / connection_duration:8.1f} connections/s, "
+        f"{number_of_devices * COMMANDS_PER_DEVICE / commands_duration:8.1f} commands/s, "
+        f"{memory / number_of_devices / 1024:6.1f} KiB per device"
+        + (f", {len(errors)} errors ({errors[0].error!r})" if errors else "")
+    )
+
+
+async def task():
+    """
+    Async function
+    """
+
+    # Display message
+    print(
+        f"{PROTOCOL}: {COMMANDS_PER_DEVICE} commands per device, {OUTPUT_LINES} lines per output"
+    )
+
+    # Benchmark of each device type
+    for device_type in DEVICE_TYPES:
+        for number_of_devices in NUMBERS_OF_DEVICES:
+            await benchmark(device_type, number_of_devices)
+
+
+# Main function call
+if __name__ == "__main__":
+
+    # Main async loop
+    asyncio.run(task())
@@ -0,0 +1,56 @@
+# Python library import
+import logging, sys, tracemalloc
+from netscud.device_selector import ALL_DEVICE_TYPE_CLASS
+
+# No log during the benchmark
+logging.disable(logging.CRITICAL)
+
+# Number of device objects created per device type (can be given as parameter)
+NUMBER_OF_DEVICES = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+# Device types measured (can be given as parameter)
+DEVICE_TYPES = (
+    sys.argv[2].split(",")
+    if len(sys.argv) > 2
+    else ["cisco_ios", "cisco_s300", "alcatel_aos", "mikrotik_routeros"]
+)
+
+
+def measure(device_type, number_of_devices):
+    """
+    Function measuring the memory used by the objects of a device type (no connection is done)
+    """
+
+    # Class of the device type (the module is imported before measuring)
+    device_class = ALL_DEVICE_TYPE_CLASS[device_type]
+
+    # Start measuring
+    tracemalloc.start()
+
+    # Create the objects
+    devices = [
+        device_class(
+            ip=f"10.0.{number // 256}.{number % 256}",
+            username="admin",
+            password="secret",
+            device_type=device_type,
+        )
+        for number in range(number_of_devices)
+    ]
+
+    # Memory used by the objects
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Display message
+    print(
+        f"{device_type:<20} {len(devices)} objects: {memory / 2**20:.1f} MiB ({memory / len(devices):.0f} bytes per instance)"
+    )
+
+
+# Main function call
+if __name__ == "__main__":
+
+    # Measure each device type
+    for device_type in DEVICE_TYPES:
+        measure(device_type, NUMBER_OF_DEVICES)
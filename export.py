@@ -0,0 +1,601 @@
+# Python library import
+import csv, datetime, json, logging, os, re
+
+try:
+
+    # Parquet files (optional)
+    import pyarrow, pyarrow.parquet
+
+except ImportError:
+
+    # Only CSV and NDJSON files
+    pyarrow = None
+
+# Logger of netscud (same logger as the one of the devices)
+log = logging.getLogger(__package__)
+
+# Declaration of constant values
+
+# Default number of rows written at once
+DEFAULT_BATCH_SIZE = 10000
+
+# Getters exported by default
+DEFAULT_GETTERS = ("get_interfaces", "get_mac_address_table", "get_lldp_neighbors")
+
+# Fields added to the rows of all the getters
+COMMON_FIELDS = (
+    ("device", "string"),
+    ("device_type", "string"),
+    ("collected_at", "timestamp"),
+)
+
+# Schema of each getter: name of the field of the keys (dictionary returned), fields and their types
+# The types are "string", "int", "bool" and "timestamp"
+GETTER_SCHEMAS = {
+    "get_interfaces": (
+        "interface",
+        (
+            ("interface", "string"),
+            ("operational", "bool"),
+            ("admin_state", "bool"),
+            ("maximum_frame_size", "int"),
+            ("full_duplex", "bool"),
+            ("speed", "int"),
+            ("mode", "string"),
+            ("description", "string"),
+        ),
+    ),
+    "get_mac_address_table": (
+        None,
+        (
+            ("mac_type", "string"),
+            ("mac_address", "string"),
+            ("vlan", "int"),
+            ("interface", "string"),
+        ),
+    ),
+    "get_arp_table": (
+        None,
+        (
+            ("address", "string"),
+            ("mac_address", "string"),
+            ("interface", "string"),
+        ),
+    ),
+    "get_lldp_neighbors": (
+        "local_interface",
+        (
+            ("local_interface", "string"),
+            ("chassis_id", "string"),
+            ("port_id", "string"),
+            ("ttl", "int"),
+            ("port_description", "string"),
+            ("system_name", "string"),
+            ("system_description", "string"),
+            ("system_capabilities", "string"),
+            ("management_address", "string"),
+        ),
+    ),
+}
+
+# Characters not allowed in the name of a directory
+_UNSAFE_CHARACTERS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def convert_value(value, value_type):
+    """
+    Function used to convert a value into the type of its field
+
+    A value which cannot be converted gives None (the schema does not change).
+
+    :param value: the value given by the getter
+    :type value: any
+
+    :param value_type: the type of the field ("string", "int", "bool" or "timestamp")
+    :type value_type: str
+
+    :return: the value converted
+    :rtype: str, int, bool or datetime
+    """
+
+    # No value?
+    if value is None:
+        return None
+
+    # Integer?
+    if value_type == "int":
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+
+    # Boolean?
+    if value_type == "bool":
+        return bool(value)
+
+    # Date?
+    if value_type == "timestamp":
+        return value
+
+    # List of strings (eg. LLDP capabilities)?
+    if isinstance(value, (list, tuple)):
+        return ",".join(str(element) for element in value)
+
+    # String
+    return str(value)
+
+
+class BatchWriter:
+    """
+    Class used to write the rows of a getter into a file, batch after batch
+
+    The file is written with a temporary name and renamed when it is
+    closed, so a file being written is never read as a complete file.
+
+
+    :param path: the path of the file
+    :type path: str
+
+    :param fields: the fields of the rows and their types
+    :type fields: tuple
+    """
+
+    # Extension of the files
+    extension = ""
+
+    def __init__(self, path, fields):
+
+        self.path = path
+        self.fields = fields
+
+        # Temporary name of the file while it is written
+        self.temporary_path = path + ".tmp"
+
+    def write(self, rows):
+        """
+        Method used to write a batch of rows
+
+        :param rows: the rows (one tuple of values per row, in the order of the fields)
+        :type rows: list of tuple
+        """
+
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Method used to close the file once all the rows are written
+        """
+
+        # The file gets its final name
+        os.replace(self.temporary_path, self.path)
+
+    def abort(self):
+        """
+        Method used to remove the file (error while the rows are read)
+        """
+
+        # Remove the temporary file
+        if os.path.exists(self.temporary_path):
+            os.remove(self.temporary_path)
+
+    def _text_values(self, row):
+        """
+        Method used to convert the dates of a row into text (ISO 8601)
+
+        :param row: the values of a row
+        :type row: tuple
+
+        :return: the values of the row
+        :rtype: list
+        """
+
+        return [
+            value.isoformat() if isinstance(value, datetime.datetime) else value
+            for value in row
+        ]
+
+
+class CSVWriter(BatchWriter):
+    """
+    Class used to write the rows of a getter into a CSV file (header with the names of the fields)
+    """
+
+    extension = "csv"
+
+    def __init__(self, path, fields):
+
+        super().__init__(path, fields)
+
+        # Open the file and write the header
+        self._file = open(self.temporary_path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([name for name, _ in fields])
+
+    def write(self, rows):
+
+        # Write the rows (None gives an empty value)
+        self._writer.writerows(self._text_values(row) for row in rows)
+        self._file.flush()
+
+    def close(self):
+
+        self._file.close()
+        super().close()
+
+    def abort(self):
+
+        self._file.close()
+        super().abort()
+
+
+class NDJSONWriter(BatchWriter):
+    """
+    Class used to write the rows of a getter into a NDJSON file (one JSON object per line)
+    """
+
+    extension = "ndjson"
+
+    def __init__(self, path, fields):
+
+        super().__init__(path, fields)
+
+        # Names of the fields
+        self._names = [name for name, _ in fields]
+
+        # Open the file
+        self._file = open(self.temporary_path, "w", encoding="utf-8")
+
+    def write(self, rows):
+
+        # Write one JSON object per row
+        self._file.writelines(
+            json.dumps(dict(zip(self._names, self._text_values(row)))) + "\n"
+            for row in rows
+        )
+        self._file.flush()
+
+    def close(self):
+
+        self._file.close()
+        super().close()
+
+    def abort(self):
+
+        self._file.close()
+        super().abort()
+
+
+class ParquetWriter(BatchWriter):
+    """
+    Class used to write the rows of a getter into a Parquet file (pyarrow is needed)
+
+    Each batch of rows is written as a row group of the file.
+    """
+
+    extension = "parquet"
+
+    def __init__(self, path, fields):
+
+        super().__init__(path, fields)
+
+        # pyarrow not installed?
+        if pyarrow is None:
+
+            # Yes
+            raise Exception("ParquetWriter: pyarrow is not installed")
+
+        # Types of pyarrow
+        types = {
+            "string": pyarrow.string(),
+            "int": pyarrow.int64(),
+            "bool": pyarrow.bool_(),
+            "timestamp": pyarrow.timestamp("us", tz="UTC"),
+        }
+
+        # Schema of the file
+        self._schema = pyarrow.schema(
+            [(name, types[value_type]) for name, value_type in fields]
+        )
+
+        # Open the file
+        self._writer = pyarrow.parquet.ParquetWriter(self.temporary_path, self._schema)
+
+    def write(self, rows):
+
+        # Values of each field
+        columns = list(zip(*rows)) if rows else [()] * len(self.fields)
+
+        # Write the columns
+        self._writer.write_table(
+            pyarrow.Table.from_arrays(
+                [
+                    pyarrow.array(column, type=field.type)
+                    for column, field in zip(columns, self._schema)
+                ],
+                schema=self._schema,
+            )
+        )
+
+    def close(self):
+
+        self._writer.close()
+        super().close()
+
+    def abort(self):
+
+        self._writer.close()
+        super().abort()
+
+
+# Writers of each format
+WRITERS = {
+    "parquet": ParquetWriter,
+    "csv": CSVWriter,
+    "ndjson": NDJSONWriter,
+}
+
+
+class FleetExporter:
+    """
+    Class used to export the results of getters of a fleet of devices into columnar files
+
+    Each getter has a stable schema (GETTER_SCHEMAS) and its rows are
+    written by batches while they are read, so the memory used does not
+    depend on the number of devices. The streaming form of a getter
+    (iter_mac_address_table, etc.) is used if the device has it. The files
+    are partitioned by getter, date and device:
+
+    <directory>/<getter>/date=<YYYY-MM-DD>/device=<ip address>/<getter>-<YYYYMMDDTHHMMSSZ>.<format>
+
+    Example: results = await FleetExporter("/data/netscud").export(Fleet(devices))
+
+
+    :param directory: the directory of the files
+    :type directory: str
+
+    :param getters: optional, the getters to export. Default value is ("get_interfaces", "get_mac_address_table", "get_lldp_neighbors")
+    :type getters: list
+
+    :param file_format: optional, "parquet", "csv" or "ndjson". Default value is "parquet" if pyarrow is installed, otherwise "csv"
+    :type file_format: str
+
+    :param batch_size: optional, the number of rows written at once. Default value is 10000
+    :type batch_size: int
+    """
+
+    def __init__(
+        self,
+        directory,
+        getters=DEFAULT_GETTERS,
+        file_format=None,
+        batch_size=DEFAULT_BATCH_SIZE,
+    ):
+
+        self.directory = directory
+        self.batch_size = max(1, batch_size)
+
+        # Getter without schema?
+        for getter in getters:
+            if getter not in GETTER_SCHEMAS:
+
+                # Yes
+                raise Exception(f"FleetExporter: no schema for getter: {getter}")
+
+        self.getters = tuple(getters)
+
+        # Format by default (parquet if pyarrow is installed)
+        if file_format is None:
+            file_format = "csv" if pyarrow is None else "parquet"
+
+        # Unknown format?
+        if file_format not in WRITERS:
+
+            # Yes
+            raise Exception(f"FleetExporter: unknown file format: {file_format}")
+
+        self.file_format = file_format
+
+    async def export(self, fleet):
+        """
+        Asyn method used to export the getters of all the devices of a fleet
+
+        :param fleet: the fleet of devices
+        :type fleet: Fleet
+
+        :return: the results, one for each device (output: number of rows of each getter)
+        :rtype: list of FleetResult
+        """
+
+        # Run the export on all the devices
+        return await fleet.run_all(self.export_device)
+
+    async def export_device(self, device):
+        """
+        Asyn method used to export the getters of a device (task of a Fleet)
+
+        :param device: the device connected
+        :type device: NetworkDevice
+
+        :return: the number of rows written for each getter
+        :rtype: dict
+        """
+
+        # Date of the collection (same date for all the getters of the device)
+        collected_at = datetime.datetime.now(datetime.timezone.utc).replace(
+            microsecond=0
+        )
+
+        # Number of rows of each getter
+        returned_output = {}
+
+        # Export each getter
+        for getter in self.getters:
+            returned_output[getter] = await self.export_getter(
+                device, getter, collected_at
+            )
+
+        return returned_output
+
+    async def export_getter(self, device, getter, collected_at):
+        """
+        Asyn method used to write the rows of a getter of a device into a file
+
+        :param device: the device connected
+        :type device: NetworkDevice
+
+        :param getter: the name of the getter (eg. "get_mac_address_table")
+        :type getter: str
+
+        :param collected_at: the date of the collection
+        :type collected_at: datetime.datetime
+
+        :return: the number of rows written
+        :rtype: int
+        """
+
+        # Display info message
+        log.info("export_getter: %s: %s", device.ip, getter)
+
+        # Schema of the getter
+        key_field, getter_fields = GETTER_SCHEMAS[getter]
+        fields = COMMON_FIELDS + getter_fields
+
+        # Values of the common fields
+        common_values = (device.ip, device.device_type, collected_at)
+
+        # Create the file
+        writer = WRITERS[self.file_format](
+            self.get_path(getter, device.ip, collected_at), fields
+        )
+
+        # Number of rows written
+        number_of_rows = 0
+
+        # Rows not yet written
+        batch = []
+
+        try:
+
+            # Read the rows of the getter
+            async for record in self._get_records(device, getter, key_field):
+
+                # Add the values of the row in the order of the fields
+                batch.append(
+                    common_values
+                    + tuple(
+                        convert_value(record.get(name), value_type)
+                        for name, value_type in getter_fields
+                    )
+                )
+
+                # Batch full?
+                if len(batch) >= self.batch_size:
+
+                    # Yes
+                    writer.write(batch)
+                    number_of_rows += len(batch)
+                    batch = []
+
+            # Last rows
+            if batch:
+                writer.write(batch)
+                number_of_rows += len(batch)
+
+        except BaseException:
+
+            # Error: no file written
+            writer.abort()
+
+            raise
+
+        # The file is complete
+        writer.close()
+
+        return number_of_rows
+
+    def get_path(self, getter, device_name, collected_at):
+        """
+        Method used to get the path of the file of a getter of a device (the directories are created)
+
+        :param getter: the name of the getter (eg. "get_mac_address_table")
+        :type getter: str
+
+        :param device_name: the name of the device (ip address)
+        :type device_name: str
+
+        :param collected_at: the date of the collection
+        :type collected_at: datetime.datetime
+
+        :return: the path of the file
+        :rtype: str
+        """
+
+        # Name of the data ("get_mac_address_table" gives "mac_address_table")
+        name = getter[4:] if getter.startswith("get_") else getter
+
+        # Directory of the device (partitions by date and device)
+        directory = os.path.join(
+            self.directory,
+            name,
+            f"date={collected_at:%Y-%m-%d}",
+            f"device={_UNSAFE_CHARACTERS.sub('_', device_name)}",
+        )
+        os.makedirs(directory, exist_ok=True)
+
+        # Path of the file
+        return os.path.join(
+            directory,
+            f"{name}-{collected_at:%Y%m%dT%H%M%SZ}.{WRITERS[self.file_format].extension}",
+        )
+
+    async def _get_records(self, device, getter, key_field):
+        """
+        Asyn generator used to get the records of a getter as dictionaries
+
+        The dictionaries of dictionaries (key: interface) and the dictionaries
+        of lists (LLDP neighbors) are flattened: the key is saved in the
+        key_field field.
+
+        :param device: the device connected
+        :type device: NetworkDevice
+
+        :param getter: the name of the getter
+        :type getter: str
+
+        :param key_field: the name of the field of the keys (None if the getter gives a list)
+        :type key_field: str
+
+        :return: the records
+        :rtype: dict
+        """
+
+        # Streaming form of the getter (eg. iter_mac_address_table)?
+        iter_getter = getattr(device, "iter_" + getter[4:], None)
+        if key_field is None and iter_getter is not None:
+
+            # Yes
+
+            # Records given while they are received
+            async for record in iter_getter():
+                yield record
+
+            return
+
+        # Get the result of the getter
+        output = await getattr(device, getter)()
+
+        # List of records?
+        if not isinstance(output, dict):
+
+            # Yes
+            for record in output:
+                yield record
+
+            return
+
+        # Read the records of each key
+        for key, value in output.items():
+
+            # Several records for a key (eg. LLDP neighbors)?
+            for record in value if isinstance(value, list) else [value]:
+                yield {key_field: key, **record}
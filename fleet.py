@@ -0,0 +1,365 @@
+# Python library import
+import asyncio, logging, time
+from netscud.device_selector import ConnectDevice
+
+# Logger of netscud (same logger as the one of the devices)
+log = logging.getLogger(__package__)
+
+# Declaration of constant values
+
+# Default maximum number of devices connected at the same time
+DEFAULT_CONCURRENCY = 100
+
+
+class FleetResult:
+    """
+    Class used to save the result of a task run on a device of a fleet
+
+
+    :param device: the parameters of the device (ip address, device_type, etc.)
+    :type device: dict
+
+    :param success: True if the task has been run without error
+    :type success: bool
+
+    :param output: the value returned by the task (None if an error occured)
+    :type output: any
+
+    :param error: the exception raised by the connection or the task (None if no error)
+    :type error: Exception
+
+    :param duration: time spent on the device (connection, task and disconnection) in seconds
+    :type duration: float
+    """
+
+    def __init__(self, device, success=False, output=None, error=None, duration=0.0):
+
+        self.device = device
+        self.success = success
+        self.output = output
+        self.error = error
+        self.duration = duration
+
+    @property
+    def name(self):
+        """
+        Name of the device (name from the inventory or ip address)
+
+        :return: the name of the device
+        :rtype: str
+        """
+
+        return self.device.get("name", self.device.get("ip", ""))
+
+    def to_dict(self):
+        """
+        Method used to convert the result into a dictionary (without the password of the device)
+
+        :return: the result
+        :rtype: dict
+        """
+
+        return {
+            "name": self.name,
+            "ip": self.device.get("ip", ""),
+            "device_type": self.device.get("device_type", ""),
+            "success": self.success,
+            "output": self.output,
+            "error": None if self.error is None else repr(self.error),
+            "duration": self.duration,
+        }
+
+    def __repr__(self):
+
+        return (
+            f"FleetResult(name={self.name!r}, success={self.success!r}, "
+            f"error={self.error!r}, duration={self.duration:.3f})"
+        )
+
+
+class Fleet:
+    """
+    Class used to run a task on many devices concurrently
+
+    The number of devices connected at the same time is limited (a pool of
+    workers takes the devices one after the other). So thousands of devices
+    do not open thousands of connections at the same time. The results are
+    given back as soon as a device is done.
+
+
+    :param devices: an Inventory object or a list of dictionaries with the parameters of the devices
+    :type devices: Inventory or list
+
+    :param concurrency: optional, maximum number of devices connected at the same time. Default value is 100
+    :type concurrency: int
+
+    :param device_timeout: optional, maximum time in seconds for a device (connection, task and disconnection). Default value is None (no limit)
+    :type device_timeout: float
+
+    :param timeout: optional, maximum time in seconds for the whole fleet. The devices not done at the end are given back with a timeout error. Default value is None (no limit)
+    :type timeout: float
+    """
+
+    def __init__(
+        self,
+        devices,
+        concurrency=DEFAULT_CONCURRENCY,
+        device_timeout=None,
+        timeout=None,
+    ):
+
+        # Inventory object?
+        if hasattr(devices, "get_all_devices"):
+
+            # Yes
+
+            # Get the devices of the inventory
+            devices = devices.get_all_devices()
+
+        # List of devices
+        self.devices = list(devices)
+
+        # At least one worker
+        self.concurrency = max(1, concurrency)
+
+        self.device_timeout = device_timeout
+        self.timeout = timeout
+
+        # Display info message
+        log.info(
+            "Fleet: devices: %s, concurrency: %s, device_timeout: %s, timeout: %s",
+            len(self.devices),
+            self.concurrency,
+            self.device_timeout,
+            self.timeout,
+        )
+
+    async def run_task_on_device(self, device, task):
+        """
+        Asyn method used to connect a device, run a task on it and disconnect it
+
+        :param device: the parameters of the device
+        :type device: dict
+
+        :param task: the async function run on the device. It is called with the connected device (NetworkDevice object) as single parameter
+        :type task: async function
+
+        :return: the result of the task for the device
+        :rtype: FleetResult
+        """
+
+        # Start time
+        start = time.monotonic()
+
+        try:
+
+            # Connection, task and disconnection within the time allowed for the device
+            output = await asyncio.wait_for(
+                self._run_task(device, task), timeout=self.device_timeout
+            )
+
+        except Exception as error:
+
+            # Something wrong (connection, command, timeout, etc.)
+
+            # Display info message
+            log.info(
+                "run_task_on_device: %s: error: %r",
+                device.get("ip", ""),
+                error,
+            )
+
+            # Return the failure
+            return FleetResult(
+                device, success=False, error=error, duration=time.monotonic() - start
+            )
+
+        # Return the success
+        return FleetResult(
+            device, success=True, output=output, duration=time.monotonic() - start
+        )
+
+    async def _run_task(self, device, task):
+        """
+        Asyn method used to run a task on a device once connected
+
+        :param device: the parameters of the device
+        :type device: dict
+
+        :param task: the async function run on the device
+        :type task: async function
+
+        :return: the value returned by the task
+        :rtype: any
+        """
+
+        # Connection to the device
+        async with ConnectDevice(**device) as connected_device:
+
+            # Run the task
+            return await task(connected_device)
+
+    async def run(self, task):
+        """
+        Asyn generator used to run a task on all the devices
+
+        The results are given as soon as a device is done (not in the order of
+        the devices). Each device gives one result, even if the global timeout
+        is reached: the devices not done get a failure with a timeout error.
+
+        :param task: the async function run on each device. It is called with the connected device (NetworkDevice object) as single parameter
+        :type task: async function
+
+        :return: the results, one for each device
+        :rtype: FleetResult
+        """
+
+        # Results given by the workers
+        queue = asyncio.Queue()
+
+        # Devices not yet taken by a worker (shared by all the workers)
+        waiting_devices = iter(self.devices)
+
+        # Devices in progress (key: worker number)
+        devices_in_progress = {}
+
+        async def worker(number):
+
+            # Take the devices one after the other
+            for device in waiting_devices:
+
+                # Save the device in progress
+                devices_in_progress[number] = device
+
+                # Run the task on the device
+                result = await self.run_task_on_device(device, task)
+
+                # The device is done
+                del devices_in_progress[number]
+
+                # Give the result
+                queue.put_nowait(result)
+
+        # Get the event loop running the fleet
+        loop = asyncio.get_running_loop()
+
+        # End of the time allowed for the fleet
+        deadline = None if self.timeout is None else loop.time() + self.timeout
+
+        # Start the workers (not more workers than devices)
+        workers = [
+            asyncio.ensure_future(worker(number))
+            for number in range(min(self.concurrency, len(self.devices)))
+        ]
+
+        # Number of results given
+        number_of_results = 0
+
+        try:
+
+            # Read all the results
+            while number_of_results < len(self.devices):
+
+                # Global timeout?
+                if deadline is None:
+
+                    # No
+
+                    # Wait for the next result
+                    result = await queue.get()
+
+                else:
+
+                    # Yes
+
+                    try:
+
+                        # Wait for the next result until the end of the time allowed
+                        result = await asyncio.wait_for(
+                            queue.get(), timeout=max(0, deadline - loop.time())
+                        )
+
+                    except asyncio.TimeoutError:
+
+                        # Time is over
+
+                        # Display info message
+                        log.info(
+                            "run: global timeout: %s device(s) not done",
+                            len(self.devices) - number_of_results,
+                        )
+
+                        break
+
+                number_of_results += 1
+
+                # Give the result
+                yield result
+
+            # Some devices not done (global timeout)?
+            if number_of_results < len(self.devices):
+
+                # Yes
+
+                # Stop the workers
+                await self._stop_workers(workers)
+
+                # Results given before the workers were stopped
+                while not queue.empty():
+                    yield queue.get_nowait()
+
+                # Devices in progress and devices not yet started get a timeout error
+                for device in list(devices_in_progress.values()) + list(
+                    waiting_devices
+                ):
+                    yield FleetResult(
+                        device,
+                        success=False,
+                        error=asyncio.TimeoutError(
+                            f"Fleet: global timeout ({self.timeout} s)"
+                        ),
+                    )
+
+        finally:
+
+            # Stop the workers (if the results are not all read)
+            await self._stop_workers(workers)
+
+    async def run_all(self, task):
+        """
+        Asyn method used to run a task on all the devices and get all the results
+
+        :param task: the async function run on each device
+        :type task: async function
+
+        :return: the results, one for each device (in the order of the devices)
+        :rtype: list of FleetResult
+        """
+
+        # Get all the results
+        results = [result async for result in self.run(task)]
+
+        # Order of the devices
+        position = {id(device): index for index, device in enumerate(self.devices)}
+
+        # Sort the results in the order of the devices
+        results.sort(key=lambda result: position[id(result.device)])
+
+        # Return the results
+        return results
+
+    async def _stop_workers(self, workers):
+        """
+        Asyn method used to stop the workers still running
+
+        :param workers: the tasks of the workers
+        :type workers: list
+        """
+
+        # Cancel the workers still running
+        for worker in workers:
+            if not worker.done():
+                worker.cancel()
+
+        # Wait for the end of the workers (disconnection of the devices)
+        await asyncio.gather(*workers, return_exceptions=True)
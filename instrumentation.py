@@ -0,0 +1,322 @@
+# Python library import
+import logging, math, time
+
+# Logger of netscud (same logger as the one of the devices)
+log = logging.getLogger(__package__)
+
+# Declaration of constant values
+
+# Names of the events
+EVENT_CONNECT = "connect"
+EVENT_AUTH = "auth"
+EVENT_PROMPT_DISCOVERY = "prompt_discovery"
+EVENT_COMMAND_SEND = "command_send"
+EVENT_FIRST_BYTE = "first_byte"
+EVENT_LAST_BYTE = "last_byte"
+EVENT_BYTES_RECEIVED = "bytes_received"
+EVENT_PARSE = "parse"
+
+
+class Event:
+    """
+    Class used to describe something measured on a device (connection, command, etc.)
+
+    The names of the events are:
+    - "connect": whole connection (connect method), duration
+    - "auth": transport connection and authentication (SSH: asyncssh.connect; Telnet: till the password is accepted), duration
+    - "prompt_discovery": SSH session opened and first prompt read, duration
+    - "command_send": command sent (send_command)
+    - "first_byte": time between the command sent and the first data received, duration
+    - "last_byte": time between the command sent and the end of the output (prompt), duration
+    - "bytes_received": size of the data received for the command (characters for SSH, bytes for Telnet), size
+    - "parse": time used to clean the output (echo of the command, prompt, etc.), duration
+
+
+    :param name: the name of the event (eg. "first_byte")
+    :type name: str
+
+    :param ip: the ip address of the device
+    :type ip: str
+
+    :param device_type: the device type of the device (eg. "cisco_ios")
+    :type device_type: str
+
+    :param command: optional, the command of the event (None for the connection)
+    :type command: str
+
+    :param duration: optional, the duration in seconds (None if not a duration)
+    :type duration: float
+
+    :param size: optional, a number of bytes (None if not a size)
+    :type size: int
+    """
+
+    __slots__ = ("name", "ip", "device_type", "command", "duration", "size", "time")
+
+    def __init__(self, name, ip, device_type, command=None, duration=None, size=None):
+
+        self.name = name
+        self.ip = ip
+        self.device_type = device_type
+        self.command = command
+        self.duration = duration
+        self.size = size
+
+        # Date of the event
+        self.time = time.time()
+
+    def to_dict(self):
+        """
+        Method used to convert the event into a dictionary
+
+        :return: the event
+        :rtype: dict
+        """
+
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+
+        # Values of the event (eg. "name='command', ip='192.168.0.1'")
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+
+        return f"Event({values})"
+
+
+def emit_event(device, name, command=None, duration=None, size=None):
+    """
+    Function used to give an event to the instrumentation of a device
+
+    An error of the instrumentation does not stop the device: it is only
+    displayed.
+
+    :param device: the device (its "instrumentation" attribute is a function receiving the events)
+    :type device: NetworkDevice
+
+    :param name: the name of the event
+    :type name: str
+
+    :param command: optional, the command of the event
+    :type command: str
+
+    :param duration: optional, the duration in seconds
+    :type duration: float
+
+    :param size: optional, a number of bytes
+    :type size: int
+    """
+
+    try:
+
+        # Give the event
+        device.instrumentation(
+            Event(name, device.ip, device.device_type, command, duration, size)
+        )
+
+    except Exception as error:
+
+        # Error of the instrumentation
+
+        # Display error message
+        log.error("emit_event: instrumentation error: %r", error)
+
+
+class CommandProbe:
+    """
+    Class used to measure the phases of a command (created only if an instrumentation is used)
+
+    The events "command_send", "first_byte", "last_byte", "bytes_received"
+    and "parse" are given to the instrumentation of the device.
+
+
+    :param device: the device
+    :type device: NetworkDevice
+
+    :param command: the command sent
+    :type command: str
+    """
+
+    __slots__ = ("device", "command", "start", "first_byte", "last_byte", "size")
+
+    def __init__(self, device, command):
+
+        self.device = device
+        self.command = command
+
+        # Time of the command sent
+        self.start = time.perf_counter()
+
+        # Time of the first and last data received
+        self.first_byte = None
+        self.last_byte = None
+
+        # Size of the data received
+        self.size = 0
+
+        # Command sent
+        emit_event(device, EVENT_COMMAND_SEND, command)
+
+    def data_received(self, size):
+        """
+        Method used when data is received
+
+        :param size: the size of the data received
+        :type size: int
+        """
+
+        # Time of the data
+        self.last_byte = time.perf_counter()
+        self.size += size
+
+        # First data?
+        if self.first_byte is None:
+
+            # Yes
+            self.first_byte = self.last_byte
+            emit_event(
+                self.device,
+                EVENT_FIRST_BYTE,
+                self.command,
+                duration=self.first_byte - self.start,
+            )
+
+    def output_received(self):
+        """
+        Method used when the end of the output is received (prompt found)
+        """
+
+        # Time of the end of the output
+        if self.last_byte is None:
+            self.last_byte = time.perf_counter()
+
+        emit_event(
+            self.device,
+            EVENT_LAST_BYTE,
+            self.command,
+            duration=self.last_byte - self.start,
+        )
+        emit_event(self.device, EVENT_BYTES_RECEIVED, self.command, size=self.size)
+
+    def output_cleaned(self):
+        """
+        Method used when the output is cleaned (echo of the command, prompt, etc. removed)
+        """
+
+        emit_event(
+            self.device,
+            EVENT_PARSE,
+            self.command,
+            duration=time.perf_counter() - self.last_byte,
+        )
+
+
+def percentile(sorted_values, percent):
+    """
+    Function used to get a percentile of values (nearest rank)
+
+    :param sorted_values: the values sorted
+    :type sorted_values: list
+
+    :param percent: the percentile (eg. 50 for the median, 99)
+    :type percent: float
+
+    :return: the percentile (None if there is no value)
+    :rtype: float
+    """
+
+    # No value?
+    if not sorted_values:
+        return None
+
+    # Nearest rank
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+
+    return sorted_values[rank - 1]
+
+
+class TimingAggregator:
+    """
+    Class used to gather the events of devices and to get their percentiles
+
+    A TimingAggregator is an instrumentation: it is given to the devices
+    (instrumentation parameter) and receives their events. The durations
+    (or the sizes for "bytes_received") are kept by event, device type and
+    command.
+
+    Example:
+
+    aggregator = TimingAggregator()
+    async with netscud.ConnectDevice(**my_device, instrumentation=aggregator) as sw1:
+        await sw1.send_command("show version")
+    print(aggregator.summary())
+    """
+
+    def __init__(self):
+
+        # Values of each event (key: name of the event, device type, command)
+        self._values = {}
+
+    def __call__(self, event):
+        """
+        Method receiving an event
+
+        :param event: the event
+        :type event: Event
+        """
+
+        # Duration or size?
+        value = event.duration if event.duration is not None else event.size
+
+        # Value to keep?
+        if value is not None:
+
+            # Yes
+            self._values.setdefault(
+                (event.name, event.device_type, event.command), []
+            ).append(value)
+
+    def clear(self):
+        """
+        Method used to remove all the values
+        """
+
+        self._values.clear()
+
+    def summary(self, by_command=True):
+        """
+        Method used to get the percentiles of the events
+
+        :param by_command: optional, if True the values are given by event, device type and command. If False they are given by event and device type only. Default value is True
+        :type by_command: bool
+
+        :return: the statistics ("event", "device_type", "command", "count", "p50", "p99", "max", "total"); durations in seconds, sizes in bytes
+        :rtype: list of dict
+        """
+
+        # Values grouped by event, device type (and command)
+        groups = {}
+        for (name, device_type, command), values in self._values.items():
+            groups.setdefault(
+                (name, device_type, command if by_command else None), []
+            ).extend(values)
+
+        # Statistics of each group
+        returned_output = []
+        for (name, device_type, command), values in sorted(
+            groups.items(), key=lambda item: tuple(str(key) for key in item[0])
+        ):
+            values.sort()
+            returned_output.append(
+                {
+                    "event": name,
+                    "device_type": device_type,
+                    "command": command,
+                    "count": len(values),
+                    "p50": percentile(values, 50),
+                    "p99": percentile(values, 99),
+                    "max": values[-1],
+                    "total": sum(values),
+                }
+            )
+
+        return returned_output
@@ -0,0 +1,723 @@
+# Python library import
+import codecs, re
+
+# Declaration of constant values
+
+# Complete CSI escape sequence: "ESC [", parameters then a letter ending the sequence
+# (an escape char followed by another one is dropped as a terminal does: "ESC ESC [ K")
+ANSI_CSI_SEQUENCE = re.compile(r"\x1b+\[[^A-Za-z]*[A-Za-z]")
+
+# Escape sequence not completed at the end of a chunk ("ESC" or "ESC [" with parameters)
+ANSI_INCOMPLETE_SEQUENCE = re.compile(r"\x1b+(?:\[[^A-Za-z]*)?\Z")
+
+# A letter (which ends a CSI escape sequence)
+ANSI_CSI_ENDING = re.compile(r"[A-Za-z]")
+
+
+class AnsiEscapeFilter:
+    """
+    Class used to remove ANSI escape sequences from the data read from a device
+
+    Just CSI sequences are removed. The filter keeps its state between 2
+    chunks: an escape sequence split over 2 reads (for instance "ESC [" at
+    the end of a chunk and "K" at the beginning of the next one) is kept
+    pending until the next chunk is received. An incomplete escape sequence
+    at the very end of the data is dropped.
+    """
+
+    def __init__(self):
+
+        # Beginning of an escape sequence not yet completed
+        self._pending = ""
+
+    def feed(self, text):
+        """
+        Method used to remove the ANSI escape sequences of a new chunk
+
+        :param text: the new data
+        :type text: str
+
+        :return: the new data without ANSI escape sequences
+        :rtype: str
+        """
+
+        # Escape sequence pending from the previous chunk?
+        if self._pending:
+
+            # Yes
+
+            # Then it is added at the beginning of the new data
+            text = self._pending + text
+            self._pending = ""
+
+        # Search the last escape char
+        index = text.rfind("\x1b")
+
+        # No escape char?
+        if index == -1:
+
+            # No escape sequence to remove
+            return text
+
+        # By default no incomplete escape sequence at the end of the data
+        start = -1
+
+        # Check if the data ends with an incomplete escape sequence
+        # (the first escape char of the incomplete sequence is needed: "ESC [ 1 ESC [ 2" for instance)
+        while index != -1:
+
+            # Incomplete escape sequence found?
+            if ANSI_INCOMPLETE_SEQUENCE.match(text, index):
+
+                # Yes
+
+                # Save its position
+                start = index
+
+            # A letter after that escape char?
+            elif ANSI_CSI_ENDING.search(text, index):
+
+                # Yes
+
+                # So all previous escape sequences are completed
+                break
+
+            # Previous escape char
+            index = text.rfind("\x1b", 0, index)
+
+        # Incomplete escape sequence found?
+        if start != -1:
+
+            # Yes
+
+            # It is kept for the next chunk
+            self._pending = text[start:]
+            text = text[:start]
+
+        # Remove all the CSI sequences
+        return ANSI_CSI_SEQUENCE.sub("", text)
+
+
+class PromptMatcher:
+    """
+    Class used to detect a prompt at the very end of a string
+
+    All the possible prompts of a device are compiled into a single regular
+    expression anchored at the end of the string. Only the end of the string
+    (the size of the longest prompt) is checked. So a hostname found in the
+    middle of an output is not seen as a prompt.
+
+
+    :param prompts: the possible prompts of the device (eg. ["switch#", "switch>"])
+    :type prompts: list
+    """
+
+    def __init__(self, prompts):
+
+        # Possible prompts (empty strings are ignored)
+        self.prompts = [prompt for prompt in prompts if prompt]
+
+        # Size of the longest prompt
+        self.max_length = max([len(prompt) for prompt in self.prompts] or [0])
+
+        # All the prompts (longest ones first)
+        alternation = "|".join(
+            re.escape(prompt) for prompt in sorted(self.prompts, key=len, reverse=True)
+        )
+
+        # Regular expression with all the prompts at the end of a string
+        self._regex = re.compile("(?:" + alternation + r")\Z") if self.prompts else None
+
+        # Regular expression with all the prompts at the beginning of a line
+        # (the carriage returns saved at the beginning of the prompts are not used)
+        self._line_regex = (
+            re.compile(
+                r"^\r*(?:"
+                + "|".join(
+                    re.escape(prompt.lstrip("\r\n"))
+                    for prompt in sorted(
+                        self.prompts,
+                        key=lambda prompt: len(prompt.lstrip("\r\n")),
+                        reverse=True,
+                    )
+                )
+                + ")",
+                re.MULTILINE,
+            )
+            if self.prompts
+            else None
+        )
+
+    def search(self, text):
+        """
+        Method used to find a prompt at the end of a string
+
+        :param text: the string with a possible prompt at the end
+        :type text: str
+
+        :return: the match object of the prompt found (position in the whole text) or None
+        :rtype: re.Match
+        """
+
+        # No prompt?
+        if self._regex is None:
+
+            # Yes
+
+            # Then no prompt can be found
+            return None
+
+        # Search only in the end of the string
+        return self._regex.search(text, max(0, len(text) - self.max_length))
+
+    def search_line(self, text, pos=0):
+        """
+        Method used to find a prompt at the beginning of a line
+
+        Used when the answers of several commands are received at the same time.
+
+        :param text: the string with possible prompts
+        :type text: str
+
+        :param pos: optional, the position where the search starts. Default value is 0
+        :type pos: int
+
+        :return: the match object of the first prompt found or None
+        :rtype: re.Match
+        """
+
+        # No prompt?
+        if self._line_regex is None:
+
+            # Yes
+
+            # Then no prompt can be found
+            return None
+
+        # Search the first prompt starting a line
+        return self._line_regex.search(text, pos)
+
+
+class ReceiveBuffer:
+    """
+    Class used to gather the data read from a device
+
+    The data read is kept in a list of chunks instead of a single string
+    growing with "+=". Only the new chunk is sanitized (ANSI escape
+    sequences, "\\r", etc.) and the search of the prompt (or of any other
+    pattern) is done on a small window: the end of the previous data plus
+    the new chunk. So the cost of a read loop is linear with the size of the
+    output instead of quadratic.
+
+
+    :param patterns: the patterns (prompts, etc.) which will be searched in the data. Used to calculate the size of the window kept between 2 chunks
+    :type patterns: list
+
+    :param sanitize: optional, a function called on each new chunk (for instance to remove ANSI escape sequences)
+    :type sanitize: function
+
+    :param decode: optional, if True the chunks received are bytes (Telnet) which are converted into string. Default value is False
+    :type decode: bool
+
+    :param keep_data: optional, if False the chunks are not saved (only the search window is kept, getvalue() gives nothing). Default value is True
+    :type keep_data: bool
+    """
+
+    def __init__(self, patterns=None, sanitize=None, decode=False, keep_data=True):
+
+        # List of chunks received (already sanitized)
+        self._chunks = []
+
+        # Total size of the data
+        self._size = 0
+
+        # End of the previous data kept for the search of patterns over 2 chunks
+        self._tail = ""
+
+        # Data on which patterns are searched (end of previous data + new chunk)
+        self.recent = ""
+
+        # Size of the beginning of "recent" which was already available before the last chunk
+        self._recent_old_size = 0
+
+        # Function used to sanitize the new chunks
+        self._sanitize = sanitize
+
+        # Chunks saved? (not saved when the data is given to the caller chunk by chunk)
+        self._keep_data = keep_data
+
+        # Bytes received? Then an incremental decoder is used (a UTF-8 character can be split over 2 chunks)
+        self._decoder = (
+            codecs.getincrementaldecoder("utf-8")("ignore") if decode else None
+        )
+
+        # Size of the window: the length of the longest pattern
+        self.window = max(
+            [len(element) for element in (patterns or []) if element] or [0]
+        )
+
+    def __len__(self):
+        """
+        Size of the data gathered
+
+        :return: the number of characters saved
+        :rtype: int
+        """
+
+        return self._size
+
+    def feed(self, data):
+        """
+        Method used to add new data read from the device
+
+        :param data: data read (str or bytes if decode is True)
+        :type data: str or bytes
+
+        :return: the new data once decoded and sanitized
+        :rtype: str
+        """
+
+        # Bytes to convert into string?
+        if self._decoder:
+
+            # Yes
+            data = self._decoder.decode(data)
+
+        # Sanitize function available?
+        if self._sanitize:
+
+            # Yes
+
+            # Only the new data is sanitized
+            data = self._sanitize(data)
+
+        # Some data to save?
+        if data:
+
+            # Yes
+
+            # Save the chunk (if needed)
+            if self._keep_data:
+                self._chunks.append(data)
+
+            # Update the size of the data
+            self._size += len(data)
+
+        # The search window is made of the end of the previous data and the new data
+        self._recent_old_size = len(self._tail)
+        self.recent = self._tail + data
+
+        # Keep the end of the data for the next chunk. A pattern split over 2 chunks
+        # has at most "window - 1" characters in the previous chunk
+        if self.window > 1:
+            self._tail = self.recent[-(self.window - 1) :]
+        else:
+            self._tail = ""
+
+        # Return the new data
+        return data
+
+    def contains(self, pattern):
+        """
+        Method used to check if a pattern is found at the end of the data (the last chunk)
+
+        :param pattern: the pattern to find
+        :type pattern: str
+
+        :return: True if the pattern is found
+        :rtype: bool
+        """
+
+        # Pattern longer than the window?
+        if len(pattern) > self.window:
+
+            # Yes
+
+            # Then the search is done on all the data
+            return pattern in self.getvalue()
+
+        # Search inside the window
+        return pattern in self.recent
+
+    def endswith(self, pattern):
+        """
+        Method used to check if the data ends with a pattern
+
+        :param pattern: the pattern to find
+        :type pattern: str
+
+        :return: True if the data ends with the pattern
+        :rtype: bool
+        """
+
+        # Pattern longer than the window?
+        if len(pattern) > self.window:
+
+            # Yes
+            return self.getvalue().endswith(pattern)
+
+        # Search inside the window
+        return self.recent.endswith(pattern)
+
+    def count_new(self, pattern):
+        """
+        Method used to count the occurrences of a pattern brought by the last chunk
+
+        The occurrences found entirely in the previous data are not counted again. So the
+        total number of occurrences is the sum of the values returned after each chunk.
+
+        :param pattern: the pattern to count
+        :type pattern: str
+
+        :return: the number of new occurrences
+        :rtype: int
+        """
+
+        # Pattern longer than the window?
+        if len(pattern) > self.window:
+
+            # Yes
+
+            # Not supported
+            raise ValueError(
+                f"count_new: pattern longer than the window: '{pattern}' ({self.window})"
+            )
+
+        # By default no occurrence
+        number = 0
+
+        # An occurrence must end in the new data
+        index = self.recent.find(
+            pattern, max(0, self._recent_old_size - len(pattern) + 1)
+        )
+
+        # Read all the occurrences
+        while index != -1:
+
+            # One more occurrence
+            number += 1
+
+            # Next occurrence
+            index = self.recent.find(pattern, index + len(pattern))
+
+        # Return the number of new occurrences
+        return number
+
+    def find_new(self, pattern, start=0):
+        """
+        Method used to find the first occurrence of a pattern brought by the last chunk
+
+        The occurrences found entirely in the previous data are not searched again.
+
+        :param pattern: the pattern to find
+        :type pattern: str
+
+        :param start: optional, the occurrence must start at this position of the data or after. Default value is 0
+        :type start: int
+
+        :return: the position of the occurrence in the whole data or -1 if not found
+        :rtype: int
+        """
+
+        # Pattern longer than the window?
+        if len(pattern) > self.window:
+
+            # Yes
+
+            # Not supported
+            raise ValueError(
+                f"find_new: pattern longer than the window: '{pattern}' ({self.window})"
+            )
+
+        # Position of the search window in the whole data
+        offset = self._size - len(self.recent)
+
+        # An occurrence must end in the new data (and start after "start")
+        index = self.recent.find(
+            pattern,
+            max(0, self._recent_old_size - len(pattern) + 1, start - offset),
+        )
+
+        # Return the position in the whole data
+        return -1 if index == -1 else offset + index
+
+    def getvalue(self):
+        """
+        Method used to get all the data gathered
+
+        :return: the data
+        :rtype: str
+        """
+
+        # More than one chunk?
+        if len(self._chunks) > 1:
+
+            # Yes
+
+            # The chunks are merged once (next calls will not join them again)
+            self._chunks = ["".join(self._chunks)]
+
+        # Return the data
+        return self._chunks[0] if self._chunks else ""
+
+    def clear(self):
+        """
+        Method used to remove all the data gathered
+        """
+
+        # Clear all the data
+        self._chunks = []
+        self._size = 0
+        self._tail = ""
+        self.recent = ""
+        self._recent_old_size = 0
+
+
+class PromptTracker:
+    """
+    Class used to detect the end of a command when the prompt is received twice
+
+    Mikrotik devices send the prompt again with the echo of the command and
+    then at the end of the output. The positions of the prompts are saved
+    while the data is received so the whole data is never searched again:
+
+    - "echo": waiting for the prompt sent with the echo of the command
+    - "first_prompt": first prompt found, waiting for the prompt ending the output
+    - "done": the prompt ending the output is found
+
+
+    :param buffer: the buffer receiving the data
+    :type buffer: ReceiveBuffer
+
+    :param prompts: the possible prompts (or endings of prompts) of the device
+    :type prompts: list
+    """
+
+    def __init__(self, buffer, prompts):
+
+        self.buffer = buffer
+        self.prompts = [prompt for prompt in prompts if prompt]
+
+        # Waiting for the prompt sent with the echo of the command
+        self.state = "echo"
+
+        # Position of the end of the first prompt in the data
+        self.first_prompt_end = 0
+
+        # Position of the prompt ending the output in the data
+        self.last_prompt_start = -1
+
+    def update(self):
+        """
+        Method used to check the new data of the buffer (called after each chunk)
+
+        :return: True if the prompt ending the output is found
+        :rtype: bool
+        """
+
+        # Check the new data until the prompt ending the output is found
+        while self.state != "done":
+
+            # Search the first prompt in the new data (after the previous prompt found)
+            position, length = -1, 0
+            for prompt in self.prompts:
+                index = self.buffer.find_new(prompt, self.first_prompt_end)
+                if index != -1 and (position == -1 or index < position):
+                    position, length = index, len(prompt)
+
+            # Prompt found?
+            if position == -1:
+
+                # No
+
+                # Wait for more data
+                return False
+
+            # First prompt found?
+            if self.state == "echo":
+
+                # Yes
+
+                # Now the prompt ending the output is expected after this one
+                self.state = "first_prompt"
+                self.first_prompt_end = position + length
+
+            else:
+
+                # No, prompt ending the output
+                self.state = "done"
+                self.last_prompt_start = position
+
+        # The end of the output is found
+        return True
+
+
+class OutputLines:
+    """
+    Class used to cut the output of a command into lines while it is received
+
+    The echo of the command at the beginning of the output is removed, as
+    well as the empty lines at the beginning and at the end of the output
+    (the same way as send_command). Only the end of the last line and the
+    beginning of the output (before the echo is found) are kept, so the
+    memory used does not depend on the size of the output.
+
+
+    :param echo: the echo of the command to remove (eg. "show version\n"). Empty string if there is no echo
+    :type echo: str
+    """
+
+    # Maximum size of data received without echo before the echo is not expected anymore
+    max_size_before_echo = 4096
+
+    def __init__(self, echo):
+
+        self.echo = echo
+
+        # Beginning of the data while the echo is not found
+        self._head = ""
+
+        # Echo already removed?
+        self._echo_removed = not echo
+
+        # End of the data after the last "\n" (line not complete)
+        self._pending = ""
+
+        # Empty lines not yet given (they are removed if they are at the end of the output)
+        self._empty_lines = 0
+
+        # Some lines already given? (the empty lines at the beginning are removed)
+        self._started = False
+
+    def feed(self, text):
+        """
+        Method used to add new data and to get the lines completed
+
+        :param text: the new data (without "\r")
+        :type text: str
+
+        :return: the lines completed (without "\n")
+        :rtype: list
+        """
+
+        # Echo of the command not yet removed?
+        if not self._echo_removed:
+
+            # Yes
+
+            # Search the echo at the beginning of the data
+            self._head += text
+            index = self._head.find(self.echo)
+
+            # Echo found?
+            if index != -1:
+
+                # Yes
+
+                # Remove it (and what is before it)
+                text = self._head[index + len(self.echo) :]
+
+            # Too much data without echo?
+            elif len(self._head) > len(self.echo) + self.max_size_before_echo:
+
+                # Yes
+
+                # No echo: all the data is the output
+                text = self._head
+
+            else:
+
+                # Wait for more data
+                return []
+
+            self._echo_removed = True
+            self._head = ""
+
+        # Cut the data into lines (the last one is not complete)
+        lines = (self._pending + text).split("\n")
+        self._pending = lines.pop()
+
+        return self._remove_empty_lines(lines)
+
+    def end(self, clean_last_line):
+        """
+        Method used to get the last lines once the end of the output is found
+
+        :param clean_last_line: function giving the last line of the data (with a "\n" before it) once cleaned (eg. without the prompt)
+        :type clean_last_line: function
+
+        :return: the last lines (without "\n")
+        :rtype: list
+        """
+
+        # Echo never found?
+        if not self._echo_removed:
+
+            # Yes
+
+            # All the data is the output
+            self._echo_removed = True
+            lines = self._head.split("\n")
+
+        else:
+
+            # No
+            lines = self._pending.split("\n")
+
+        # Clean the last line (prompt removed)
+        # The last line is given after a "\n" (the possible prompts start with "\n")
+        last_line = clean_last_line("\n" + lines[-1])
+        lines[-1] = last_line[1:] if last_line[:1] == "\n" else last_line
+
+        # No more data
+        self._head = self._pending = ""
+
+        # The empty lines at the end are not given
+        return self._remove_empty_lines(lines + [""])
+
+    def _remove_empty_lines(self, lines):
+        """
+        Method used to remove the empty lines at the beginning and to keep the empty lines at the end
+
+        :param lines: the lines completed
+        :type lines: list
+
+        :return: the lines to give
+        :rtype: list
+        """
+
+        # Beginning of the output?
+        if not self._started:
+
+            # Yes
+
+            # Skip the empty lines
+            index = 0
+            while index < len(lines) and not lines[index]:
+                index += 1
+            lines = lines[index:]
+
+        # Count the empty lines at the end
+        index = len(lines)
+        while index > 0 and not lines[index - 1]:
+            index -= 1
+
+        # Only empty lines?
+        if index == 0:
+
+            # Yes
+
+            # They are kept (given if a line with data comes after them)
+            if self._started:
+                self._empty_lines += len(lines)
+
+            return []
+
+        # The lines with data are given with the empty lines kept before them
+        lines_to_give = [""] * self._empty_lines + lines[:index]
+
+        # The empty lines at the end are kept
+        self._empty_lines = len(lines) - index
+        self._started = True
+
+        return lines_to_give
@@ -0,0 +1,1182 @@
+# Python library import
+import argparse, asyncio, asyncssh, collections, logging
+from netscud.devices.mikrotik.routeros_api import SentenceDecoder, encode_sentence
+
+# Logger of netscud (same logger as the one of the devices)
+log = logging.getLogger(__package__)
+
+# Declaration of constant values
+
+# Size of the data read at once
+MAX_BUFFER_DATA = 65535
+
+# ANSI escape sequence added to the outputs (erase till the end of the line)
+ANSI_ERASE_LINE = "\x1b[K"
+
+# Profiles of the devices simulated
+# - "prompt": prompt of the device ({hostname} and {username} replaced)
+# - "login", "password": prompts of the Telnet authentication
+# - "paging": command disabling paging ("" if the device has no paging)
+# - "more": text sent at the end of a page while paging is enabled
+# - "config": commands entering and leaving the configuration mode with the prompt used in configuration mode
+# - "echo_prompt": True if the prompt is sent again with the echo of the command (Mikrotik)
+# - "host_key": algorithm of the SSH host key (Alcatel: netscud only accepts "ssh-dss")
+# - "outputs": canned outputs of some commands ({hostname} replaced)
+PROFILES = {
+    "cisco_ios": {
+        "prompt": "{hostname}#",
+        "login": "Username: ",
+        "password": "Password: ",
+        "paging": "terminal length 0",
+        "more": " --More-- ",
+        "config": ("configure terminal", ("exit", "end"), "{hostname}(config)#"),
+        "echo_prompt": False,
+        "host_key": "ssh-ed25519",
+        "outputs": {
+            "show version": "Cisco IOS Software, C2960 Software (C2960-LANBASEK9-M), Version 15.0(2)SE11, RELEASE SOFTWARE (fc3)\r\n{hostname} uptime is 1 week, 2 days, 3 hours, 4 minutes\r\nProcessor board ID FOC1234X5YZ",
+            "show version | include uptime": "{hostname} uptime is 1 week, 2 days, 3 hours, 4 minutes",
+            "show inventory": 'NAME: "1", DESCR: "WS-C2960-24TT-L"\r\nPID: WS-C2960-24TT-L  , VID: V02  , SN: FOC1234X5YZ',
+        },
+    },
+    "cisco_s300": {
+        "prompt": "{hostname}#",
+        "login": "User Name:",
+        "password": "Password:",
+        "paging": "terminal datadump",
+        "more": "More: <space>,  Quit: q or CTRL+Z, One line: <return> ",
+        "config": ("configure terminal", ("exit", "end"), "{hostname}(config)#"),
+        "echo_prompt": False,
+        "host_key": "ssh-ed25519",
+        "outputs": {
+            "show system | include System Name:": "System Name:                              {hostname}",
+            "show version": "Active-image: flash://system/images/image_1.bin\r\n  Version: 1.4.11.5\r\n  MD5 Digest: 5f0c4b1e2d3a4f5e6d7c8b9a0f1e2d3c",
+            "show inventory": 'NAME: "1"   DESCR: "SG300-28 28-Port Gigabit Managed Switch"\r\nPID: SG300-28-K9       VID: V02      SN: DNI1234X5YZ',
+            "show system id unit 1": "Unit    Serial number\r\n---- -------------------\r\n 1       DNI1234X5YZ",
+        },
+    },
+    "alcatel_aos": {
+        "prompt": "{hostname}-> ",
+        "login": "login : ",
+        "password": "password : ",
+        "paging": "",
+        "more": "",
+        "config": None,
+        "echo_prompt": False,
+        "host_key": "ssh-dss",
+        "outputs": {
+            "show microcode": "/flash/working\r\n   Package           Release                 Size     Description\r\n-----------------+-------------------------+--------+-----------------------------------\r\nKfbase.img        6.7.2.191.R04            18892862 Alcatel-Lucent Base Software",
+            "show system": "System:\r\n  Description:  Alcatel-Lucent OS6450-P24 6.7.2.191.R04 GA, April 19, 2018.,\r\n  Name:         {hostname},",
+            "show chassis": "Chassis 1\r\n  Model Name:                    OS6450-P24,\r\n  Description:                   24 G POE,\r\n  Part Number:                   902736-90,\r\n  Serial Number:                 M1234567,",
+        },
+    },
+    "mikrotik_routeros": {
+        "prompt": "[{username}@{hostname}] > ",
+        "login": "Login: ",
+        "password": "Password: ",
+        "paging": "",
+        "more": "",
+        "config": None,
+        "echo_prompt": True,
+        "host_key": "ssh-ed25519",
+        "outputs": {
+            "system identity print without-paging": "  name: {hostname}",
+            "system resource print without-paging": "                   uptime: 1w2d3h4m5s\r\n                  version: 6.48.6 (long-term)\r\n             architecture-name: mipsbe\r\n                board-name: CRS326-24G-2S+",
+            "system routerboard print without-paging": "       routerboard: yes\r\n             model: CRS326-24G-2S+\r\n     serial-number: 6A1B2C3D4E5F\r\n  current-firmware: 6.48.6",
+        },
+    },
+}
+
+
+class DeviceSimulator:
+    """
+    Class used to simulate network devices on the local computer (SSH or Telnet server)
+
+    A simulator impersonates a device type (prompt, Telnet authentication,
+    paging, configuration mode, echo of the commands, etc.) so netscud can
+    be tested or benchmarked without real switches. Each connection is a
+    device: thousands of devices can be connected to the same simulator
+    (same ip address and port).
+
+    The commands without canned output get a generated output of
+    "output_lines" lines of "line_length" characters.
+
+    Example:
+
+    async with DeviceSimulator("cisco_ios", latency=0.05) as simulator:
+        async with netscud.ConnectDevice(**simulator.device()) as sw1:
+            print(await sw1.send_command("show version"))
+
+
+    :param device_type: optional, the device type simulated ("cisco_ios", "cisco_s300", "alcatel_aos" or "mikrotik_routeros"). Default value is "cisco_ios"
+    :type device_type: str
+
+    :param protocol: optional, "ssh" or "telnet". Default value is "ssh"
+    :type protocol: str
+
+    :param host: optional, the ip address of the server. Default value is "127.0.0.1"
+    :type host: str
+
+    :param port: optional, the port of the server. Default value is 0 (a free port is used)
+    :type port: int
+
+    :param hostname: optional, the name of the device in the prompt. Default value is "switch"
+    :type hostname: str
+
+    :param username: optional, the username accepted (None: any username). Default value is None
+    :type username: str
+
+    :param password: optional, the password accepted (None: any password). Default value is None
+    :type password: str
+
+    :param latency: optional, time in seconds before the answer of each command. Default value is 0.0
+    :type latency: float
+
+    :param output_lines: optional, the number of lines of the generated outputs. Default value is 10
+    :type output_lines: int
+
+    :param line_length: optional, the number of characters of each line of the generated outputs. Default value is 80
+    :type line_length: int
+
+    :param outputs: optional, canned outputs added to the outputs of the profile (command: output)
+    :type outputs: dict
+
+    :param ansi: optional, if True ANSI escape sequences are added at the end of the lines of the outputs. Default value is False
+    :type ansi: bool
+
+    :param page_lines: optional, the number of lines of a page while paging is enabled. Default value is 24
+    :type page_lines: int
+    """
+
+    def __init__(
+        self,
+        device_type="cisco_ios",
+        protocol="ssh",
+        host="127.0.0.1",
+        port=0,
+        hostname="switch",
+        username=None,
+        password=None,
+        latency=0.0,
+        output_lines=10,
+        line_length=80,
+        outputs=None,
+        ansi=False,
+        page_lines=24,
+    ):
+
+        # Device type supported?
+        if device_type not in PROFILES:
+
+            # No
+
+            # Raise an exception
+            raise ValueError(f"DeviceSimulator: unsupported device type: {device_type}")
+
+        self.device_type = device_type
+        self.profile = PROFILES[device_type]
+        self.protocol = protocol.lower()
+        self.host = host
+        self.port = port
+        self.hostname = hostname
+        self.username = username
+        self.password = password
+        self.latency = latency
+        self.ansi = ansi
+        self.page_lines = page_lines
+
+        # Canned outputs
+        self.outputs = {
+            command: output.format(hostname=hostname)
+            for command, output in self.profile["outputs"].items()
+        }
+        self.outputs.update(outputs or {})
+
+        # Generated output (used for the other commands)
+        self.default_output = "\r\n".join(
+            f"{number:<8}".ljust(line_length, "x")[:line_length]
+            for number in range(output_lines)
+        )
+
+        # Server (asyncssh or asyncio)
+        self.server = None
+
+        # Statistics: connections opened, connections open, commands received
+        self.connections = 0
+        self.open_connections = 0
+        self.commands = 0
+
+        # Number of times each command was received
+        self.received_commands = collections.Counter()
+
+        # Sessions running (task: function closing the connection)
+        self._sessions = {}
+
+    async def start(self):
+        """
+        Asyn method used to start the server
+
+        :return: the port of the server
+        :rtype: int
+        """
+
+        # Display info message
+        log.info(
+            "DeviceSimulator: start: %s %s %s:%s",
+            self.device_type,
+            self.protocol,
+            self.host,
+            self.port,
+        )
+
+        # SSH?
+        if self.protocol == "ssh":
+
+            # Yes
+
+            # Class of the SSH server (authentication with the username and password of the simulator)
+            simulator = self
+
+            class SSHServer(asyncssh.SSHServer):
+                def begin_auth(self, username):
+                    return True
+
+                def password_auth_supported(self):
+                    return True
+
+                def validate_password(self, username, password):
+                    return simulator.check_credentials(username, password)
+
+            # Start the SSH server
+            self.server = await asyncssh.create_server(
+                SSHServer,
+                self.host,
+                self.port,
+                server_host_keys=[
+                    asyncssh.generate_private_key(self.profile["host_key"])
+                ],
+                process_factory=self.handle_ssh,
+                line_editor=False,
+                encoding=None,
+            )
+
+        # Telnet?
+        elif self.protocol == "telnet":
+
+            # Yes
+
+            # Start the Telnet server
+            self.server = await asyncio.start_server(
+                self.handle_telnet, self.host, self.port, backlog=4096
+            )
+
+        else:
+
+            # Unsupported protocol
+
+            # Raise an exception
+            raise ValueError(f"DeviceSimulator: unsupported protocol: {self.protocol}")
+
+        # Port used (a free port if 0 was given)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+        return self.port
+
+    async def stop(self):
+        """
+        Asyn method used to stop the server
+        """
+
+        # Display info message
+        log.info("DeviceSimulator: stop")
+
+        # Server started?
+        if self.server:
+
+            # Yes
+
+            # No more connection accepted
+            self.server.close()
+
+            # Close the connections still open and wait for the end of their sessions
+            for close in self._sessions.values():
+                close()
+            if self._sessions:
+                await asyncio.wait(list(self._sessions), timeout=self.latency + 1)
+
+            await self.server.wait_closed()
+            self.server = None
+
+    async def __aenter__(self):
+
+        await self.start()
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+
+        await self.stop()
+
+    def device(self, **kwargs):
+        """
+        Method used to get the parameters of a device connected to the simulator (for ConnectDevice)
+
+        :param kwargs: optional, parameters added or replaced (eg. timeout=30)
+        :type kwargs: any
+
+        :return: the parameters of the device
+        :rtype: dict
+        """
+
+        return {
+            "ip": self.host,
+            "port": self.port,
+            "username": self.username or "admin",
+            "password": self.password or "",
+            "device_type": self.device_type,
+            "protocol": self.protocol,
+            **kwargs,
+        }
+
+    def check_credentials(self, username, password):
+        """
+        Method used to check the username and the password of a connection
+
+        The "+..." options of the Mikrotik usernames (eg. "admin+cte") are ignored.
+
+        :param username: the username received
+        :type username: str
+
+        :param password: the password received
+        :type password: str
+
+        :return: True if the username and the password are accepted
+        :rtype: bool
+        """
+
+        # Mikrotik options of the username removed
+        username = username.split("+", 1)[0]
+
+        return (self.username is None or username == self.username) and (
+            self.password is None or password == self.password
+        )
+
+    async def handle_ssh(self, process):
+        """
+        Asyn method used to run a SSH session
+
+        :param process: the SSH session
+        :type process: asyncssh.SSHServerProcess
+        """
+
+        # Username of the connection
+        username = process.get_extra_info("username").split("+", 1)[0]
+
+        # Run the session
+        await self.run_session(
+            SimulatedSession(
+                self,
+                username,
+                lambda: process.stdin.read(MAX_BUFFER_DATA),
+                lambda text: process.stdout.write(text.encode()),
+            ),
+            process.close,
+        )
+
+        # End of the session
+        process.exit(0)
+
+    async def handle_telnet(self, reader, writer):
+        """
+        Asyn method used to run a Telnet session (authentication first)
+
+        :param reader: the data received
+        :type reader: asyncio.StreamReader
+
+        :param writer: the data sent
+        :type writer: asyncio.StreamWriter
+        """
+
+        try:
+
+            # Run the session
+            await self.run_session(
+                SimulatedSession(
+                    self,
+                    "",
+                    lambda: reader.read(MAX_BUFFER_DATA),
+                    lambda text: writer.write(text.encode()),
+                ),
+                writer.close,
+                login=True,
+            )
+
+        finally:
+
+            # End of the connection
+            writer.close()
+
+    async def run_session(self, session, close, login=False):
+        """
+        Asyn method used to run a session and to count the connections
+
+        :param session: the session
+        :type session: SimulatedSession
+
+        :param close: the function closing the connection (used by stop)
+        :type close: function
+
+        :param login: optional, True if an authentication is needed first (Telnet). Default value is False
+        :type login: bool
+        """
+
+        # One more connection
+        self.connections += 1
+        self.open_connections += 1
+        task = asyncio.current_task()
+        self._sessions[task] = close
+
+        try:
+
+            # Authentication accepted (if needed)?
+            if not login or await session.login():
+
+                # Yes
+
+                # Run the session
+                await session.run()
+
+        except (ConnectionError, asyncssh.Error):
+
+            # Connection closed by the client
+            pass
+
+        finally:
+
+            # One less connection open
+            self.open_connections -= 1
+            del self._sessions[task]
+
+
+class SimulatedSession:
+    """
+    Class used to answer the commands of a connection to the simulator (one simulated device)
+
+
+    :param simulator: the simulator
+    :type simulator: DeviceSimulator
+
+    :param username: the username of the connection ("" for Telnet, read by login())
+    :type username: str
+
+    :param read: function returning a coroutine reading the data received (bytes; b"" when the connection is closed)
+    :type read: function
+
+    :param write: function sending a text
+    :type write: function
+    """
+
+    def __init__(self, simulator, username, read, write):
+
+        self.simulator = simulator
+        self.profile = simulator.profile
+        self.username = username
+        self.read = read
+        self.write = write
+
+        # Data received not yet used (after the last end of line)
+        self.pending = ""
+
+        # True if the last line ended with "\r" (a "\n" received next is the end of the same line)
+        self.carriage_return = False
+
+        # Paging enabled by default (if the device has paging)
+        self.paging = bool(self.profile["paging"])
+
+        # Configuration mode
+        self.config_mode = False
+
+    @property
+    def prompt(self):
+        """
+        Prompt of the device (configuration mode or not)
+        """
+
+        # Configuration mode?
+        if self.config_mode:
+
+            # Yes
+            prompt = self.profile["config"][2]
+
+        else:
+
+            # No
+            prompt = self.profile["prompt"]
+
+        return prompt.format(
+            hostname=self.simulator.hostname, username=self.username or "admin"
+        )
+
+    async def read_line(self):
+        """
+        Asyn method used to read a line
+
+        :return: the line without the end of line (None if the connection is closed)
+        :rtype: str
+        """
+
+        # Read till an end of line is received
+        while "\n" not in self.pending and "\r" not in self.pending:
+
+            # Read data
+            data = await self.read()
+
+            # Connection closed?
+            if not data:
+
+                # Yes
+                return None
+
+            self.pending += data.decode(errors="ignore")
+
+            # End of the previous line ("\r\n" received in 2 parts)?
+            if self.carriage_return and self.pending[:1] == "\n":
+
+                # Yes
+                self.pending = self.pending[1:]
+
+            self.carriage_return = False
+
+        # Split the first line ("\r\n", "\r" or "\n")
+        position = min(
+            index
+            for index in (self.pending.find("\r"), self.pending.find("\n"))
+            if index != -1
+        )
+        line, end_of_line = self.pending[:position], self.pending[position]
+        self.pending = self.pending[position + 1 :]
+
+        # End of line with "\r"?
+        if end_of_line == "\r":
+
+            # Yes
+
+            # "\r\n"?
+            if self.pending[:1] == "\n":
+
+                # Yes
+                self.pending = self.pending[1:]
+
+            # "\n" not yet received?
+            elif not self.pending:
+
+                # Yes
+                self.carriage_return = True
+
+        return line
+
+    async def login(self):
+        """
+        Asyn method used for the Telnet authentication
+
+        :return: True if the username and the password are accepted
+        :rtype: bool
+        """
+
+        # Username
+        self.write(f"\r\n{self.profile['login']}")
+        username = await self.read_line()
+
+        # Password
+        self.write(f"\r\n{self.profile['password']}")
+        password = await self.read_line()
+
+        # Connection closed?
+        if username is None or password is None:
+
+            # Yes
+            return False
+
+        # Wrong username or password?
+        if not self.simulator.check_credentials(username, password):
+
+            # Yes
+            self.write("\r\n% Authentication failed\r\n")
+            return False
+
+        # Username of the prompt (Mikrotik options removed)
+        self.username = username.split("+", 1)[0]
+
+        return True
+
+    async def run(self):
+        """
+        Asyn method used to answer the commands till the connection is closed
+        """
+
+        # First prompt (Mikrotik: the prompt is written again after an ANSI escape sequence)
+        if self.profile["echo_prompt"]:
+            self.write(f"\r\n\r\n{self.prompt}{ANSI_ERASE_LINE}\r{self.prompt}")
+        else:
+            self.write(f"\r\n{self.prompt}")
+
+        # Read the commands
+        while True:
+
+            # Read a command
+            command = await self.read_line()
+
+            # Connection closed?
+            if command is None:
+
+                # Yes
+                break
+
+            # Answer the command
+            await self.execute(command.strip())
+
+    async def execute(self, command):
+        """
+        Asyn method used to answer a command
+
+        :param command: the command received
+        :type command: str
+        """
+
+        # One more command
+        self.simulator.commands += 1
+        self.simulator.received_commands[command] += 1
+
+        # Echo of the command (Mikrotik: with the prompt)
+        if self.profile["echo_prompt"]:
+            echo = f"\r{self.prompt}{command}\r\n\r"
+        else:
+            echo = f"{command}\r\n"
+
+        # Get the output of the command
+        output = self.get_output(command)
+
+        # Time needed by the device
+        if self.simulator.latency:
+            await asyncio.sleep(self.simulator.latency)
+
+        # Output with ANSI escape sequences?
+        if output and self.simulator.ansi:
+            output = output.replace("\r\n", ANSI_ERASE_LINE + "\r\n")
+
+        # Paging of the output?
+        if output and self.paging and self.profile["more"]:
+
+            # Yes
+            output = await self.write_pages(echo, output)
+
+            # Output stopped by the user?
+            if output is None:
+
+                # Yes
+                self.write(f"\r\n{self.prompt}")
+                return
+
+            echo = ""
+
+        # Send the echo, the output and the prompt
+        self.write(
+            f"{echo}{output}\r\n{self.prompt}" if output else f"{echo}{self.prompt}"
+        )
+
+    async def write_pages(self, echo, output):
+        """
+        Asyn method used to send an output page by page (a key is expected at the end of each page)
+
+        :param echo: the echo of the command
+        :type echo: str
+
+        :param output: the output of the command
+        :type output: str
+
+        :return: the last page (None if the output is stopped with "q")
+        :rtype: str
+        """
+
+        # Lines of the output
+        lines = output.split("\r\n")
+        page_lines = max(1, self.simulator.page_lines)
+
+        # Beginning of each page
+        starts = range(0, len(lines), page_lines)
+
+        # Send the pages except the last one
+        for start in starts[:-1]:
+
+            # Send the page
+            self.write(
+                echo
+                + "\r\n".join(lines[start : start + page_lines])
+                + "\r\n"
+                + self.profile["more"]
+            )
+            echo = ""
+
+            # Wait for a key
+            key = await self.read()
+
+            # Stop?
+            if not key or key[:1] in (b"q", b"Q", b"\x1a"):
+
+                # Yes
+                return None
+
+            # Remove the text of paging
+            self.write("\r" + " " * len(self.profile["more"]) + "\r")
+
+        # Last page
+        return echo + "\r\n".join(lines[starts[-1] :])
+
+    def get_output(self, command):
+        """
+        Method used to get the output of a command (paging and configuration mode are changed)
+
+        :param command: the command received
+        :type command: str
+
+        :return: the output of the command ("" if no output)
+        :rtype: str
+        """
+
+        # Empty command (carriage return)?
+        if not command:
+
+            # Yes
+            return ""
+
+        # Command disabling paging?
+        if command == self.profile["paging"]:
+
+            # Yes
+            self.paging = False
+            return ""
+
+        # Configuration mode of the device?
+        config = self.profile["config"]
+        if config:
+
+            # Yes
+
+            # Enter the configuration mode?
+            if command == config[0]:
+
+                # Yes
+                self.config_mode = True
+                return ""
+
+            # Leave the configuration mode?
+            if command in config[1]:
+
+                # Yes
+                self.config_mode = False
+                return ""
+
+            # Command in configuration mode?
+            if self.config_mode:
+
+                # Yes, no output
+                return ""
+
+        # Canned output?
+        output = self.simulator.outputs.get(command)
+        if output is not None:
+
+            # Yes
+            return output
+
+        # Generated output
+        return self.simulator.default_output
+
+
+class RouterOSAPISimulator:
+    """
+    Class used to simulate the RouterOS API of Mikrotik devices on the local computer
+
+    The server answers the sentences of the API (see RouterOSAPI): "/login"
+    (username and password checked), "<menu>/print" with the records given
+    (queries "?key=value" and ".proplist" supported) and "/quit". Each
+    answer gets the tag of its command. An unknown command or a wrong
+    login gets a "!trap" then a "!done".
+
+    Example:
+
+    records = {"/ip/arp": [{"address": "192.168.0.1", "mac-address": "00:11:22:33:44:55"}]}
+    async with RouterOSAPISimulator(records=records) as simulator:
+        async with RouterOSAPI(**simulator.device()) as api:
+            print(await api.print("/ip/arp"))
+
+
+    :param host: optional, the ip address of the server. Default value is "127.0.0.1"
+    :type host: str
+
+    :param port: optional, the port of the server. Default value is 0 (a free port is used)
+    :type port: int
+
+    :param username: optional, the username accepted (None: any username). Default value is None
+    :type username: str
+
+    :param password: optional, the password accepted (None: any password). Default value is None
+    :type password: str
+
+    :param records: optional, the records of each menu (menu: list of dictionaries, eg. {"/ip/arp": [...]}) or of each command other than "print" (eg. {"/interface/ethernet/monitor": [...]})
+    :type records: dict
+
+    :param latency: optional, time in seconds before the answer of each command. Default value is 0.0
+    :type latency: float
+    """
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=0,
+        username=None,
+        password=None,
+        records=None,
+        latency=0.0,
+    ):
+
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.records = records or {}
+        self.latency = latency
+
+        # Server (asyncio)
+        self.server = None
+
+        # Statistics: connections opened, commands received
+        self.connections = 0
+        self.commands = 0
+
+        # Connections open (task: function closing the connection)
+        self._sessions = {}
+
+    async def start(self):
+        """
+        Asyn method used to start the server
+
+        :return: the port of the server
+        :rtype: int
+        """
+
+        # Display info message
+        log.info("RouterOSAPISimulator: start: %s:%s", self.host, self.port)
+
+        # Start the server
+        self.server = await asyncio.start_server(
+            self.handle_connection, self.host, self.port
+        )
+
+        # Port used (a free port if 0 was given)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+        return self.port
+
+    async def stop(self):
+        """
+        Asyn method used to stop the server
+        """
+
+        # Display info message
+        log.info("RouterOSAPISimulator: stop")
+
+        # Server started?
+        if self.server:
+
+            # Yes
+
+            # No more connection accepted
+            self.server.close()
+
+            # Close the connections still open and wait for the end of their sessions
+            for close in self._sessions.values():
+                close()
+            if self._sessions:
+                await asyncio.wait(list(self._sessions), timeout=self.latency + 1)
+
+            await self.server.wait_closed()
+            self.server = None
+
+    async def __aenter__(self):
+
+        await self.start()
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+
+        await self.stop()
+
+    def device(self, **kwargs):
+        """
+        Method used to get the parameters of a connection to the simulator (for RouterOSAPI)
+
+        :param kwargs: optional, parameters added or replaced (eg. timeout=30)
+        :type kwargs: any
+
+        :return: the parameters of the connection
+        :rtype: dict
+        """
+
+        return {
+            "ip": self.host,
+            "port": self.port,
+            "username": self.username or "admin",
+            "password": self.password or "",
+            **kwargs,
+        }
+
+    async def handle_connection(self, reader, writer):
+        """
+        Asyn method used to answer the sentences of a connection
+
+        :param reader: the data received
+        :type reader: asyncio.StreamReader
+
+        :param writer: the data sent
+        :type writer: asyncio.StreamWriter
+        """
+
+        # One more connection
+        self.connections += 1
+        task = asyncio.current_task()
+        self._sessions[task] = writer.close
+
+        # Decoder of the sentences
+        decoder = SentenceDecoder()
+
+        # Not yet logged in
+        logged_in = False
+
+        try:
+
+            # Read the sentences
+            while True:
+
+                # Read the data received
+                data = await reader.read(MAX_BUFFER_DATA)
+
+                # Connection closed?
+                if not data:
+
+                    # Yes
+                    break
+
+                # Answer each sentence
+                for words in decoder.feed(data):
+
+                    # Empty sentence?
+                    if not words:
+
+                        # Yes
+                        continue
+
+                    # One more command
+                    self.commands += 1
+
+                    # Command, attributes, queries and tag of the sentence
+                    command, attributes, queries, tag = words[0], {}, [], None
+                    for word in words[1:]:
+                        if word.startswith(".tag="):
+                            tag = word[5:]
+                        elif word.startswith("="):
+                            key, _, value = word[1:].partition("=")
+                            attributes[key] = value
+                        elif word.startswith("?"):
+                            queries.append(word[1:])
+
+                    # Menu of a "print" command (records given by "records")
+                    menu = (
+                        command[: -len("/print")]
+                        if command.endswith("/print")
+                        else command
+                    )
+
+                    # Tag added to each answer
+                    tag_words = [f".tag={tag}"] if tag is not None else []
+
+                    # Time needed by the device
+                    if self.latency:
+                        await asyncio.sleep(self.latency)
+
+                    # Login?
+                    if command == "/login":
+
+                        # Yes
+
+                        # Username and password accepted?
+                        logged_in = (
+                            self.username is None
+                            or attributes.get("name") == self.username
+                        ) and (
+                            self.password is None
+                            or attributes.get("password") == self.password
+                        )
+
+                        # Answer of the login
+                        if not logged_in:
+                            writer.write(
+                                encode_sentence(
+                                    [
+                                        "!trap",
+                                        "=message=invalid user name or password (6)",
+                                    ]
+                                    + tag_words
+                                )
+                            )
+                        writer.write(encode_sentence(["!done"] + tag_words))
+
+                    # Not logged in or end of the connection?
+                    elif not logged_in or command == "/quit":
+
+                        # Yes
+
+                        # The connection is closed
+                        writer.write(
+                            encode_sentence(
+                                [
+                                    "!fatal",
+                                    (
+                                        "session terminated on request"
+                                        if logged_in
+                                        else "not logged in"
+                                    ),
+                                ]
+                            )
+                        )
+                        await writer.drain()
+                        return
+
+                    # Records of a menu ("<menu>/print") or of a command (eg. "<menu>/monitor")?
+                    elif menu in self.records:
+
+                        # Yes
+
+                        # Properties to give (all by default)
+                        proplist = (
+                            attributes[".proplist"].split(",")
+                            if ".proplist" in attributes
+                            else None
+                        )
+
+                        # Records matching all the queries ("key=value")
+                        for record in self.records[menu]:
+                            if all(
+                                str(record.get(key)) == value
+                                for key, _, value in (
+                                    query.partition("=") for query in queries
+                                )
+                            ):
+                                writer.write(
+                                    encode_sentence(
+                                        ["!re"]
+                                        + [
+                                            f"={key}={value}"
+                                            for key, value in record.items()
+                                            if proplist is None or key in proplist
+                                        ]
+                                        + tag_words
+                                    )
+                                )
+
+                        # End of the answer
+                        writer.write(encode_sentence(["!done"] + tag_words))
+
+                    else:
+
+                        # Unknown command
+                        writer.write(
+                            encode_sentence(
+                                ["!trap", "=message=no such command prefix"] + tag_words
+                            )
+                        )
+                        writer.write(encode_sentence(["!done"] + tag_words))
+
+                await writer.drain()
+
+        except ConnectionError:
+
+            # Connection closed by the client
+            pass
+
+        finally:
+
+            # End of the connection
+            del self._sessions[task]
+            writer.close()
+
+
+async def serve(device_type, protocol, port, **kwargs):
+    """
+    Asyn function used to run a simulator till the program is stopped
+
+    :param device_type: the device type simulated
+    :type device_type: str
+
+    :param protocol: "ssh" or "telnet"
+    :type protocol: str
+
+    :param port: the port of the server
+    :type port: int
+
+    :param kwargs: optional, other parameters of the simulator
+    :type kwargs: any
+    """
+
+    # Start the simulator
+    async with DeviceSimulator(device_type, protocol, port=port, **kwargs) as simulator:
+
+        # Display message
+        print(
+            f"{device_type} simulator ({protocol}) on {simulator.host}:{simulator.port}",
+            flush=True,
+        )
+
+        # Run forever
+        await asyncio.Event().wait()
+
+
+def main():
+    """
+    Function used to run a simulator from the command line
+
+    Example: python -m netscud.simulator cisco_ios --protocol telnet --port 2323 --latency 0.05
+    """
+
+    # Parameters of the command line
+    parser = argparse.ArgumentParser(description="netscud device simulator")
+    parser.add_argument("device_type", choices=sorted(PROFILES))
+    parser.add_argument("--protocol", choices=("ssh", "telnet"), default="ssh")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--hostname", default="switch")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--output-lines", type=int, default=10)
+    parser.add_argument("--line-length", type=int, default=80)
+    parser.add_argument("--ansi", action="store_true")
+    arguments = parser.parse_args()
+
+    # Run the simulator
+    asyncio.run(
+        serve(
+            arguments.device_type,
+            arguments.protocol,
+            arguments.port,
+            host=arguments.host,
+            hostname=arguments.hostname,
+            latency=arguments.latency,
+            output_lines=arguments.output_lines,
+            line_length=arguments.line_length,
+            ansi=arguments.ansi,
+        )
+    )
+
+
+# Main function call
+if __name__ == "__main__":
+    main()
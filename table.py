@@ -0,0 +1,317 @@
+# Python library import
+from array import array
+from collections.abc import Mapping
+
+# Declaration of constant values
+
+# Fields of the MAC address table (get_mac_address_table)
+MAC_ADDRESS_TABLE_FIELDS = ("mac_type", "mac_address", "vlan", "interface")
+
+# Fields of the MAC address table with few different values
+MAC_ADDRESS_TABLE_CATEGORIES = ("mac_type", "vlan", "interface")
+
+# Fields of the ARP table (get_arp_table)
+ARP_TABLE_FIELDS = ("address", "mac_address", "interface")
+
+# Fields of the ARP table with few different values
+ARP_TABLE_CATEGORIES = ("interface",)
+
+
+class Row(Mapping):
+    """
+    Class used to read a row of a Table like a dictionary
+
+    The row does not copy the values: it only has the position of the row
+    in the table (row["mac_address"], row.get("vlan"), dict(row), etc.).
+
+
+    :param table: the table of the row
+    :type table: Table
+
+    :param index: the position of the row in the table
+    :type index: int
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table, index):
+
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, key):
+
+        # Get the value of the field in its column (KeyError if the field is unknown)
+        return self._table._get_value(self._table._positions[key], self._index)
+
+    def __iter__(self):
+
+        return iter(self._table.fields)
+
+    def __len__(self):
+
+        return len(self._table.fields)
+
+    def __repr__(self):
+
+        return repr(dict(self))
+
+
+class Table:
+    """
+    Class used to save the rows of a table getter (MAC address table, ARP table, etc.) by columns
+
+    A list of dictionaries repeats the names of the fields and a dictionary
+    in each row. A Table keeps one list per field instead. The fields with
+    few different values (type of MAC address, vlan, interface, name of the
+    device, etc.) are saved as categories: each different value is saved
+    once and each row only has its code (4 bytes).
+
+    The rows are read as dictionaries (table[0]["mac_address"], for loop,
+    etc.) and a Table is equal to the list of dictionaries with the same
+    values.
+
+
+    :param fields: the names of the fields (columns)
+    :type fields: list
+
+    :param categories: optional, the names of the fields with few different values (their values must be hashable). Default value is () (no category)
+    :type categories: list
+    """
+
+    __slots__ = ("fields", "_positions", "_columns", "_categories")
+
+    def __init__(self, fields, categories=()):
+
+        # Names of the fields
+        self.fields = tuple(fields)
+
+        # Position of each field
+        self._positions = {
+            field: position for position, field in enumerate(self.fields)
+        }
+
+        # Values of each field (codes for the categories)
+        self._columns = [
+            array("I") if field in categories else [] for field in self.fields
+        ]
+
+        # Different values of the categories (list of values, code of each value); None if not a category
+        self._categories = [
+            ([], {}) if field in categories else None for field in self.fields
+        ]
+
+    @classmethod
+    async def collect(cls, records, fields, categories=(), **values):
+        """
+        Asyn method used to create a table from the records given by an async generator
+
+        Example: table = await Table.collect(sw1.iter_mac_address_table(), MAC_ADDRESS_TABLE_FIELDS, MAC_ADDRESS_TABLE_CATEGORIES)
+
+        :param records: the records (dictionaries) given by an async generator (eg. iter_mac_address_table())
+        :type records: async generator
+
+        :param fields: the names of the fields (columns)
+        :type fields: list
+
+        :param categories: optional, the names of the fields with few different values. Default value is () (no category)
+        :type categories: list
+
+        :param values: optional, values added to each record (eg. device="switch1")
+        :type values: any
+
+        :return: the table with the records
+        :rtype: Table
+        """
+
+        # Create the table
+        table = cls(fields, categories)
+
+        # Add the records
+        await table.aextend(records, **values)
+
+        return table
+
+    def append(self, record):
+        """
+        Method used to add a record at the end of the table
+
+        :param record: the record (a missing field gives None)
+        :type record: dict
+        """
+
+        # Add the value of each field
+        for column, category, field in zip(
+            self._columns, self._categories, self.fields
+        ):
+
+            # Get the value
+            value = record.get(field)
+
+            # Category?
+            if category is not None:
+
+                # Yes
+
+                # Get the code of the value
+                category_values, codes = category
+                code = codes.get(value)
+
+                # New value?
+                if code is None:
+
+                    # Yes
+                    code = codes[value] = len(category_values)
+                    category_values.append(value)
+
+                # Add the code
+                column.append(code)
+
+            else:
+
+                # No
+
+                # Add the value
+                column.append(value)
+
+    def extend(self, records, **values):
+        """
+        Method used to add records at the end of the table
+
+        :param records: the records (dictionaries)
+        :type records: list
+
+        :param values: optional, values added to each record (eg. device="switch1")
+        :type values: any
+        """
+
+        # Add each record
+        for record in records:
+            self.append({**record, **values} if values else record)
+
+    async def aextend(self, records, **values):
+        """
+        Asyn method used to add the records given by an async generator (eg. iter_mac_address_table())
+
+        The records are added while they are received.
+
+        :param records: the records (dictionaries) given by an async generator
+        :type records: async generator
+
+        :param values: optional, values added to each record (eg. device="switch1")
+        :type values: any
+        """
+
+        # Add each record
+        async for record in records:
+            self.append({**record, **values} if values else record)
+
+    def column(self, field):
+        """
+        Method used to get all the values of a field
+
+        :param field: the name of the field
+        :type field: str
+
+        :return: the values of the field (one value per row)
+        :rtype: list
+        """
+
+        # Get the column
+        position = self._positions[field]
+        column = self._columns[position]
+        category = self._categories[position]
+
+        # Category?
+        if category is not None:
+
+            # Yes, the codes are converted into values
+            category_values = category[0]
+            return [category_values[code] for code in column]
+
+        # Copy of the values
+        return list(column)
+
+    def to_list(self):
+        """
+        Method used to convert the table into a list of dictionaries (the result of get_mac_address_table, etc.)
+
+        :return: the rows of the table
+        :rtype: list of dict
+        """
+
+        # Get the columns with their values
+        columns = [self.column(field) for field in self.fields]
+
+        # Create a dictionary for each row
+        return [dict(zip(self.fields, values)) for values in zip(*columns)]
+
+    def _get_value(self, position, index):
+        """
+        Method used to get a value of the table
+
+        :param position: the position of the field
+        :type position: int
+
+        :param index: the position of the row
+        :type index: int
+
+        :return: the value
+        :rtype: any
+        """
+
+        # Get the value or its code
+        value = self._columns[position][index]
+
+        # Category?
+        category = self._categories[position]
+        if category is not None:
+
+            # Yes, the code is converted into a value
+            value = category[0][value]
+
+        return value
+
+    def __len__(self):
+
+        return len(self._columns[0]) if self._columns else 0
+
+    def __getitem__(self, index):
+
+        # Several rows?
+        if isinstance(index, slice):
+
+            # Yes
+            return [Row(self, i) for i in range(*index.indices(len(self)))]
+
+        # Negative index (from the end of the table)?
+        if index < 0:
+            index += len(self)
+
+        # Index out of the table?
+        if not 0 <= index < len(self):
+            raise IndexError("Table index out of range")
+
+        return Row(self, index)
+
+    def __iter__(self):
+
+        for index in range(len(self)):
+            yield Row(self, index)
+
+    def __eq__(self, other):
+
+        # Table or list of dictionaries?
+        if not isinstance(other, (Table, list)):
+
+            # No
+            return NotImplemented
+
+        # Same rows?
+        return len(self) == len(other) and all(
+            row == other_row for row, other_row in zip(self, other)
+        )
+
+    def __repr__(self):
+
+        return f"Table(fields={self.fields!r}, rows={len(self)})"
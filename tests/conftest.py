@@ -0,0 +1,19 @@
+# Python library import
+import importlib.util, os, sys
+
+# The root of the repository is the netscud package: it is imported as "netscud"
+# (like once installed) without being installed
+if "netscud" not in sys.modules:
+
+    # Root of the repository
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    # Import the package
+    spec = importlib.util.spec_from_file_location(
+        "netscud",
+        os.path.join(root, "__init__.py"),
+        submodule_search_locations=[root],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["netscud"] = module
+    spec.loader.exec_module(module)
@@ -0,0 +1,118 @@
+# Python library import
+import asyncio
+import pytest
+import netscud
+from netscud.simulator import DeviceSimulator
+
+# VLANs of the simulated devices (VLAN 10: ether1/1/1/2 untagged, VLAN 20: sfp1/1/1/3 tagged)
+OUTPUTS = {
+    "mikrotik_routeros": {
+        "interface bridge vlan print terse": (
+            ' 0   comment="vlan 10" bridge=bridge1 vlan-ids=10 tagged=sfp1 untagged=ether1\r\n'
+            " 1   bridge=bridge1 vlan-ids=20 tagged=sfp1 untagged=ether5"
+        ),
+    },
+    "alcatel_aos": {
+        "show vlan port": (
+            " vlan     port     type        status\r\n"
+            "--------+-------+-----------+-------------\r\n"
+            "   1     1/1/1   default     forwarding\r\n"
+            "  10     1/1/2   default     forwarding\r\n"
+            "  20     1/1/3   qtagged     forwarding"
+        ),
+        "show vlan": (
+            " vlan    type   admin   oper    1x1   flat   auth   ip    tag   name\r\n"
+            "------+-------+-------+------+------+------+------+-----+-----+----------\r\n"
+            "   1      std    on      on     on     on     off   on     off  VLAN 1\r\n"
+            "  10      std    on      on     on     on     off   off    off  VLAN 10\r\n"
+            "  20      std    on      on     on     on     off   off    off  VLAN 20"
+        ),
+    },
+}
+
+# Membership asked, status and configuration commands expected for each device type
+CASES = {
+    "mikrotik_routeros": {
+        "add": (
+            {"ether2": ("access", 10), "ether3": ("trunk", 20)},
+            True,
+            {
+                "interface bridge vlan set [find vlan-ids=10] untagged=ether1,ether2",
+                "interface bridge vlan set [find vlan-ids=20] tagged=sfp1,ether3",
+                "interface bridge port set [find interface=ether2] pvid=10",
+            },
+        ),
+        "move": (
+            {"ether1": ("access", 20)},
+            True,
+            {
+                'interface bridge vlan set [find vlan-ids=10] untagged=""',
+                "interface bridge vlan set [find vlan-ids=20] untagged=ether5,ether1",
+                "interface bridge port set [find interface=ether1] pvid=20",
+            },
+        ),
+        "no-op": (
+            {"ether1": ("access", 10), "sfp1": ("trunk", 20)},
+            True,
+            set(),
+        ),
+        "missing VLAN": (
+            {"ether2": ("access", 10), "ether3": ("access", 30)},
+            False,
+            set(),
+        ),
+    },
+    "alcatel_aos": {
+        "add": (
+            {"1/1/4": ("access", 10), "1/1/5": ("trunk", 20)},
+            True,
+            {"vlan 10 port default 1/1/4", "vlan 20 802.1q 1/1/5"},
+        ),
+        "move": (
+            {"1/1/2": ("access", 20)},
+            True,
+            {"vlan 20 port default 1/1/2"},
+        ),
+        "no-op": (
+            {"1/1/2": ("access", 10), "1/1/3": ("trunk", 20)},
+            True,
+            set(),
+        ),
+        "missing VLAN": (
+            {"1/1/4": ("access", 10), "1/1/5": ("access", 30)},
+            False,
+            set(),
+        ),
+    },
+}
+
+
+@pytest.mark.parametrize("case", ["add", "move", "no-op", "missing VLAN"])
+@pytest.mark.parametrize("device_type", sorted(CASES))
+def test_apply_vlan_membership(device_type, case):
+    membership, expected_status, expected_commands = CASES[device_type][case]
+
+    async def run():
+        async with DeviceSimulator(
+            device_type, "ssh", outputs=OUTPUTS[device_type], output_lines=0
+        ) as sim:
+            async with netscud.ConnectDevice(**sim.device(), timeout=5) as device:
+                status = await device.apply_vlan_membership(membership)
+
+                # Configuration commands received (not the show and print commands)
+                return status, {
+                    cmd
+                    for cmd in sim.received_commands
+                    if cmd.startswith(
+                        (
+                            "interface bridge vlan set",
+                            "interface bridge port set",
+                            "vlan ",
+                        )
+                    )
+                }
+
+    status, commands = asyncio.run(run())
+
+    assert status == expected_status
+    assert commands == expected_commands
@@ -0,0 +1,153 @@
+# Python library import
+import asyncio, json
+import netscud
+from netscud.capabilities import CapabilityCache
+from netscud.simulator import DeviceSimulator
+
+# Commands of the 2 dialects (AOS 7+ and AOS 6)
+AOS7_CMD = "show interfaces alias"
+AOS6_CMD = "show interfaces port"
+
+# Outputs of an AOS 6 device (AOS 7+ command refused)
+AOS6_OUTPUTS = {
+    AOS7_CMD: '                      ^\r\nERROR: Invalid entry: "alias"',
+    AOS6_CMD: "Slot/Port  Admin Status  Link Status  Alias",
+}
+
+
+def read_values(path):
+    """
+    Function used to read the values of the capabilities written in a file
+    """
+
+    with open(path, encoding="utf-8") as file:
+        return [
+            (record["device_type"], record["name"], record["value"])
+            for record in map(json.loads, file)
+        ]
+
+
+def test_aos_version_probe_and_cache(tmp_path):
+    path = str(tmp_path / "capabilities.jsonl")
+
+    async def run():
+        results = []
+        async with DeviceSimulator("alcatel_aos", "ssh") as sim:
+
+            # 2 runs of a script (the second one reads the file written by the first one)
+            for _ in range(2):
+                async with netscud.ConnectDevice(
+                    **sim.device(capability_cache=CapabilityCache(path)), timeout=5
+                ) as device:
+                    commands = sim.commands
+                    aos_version = await device.get_aos_version()
+                    results.append((aos_version, sim.commands - commands))
+
+                # Capabilities written when the device is disconnected
+                results.append(read_values(path))
+
+        return results
+
+    first_run, first_file, second_run, second_file = asyncio.run(run())
+
+    # The dialect is found once with "show microcode" and saved
+    assert first_run == (6, 1)
+    assert first_file == [("alcatel_aos", "aos_version", 6)]
+
+    # Then read from the file (no command sent, nothing written)
+    assert second_run == (6, 0)
+    assert second_file == first_file
+
+
+def test_aos_version_fallback(tmp_path):
+    path = str(tmp_path / "capabilities.jsonl")
+
+    async def run():
+        async with DeviceSimulator("alcatel_aos", "ssh", outputs=AOS6_OUTPUTS) as sim:
+
+            # Dialect saved by a previous run: AOS 7 (device downgraded since)
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(
+                    json.dumps(
+                        {
+                            "ip": sim.host,
+                            "port": sim.port,
+                            "device_type": "alcatel_aos",
+                            "name": "aos_version",
+                            "value": 7,
+                        }
+                    )
+                    + "\n"
+                )
+
+            async with netscud.ConnectDevice(
+                **sim.device(capability_cache=CapabilityCache(path)), timeout=5
+            ) as device:
+                commands = sim.commands
+
+                # AOS 7 command refused, then AOS 6 command sent
+                output = await device.send_aos_command(AOS7_CMD, AOS6_CMD)
+
+                return (
+                    output,
+                    sim.commands - commands,
+                    device.get_capability("aos_version"),
+                )
+
+    output, commands, aos_version = asyncio.run(run())
+
+    assert output == AOS6_OUTPUTS[AOS6_CMD]
+    assert commands == 2
+    assert aos_version == 6
+
+    # The new dialect is added at the end of the file
+    assert read_values(path) == [
+        ("alcatel_aos", "aos_version", 7),
+        ("alcatel_aos", "aos_version", 6),
+    ]
+
+
+def test_capability_cache_round_trip(tmp_path):
+    path = str(tmp_path / "capabilities.jsonl")
+
+    class Device:
+        ip = "192.168.0.1"
+        port = 22
+        device_type = "alcatel_aos"
+
+    async def run():
+        cache = CapabilityCache(path)
+
+        # Several values saved while the event loop is running
+        for value in (6, 7, 6, 7):
+            cache.set(Device, "aos_version", value)
+        cache.set(Device, "other", {"a": [1, 2]})
+
+        # Same value: nothing written
+        cache.set(Device, "other", {"a": [1, 2]})
+
+        # Wait for the lines written by the thread
+        await cache.flush()
+
+    asyncio.run(run())
+
+    # Lines written in order
+    assert [value for _, _, value in read_values(path)] == [6, 7, 6, 7, {"a": [1, 2]}]
+
+    # A line which cannot be read is ignored
+    with open(path, "a", encoding="utf-8") as file:
+        file.write('{"ip": "192.168.0.1", "port"\n')
+
+    # The file is read again (last values), then rewritten (a lot of old values)
+    cache = CapabilityCache(path)
+    assert cache.get(Device, "aos_version") == 7
+    assert cache.get(Device, "other") == {"a": [1, 2]}
+    assert cache.get(Device, "unknown", "default") == "default"
+    assert read_values(path) == [
+        ("alcatel_aos", "aos_version", 7),
+        ("alcatel_aos", "other", {"a": [1, 2]}),
+    ]
+
+    # Without event loop the line is written at once
+    cache.set(Device, "aos_version", 6)
+    assert read_values(path)[-1] == ("alcatel_aos", "aos_version", 6)
@@ -0,0 +1,75 @@
+# Python library import
+import asyncio
+import pytest
+import netscud
+from netscud.simulator import DeviceSimulator
+
+
+class ChunkReader:
+    """
+    Stream giving the data received chunk by chunk
+    """
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    async def read(self, size):
+        return self.chunks.pop(0).encode() if self.chunks else b""
+
+
+class Writer:
+    """
+    Stream keeping the data sent
+    """
+
+    def __init__(self):
+        self.data = b""
+
+    def write(self, data):
+        self.data += data
+
+
+@pytest.mark.parametrize("protocol", ["ssh", "telnet"])
+@pytest.mark.parametrize(
+    "device_type", ["cisco_ios", "cisco_s300", "alcatel_aos", "mikrotik_routeros"]
+)
+def test_check_connection_then_command(device_type, protocol):
+    async def run():
+        async with DeviceSimulator(device_type, protocol) as sim:
+            async with netscud.ConnectDevice(**sim.device(), timeout=5) as device:
+                expected = await device.send_command(device.cmd_get_hostname)
+                working = await device.check_connection()
+                return (
+                    working,
+                    expected,
+                    await device.send_command(device.cmd_get_hostname),
+                )
+
+    working, expected, output = asyncio.run(run())
+
+    assert working
+    assert output == expected
+
+
+def test_check_connection_mikrotik_prompt_redrawn():
+    device = netscud.ConnectDevice(
+        ip="127.0.0.1",
+        username="admin",
+        password="",
+        device_type="mikrotik_routeros",
+        protocol="telnet",
+    )
+
+    # Prompt redrawn in a second chunk (after the echo of the carriage return)
+    device._reader = ChunkReader(
+        ["\r[admin@switch] > \r\n", "\r[admin@switch] > ", "not read"]
+    )
+    device._writer = Writer()
+
+    assert asyncio.run(device.check_connection(timeout=1))
+
+    # Carriage return of the device sent
+    assert device._writer.data == device._carriage_return_for_send_command.encode()
+
+    # Both prompts read (nothing left for the next command)
+    assert device._reader.chunks == ["not read"]
@@ -0,0 +1,54 @@
+# Python library import
+import asyncio
+import pytest
+import netscud
+from netscud.simulator import DeviceSimulator
+
+# Facts expected from the canned outputs of the simulator
+EXPECTED_FACTS = {
+    "cisco_ios": {
+        "version": "15.0(2)SE11",
+        "hostname": "switch",
+        "model": "WS-C2960-24TT-L",
+        "serial_number": "FOC1234X5YZ",
+    },
+    "cisco_s300": {
+        "version": "1.4.11.5",
+        "hostname": "switch",
+        "model": "SG300-28 28-Port Gigabit Managed Switch",
+        "serial_number": "",
+    },
+    "alcatel_aos": {
+        "version": "6.7.2.191.R04",
+        "hostname": "switch",
+        "model": "OS6450-P24",
+        "serial_number": "M1234567",
+    },
+    "mikrotik_routeros": {
+        "version": "6.48.6",
+        "hostname": "switch",
+        "model": "CRS326-24G-2S+",
+        "serial_number": "6A1B2C3D4E5F",
+    },
+}
+
+
+@pytest.mark.parametrize("device_type", sorted(EXPECTED_FACTS))
+def test_get_facts(device_type):
+    async def run():
+        async with DeviceSimulator(device_type, "ssh") as sim:
+            async with netscud.ConnectDevice(**sim.device(), timeout=5) as device:
+                return await device.get_facts()
+
+    assert asyncio.run(run()) == EXPECTED_FACTS[device_type]
+
+
+def test_get_facts_no_serial_number():
+    async def run():
+        # "show inventory" without "SN:" line
+        outputs = {"show inventory": 'NAME: "1", DESCR: "WS-C2960-24TT-L"'}
+        async with DeviceSimulator("cisco_ios", "ssh", outputs=outputs) as sim:
+            async with netscud.ConnectDevice(**sim.device(), timeout=5) as device:
+                return await device.get_serial_number()
+
+    assert asyncio.run(run()) == ""
@@ -0,0 +1,56 @@
+# Python library import
+import asyncio
+import pytest
+import netscud
+from netscud.simulator import DeviceSimulator
+from netscud.devices.alcatel.alcatel_aos import AlcatelAOS
+from netscud.devices.mikrotik.mikrotik_routeros import MikrotikRouterOS
+
+# Classes of the devices
+DEVICE_CLASSES = {
+    "alcatel_aos": AlcatelAOS,
+    "mikrotik_routeros": MikrotikRouterOS,
+}
+
+# Long ARP tables (one entry per line)
+ARP_TABLES = {
+    "alcatel_aos": (
+        "Total 2000 arp entries\r\n"
+        " IP Addr           Hardware Addr       Type       Flags   Port       Interface\r\n"
+        "-----------------+-------------------+----------+-------+--------+---------\r\n"
+        + "\r\n".join(
+            f" 10.0.{number // 256}.{number % 256:<10} 00:00:00:00:{number // 256:02x}:{number % 256:02x}   DYNAMIC             1/1/1      vlan 1"
+            for number in range(2000)
+        )
+    ),
+    "mikrotik_routeros": "\r\n".join(
+        f" {number} address=10.0.{number // 256}.{number % 256} mac-address=00:00:00:00:{number // 256:02X}:{number % 256:02X} interface=ether1 published=no"
+        for number in range(2000)
+    ),
+}
+
+
+@pytest.mark.parametrize("protocol", ["ssh", "telnet"])
+@pytest.mark.parametrize("device_type", sorted(ARP_TABLES))
+def test_iter_arp_table_left_early(device_type, protocol):
+    async def run():
+        outputs = {DEVICE_CLASSES[device_type].cmd_get_arp: ARP_TABLES[device_type]}
+        async with DeviceSimulator(device_type, protocol, outputs=outputs) as sim:
+            async with netscud.ConnectDevice(**sim.device(), timeout=5) as device:
+                expected = await device.send_command(device.cmd_get_hostname)
+
+                # Only the first entry of the table is read
+                async for entry in device.iter_arp_table():
+                    break
+
+                # The next command gets its own output
+                return (
+                    entry,
+                    expected,
+                    await device.send_command(device.cmd_get_hostname),
+                )
+
+    entry, expected, output = asyncio.run(run())
+
+    assert entry["address"] == "10.0.0.0"
+    assert output == expected
@@ -0,0 +1,269 @@
+# Python library import
+import asyncio
+import netscud
+from netscud.simulator import DeviceSimulator, RouterOSAPISimulator
+
+# Outputs of the CLI of the simulated device
+CLI_OUTPUTS = {
+    "ip arp print terse without-paging": (
+        " 0 D address=192.168.0.2 mac-address=00:0C:42:00:00:01 interface=bridge1 published=no\r\n"
+        " 1 D address=192.168.0.3 mac-address=00:0C:42:00:00:02 interface=bridge1 published=no"
+    ),
+    "interface bridge host print without-paging": (
+        "Flags: X - disabled, I - invalid, D - dynamic, L - local, E - external\r\n"
+        " #       MAC-ADDRESS        VID ON-INTERFACE    BRIDGE\r\n"
+        " 0   D   00:0C:42:00:00:01   10 ether2          bridge1\r\n"
+        " 1   DL  00:0C:42:00:00:FF    1 bridge1         bridge1\r\n"
+        " 2       00:0C:42:00:00:03   20 ether3          bridge1"
+    ),
+    "interface bridge vlan print terse without-paging": (
+        ' 0   comment="vlan 10" bridge=bridge1 vlan-ids=10 tagged=sfp1 untagged=ether2\r\n'
+        " 1   bridge=bridge1 vlan-ids=20 tagged=sfp1 untagged=ether3"
+    ),
+    "interface ethernet print terse without-paging": (
+        ' 0 R name=ether1 default-name=ether1 mtu=1500 l2mtu=1592 comment="to core"\r\n'
+        " 1 X name=ether2 default-name=ether2 mtu=1500 l2mtu=1592\r\n"
+        " 2   name=ether3 default-name=ether3 mtu=1500 l2mtu=1592"
+    ),
+    "foreach i in=([/interface ethernet find]) do={/interface ethernet monitor $i once without-paging}": (
+        "                      name: ether1\r\n"
+        "                    status: link-ok\r\n"
+        "                      rate: 1Gbps\r\n"
+        "               full-duplex: yes\r\n"
+        "\r\n"
+        "                      name: ether3\r\n"
+        "                    status: no-link\r\n"
+        "                      rate: 100Mbps\r\n"
+        "               full-duplex: no"
+    ),
+    "interface bridge port print terse without-paging": (
+        " 0   interface=ether1 bridge=bridge1 pvid=1 frame-types=admit-only-vlan-tagged\r\n"
+        " 1   interface=ether2 bridge=bridge1 pvid=10 frame-types=admit-only-untagged-and-priority-tagged\r\n"
+        " 2   interface=ether3 bridge=bridge1 pvid=20 frame-types=admit-all"
+    ),
+    "ip route print without-paging terse": (
+        " 0 ADC  dst-address=192.168.0.0/24 pref-src=192.168.0.1 gateway=bridge1 distance=0 scope=10\r\n"
+        " 1 A S  dst-address=0.0.0.0/0 gateway=192.168.0.254 distance=1 scope=30\r\n"
+        " 2   S  dst-address=10.0.0.0/8 gateway=192.168.0.253 distance=2 scope=30"
+    ),
+    "ip address print terse without-paging": (
+        " 0   address=192.168.0.1/24 network=192.168.0.0 interface=bridge1 actual-interface=bridge1\r\n"
+        " 1   address=10.1.0.1/16 network=10.1.0.0 interface=ether1 actual-interface=ether1"
+    ),
+}
+
+# Records of the RouterOS API of the same device
+API_RECORDS = {
+    "/ip/arp": [
+        {
+            "address": "192.168.0.2",
+            "mac-address": "00:0C:42:00:00:01",
+            "interface": "bridge1",
+        },
+        {
+            "address": "192.168.0.3",
+            "mac-address": "00:0C:42:00:00:02",
+            "interface": "bridge1",
+        },
+    ],
+    "/interface/bridge/host": [
+        {
+            "mac-address": "00:0C:42:00:00:01",
+            "vid": "10",
+            "on-interface": "ether2",
+            "dynamic": "true",
+            "local": "false",
+        },
+        {
+            "mac-address": "00:0C:42:00:00:FF",
+            "vid": "1",
+            "on-interface": "bridge1",
+            "dynamic": "true",
+            "local": "true",
+        },
+        {
+            "mac-address": "00:0C:42:00:00:03",
+            "vid": "20",
+            "on-interface": "ether3",
+            "dynamic": "false",
+            "local": "false",
+        },
+    ],
+    "/interface/bridge/vlan": [
+        {
+            "comment": "vlan 10",
+            "bridge": "bridge1",
+            "vlan-ids": "10",
+            "tagged": "sfp1",
+            "untagged": "ether2",
+        },
+        {
+            "bridge": "bridge1",
+            "vlan-ids": "20",
+            "tagged": "sfp1",
+            "untagged": "ether3",
+        },
+    ],
+    "/interface/ethernet": [
+        {
+            "name": "ether1",
+            "l2mtu": "1592",
+            "running": "true",
+            "disabled": "false",
+            "comment": "to core",
+        },
+        {"name": "ether2", "l2mtu": "1592", "running": "false", "disabled": "true"},
+        {"name": "ether3", "l2mtu": "1592", "running": "false", "disabled": "false"},
+    ],
+    "/interface/ethernet/monitor": [
+        {"name": "ether1", "rate": "1Gbps", "full-duplex": "true"},
+        {"name": "ether3", "rate": "100Mbps", "full-duplex": "false"},
+    ],
+    "/interface/bridge/port": [
+        {"interface": "ether1", "frame-types": "admit-only-vlan-tagged"},
+        {
+            "interface": "ether2",
+            "frame-types": "admit-only-untagged-and-priority-tagged",
+        },
+        {"interface": "ether3", "frame-types": "admit-all"},
+    ],
+    "/ip/route": [
+        {
+            "dst-address": "192.168.0.0/24",
+            "gateway": "bridge1",
+            "distance": "0",
+            "active": "true",
+            "dynamic": "true",
+            "connect": "true",
+        },
+        {
+            "dst-address": "0.0.0.0/0",
+            "gateway": "192.168.0.254",
+            "distance": "1",
+            "active": "true",
+            "static": "true",
+        },
+        {
+            "dst-address": "10.0.0.0/8",
+            "gateway": "192.168.0.253",
+            "distance": "2",
+            "active": "false",
+            "static": "true",
+        },
+    ],
+    "/ip/address": [
+        {"address": "192.168.0.1/24", "interface": "bridge1"},
+        {"address": "10.1.0.1/16", "interface": "ether1"},
+    ],
+    "/system/resource": [
+        {"version": "6.48.6 (long-term)", "board-name": "CRS326-24G-2S+"}
+    ],
+    "/system/identity": [{"name": "switch"}],
+    "/system/routerboard": [{"serial-number": "6A1B2C3D4E5F"}],
+}
+
+
+async def read_getters(device):
+    """
+    Function used to get the values of the getters of a device
+
+    :param device: the device
+    :type device: MikrotikRouterOS
+
+    :return: the value of each getter
+    :rtype: dict
+    """
+
+    return {
+        "arp_table": await device.get_arp_table(),
+        "arp_table_compact": list(await device.get_arp_table(compact=True)),
+        "mac_address_table": await device.get_mac_address_table(),
+        "vlans": await device.get_vlans(),
+        "interfaces": await device.get_interfaces(),
+        "routing_table": await device.get_routing_table(),
+        "interfaces_ip": await device.get_interfaces_ip(),
+        "facts": await device.get_facts(),
+        "hostname": await device.get_hostname(),
+        "version": await device.get_version(),
+        "model": await device.get_model(),
+        "serial_number": await device.get_serial_number(),
+    }
+
+
+def test_mikrotik_api_getters():
+    async def run():
+        async with DeviceSimulator(
+            "mikrotik_routeros", "ssh", outputs=CLI_OUTPUTS
+        ) as sim, RouterOSAPISimulator(records=API_RECORDS) as api_sim:
+
+            # Getters with the CLI
+            async with netscud.ConnectDevice(**sim.device(), timeout=5) as device:
+                cli_values = await read_getters(device)
+
+            # Commands received by the CLI
+            cli_commands = sum(sim.received_commands.values())
+
+            # Getters with the RouterOS API
+            async with netscud.ConnectDevice(
+                **sim.device(api=True, api_port=api_sim.port), timeout=5
+            ) as device:
+                api_values = await read_getters(device)
+
+            # Commands received by the CLI in API mode (connection only)
+            api_commands = sum(sim.received_commands.values()) - cli_commands
+
+            return cli_values, api_values, api_commands, api_sim.commands
+
+    cli_values, api_values, api_commands, api_sim_commands = asyncio.run(run())
+
+    # Same values with the CLI and with the API
+    assert api_values == cli_values
+
+    # The getters use the API only (no command sent to the CLI after the connection)
+    assert api_commands == 0
+    assert api_sim_commands > 10
+
+    # Values of the getters
+    assert cli_values["interfaces"] == {
+        "ether1": {
+            "operational": True,
+            "admin_state": True,
+            "maximum_frame_size": 1592,
+            "full_duplex": True,
+            "speed": 1000,
+            "mode": "trunk",
+            "description": "to core",
+        },
+        "ether2": {
+            "operational": False,
+            "admin_state": False,
+            "maximum_frame_size": 1592,
+            "full_duplex": False,
+            "speed": 0,
+            "mode": "access",
+            "description": "",
+        },
+        "ether3": {
+            "operational": False,
+            "admin_state": True,
+            "maximum_frame_size": 1592,
+            "full_duplex": False,
+            "speed": 100,
+            "mode": "hybrid",
+            "description": "",
+        },
+    }
+    assert [mac["mac_type"] for mac in cli_values["mac_address_table"]] == [
+        "dynamic",
+        "self",
+        "static",
+    ]
+    assert [
+        (route["protocol"], route["active"])
+        for route in cli_values["routing_table"].values()
+    ] == [("connected", True), ("static", True), ("static", False)]
+    assert cli_values["vlans"] == {
+        10: {"name": "vlan 10", "extra": {"bridge": "bridge1"}},
+        20: {"name": "", "extra": {"bridge": "bridge1"}},
+    }
+    assert cli_values["facts"]["version"] == "6.48.6"
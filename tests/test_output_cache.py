@@ -0,0 +1,135 @@
+# Python library import
+import asyncio
+import time
+import netscud
+from netscud.simulator import DeviceSimulator
+
+# VLAN table of the simulated Mikrotik device
+MIKROTIK_VLAN_TABLE = (
+    ' 0   comment="vlan 10" bridge=bridge1 vlan-ids=10 tagged=sfp1 untagged=ether1 current-tagged=sfp1 current-untagged=ether1\r\n'
+    " 1   bridge=bridge1 vlan-ids=20 tagged=sfp1 untagged=ether5 current-tagged=sfp1 current-untagged=ether5"
+)
+
+
+def run_device(device_type, function, outputs=None, **kwargs):
+    """
+    Function used to run an async function with a device connected to a simulator
+
+    :param device_type: the device type simulated
+    :type device_type: str
+
+    :param function: the async function (called with the simulator and the device)
+    :type function: function
+
+    :param outputs: optional, canned outputs of the simulator
+    :type outputs: dict
+
+    :return: the value returned by the function
+    :rtype: any
+    """
+
+    async def run():
+        async with DeviceSimulator(
+            device_type, "ssh", outputs=outputs, output_lines=0
+        ) as sim:
+            async with netscud.ConnectDevice(
+                **sim.device(**kwargs), timeout=5
+            ) as device:
+                return await function(sim, device)
+
+    return asyncio.run(run())
+
+
+def test_output_cache_opt_in():
+    async def read_twice(sim, device):
+        await device.send_cached_command("show vlan")
+        await device.send_cached_command("show vlan")
+        return sim.received_commands["show vlan"]
+
+    # Without "output_cache_ttl" the command is always sent
+    assert run_device("alcatel_aos", read_twice) == 2
+
+    # With "output_cache_ttl" the output is used again
+    assert run_device("alcatel_aos", read_twice, output_cache_ttl=60) == 1
+
+
+def test_output_cache_ttl_expired():
+    async def read_after_ttl(sim, device):
+        await device.send_cached_command("show vlan")
+        time.sleep(0.2)
+        await device.send_cached_command("show vlan")
+        return sim.received_commands["show vlan"]
+
+    # The output is too old: the command is sent again
+    assert run_device("alcatel_aos", read_after_ttl, output_cache_ttl=0.1) == 2
+
+
+def test_output_cache_targeted_invalidation():
+    async def change(sim, device):
+        cmds = ["show vlan", device.cmd_get_routing_table]
+
+        # Both outputs kept
+        for cmd in cmds:
+            await device.send_cached_command(cmd)
+
+        # A VLAN added: only the VLAN table is read again
+        await device.add_vlan(30, "vlan30")
+        for cmd in cmds:
+            await device.send_cached_command(cmd)
+        counts = [sim.received_commands[cmd] for cmd in cmds]
+
+        # Unknown change (send_config_set): all the outputs are read again
+        await device.send_config_set(["vlan 40"])
+        for cmd in cmds:
+            await device.send_cached_command(cmd)
+
+        return counts, [sim.received_commands[cmd] for cmd in cmds]
+
+    counts, counts_after_config = run_device("alcatel_aos", change, output_cache_ttl=60)
+
+    assert counts == [2, 1]
+    assert counts_after_config == [3, 2]
+
+
+def test_output_cache_mikrotik_vlan_table_updated():
+    async def change(sim, device):
+
+        # Several changes of interfaces
+        await device.add_interface_to_vlan("ether2", "access", 10)
+        await device.add_interface_to_vlan("ether3", "access", 10)
+        await device.add_interface_to_vlan("ether4", "trunk", 20)
+        await device.remove_interface_from_vlan("ether2", "access", 10)
+
+        return sim.received_commands
+
+    outputs = {"interface bridge vlan print terse": MIKROTIK_VLAN_TABLE}
+
+    # VLAN table updated after each change (read once)
+    received = run_device(
+        "mikrotik_routeros", change, outputs=outputs, output_cache_ttl=60
+    )
+    assert received["interface bridge vlan print terse"] == 1
+    assert (
+        received["interface bridge vlan set [find vlan-ids=10] untagged=ether1,ether2"]
+        == 1
+    )
+    assert (
+        received[
+            "interface bridge vlan set [find vlan-ids=10] untagged=ether1,ether2,ether3"
+        ]
+        == 1
+    )
+    assert received["interface bridge vlan set [find vlan-ids=20] tagged=sfp1,ether4"]
+    assert received[
+        "interface bridge vlan set [find vlan-ids=10] untagged=ether1,ether3"
+    ]
+
+    # Without output cache the VLAN table is read for each change
+    received = run_device("mikrotik_routeros", change, outputs=outputs)
+    assert received["interface bridge vlan print terse"] == 4
+
+    # The second interface is added to the VLAN read (without the first one)
+    assert (
+        received["interface bridge vlan set [find vlan-ids=10] untagged=ether1,ether3"]
+        == 1
+    )
@@ -0,0 +1,173 @@
+# Python library import
+import asyncio
+import pytest
+import netscud
+from netscud.simulator import DeviceSimulator
+from netscud.receive_buffer import PromptMatcher
+
+# Commands sent to each simulated device (canned outputs and generated outputs)
+COMMANDS = {
+    "cisco_ios": ["show version", "show clock", "show version | include uptime"],
+    "cisco_s300": ["show version", "show clock", "show system | include System Name:"],
+    "alcatel_aos": ["show microcode", "show system", "show chassis"],
+    "mikrotik_routeros": [
+        "system identity print without-paging",
+        "system resource print without-paging",
+        "interface print",
+    ],
+}
+
+
+async def send_commands(device_type, protocol, **kwargs):
+    """
+    Send the commands of a device type with send_commands, sequential mode then with the other parameters
+    """
+
+    async with DeviceSimulator(device_type, protocol) as sim:
+
+        # Sequential mode
+        async with netscud.ConnectDevice(**sim.device(), timeout=5) as device:
+            sequential = await device.send_commands(COMMANDS[device_type])
+
+        # Mode given by the parameters
+        async with netscud.ConnectDevice(**sim.device(**kwargs), timeout=5) as device:
+            other = await device.send_commands(COMMANDS[device_type])
+
+    return sequential, other
+
+
+@pytest.mark.parametrize("protocol", ["ssh", "telnet"])
+@pytest.mark.parametrize("device_type", sorted(COMMANDS))
+def test_pipelined_outputs_same_as_sequential(device_type, protocol):
+
+    # Pipelined mode
+    sequential, pipelined = asyncio.run(
+        send_commands(device_type, protocol, getter_window=3)
+    )
+
+    assert pipelined == sequential
+
+    # SSH: ANSI escape sequences and "\r" removed (same as send_commandSSH)
+    if protocol == "ssh":
+        assert all("\r" not in output and "\x1b" not in output for output in pipelined)
+
+
+@pytest.mark.parametrize("device_type", sorted(COMMANDS))
+def test_channels_outputs_same_as_sequential(device_type):
+
+    # Several SSH channels
+    sequential, channels = asyncio.run(send_commands(device_type, "ssh", channels=3))
+
+    assert channels == sequential
+
+
+@pytest.mark.parametrize("protocol", ["ssh", "telnet"])
+def test_pipelined_config_set_same_as_sequential(protocol):
+    async def run():
+        async with DeviceSimulator("cisco_ios", protocol) as sim:
+            async with netscud.ConnectDevice(**sim.device(), timeout=5) as device:
+                cmds = [f"interface gi1/0/{port}" for port in range(1, 6)]
+                return (
+                    await device.send_config_set(cmds),
+                    await device.send_config_set(cmds, window=3),
+                )
+
+    sequential, pipelined = asyncio.run(run())
+
+    assert pipelined == sequential
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"getter_window": 3}, {"channels": 2}], ids=str)
+def test_send_commands_error_same_in_all_modes(kwargs):
+    async def run():
+        outputs = {"show bad": "% Invalid input detected at '^' marker."}
+        async with DeviceSimulator("cisco_ios", "ssh", outputs=outputs) as sim:
+            async with netscud.ConnectDevice(
+                **sim.device(**kwargs), timeout=5
+            ) as device:
+                await device.send_commands(["show version", "show bad", "show clock"])
+
+    # Same exception as send_command (output of the command)
+    with pytest.raises(Exception) as error:
+        asyncio.run(run())
+
+    assert str(error.value) == "% Invalid input detected at '^' marker."
+
+
+class ChunkReader:
+    """
+    Stream giving the data received chunk by chunk
+    """
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    async def read(self, size):
+        await asyncio.sleep(0)
+        return self.chunks.pop(0).encode() if self.chunks else b""
+
+
+class Writer:
+    """
+    Stream keeping the data sent
+    """
+
+    def __init__(self):
+        self.data = b""
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+
+def test_pipelined_prompt_like_line_at_end_of_chunk():
+    device = netscud.ConnectDevice(
+        ip="127.0.0.1",
+        username="admin",
+        password="",
+        device_type="cisco_ios",
+        protocol="telnet",
+    )
+    device.possible_prompts = ["switch#"]
+    device._prompt_matcher = PromptMatcher(device.possible_prompts)
+
+    # A line of the output looking like a prompt ends the first chunk
+    device._reader = ChunkReader(
+        [
+            "show a\r\nline1\r\nswitch#",
+            "fake\r\nswitch#show b\r\nout b\r\nswitch#",
+        ]
+    )
+    device._writer = Writer()
+
+    answers, _ = asyncio.run(device.send_commands_pipelined(["show a", "show b"], 2))
+
+    assert answers == [
+        "show a\r\nline1\r\nswitch#fake\r\nswitch#",
+        "show b\r\nout b\r\nswitch#",
+    ]
+
+
+def test_mikrotik_pipelined_echo_not_yet_received():
+    device = netscud.ConnectDevice(
+        ip="127.0.0.1",
+        username="admin",
+        password="",
+        device_type="mikrotik_routeros",
+    )
+    prompt = "[admin@switch] > "
+    text = f"print a\nline1\n{prompt}"
+
+    # Prompt at the end of the data: the echo of the next command is needed
+    assert device.find_end_of_pipelined_output(text, "print b") == -1
+    assert device.find_end_of_pipelined_output(text + f"\r{prompt}pr", "print b") == -1
+
+    # Echo of the next command received
+    assert device.find_end_of_pipelined_output(
+        text + f"\r{prompt}print b\n", "print b"
+    ) == len(text)
+
+    # Line looking like a prompt followed by other data
+    assert device.find_end_of_pipelined_output(text + "fake\n", "print b") == -1
@@ -0,0 +1,185 @@
+# Python library import
+import pytest
+from netscud.receive_buffer import AnsiEscapeFilter, PromptMatcher, ReceiveBuffer
+
+# Data with ANSI escape sequences and the same data once cleaned
+ANSI_DATA = [
+    ("abc\x1b[Kdef", "abcdef"),
+    ("\x1b[9999B\x1b[2K\rswitch#", "\rswitch#"),
+    ("line\x1b[1;32mgreen\x1b[0m", "linegreen"),
+    ("abc\x1b\x1b[Kdef", "abcdef"),
+    ("abc\x1b\x1b\x1b[9999Bdef", "abcdef"),
+    ("no escape sequence", "no escape sequence"),
+]
+
+
+def feed_chunks(chunks):
+    """
+    Function used to send several chunks to a new ANSI escape filter
+
+    :param chunks: the chunks
+    :type chunks: list
+
+    :return: the data once filtered
+    :rtype: str
+    """
+
+    # New filter
+    ansi_filter = AnsiEscapeFilter()
+
+    # All the chunks are filtered
+    return "".join(ansi_filter.feed(chunk) for chunk in chunks)
+
+
+@pytest.mark.parametrize("data, expected", ANSI_DATA)
+def test_ansi_escape_filter(data, expected):
+    assert feed_chunks([data]) == expected
+
+
+@pytest.mark.parametrize("data, expected", ANSI_DATA)
+def test_ansi_escape_filter_split(data, expected):
+
+    # The data is split at every position (escape sequences split over 2 chunks)
+    for index in range(len(data) + 1):
+        assert feed_chunks([data[:index], data[index:]]) == expected
+
+    # Then one char per chunk
+    assert feed_chunks(list(data)) == expected
+
+
+def test_ansi_escape_filter_pending():
+    ansi_filter = AnsiEscapeFilter()
+
+    # The beginning of the escape sequence is kept until the next chunk
+    assert ansi_filter.feed("switch\x1b[2") == "switch"
+    assert ansi_filter.feed("") == ""
+    assert ansi_filter.feed("K#") == "#"
+
+    # Chunks without escape char are left unchanged
+    assert ansi_filter.feed("show version\r\n") == "show version\r\n"
+
+
+def test_prompt_matcher_end_of_text():
+    matcher = PromptMatcher(["switch#", "switch>", ""])
+
+    # Prompt at the very end
+    match = matcher.search("show version\r\noutput\r\nswitch#")
+    assert match.group() == "switch#"
+    assert match.start() == len("show version\r\noutput\r\n")
+
+    # Prompt in the middle of the output (the hostname in a description for instance)
+    assert matcher.search("switch# is the name\r\nswitch> list") is None
+
+    # Prompt followed by some data
+    assert matcher.search("switch#show version") is None
+
+    # Beginning of the prompt only
+    assert matcher.search("output\r\nswitch") is None
+
+
+def test_prompt_matcher_longest_prompt():
+    matcher = PromptMatcher(["switch#", "switch(config)#"])
+
+    # Only the end of the text (the size of the longest prompt) is checked
+    assert matcher.max_length == len("switch(config)#")
+    assert matcher.search("x" * 100000 + "switch(config)#").group() == "switch(config)#"
+    assert matcher.search("switch(config)#" + "x" * 100000) is None
+
+
+def test_prompt_matcher_no_prompt():
+    matcher = PromptMatcher(["", ""])
+
+    assert matcher.search("switch#") is None
+    assert matcher.search_line("switch#") is None
+
+
+def test_prompt_matcher_search_line():
+    matcher = PromptMatcher(["\r\nswitch#"])
+
+    text = "show a\r\nout switch# a\r\n\rswitch#show b\r\nswitch#"
+
+    # Prompt at the beginning of a line (carriage returns of the prompt not used)
+    match = matcher.search_line(text)
+    assert match.start() == text.index("\rswitch#")
+    assert match.group() == "\rswitch#"
+
+    # Next prompt
+    assert matcher.search_line(text, match.end()).start() == text.rindex("switch#")
+
+
+def test_receive_buffer_tail_window():
+    buffer = ReceiveBuffer(["switch#", "--More--"])
+
+    # Window: the size of the longest pattern
+    assert buffer.window == len("--More--")
+
+    # Pattern split over 2 chunks
+    buffer.feed("output\r\nswi")
+    assert not buffer.contains("switch#")
+    buffer.feed("tch#")
+    assert buffer.contains("switch#")
+    assert buffer.endswith("switch#")
+
+    # Only the end of the previous data is kept with the new chunk ("window - 1" chars)
+    buffer.feed("x" * 100)
+    assert buffer.recent == "switch#" + "x" * 100
+    buffer.feed("y")
+    assert buffer.recent == "x" * 7 + "y"
+    assert not buffer.contains("switch#")
+
+    # All the data is still available
+    assert buffer.getvalue() == "output\r\nswitch#" + "x" * 100 + "y"
+    assert len(buffer) == len("output\r\nswitch#") + 101
+
+
+def test_receive_buffer_new_occurrences():
+    buffer = ReceiveBuffer(["--More--"])
+
+    # The occurrences are counted once even if they are in the tail window
+    assert buffer.count_new("--More--") == 0
+    buffer.feed("line 1\r\n--More--")
+    assert buffer.count_new("--More--") == 1
+    assert buffer.find_new("--More--") == len("line 1\r\n")
+    buffer.feed("\r\nline 2\r\n--Mo")
+    assert buffer.count_new("--More--") == 0
+    assert buffer.find_new("--More--") == -1
+    buffer.feed("re--")
+    assert buffer.count_new("--More--") == 1
+    assert buffer.find_new("--More--") == len("line 1\r\n--More--\r\nline 2\r\n")
+
+    # Occurrence before "start"
+    assert buffer.find_new("--More--", len(buffer)) == -1
+
+    # Pattern longer than the window
+    with pytest.raises(ValueError):
+        buffer.count_new("--More-- (q to quit)")
+    with pytest.raises(ValueError):
+        buffer.find_new("--More-- (q to quit)")
+
+    # Then the search of a long pattern is done on all the data
+    assert buffer.contains("line 1\r\n--More--")
+    assert buffer.endswith("line 2\r\n--More--")
+
+
+def test_receive_buffer_decode_and_sanitize():
+    buffer = ReceiveBuffer(
+        ["switch#"], sanitize=AnsiEscapeFilter().feed, decode=True, keep_data=False
+    )
+
+    # UTF-8 char and escape sequence split over 2 chunks
+    data = "caf\u00e9\x1b[K\r\nswitch#".encode()
+    index = data.index(b"\xa9")
+    assert buffer.feed(data[:index]) == "caf"
+    assert buffer.feed(data[index : index + 2]) == "\u00e9"
+    assert buffer.feed(data[index + 2 :]) == "\r\nswitch#"
+    assert buffer.endswith("switch#")
+
+    # The chunks are not saved
+    assert buffer.getvalue() == ""
+    assert len(buffer) == len("caf\u00e9\r\nswitch#")
+
+    # Everything removed
+    buffer.clear()
+    assert len(buffer) == 0
+    assert buffer.recent == ""
+    assert not buffer.contains("switch#")
@@ -0,0 +1,70 @@
+# Python library import
+import asyncio
+import pytest
+from netscud import RouterOSAPI
+from netscud.simulator import RouterOSAPISimulator
+
+# Records of the simulated device
+RECORDS = {
+    "/ip/arp": [
+        {
+            "address": "192.168.0.1",
+            "mac-address": "00:11:22:33:44:01",
+            "interface": "ether1",
+        },
+        {
+            "address": "192.168.0.2",
+            "mac-address": "00:11:22:33:44:02",
+            "interface": "ether2",
+        },
+    ],
+    "/system/identity": [{"name": "router"}],
+}
+
+
+def test_routeros_api_print():
+    async def run():
+        async with RouterOSAPISimulator(
+            username="admin", password="secret", records=RECORDS
+        ) as sim:
+            async with RouterOSAPI(**sim.device(password="secret")) as api:
+
+                # Several tagged commands at the same time
+                return await asyncio.gather(
+                    api.print("/ip/arp"),
+                    api.print("/system/identity"),
+                    api.print(
+                        "/ip/arp", queries=["interface=ether2"], proplist=["address"]
+                    ),
+                )
+
+    arp, identity, filtered = asyncio.run(run())
+
+    assert arp == RECORDS["/ip/arp"]
+    assert identity == [{"name": "router"}]
+    assert filtered == [{"address": "192.168.0.2"}]
+
+
+def test_routeros_api_trap():
+    async def run():
+        async with RouterOSAPISimulator(records=RECORDS) as sim:
+            async with RouterOSAPI(**sim.device()) as api:
+
+                # "!trap" then "!done": the command gets the error
+                with pytest.raises(Exception, match="no such command prefix"):
+                    await api.print("/unknown/menu")
+
+                # The connection can still be used
+                return await api.print("/system/identity")
+
+    assert asyncio.run(run()) == [{"name": "router"}]
+
+
+def test_routeros_api_login_refused():
+    async def run():
+        async with RouterOSAPISimulator(username="admin", password="secret") as sim:
+            async with RouterOSAPI(**sim.device(password="wrong")):
+                pass
+
+    with pytest.raises(Exception, match="invalid user name or password"):
+        asyncio.run(run())
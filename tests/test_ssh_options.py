@@ -0,0 +1,50 @@
+# Python library import
+import netscud
+from netscud.base_connection import get_ssh_client_options
+
+
+def test_ssh_options_credentials_not_cached():
+    devices = [
+        netscud.ConnectDevice(
+            ip="127.0.0.1", username="admin", password=password, device_type="cisco_ios"
+        )
+        for password in ("secret1", "secret2")
+    ]
+
+    # Credentials of each device in the options of the connection
+    assert [device.get_ssh_options().password for device in devices] == [
+        "secret1",
+        "secret2",
+    ]
+
+    # Options of the profile shared (without the credentials)
+    options = get_ssh_client_options()
+    assert options.password is None
+
+
+def test_ssh_options_algorithms():
+    options = get_ssh_client_options()
+
+    # Post-quantum hybrid key exchange first (asyncssh default algorithms)
+    assert options.kex_algs[0] == b"mlkem768x25519-sha256"
+
+    # Old algorithms not offered by default
+    assert b"diffie-hellman-group1-sha1" not in options.kex_algs
+    assert b"rsa1024-sha1" not in options.kex_algs
+    assert b"hmac-md5" not in options.mac_algs
+
+
+def test_ssh_options_legacy_algorithms():
+    device = netscud.ConnectDevice(
+        ip="127.0.0.1",
+        username="admin",
+        password="secret",
+        device_type="cisco_ios",
+        legacy_ssh_algorithms=True,
+    )
+    options = device.get_ssh_options()
+
+    # Old algorithms offered after the default ones
+    assert options.kex_algs[0] == b"mlkem768x25519-sha256"
+    assert options.kex_algs[-1] in (b"diffie-hellman-group1-sha1", b"rsa1024-sha1")
+    assert b"hmac-md5" in options.mac_algs[-10:]
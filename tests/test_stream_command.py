@@ -0,0 +1,42 @@
+# Python library import
+import asyncio
+import pytest
+import netscud
+from netscud.simulator import DeviceSimulator
+
+
+@pytest.mark.parametrize(
+    "protocol, kwargs",
+    [("ssh", {}), ("telnet", {}), ("ssh", {"channels": 2})],
+    ids=["ssh", "telnet", "channels"],
+)
+@pytest.mark.parametrize("close", [False, True], ids=["left", "closed"])
+def test_stream_command_left_early(protocol, kwargs, close):
+    async def run():
+        async with DeviceSimulator("cisco_ios", protocol, output_lines=2000) as sim:
+            async with netscud.ConnectDevice(
+                **sim.device(**kwargs), timeout=5
+            ) as device:
+                expected = await device.send_command("show version")
+
+                # Only the first line of a long output is read
+                lines = device.stream_command("show running-config")
+                async for line in lines:
+                    break
+
+                # Generator closed or only left
+                if close:
+                    await lines.aclose()
+
+                # The next command gets its own output
+                output = await device.send_command("show version")
+
+                # Then the generator is closed
+                await lines.aclose()
+
+                return expected, output, await device.send_command("show version")
+
+    expected, output, last_output = asyncio.run(run())
+
+    assert output == expected
+    assert last_output == expected
@@ -0,0 +1,95 @@
+# Python library import
+import asyncio
+import pytest
+from netscud.table import (
+    Table,
+    MAC_ADDRESS_TABLE_FIELDS,
+    MAC_ADDRESS_TABLE_CATEGORIES,
+)
+
+# Records of a MAC address table
+MAC_ADDRESS_TABLE = [
+    {
+        "mac_type": "dynamic",
+        "mac_address": f"00:00:00:00:00:{number:02x}",
+        "vlan": number % 3 + 1,
+        "interface": f"1/1/{number % 5 + 1}",
+    }
+    for number in range(50)
+]
+
+
+def test_table_round_trip():
+    table = Table(MAC_ADDRESS_TABLE_FIELDS, MAC_ADDRESS_TABLE_CATEGORIES)
+    table.extend(MAC_ADDRESS_TABLE)
+
+    # Same rows as the list of dictionaries
+    assert len(table) == len(MAC_ADDRESS_TABLE)
+    assert table == MAC_ADDRESS_TABLE
+    assert table.to_list() == MAC_ADDRESS_TABLE
+    assert [dict(row) for row in table] == MAC_ADDRESS_TABLE
+    assert table[-1] == MAC_ADDRESS_TABLE[-1]
+    assert table[10:12] == MAC_ADDRESS_TABLE[10:12]
+    assert table.column("vlan") == [record["vlan"] for record in MAC_ADDRESS_TABLE]
+
+    # Missing field
+    table.append({"mac_address": "00:00:00:00:01:00"})
+    assert table[-1] == {
+        "mac_type": None,
+        "mac_address": "00:00:00:00:01:00",
+        "vlan": None,
+        "interface": None,
+    }
+
+    # Different values
+    assert table != MAC_ADDRESS_TABLE
+    assert table[0] != MAC_ADDRESS_TABLE[1]
+
+    # Unknown field and row
+    with pytest.raises(KeyError):
+        table[0]["port"]
+    with pytest.raises(IndexError):
+        table[len(table)]
+
+
+def test_table_category_codes():
+    table = Table(MAC_ADDRESS_TABLE_FIELDS, MAC_ADDRESS_TABLE_CATEGORIES)
+    table.extend(MAC_ADDRESS_TABLE)
+
+    # Each different value of a category is saved once with its code
+    position = table.fields.index("interface")
+    values, codes = table._categories[position]
+    assert values == [f"1/1/{number}" for number in range(1, 6)]
+    assert codes == {value: code for code, value in enumerate(values)}
+
+    # The rows only have the codes
+    assert table._columns[position].typecode == "I"
+    assert list(table._columns[position]) == [
+        number % 5 for number in range(len(MAC_ADDRESS_TABLE))
+    ]
+
+    # Fields which are not categories keep their values
+    position = table.fields.index("mac_address")
+    assert table._categories[position] is None
+    assert table._columns[position] == [
+        record["mac_address"] for record in MAC_ADDRESS_TABLE
+    ]
+
+
+def test_table_collect():
+    async def records():
+        for record in MAC_ADDRESS_TABLE:
+            yield record
+
+    # Values added to each record
+    table = asyncio.run(
+        Table.collect(
+            records(),
+            ("device",) + MAC_ADDRESS_TABLE_FIELDS,
+            ("device",) + MAC_ADDRESS_TABLE_CATEGORIES,
+            device="switch1",
+        )
+    )
+
+    assert table == [{"device": "switch1", **record} for record in MAC_ADDRESS_TABLE]
+    assert table._categories[0][0] == ["switch1"]
@@ -0,0 +1,121 @@
+# Python library import
+import pytest
+from netscud.devices.mikrotik.terse import (
+    parse_terse,
+    parse_terse_line,
+    parse_terse_values,
+    replace_terse_value,
+)
+
+# Lines of "print terse" commands and their fields
+TERSE_LINES = [
+    # Flags columns (index and flags are not returned)
+    (
+        " 0 D address=10.0.0.1 mac-address=00:0C:42:00:00:01 interface=bridge1",
+        {
+            "address": "10.0.0.1",
+            "mac-address": "00:0C:42:00:00:01",
+            "interface": "bridge1",
+        },
+    ),
+    (
+        " 1 XI  name=ether2 mtu=1500",
+        {"name": "ether2", "mtu": "1500"},
+    ),
+    # Quoted values
+    (
+        ' 2   name="vlan 10" vlan-id=10 comment="voice vlan"',
+        {"name": "vlan 10", "vlan-id": "10", "comment": "voice vlan"},
+    ),
+    # Escaped quotes and backslashes
+    (
+        ' 3   comment="say \\"hi\\"" path="C:\\\\dir" vlan-id=10',
+        {"comment": 'say "hi"', "path": "C:\\dir", "vlan-id": "10"},
+    ),
+    # "=" inside values
+    (
+        ' 4 D address=10.0.0.2 comment="a=b c=d" interface=ether1',
+        {"address": "10.0.0.2", "comment": "a=b c=d", "interface": "ether1"},
+    ),
+    # Empty values
+    (
+        ' 5   name=ether3 comment="" identity= mtu=1500 untagged=',
+        {
+            "name": "ether3",
+            "comment": "",
+            "identity": "",
+            "mtu": "1500",
+            "untagged": "",
+        },
+    ),
+    # Unquoted value with spaces
+    (
+        " 6 A dst-address=0.0.0.0/0 description=my long text distance=1",
+        {"dst-address": "0.0.0.0/0", "description": "my long text", "distance": "1"},
+    ),
+    # No field
+    (" 7 ;;; only a comment", {}),
+    ("", {}),
+]
+
+
+@pytest.mark.parametrize("line, expected", TERSE_LINES)
+def test_parse_terse_line(line, expected):
+    assert parse_terse_line(line) == expected
+
+
+def test_parse_terse():
+    output = "\r\n".join(line for line, _ in TERSE_LINES)
+
+    # Dictionaries (lines without field skipped)
+    assert list(parse_terse(output)) == [
+        expected for _, expected in TERSE_LINES if expected
+    ]
+
+    # Tuples of the values wanted
+    assert list(parse_terse(output, ("name", "comment")))[:4] == [
+        (None, None),
+        ("ether2", None),
+        ("vlan 10", "voice vlan"),
+        (None, 'say "hi"'),
+    ]
+
+
+@pytest.mark.parametrize("line, expected", TERSE_LINES)
+def test_parse_terse_values(line, expected):
+    fields = ("address", "interface", "name", "comment", "vlan-id")
+
+    # Same values as parse_terse_line (single word values)
+    assert list(parse_terse_values([line], fields)) == [
+        tuple(expected.get(field) for field in fields)
+    ]
+
+
+def test_parse_terse_values_quoted_field():
+
+    # Fields only found in a quoted value or after it
+    line = ' 0 D address=10.0.0.1 comment="x interface=fake" interface=ether1'
+    assert list(parse_terse_values([line], ("address", "interface"))) == [
+        ("10.0.0.1", "ether1")
+    ]
+
+    # Quoted value of a field wanted
+    line = ' 1 D address=10.0.0.2 interface="my bridge"'
+    assert list(parse_terse_values([line], ("address", "interface"))) == [
+        ("10.0.0.2", "my bridge")
+    ]
+
+
+def test_replace_terse_value():
+    line = ' 0   comment="untagged=x y" bridge=bridge1 vlan-ids=10 untagged=ether1 tagged=sfp1'
+
+    # Value in the middle or at the end of the line (not in a quoted value)
+    assert replace_terse_value(line, "untagged", "ether1,ether2") == line.replace(
+        "untagged=ether1", "untagged=ether1,ether2"
+    )
+    assert replace_terse_value(line, "tagged", "") == line[: -len("sfp1")]
+
+    # Field not found, quoted value, new value with a space
+    assert replace_terse_value(line, "pvid", "10") is None
+    assert replace_terse_value(' 0 comment="vlan 10"', "comment", "x") is None
+    assert replace_terse_value(line, "untagged", "ether1 ether2") is None